@@ -0,0 +1,180 @@
+"""Benchmark for the qontract-api cache codecs.
+
+Stores a synthetic Slack users snapshot with every codec through
+CacheBackend.set_obj/get_obj (memory tier disabled) and reports the size of
+the stored value and the set/get latency. Without --redis-url the values are
+kept in a dict, which measures the serialization overhead only.
+
+"pickle" is not a qontract-api codec. It stands in for a trusted path that
+restores models without validation and shows that this is slower than
+pydantic-core validation.
+
+    uv run python dev/benchmarks/cache_codecs.py --users 20000
+    uv run python dev/benchmarks/cache_codecs.py --redis-url redis://localhost:6379/0
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import statistics
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from qontract_api.cache.base import CacheBackend
+from qontract_api.cache.codec import CacheCodec, JsonCodec
+from qontract_api.cache.redis import RedisCacheBackend
+from qontract_api.slack.slack_workspace_client import CachedUsers
+from qontract_utils.slack_api import SlackUser
+from qontract_utils.slack_api.models import SlackEnterpriseUser, SlackUserProfile
+from redis import Redis
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+KEY = "benchmark:cache-codecs"
+
+
+class PickleCodec(CacheCodec):
+    """Trusted codec restoring models (including nested ones) without validation."""
+
+    tag = b"p"
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, payload: bytes, cls: type[Any]) -> Any:
+        return pickle.loads(payload)
+
+
+class DictCacheBackend(CacheBackend):
+    """CacheBackend storing values in a dict (serialization cost only)."""
+
+    def __init__(self, codec: CacheCodec | None) -> None:
+        super().__init__(memory_max_size=0, codec=codec)
+        self.storage: dict[str, str | bytes] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.storage.get(key)  # type: ignore[return-value]
+
+    def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        self.storage[key] = value
+
+    def get_bytes(self, key: str) -> bytes | None:
+        return self.storage.get(key)  # type: ignore[return-value]
+
+    def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: int | None = None,
+    ) -> None:
+        self.storage[key] = value
+
+    def _delete_from_backend(self, key: str) -> None:
+        self.storage.pop(key, None)
+
+    def exists(self, key: str) -> bool:
+        return key in self.storage
+
+    def ping(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.storage.clear()
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = 300) -> Generator[None]:
+        yield
+
+
+def users(count: int) -> CachedUsers:
+    return CachedUsers(
+        items=[
+            SlackUser(
+                id=f"U{i:08d}",
+                name=f"user-{i}",
+                deleted=i % 20 == 0,
+                profile=SlackUserProfile(
+                    email=f"user-{i}@example.com",
+                    real_name=f"User {i}",
+                    display_name=f"user{i}",
+                ),
+                enterprise_user=SlackEnterpriseUser(id=f"W{i:08d}"),
+            )
+            for i in range(count)
+        ],
+        version=time.time_ns(),
+        fetched_at=time.time(),
+    )
+
+
+def make_cache(codec: CacheCodec | None, redis_url: str | None) -> CacheBackend:
+    if not redis_url:
+        return DictCacheBackend(codec)
+    return RedisCacheBackend(
+        Redis.from_url(redis_url, decode_responses=True),
+        memory_max_size=0,
+        codec=codec,
+        binary_client=Redis.from_url(redis_url),
+    )
+
+
+def stored_size(cache: CacheBackend) -> int:
+    if cache.codec is not None:
+        return len(cache.get_bytes(KEY) or b"")
+    return len((cache.get(KEY) or "").encode())
+
+
+def measure(
+    label: str, cache: CacheBackend, snapshot: CachedUsers, rounds: int
+) -> None:
+    set_times, get_times = [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        cache.set_obj(KEY, snapshot, ttl=60)
+        set_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        cached = cache.get_obj(KEY, CachedUsers)
+        get_times.append(time.perf_counter() - start)
+        assert cached == snapshot
+
+    size = stored_size(cache)
+    cache.delete(KEY)
+    print(
+        f"  {label:<16} {size / 1024:>10.1f} KiB"
+        f" {statistics.median(set_times) * 1000:>10.1f} ms"
+        f" {statistics.median(get_times) * 1000:>10.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--compression-threshold", type=int, default=65536)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    snapshot = users(args.users)
+    threshold = args.compression_threshold
+    codecs: dict[str, CacheCodec | None] = {
+        "legacy": None,
+        "json": JsonCodec(),
+        "json+zstd": JsonCodec(compression_threshold=threshold),
+        "pickle": PickleCodec(),
+        "pickle+zstd": PickleCodec(compression_threshold=threshold),
+    }
+
+    print(f"users: {args.users} ({'redis' if args.redis_url else 'in-process'})")
+    print(f"  {'codec':<16} {'size':>14} {'set':>13} {'get':>13}")
+    for label, codec in codecs.items():
+        cache = make_cache(codec, args.redis_url)
+        measure(label, cache, snapshot, args.rounds)
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
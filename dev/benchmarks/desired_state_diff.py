@@ -0,0 +1,113 @@
+"""Benchmark for the fine grained desired state diff extraction.
+
+Builds synthetic saas-file and namespace shaped desired states, changes a
+single item, and compares the deepdiff and merkle backends of extract_diffs
+in the forked extraction process build_desired_state_diff uses.
+
+    uv run python dev/benchmarks/desired_state_diff.py --items 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import functools
+import time
+from typing import TYPE_CHECKING, Any
+
+from reconcile.change_owners.diff import (
+    IDENTIFIER_FIELD_NAME,
+    DiffBackend,
+    extract_diffs,
+)
+from reconcile.utils.runtime.desired_state_diff import extract_diffs_with_timeout
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def saas_file(i: int) -> dict[str, Any]:
+    return {
+        "name": f"saas-{i}",
+        "app": {"name": f"app-{i % 50}"},
+        "pipelinesProvider": {"name": "tekton", "provider": "tekton"},
+        "resourceTemplates": [
+            {
+                "name": f"template-{t}",
+                "url": f"https://github.com/org/repo-{i}",
+                "path": "/openshift/template.yaml",
+                "parameters": {"REPLICAS": 3, "IMAGE": f"quay.io/org/app-{i}"},
+                "targets": [
+                    {
+                        IDENTIFIER_FIELD_NAME: f"saas-{i}-{t}-{n}",
+                        "namespace": {"name": f"ns-{n}", "cluster": {"name": "c1"}},
+                        "ref": f"{i:040x}",
+                        "parameters": {"ENV": f"env-{n}"},
+                    }
+                    for n in range(5)
+                ],
+            }
+            for t in range(3)
+        ],
+    }
+
+
+def namespace(i: int) -> dict[str, Any]:
+    return {
+        "name": f"ns-{i}",
+        "cluster": {"name": f"cluster-{i % 10}"},
+        "managedRoles": True,
+        "openshiftResources": [
+            {
+                IDENTIFIER_FIELD_NAME: f"ns-{i}-resource-{r}",
+                "provider": "resource",
+                "path": f"/services/app-{i}/resource-{r}.yaml",
+            }
+            for r in range(10)
+        ],
+        "limitRanges": {"name": "default", "limits": [{"type": "Container"}]},
+    }
+
+
+def desired_states(
+    items: int, build: Callable[[int], dict[str, Any]]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    previous = {"items": {f"item-{i}": build(i) for i in range(items)}}
+    current = copy.deepcopy(previous)
+    current["items"][f"item-{items // 2}"]["name"] = "changed"
+    return previous, current
+
+
+def measure(label: str, extract: Callable[..., list], *args: Any) -> float:
+    start = time.perf_counter()
+    diffs = extract(*args)
+    duration = time.perf_counter() - start
+    print(f"  {label:<32} {duration:.2f}s ({len(diffs)} diffs)")
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5_000)
+    args = parser.parse_args()
+
+    for name, build in (("saas files", saas_file), ("namespaces", namespace)):
+        previous, current = desired_states(args.items, build)
+        print(f"{name}: {args.items}")
+        durations = {
+            backend: measure(
+                f"{backend.value}",
+                extract_diffs_with_timeout,
+                functools.partial(extract_diffs, backend=backend),
+                previous,
+                current,
+                600,
+            )
+            for backend in DiffBackend
+        }
+        speedup = durations[DiffBackend.DEEPDIFF] / durations[DiffBackend.MERKLE]
+        print(f"  {'speedup':<32} {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
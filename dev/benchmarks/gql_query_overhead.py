@@ -0,0 +1,79 @@
+"""Client side overhead of GqlApi.query.
+
+Runs a generated query definition through GqlApi against a transport that
+answers without any network I/O, so the measured time is what GqlApi and the
+gql client spend per query. Compares parsing and printing the document on
+every call, as GqlApi used to, with the cached ParsedQuery.
+
+    uv run python dev/benchmarks/gql_query_overhead.py --queries 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from types import MethodType
+from typing import TYPE_CHECKING, Any
+
+from gql.transport import Transport
+from graphql import ExecutionResult
+
+from reconcile.gql_definitions.common.namespaces import DEFINITION
+from reconcile.utils import gql
+
+if TYPE_CHECKING:
+    from gql import GraphQLRequest
+
+
+class NoopTransport(Transport):
+    def execute(self, request: GraphQLRequest, *args: Any, **kwargs: Any) -> Any:
+        # the payload is what the HTTP transport sends
+        assert request.payload
+        return ExecutionResult(data={"namespaces": []})
+
+    def connect(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def uncached_execute(
+    self: gql.GqlApi, query: str, variables: dict[str, Any] | None
+) -> dict[str, Any]:
+    request = gql.gql(query)
+    if variables:
+        request.variable_values = variables
+    return self.client.execute(request, get_execution_result=True).formatted
+
+
+def measure(api: gql.GqlApi, queries: int) -> float:
+    start = time.perf_counter()
+    for _ in range(queries):
+        api.query(DEFINITION)
+    return (time.perf_counter() - start) / queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    api = gql.GqlApi("http://localhost/graphql")
+    api.client = gql.Client(transport=NoopTransport())
+
+    api._execute = MethodType(uncached_execute, api)  # type: ignore[method-assign]
+    uncached = measure(api, args.queries)
+    del api._execute
+
+    gql.warm_up_document_cache()
+    cached = measure(api, args.queries)
+
+    print(f"queries:               {args.queries}")
+    print(f"parse/print per query: {uncached * 1e6:8.1f} us/query")
+    print(f"cached document:       {cached * 1e6:8.1f} us/query")
+    print(f"speedup:               {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""CPU and memory benchmark for OpenshiftResource.annotate/sha256sum.
+
+Compares the copy on write canonicalization against the previous approach
+of deep copying the body for canonicalization. annotate() still deep copies
+the annotated body, so the previous approach is emulated by one additional
+deep copy, which allocates the same copies the old implementation did.
+
+    uv run python dev/benchmarks/openshift_resource_annotate.py --keys 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from reconcile.utils.openshift_resource import OpenshiftResource as OR
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def config_map(keys: int, value_size: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": "large", "labels": {"app": "app"}},
+        "data": {f"key-{i}": "x" * value_size for i in range(keys)},
+    }
+
+
+def deepcopy_annotate(resource: OR) -> OR:
+    copy.deepcopy(resource.body)
+    return resource.annotate()
+
+
+def deepcopy_sha256sum(resource: OR) -> str:
+    return deepcopy_annotate(resource).body["metadata"]["annotations"][
+        "qontract.sha256sum"
+    ]
+
+
+def measure(name: str, func: Callable[[], Any], iterations: int) -> None:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    seconds = (time.perf_counter() - start) / iterations
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<28} {seconds * 1000:8.2f} ms {peak / 1024 / 1024:8.2f} MiB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--value-size", type=int, default=512)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    resource = OR(config_map(args.keys, args.value_size), "bench", "1")
+    measure("annotate", resource.annotate, args.iterations)
+    measure("annotate (deepcopy)", lambda: deepcopy_annotate(resource), args.iterations)
+    measure("sha256sum", resource.sha256sum, args.iterations)
+    measure(
+        "sha256sum (deepcopy)", lambda: deepcopy_sha256sum(resource), args.iterations
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Microbenchmark for three_way_diff_using_hash.
+
+Builds synthetic current/desired resource pairs the way they look after a
+fetch from the cluster and compares three_way_diff_using_hash against
+always building the JSON patch of the normalized objects. ConfigMaps
+normalize to the desired object and take the equality short-circuit,
+Deployments carry a status and defaulted fields and always need the patch.
+
+    uv run python dev/benchmarks/three_way_diff.py --objects 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING, Any
+
+import jsonpatch  # type: ignore
+
+from reconcile.utils.openshift_resource import OpenshiftResource as OR
+from reconcile.utils.three_way_diff_strategy import (
+    is_valid_change,
+    normalize_object,
+    three_way_diff_using_hash,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def config_map(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": f"config-map-{i}", "labels": {"app": f"app-{i}"}},
+        "data": {f"key-{k}": f"value-{i}-{k}" for k in range(10)},
+    }
+
+
+def deployment(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": f"deployment-{i}", "labels": {"app": f"app-{i}"}},
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": f"app-{i}"}},
+            "template": {
+                "metadata": {"labels": {"app": f"app-{i}"}},
+                "spec": {
+                    "containers": [
+                        {
+                            "name": "app",
+                            "image": f"quay.io/org/app:{i:08x}",
+                            "env": [
+                                {"name": "A", "value": "a"},
+                                {"name": "B", "value": "b"},
+                            ],
+                        }
+                    ]
+                },
+            },
+        },
+    }
+
+
+def pairs(objects: int, body: Callable[[int], dict[str, Any]]) -> list[tuple[OR, OR]]:
+    result = []
+    for i in range(objects):
+        desired = OR(body(i), "bench", "1")
+        current = desired.annotate()
+        current.body["metadata"] |= {
+            "namespace": "ns",
+            "uid": f"uid-{i}",
+            "resourceVersion": str(i),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+        }
+        if current.body["kind"] == "Deployment":
+            current.body["spec"]["revisionHistoryLimit"] = 10
+            current.body["status"] = {"replicas": 3, "readyReplicas": 3}
+        result.append((current, desired))
+    return result
+
+
+def patch_only(c_item: OR, d_item: OR) -> bool:
+    if c_item.body["metadata"]["annotations"]["qontract.sha256sum"] != (
+        d_item.sha256sum()
+    ):
+        return False
+    current = normalize_object(c_item)
+    desired = normalize_object(d_item)
+    patch = jsonpatch.JsonPatch.from_diff(current.body, desired.body)
+    return not any(is_valid_change(current, desired, p) for p in patch.patch)
+
+
+def compare_all(items: list[tuple[OR, OR]], equal: Callable[[OR, OR], bool]) -> float:
+    start = time.perf_counter()
+    for current, desired in items:
+        assert equal(current, desired)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"objects per kind:            {args.objects}")
+    for kind, body in (("ConfigMap", config_map), ("Deployment", deployment)):
+        items = pairs(args.objects, body)
+        patch = compare_all(items, patch_only)
+        diff = compare_all(items, three_way_diff_using_hash)
+        print(f"{kind + ' patch only:':<29}{patch:.2f}s")
+        print(f"{kind + ' three way diff:':<29}{diff:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,23 +8,31 @@ Two-Tier Cache Architecture (ADR-016):
 - Tier 2: Redis/Valkey backend (JSON serialization for persistence)
 
 Cache backends store string values. Callers are responsible for serialization/deserialization.
+With a CacheCodec, get_obj/set_obj store binary (optionally compressed) values instead.
 
 Singleton Pattern:
 - CacheBackend.get_instance() provides thread-safe singleton per backend type
 - Ensures in-memory cache is shared across all users in the same process
+
+Single-Flight:
+- CacheBackend.single_flight() / get_or_set_obj() coalesce concurrent cache misses
+  across processes: one caller computes the value, the others poll for it
 """
 
 from __future__ import annotations
 
 import threading
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from cachetools import TTLCache
+from prometheus_client import Counter
 from pydantic import BaseModel
 from qontract_utils.json_utils import json_dumps, json_loads
 
+from qontract_api.cache.codec import CacheDecodeError
 from qontract_api.logger import get_logger
 
 if TYPE_CHECKING:
@@ -32,9 +40,18 @@ if TYPE_CHECKING:
 
     from redis import Redis
 
+    from qontract_api.cache.codec import CacheCodec
+
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+V = TypeVar("V")
+
+single_flight_calls = Counter(
+    "qontract_api_cache_single_flight_total",
+    "Single-flight cache misses by role (leader computes, follower waits)",
+    labelnames=["role"],
+)
 
 
 class CacheBackend(ABC):
@@ -143,6 +160,7 @@ class CacheBackend(ABC):
         deserializer: Callable[[str], Any] | None = None,
         memory_max_size: int = 1000,
         memory_ttl: int = 60,
+        codec: CacheCodec | None = None,
     ) -> None:
         """Initialize cache backend with two-tier caching.
 
@@ -151,10 +169,27 @@ class CacheBackend(ABC):
             deserializer: Function to deserialize strings to objects (default: json_loads)
             memory_max_size: Max items in memory cache (LRU eviction). 0 = disabled.
             memory_ttl: Memory cache TTL in seconds
+            codec: Binary codec for get_obj/set_obj (None = serializer/deserializer),
+                requires a backend implementing get_bytes/set_bytes
+
+        Raises:
+            ValueError: If a codec is given but the backend doesn't implement
+                get_bytes/set_bytes
         """
+        if codec is not None and (
+            type(self).get_bytes is CacheBackend.get_bytes
+            or type(self).set_bytes is CacheBackend.set_bytes
+        ):
+            msg = (
+                f"{type(self).__name__} doesn't support codecs (no get_bytes/set_bytes)"
+            )
+            raise ValueError(msg)
         self.serializer = serializer or json_dumps
         self.deserializer = deserializer or json_loads
+        self.codec = codec
         self._memory_cache: TTLCache[str, Any] | None = None
+        # TTLCache is not thread-safe (concurrent fetches share the memory tier)
+        self._memory_lock = threading.Lock()
 
         # Tier 1: In-memory cache (Python objects, no serialization overhead)
         if memory_max_size > 0:
@@ -186,6 +221,27 @@ class CacheBackend(ABC):
         """
         ...
 
+    def get_bytes(self, key: str) -> bytes | None:
+        """Get binary value from cache (required for codecs, checked in __init__).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes or None if key doesn't exist
+        """
+        raise NotImplementedError
+
+    def set_bytes(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        """Set binary value in cache with optional TTL (required for codecs, checked in __init__).
+
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time-to-live in seconds (None = no expiration)
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _delete_from_backend(self, key: str) -> None:
         """Delete key from backend storage (Redis/Valkey).
@@ -203,7 +259,8 @@ class CacheBackend(ABC):
         """
         # Tier 1: Delete from memory cache
         if self._memory_cache is not None:
-            self._memory_cache.pop(key, None)
+            with self._memory_lock:
+                self._memory_cache.pop(key, None)
 
         # Tier 2: Delete from Redis backend
         self._delete_from_backend(key)
@@ -246,7 +303,8 @@ class CacheBackend(ABC):
         Does not affect Redis cache (Tier 2).
         """
         if self._memory_cache is not None:
-            self._memory_cache.clear()
+            with self._memory_lock:
+                self._memory_cache.clear()
 
     def get_obj(self, key: str, cls: type[T]) -> T | None:
         """Get object from cache with two-tier lookup (memory → Redis).
@@ -265,21 +323,40 @@ class CacheBackend(ABC):
         """
         # Tier 1: Memory cache (99% hit rate expected - FAST!)
         # TODO: https://github.com/app-sre/qontract-reconcile/pull/5332#discussion_r2608966256
-        if self._memory_cache is not None and key in self._memory_cache:
-            return self._memory_cache[key]
+        if self._memory_cache is not None:
+            with self._memory_lock:
+                # get() instead of "in" + [] - the item may expire in between
+                obj = self._memory_cache.get(key)
+            if obj is not None:
+                return obj
 
-        # Tier 2: Redis/Valkey cache (JSON deserialization)
+        # Tier 2: Redis/Valkey cache (JSON deserialization or codec)
         try:
-            value = self.get(key)
-            if value is None:
-                return None
+            if self.codec is not None:
+                encoded = self.get_bytes(key)
+                if encoded is None:
+                    return None
+
+                # Other codec, legacy JSON string or changed model -> cache miss
+                try:
+                    obj = self.codec.decode(encoded, cls)
+                except CacheDecodeError as e:
+                    logger.warning(
+                        f"Ignoring undecodable cache value: {e}", cache_key=key
+                    )
+                    return None
+            else:
+                value = self.get(key)
+                if value is None:
+                    return None
 
-            data = self.deserializer(value)
-            obj = cls.model_validate(data)
+                data = self.deserializer(value)
+                obj = cls.model_validate(data)
 
             # Warm memory cache for next access
             if self._memory_cache is not None:
-                self._memory_cache[key] = obj
+                with self._memory_lock:
+                    self._memory_cache[key] = obj
 
             return obj
 
@@ -304,12 +381,16 @@ class CacheBackend(ABC):
         """
         # Tier 1: Memory cache (Python object, no serialization)
         if self._memory_cache is not None:
-            self._memory_cache[key] = value
+            with self._memory_lock:
+                self._memory_cache[key] = value
 
-        # Tier 2: Redis cache (JSON serialization for persistence)
+        # Tier 2: Redis cache (JSON serialization or codec for persistence)
         try:
-            serialized = self.serializer(value)
-            self.set(key, serialized, ttl)
+            if self.codec is not None:
+                self.set_bytes(key, self.codec.encode(value), ttl)
+            else:
+                serialized = self.serializer(value)
+                self.set(key, serialized, ttl)
         except (ConnectionError, TimeoutError) as e:
             logger.warning(
                 f"Cache backend unavailable, memory-only mode: {e}",
@@ -347,3 +428,107 @@ class CacheBackend(ABC):
                 cache.set("my-resource", modified_value)
         """
         ...
+
+    @contextmanager
+    def try_lock(self, key: str, timeout: float = 300) -> Generator[bool]:
+        """Non-blocking variant of lock().
+
+        Backends without non-blocking locks fall back to lock(), i.e. wait for
+        the lock and always yield True.
+
+        Args:
+            key: Cache key to lock (same key used for get/set)
+            timeout: Lock timeout in seconds
+
+        Yields:
+            True if the lock was acquired, False if another process holds it
+        """
+        with self.lock(key, timeout=timeout):
+            yield True
+
+    def single_flight(
+        self,
+        key: str,
+        read: Callable[[], V | None],
+        compute: Callable[[], V],
+        timeout: float = 300,
+        poll_interval: float = 0.05,
+    ) -> V:
+        """Coalesce concurrent cache misses of a key across processes.
+
+        The first caller acquires the lock, checks the cache again and runs
+        compute(), which must populate the cache. Concurrent callers don't queue
+        on the lock but poll read() (with backoff up to 1s) until the value
+        shows up. If the lock is released without a value (compute() failed),
+        the next polling caller takes over.
+
+        Args:
+            key: Cache key (the lock is derived from it)
+            read: Reads the cached value, None on a miss
+            compute: Computes and caches the value (called with the lock held)
+            timeout: Lock timeout in seconds
+            poll_interval: Initial interval for polling read() while waiting
+
+        Returns:
+            Cached or computed value
+
+        Example:
+            users = cache.single_flight(
+                "slack:workspace:users",
+                read=lambda: cache.get_obj("slack:workspace:users", CachedUsers),
+                compute=fetch_and_cache_users,
+            )
+        """
+        while True:
+            with self.try_lock(key, timeout=timeout) as acquired:
+                if acquired:
+                    # Double-check after lock
+                    if (value := read()) is not None:
+                        return value
+                    single_flight_calls.labels(role="leader").inc()
+                    return compute()
+
+            # Another process computes the value, wait for it
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 1.0)
+            if (value := read()) is not None:
+                single_flight_calls.labels(role="follower").inc()
+                return value
+
+    def get_or_set_obj(
+        self,
+        key: str,
+        cls: type[T],
+        compute: Callable[[], T],
+        ttl: int | None = None,
+    ) -> T:
+        """Get object from cache, computing it once across processes on a miss.
+
+        Args:
+            key: Cache key
+            cls: Pydantic BaseModel class to deserialize into
+            compute: Computes the object on a cache miss (e.g. API call)
+            ttl: Time-to-live in seconds (None = no expiration)
+
+        Returns:
+            Cached or computed Pydantic model instance
+
+        Example:
+            teams = cache.get_or_set_obj(
+                "glitchtip:instance:org:teams",
+                CachedTeams,
+                lambda: CachedTeams(items=api.teams("org")),
+                ttl=300,
+            )
+        """
+        if (cached := self.get_obj(key, cls)) is not None:
+            return cached
+
+        def compute_and_set() -> T:
+            value = compute()
+            self.set_obj(key, value, ttl)
+            return value
+
+        return self.single_flight(
+            key, read=lambda: self.get_obj(key, cls), compute=compute_and_set
+        )
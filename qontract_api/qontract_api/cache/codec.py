@@ -0,0 +1,140 @@
+"""Binary codecs for objects stored in the cache backend (Tier 2).
+
+The default CacheBackend path stores JSON strings (json_dumps) and parses
+them into a dict before validating it with model_validate on every read.
+Cached collections (Slack users, namespace names, ...) are several MB and
+read by every task, so a codec can be configured instead:
+
+- json: pydantic-core JSON bytes, parsed and validated in one pass
+  (model_validate_json) without building an intermediate dict
+
+Payloads at or above the compression threshold are compressed with zstd.
+Every value starts with a two byte header (codec tag, compression flag), so
+values written by another codec or the legacy string path are detected and
+treated as cache misses instead of being misread.
+
+There is no trusted (unvalidated) codec on purpose: restoring models with
+pickle or model_construct is slower than pydantic-core validation, see
+dev/benchmarks/cache_codecs.py.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from compression import zstd
+from typing import Any, ClassVar, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
+
+T = TypeVar("T", bound=BaseModel)
+
+_RAW = b"0"
+_ZSTD = b"z"
+
+
+class CacheDecodeError(Exception):
+    """Cached value cannot be decoded by the configured codec."""
+
+
+class CacheCodec(ABC):
+    """Serialize cached objects to bytes, compressing large payloads.
+
+    Args:
+        compression_threshold: Compress payloads of at least this many bytes
+            with zstd (0 = disabled)
+        compression_level: zstd compression level
+    """
+
+    # Single byte identifying the codec in the value header
+    tag: ClassVar[bytes]
+
+    def __init__(
+        self, compression_threshold: int = 0, compression_level: int = 3
+    ) -> None:
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize an object to bytes (without header)."""
+
+    @abstractmethod
+    def loads(self, payload: bytes, cls: type[T]) -> T:
+        """Deserialize bytes (without header) into an instance of cls.
+
+        Raises:
+            CacheDecodeError: If the payload does not match cls
+        """
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize an object and compress it if it is large enough."""
+        payload = self.dumps(value)
+        if self.compression_threshold and len(payload) >= self.compression_threshold:
+            return (
+                self.tag + _ZSTD + zstd.compress(payload, level=self.compression_level)
+            )
+        return self.tag + _RAW + payload
+
+    def decode(self, data: bytes, cls: type[T]) -> T:
+        """Decompress and deserialize a value written by encode().
+
+        Raises:
+            CacheDecodeError: If the value was written by another codec or
+                does not match cls
+        """
+        if data[:1] != self.tag:
+            msg = f"Value was not written by the {type(self).__name__}"
+            raise CacheDecodeError(msg)
+        flag, payload = data[1:2], data[2:]
+        if flag == _ZSTD:
+            try:
+                payload = zstd.decompress(payload)
+            except zstd.ZstdError as e:
+                raise CacheDecodeError(str(e)) from e
+        elif flag != _RAW:
+            msg = f"Unknown compression flag {flag!r}"
+            raise CacheDecodeError(msg)
+        return self.loads(payload, cls)
+
+
+class JsonCodec(CacheCodec):
+    """JSON bytes via pydantic-core, validated on read."""
+
+    tag = b"j"
+
+    def dumps(self, value: Any) -> bytes:  # noqa: PLR6301
+        return to_json(value, by_alias=True)
+
+    def loads(self, payload: bytes, cls: type[T]) -> T:  # noqa: PLR6301
+        try:
+            return cls.model_validate_json(payload)
+        except ValidationError as e:
+            raise CacheDecodeError(str(e)) from e
+
+
+_CODECS: dict[str, type[CacheCodec]] = {
+    "json": JsonCodec,
+}
+
+
+def get_codec(name: str, compression_threshold: int = 0) -> CacheCodec | None:
+    """Create the cache codec configured by name.
+
+    Args:
+        name: Codec name ("json"), empty for the legacy JSON string format
+            without codec
+        compression_threshold: Compress payloads of at least this many bytes
+
+    Returns:
+        CacheCodec instance or None for the legacy format
+
+    Raises:
+        ValueError: If the codec is not supported
+    """
+    if not name:
+        return None
+    if name not in _CODECS:
+        msg = f"Unsupported cache codec: {name}"
+        raise ValueError(msg)
+    return _CODECS[name](compression_threshold=compression_threshold)
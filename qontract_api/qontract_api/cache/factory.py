@@ -7,6 +7,7 @@ Uses CacheBackend.get_instance() factory pattern.
 from redis import Redis
 
 from qontract_api.cache.base import CacheBackend
+from qontract_api.cache.codec import get_codec
 from qontract_api.config import settings
 
 
@@ -36,11 +37,18 @@ def get_cache() -> CacheBackend:
             encoding="utf-8",
             decode_responses=True,
         )
+        codec = get_codec(
+            settings.cache_codec,
+            compression_threshold=settings.cache_compression_threshold,
+        )
         return CacheBackend.get_instance(
             backend_type="redis",
             client=client,
             memory_max_size=settings.cache_memory_max_size,
             memory_ttl=settings.cache_memory_ttl,
+            codec=codec,
+            # Codec values are bytes, they must not be decoded as UTF-8
+            binary_client=Redis.from_url(settings.cache_broker_url) if codec else None,
         )
     msg = f"Unsupported cache backend: {settings.cache_backend}"
     raise ValueError(msg)
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
     from redis import Redis
 
+    from qontract_api.cache.codec import CacheCodec
+
 
 class RedisCacheBackend(CacheBackend):
     """Redis/Valkey cache backend with two-tier caching (synchronous).
@@ -21,6 +23,7 @@ class RedisCacheBackend(CacheBackend):
     - Tier 2: Redis/Valkey (JSON strings, persistent/shared)
 
     Stores values as strings. Caller is responsible for serialization/deserialization.
+    With a codec, get_obj/set_obj store bytes via the binary client instead.
     """
 
     def __init__(
@@ -30,6 +33,8 @@ class RedisCacheBackend(CacheBackend):
         deserializer: Callable[[str], Any] | None = None,
         memory_max_size: int = 1000,
         memory_ttl: int = 60,
+        codec: CacheCodec | None = None,
+        binary_client: Redis | None = None,
     ) -> None:
         """Initialize Redis/Valkey cache backend with two-tier caching.
 
@@ -39,14 +44,19 @@ class RedisCacheBackend(CacheBackend):
             deserializer: Function to deserialize strings to objects (default: json_loads)
             memory_max_size: Max items in memory cache (LRU eviction). 0 = disabled.
             memory_ttl: Memory cache TTL in seconds
+            codec: Binary codec for get_obj/set_obj (None = serializer/deserializer)
+            binary_client: Client without decode_responses for binary values
+                (default: client)
         """
         super().__init__(
             serializer=serializer,
             deserializer=deserializer,
             memory_max_size=memory_max_size,
             memory_ttl=memory_ttl,
+            codec=codec,
         )
         self._client = client
+        self._binary_client = binary_client or client
 
     def get(self, key: str) -> str | None:
         """Get value from cache as string.
@@ -73,6 +83,31 @@ class RedisCacheBackend(CacheBackend):
         else:
             self.client.set(key, value)
 
+    def get_bytes(self, key: str) -> bytes | None:
+        """Get binary value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes or None if key doesn't exist
+        """
+        value = self.binary_client.get(key)
+        return bytes(value) if value else None
+
+    def set_bytes(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        """Set binary value in cache with optional TTL.
+
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time-to-live in seconds (None = no expiration)
+        """
+        if ttl:
+            self.binary_client.setex(key, ttl, value)
+        else:
+            self.binary_client.set(key, value)
+
     def _delete_from_backend(self, key: str) -> None:
         """Delete key from Redis backend storage.
 
@@ -112,12 +147,19 @@ class RedisCacheBackend(CacheBackend):
         closed automatically. Explicit close for cleanup.
         """
         self.client.close()
+        if self._binary_client is not self._client:
+            self._binary_client.close()
 
     @property
     def client(self) -> Redis:
         """Return the underlying Redis client."""
         return self._client
 
+    @property
+    def binary_client(self) -> Redis:
+        """Return the Redis client for binary values (no response decoding)."""
+        return self._binary_client
+
     @contextmanager
     def lock(self, key: str, timeout: float = 300) -> Generator[None]:
         """Distributed lock using Valkey's native lock (Lua scripts + watch-dog).
@@ -151,3 +193,27 @@ class RedisCacheBackend(CacheBackend):
             # Lock may have expired - ignore release errors
             with suppress(Exception):
                 lock.release()
+
+    @contextmanager
+    def try_lock(self, key: str, timeout: float = 300) -> Generator[bool]:
+        """Non-blocking distributed lock, yields False if the lock is held.
+
+        Args:
+            key: Lock key
+            timeout: Lock timeout in seconds
+
+        Yields:
+            True if the lock was acquired, False otherwise
+        """
+        lock = self.client.lock(f"{key}:lock", timeout=timeout, blocking=False)
+
+        if not lock.acquire():
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            # Lock may have expired - ignore release errors
+            with suppress(Exception):
+                lock.release()
@@ -0,0 +1,246 @@
+"""Versioned snapshots of cached collections (users, usergroups, namespaces, ...).
+
+A snapshot is a whole collection fetched from an external API, stored in the
+CacheBackend under a per-version data key. A small version key points to the
+current data key:
+
+    slack:<workspace>:users:version -> 1718000000000000000
+    slack:<workspace>:users:1718000000000000000 -> CachedUsers(...)
+
+Data keys are immutable, so the two-tier cache can never serve an outdated
+snapshot for the current version. On top of that, each worker process keeps
+the last snapshot it saw per key and only deserializes the data key again
+once the version changed (change-driven invalidation).
+
+Writes apply deltas to the current snapshot and publish it as a new version
+instead of deleting the cache, so the next task doesn't re-download the whole
+collection. With a refresh-ahead ratio, snapshots older than that fraction of
+their TTL are served stale while a background thread re-fetches them.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from prometheus_client import Counter, Histogram
+from pydantic import BaseModel
+
+from qontract_api.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from qontract_api.cache.base import CacheBackend
+
+logger = get_logger(__name__)
+
+snapshot_lookups = Counter(
+    "qontract_api_cache_snapshot_lookups_total",
+    "Snapshot lookups by result (local, remote, stale, miss)",
+    labelnames=["entity", "result"],
+)
+
+snapshot_writes = Counter(
+    "qontract_api_cache_snapshot_writes_total",
+    "Snapshot versions written by kind (fetch, refresh, delta)",
+    labelnames=["entity", "kind"],
+)
+
+snapshot_fetch_duration = Histogram(
+    "qontract_api_cache_snapshot_fetch_duration_seconds",
+    "Duration of fetching a full snapshot from the source API",
+    labelnames=["entity"],
+)
+
+
+class Snapshot(BaseModel, frozen=True):
+    """Base model for cached collections stored as versioned snapshots."""
+
+    version: int = 0
+    # unix timestamp of the last full fetch, delta updates keep it
+    fetched_at: float = 0.0
+
+
+# Worker-local snapshots by cache key (shared by all clients of a process)
+_local_snapshots: dict[str, Snapshot] = {}
+# Cache keys with a background refresh in flight
+_refreshing: set[str] = set()
+_local_lock = threading.Lock()
+
+
+def clear_local_snapshots() -> None:
+    """Forget all worker-local snapshots - primarily for testing."""
+    with _local_lock:
+        _local_snapshots.clear()
+
+
+class SnapshotCache[S: Snapshot]:
+    """Versioned snapshot of one cached collection.
+
+    Args:
+        cache: Cache backend
+        key: Cache key of the collection (version and data keys derive from it)
+        model: Snapshot model to deserialize into
+        ttl: TTL of the snapshot in seconds
+        fetch: Fetches the full collection from the source API
+        entity: Entity name for metrics (e.g. "slack_users")
+        refresh_ahead_ratio: Fraction of the TTL after which the snapshot is
+            served stale and refreshed in the background (0 = disabled)
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: CacheBackend,
+        key: str,
+        model: type[S],
+        ttl: int,
+        fetch: Callable[[], S],
+        entity: str,
+        refresh_ahead_ratio: float = 0.0,
+    ) -> None:
+        self.cache = cache
+        self.key = key
+        self.model = model
+        self.ttl = ttl
+        self.fetch = fetch
+        self.entity = entity
+        self.refresh_after = ttl * refresh_ahead_ratio if refresh_ahead_ratio else None
+
+    def _version_key(self) -> str:
+        return f"{self.key}:version"
+
+    def _data_key(self, version: int) -> str:
+        return f"{self.key}:{version}"
+
+    def _current_version(self) -> int | None:
+        try:
+            value = self.cache.get(self._version_key())
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning(f"Cache backend unavailable: {e}", cache_key=self.key)
+            return None
+        return int(value) if value else None
+
+    def _load(self, version: int) -> tuple[S | None, str]:
+        """Load a snapshot version, worker-local first. Returns (snapshot, tier)."""
+        with _local_lock:
+            local = _local_snapshots.get(self.key)
+        if local is not None and local.version == version:
+            return local, "local"  # type: ignore[return-value]
+        snapshot = self.cache.get_obj(self._data_key(version), self.model)
+        if snapshot is not None:
+            with _local_lock:
+                _local_snapshots[self.key] = snapshot
+        return snapshot, "remote"
+
+    def _store(self, snapshot: S, previous_version: int | None, ttl: int) -> S:
+        """Publish a snapshot as a new version. Requires the lock to be held."""
+        version = max(time.time_ns(), (previous_version or 0) + 1)
+        snapshot = snapshot.model_copy(update={"version": version})
+        self.cache.set_obj(self._data_key(version), snapshot, ttl)
+        self.cache.set(self._version_key(), str(version), ttl)
+        if previous_version is not None:
+            self.cache.delete(self._data_key(previous_version))
+        with _local_lock:
+            _local_snapshots[self.key] = snapshot
+        return snapshot
+
+    def _fetch_and_store(self, previous_version: int | None, kind: str) -> S:
+        """Fetch the full collection and publish it. Requires the lock to be held."""
+        start = time.monotonic()
+        snapshot = self.fetch().model_copy(update={"fetched_at": time.time()})
+        snapshot_fetch_duration.labels(entity=self.entity).observe(
+            time.monotonic() - start
+        )
+        snapshot_writes.labels(entity=self.entity, kind=kind).inc()
+        return self._store(snapshot, previous_version, self.ttl)
+
+    def _is_stale(self, snapshot: S) -> bool:
+        return (
+            self.refresh_after is not None
+            and time.time() - snapshot.fetched_at > self.refresh_after
+        )
+
+    def _refresh(self, stale_version: int) -> None:
+        try:
+            with self.cache.lock(self.key):
+                # another worker may have refreshed or updated it meanwhile
+                if self._current_version() == stale_version:
+                    self._fetch_and_store(stale_version, kind="refresh")
+        except Exception:
+            logger.exception("Background snapshot refresh failed", cache_key=self.key)
+        finally:
+            with _local_lock:
+                _refreshing.discard(self.key)
+
+    def _refresh_in_background(self, stale_version: int) -> None:
+        with _local_lock:
+            if self.key in _refreshing:
+                return
+            _refreshing.add(self.key)
+        threading.Thread(
+            target=self._refresh,
+            args=(stale_version,),
+            name=f"snapshot-refresh-{self.entity}",
+            daemon=True,
+        ).start()
+
+    def get(self) -> S:
+        """Get the current snapshot, fetch it on a miss (single-flight)."""
+        # Try cache first (no lock for reads)
+        if (version := self._current_version()) is not None:
+            snapshot, tier = self._load(version)
+            if snapshot is not None:
+                if self._is_stale(snapshot):
+                    tier = "stale"
+                    self._refresh_in_background(version)
+                snapshot_lookups.labels(entity=self.entity, result=tier).inc()
+                return snapshot
+
+        # Concurrent misses (of all workers) fetch the collection only once
+        return self.cache.single_flight(self.key, read=self._read, compute=self._fetch)
+
+    def _read(self) -> S | None:
+        if (version := self._current_version()) is None:
+            return None
+        snapshot, tier = self._load(version)
+        if snapshot is not None:
+            snapshot_lookups.labels(entity=self.entity, result=tier).inc()
+        return snapshot
+
+    def _fetch(self) -> S:
+        """Fetch and publish a missing snapshot. Requires the lock to be held."""
+        snapshot_lookups.labels(entity=self.entity, result="miss").inc()
+        return self._fetch_and_store(self._current_version(), kind="fetch")
+
+    def update(self, apply: Callable[[S], S]) -> None:
+        """Apply a delta to the current snapshot and publish it as a new version.
+
+        Nothing is done if there is no current snapshot, the next read fetches
+        the full collection anyway. The new version expires with the last full
+        fetch, so deltas never keep a snapshot alive beyond its TTL.
+        """
+        try:
+            with self.cache.lock(self.key):
+                if (version := self._current_version()) is None:
+                    return
+                snapshot, _ = self._load(version)
+                if snapshot is None:
+                    return
+                remaining_ttl = math.ceil(
+                    self.ttl - (time.time() - snapshot.fetched_at)
+                )
+                if remaining_ttl <= 0:
+                    # expired, the next read fetches the full collection
+                    self.cache.delete(self._version_key())
+                    return
+                updated = apply(snapshot).model_copy(
+                    update={"fetched_at": snapshot.fetched_at}
+                )
+                self._store(updated, version, remaining_ttl)
+                snapshot_writes.labels(entity=self.entity, kind="delta").inc()
+        except RuntimeError as e:
+            logger.warning(f"Could not acquire lock to update {self.key}: {e}")
@@ -264,6 +264,11 @@ class GlitchtipSettings(BaseModel):
         default=60 * 60,
         description="Glitchtip organization/team users cache TTL in seconds (one hour)",
     )
+    max_concurrent_requests: int = Field(
+        default=8,
+        description="Maximum number of concurrent Glitchtip API fetches when "
+        "warming the cache of an instance (per-org and per-team collections)",
+    )
 
 
 class KubernetesSettings(BaseModel):
@@ -351,6 +356,22 @@ class EventSettings(BaseModel):
         default="qontract-api-subscriber",
         description="Redis consumer group name for stream subscribers",
     )
+    buffer_size: int = Field(
+        default=10000,
+        description="Maximum number of events buffered per process before new events are dropped",
+    )
+    batch_size: int = Field(
+        default=100,
+        description="Number of buffered events that triggers a pipelined flush to Redis",
+    )
+    flush_interval: float = Field(
+        default=0.5,
+        description="Maximum time (seconds) an event waits in the buffer before it is flushed",
+    )
+    flush_timeout: float = Field(
+        default=5.0,
+        description="Maximum time (seconds) to wait for buffered events on task completion and shutdown",
+    )
 
 
 class Settings(BaseSettings):
@@ -431,6 +452,18 @@ class Settings(BaseSettings):
         default=60,
         description="In-memory cache TTL in seconds (time-based expiration)",
     )
+    cache_codec: str = Field(
+        default="",
+        description="Codec for cached objects: json (binary, optionally compressed). Empty keeps the legacy JSON string format. All workers must use the same codec.",
+    )
+    cache_compression_threshold: int = Field(
+        default=65536,
+        description="Compress cached objects of at least this many bytes with zstd (requires cache_codec). Set to 0 to disable compression.",
+    )
+    cache_refresh_ahead_ratio: float = Field(
+        default=0.0,
+        description="Fraction of a snapshot TTL (e.g. Slack users) after which it is served stale while being refreshed in the background. Set to 0 to disable.",
+    )
 
     # Celery
     celery_broker_url: str = Field(
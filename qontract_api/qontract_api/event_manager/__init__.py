@@ -1,9 +1,15 @@
 """Event manager for qontract-api."""
 
 from qontract_api.event_manager._base import EventManager
-from qontract_api.event_manager._factory import get_event_manager
+from qontract_api.event_manager._factory import (
+    flush_event_manager,
+    get_event_manager,
+)
+from qontract_api.event_manager._publisher import BufferedPublisher
 
 __all__ = [
+    "BufferedPublisher",
     "EventManager",
+    "flush_event_manager",
     "get_event_manager",
 ]
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 import structlog
 from qontract_utils.events import Event, RedisBroker
 
+from qontract_api.event_manager._publisher import BufferedPublisher
+
 if TYPE_CHECKING:
     from qontract_api.config import Settings
 
@@ -16,12 +18,18 @@ class EventManager:
     """Manages event publishing for qontract-api.
 
     Encapsulates the event publisher lifecycle and configuration.
-    Publishing failures are logged but never propagated to the caller.
+    Events are buffered and written in batches over a long-lived connection,
+    see BufferedPublisher. Publishing failures are logged but never
+    propagated to the caller.
     """
 
-    def __init__(self, publisher: RedisBroker, stream: str) -> None:
+    def __init__(
+        self,
+        publisher: BufferedPublisher,
+        flush_timeout: float | None = None,
+    ) -> None:
         self._publisher = publisher
-        self._stream = stream
+        self._flush_timeout = flush_timeout
 
     def publish_event(self, event: Event) -> None:
         """Publish a single event. Failures are logged but do not propagate.
@@ -31,11 +39,19 @@ class EventManager:
         """
         context = structlog.contextvars.get_merged_contextvars(structlog.get_logger())
         headers = {k: str(v) for k, v in context.items()} if context else None
-        with self._publisher as publisher:
-            try:
-                publisher.publish(event, stream=self._stream, headers=headers)
-            except Exception:
-                log.exception(f"Failed to publish event {event.type}")
+        try:
+            self._publisher.publish(event, headers=headers)
+        except Exception:
+            log.exception(f"Failed to publish event {event.type}")
+
+    def flush(self) -> None:
+        """Wait (up to the flush timeout) until all buffered events are published."""
+        if not self._publisher.flush(self._flush_timeout):
+            log.warning("Timed out waiting for buffered events to be published")
+
+    def close(self) -> None:
+        """Publish the remaining buffered events and disconnect."""
+        self._publisher.close(self._flush_timeout)
 
     @classmethod
     def from_config(cls, settings: Settings) -> EventManager | None:
@@ -51,5 +67,11 @@ class EventManager:
                 "EventManager will not be initialized."
             )
             return None
-        publisher = RedisBroker(settings.cache_broker_url)
-        return cls(publisher=publisher, stream=settings.events.stream)
+        publisher = BufferedPublisher(
+            RedisBroker(settings.cache_broker_url),
+            stream=settings.events.stream,
+            buffer_size=settings.events.buffer_size,
+            batch_size=settings.events.batch_size,
+            flush_interval=settings.events.flush_interval,
+        )
+        return cls(publisher=publisher, flush_timeout=settings.events.flush_timeout)
@@ -1,10 +1,33 @@
+import threading
+
 from qontract_api.config import settings
 from qontract_api.event_manager._base import EventManager
 
+_lock = threading.Lock()
+_initialized = False
+_event_manager: EventManager | None = None
+
 
 def get_event_manager() -> EventManager | None:
-    """Create an EventManager from application settings.
+    """Get the singleton EventManager from application settings.
+
+    All tasks of a worker process share the same EventManager, and with it
+    the same event buffer and Redis connection.
 
     Returns None if event publishing is disabled.
     """
-    return EventManager.from_config(settings=settings)
+    global _initialized, _event_manager  # noqa: PLW0603
+    # Fast path: already initialized (no lock needed)
+    if _initialized:
+        return _event_manager
+    with _lock:
+        if not _initialized:
+            _event_manager = EventManager.from_config(settings=settings)
+            _initialized = True
+    return _event_manager
+
+
+def flush_event_manager() -> None:
+    """Flush the buffered events of the singleton EventManager, if there is one."""
+    if _event_manager is not None:
+        _event_manager.flush()
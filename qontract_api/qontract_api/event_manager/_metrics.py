@@ -0,0 +1,35 @@
+"""Prometheus metrics for event publishing."""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Time from publish_event until Redis acknowledged the event
+event_publish_latency = Histogram(
+    "qontract_api_event_publish_latency_seconds",
+    "Latency from buffering an event until it is written to the stream",
+)
+
+# Time of a single pipelined write to Redis
+event_flush_duration = Histogram(
+    "qontract_api_event_flush_duration_seconds",
+    "Duration of a pipelined event batch write",
+)
+
+# Events waiting in the in-memory buffer
+event_queue_depth = Gauge(
+    "qontract_api_event_queue_depth",
+    "Number of events buffered and not yet written to the stream",
+    multiprocess_mode="livesum",
+)
+
+# Events written to the stream
+events_published = Counter(
+    "qontract_api_events_published_total",
+    "Total events written to the stream",
+)
+
+# Events lost because the buffer was full or the write failed
+events_dropped = Counter(
+    "qontract_api_events_dropped_total",
+    "Total events that could not be published",
+    labelnames=["reason"],
+)
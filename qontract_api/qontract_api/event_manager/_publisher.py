@@ -0,0 +1,198 @@
+"""Long-lived, buffered event publisher.
+
+A background thread per process owns the Redis connection (and its asyncio
+event loop) and writes buffered events in pipelined batches, so publishing an
+event never pays for a connection setup or a round trip of its own.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from qontract_api.event_manager._metrics import (
+    event_flush_duration,
+    event_publish_latency,
+    event_queue_depth,
+    events_dropped,
+    events_published,
+)
+
+if TYPE_CHECKING:
+    from qontract_utils.events import Event, RedisBroker
+
+log = logging.getLogger(__name__)
+
+
+class _BufferedEvent(NamedTuple):
+    event: Event
+    headers: dict[str, Any] | None
+    enqueued_at: float
+
+
+class BufferedPublisher:
+    """Buffers events in memory and publishes them in pipelined batches.
+
+    A batch is written once `batch_size` events are buffered, once the oldest
+    buffered event waited `flush_interval` seconds, or when `flush()` is called.
+    The connection is kept open between batches and re-established when a
+    write fails. Events are dropped (and counted) when the buffer is full or a
+    batch fails twice, publishing never blocks or raises.
+
+    The publisher is fork-aware: a forked child (e.g. a Celery prefork worker)
+    starts with an empty buffer and its own thread and connection.
+    """
+
+    def __init__(
+        self,
+        broker: RedisBroker,
+        stream: str,
+        *,
+        buffer_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self._broker = broker
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._buffer: deque[_BufferedEvent] = deque()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closing = False
+        self._connected = False
+        self._thread: threading.Thread | None = None
+
+    def _ensure_thread(self) -> None:
+        """Start the publisher thread. Must be called with the condition held."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="event-publisher", daemon=True
+            )
+            self._thread.start()
+
+    def publish(self, event: Event, headers: dict[str, Any] | None) -> None:
+        """Add an event to the buffer without waiting for it to be written."""
+        if self._pid != os.getpid():
+            # inherited locks and threads are unusable after a fork
+            self._reset()
+        with self._cond:
+            if self._closing:
+                events_dropped.labels(reason="closed").inc()
+                log.warning(f"Event publisher is closed, dropping event {event.type}")
+                return
+            if len(self._buffer) >= self._buffer_size:
+                events_dropped.labels(reason="buffer_full").inc()
+                log.warning(f"Event buffer is full, dropping event {event.type}")
+                return
+            self._buffer.append(_BufferedEvent(event, headers, time.monotonic()))
+            event_queue_depth.inc()
+            self._ensure_thread()
+            if len(self._buffer) >= self._batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all buffered events are written.
+
+        Returns False if the timeout passed before the buffer was drained.
+        """
+        if self._pid != os.getpid():
+            return True
+        with self._cond:
+            if not self._buffer and not self._in_flight:
+                return True
+            self._flush_requested = True
+            self._ensure_thread()
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._buffer and not self._in_flight, timeout
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush the buffer, stop the publisher thread and disconnect."""
+        if self._pid != os.getpid():
+            return
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                log.warning("Event publisher did not drain its buffer before closing")
+
+    def _next_batch(self) -> list[_BufferedEvent] | None:
+        """Wait for the next batch to write. Returns None once closed and drained."""
+        with self._cond:
+            while not self._buffer:
+                if self._closing:
+                    return None
+                self._cond.wait()
+            deadline = self._buffer[0].enqueued_at + self._flush_interval
+            while (
+                len(self._buffer) < self._batch_size
+                and not self._flush_requested
+                and not self._closing
+                and (remaining := deadline - time.monotonic()) > 0
+            ):
+                self._cond.wait(remaining)
+            size = min(self._batch_size, len(self._buffer))
+            batch = [self._buffer.popleft() for _ in range(size)]
+            self._in_flight = size
+            return batch
+
+    def _run(self) -> None:
+        try:
+            while (batch := self._next_batch()) is not None:
+                self._write(batch)
+                with self._cond:
+                    self._in_flight = 0
+                    if not self._buffer:
+                        self._flush_requested = False
+                    self._cond.notify_all()
+        finally:
+            self._disconnect()
+
+    def _write(self, batch: list[_BufferedEvent]) -> None:
+        messages = [(item.event, item.headers) for item in batch]
+        for attempt in range(2):
+            start = time.monotonic()
+            try:
+                if not self._connected:
+                    self._broker.__enter__()  # noqa: PLC2801
+                    self._connected = True
+                self._broker.publish_batch(messages, stream=self._stream)
+            except Exception:
+                # the connection might be stale (e.g. Redis restarted), reconnect
+                self._disconnect()
+                if attempt == 0:
+                    continue
+                log.exception(f"Failed to publish {len(batch)} events")
+                events_dropped.labels(reason="publish_failed").inc(len(batch))
+            else:
+                now = time.monotonic()
+                event_flush_duration.observe(now - start)
+                for item in batch:
+                    event_publish_latency.observe(now - item.enqueued_at)
+                events_published.inc(len(batch))
+            break
+        event_queue_depth.dec(len(batch))
+
+    def _disconnect(self) -> None:
+        if not self._connected:
+            return
+        self._connected = False
+        try:
+            self._broker.__exit__(None, None, None)
+        except Exception:
+            log.exception("Failed to disconnect event publisher")
@@ -4,11 +4,14 @@ This layer sits between the stateless GlitchtipApi and business logic, providing
 - Two-tier caching (memory + Redis) for Glitchtip data
 - Distributed locking for thread-safe cache updates
 - Write-through cache invalidation after mutations
+- Concurrent prefetching of per-org and per-team collections
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 from qontract_utils.glitchtip_api.models import (
@@ -22,6 +25,8 @@ from qontract_utils.glitchtip_api.models import (
 from qontract_api.logger import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Mapping
+
     from qontract_utils.glitchtip_api import GlitchtipApi
 
     from qontract_api.cache.base import CacheBackend
@@ -67,6 +72,7 @@ class GlitchtipWorkspaceClient:
     - Cached access to organizations, projects, and alerts with TTL
     - Distributed locking for thread-safe cache updates
     - Write-through cache invalidation after mutations
+    - Concurrent prefetching to warm the cache before reconciling
     """
 
     def __init__(
@@ -116,6 +122,66 @@ class GlitchtipWorkspaceClient:
         except RuntimeError as e:
             logger.warning(f"Could not acquire lock for {cache_key}: {e}")
 
+    def _fetch_concurrently(self, calls: list[Callable[[], Any]]) -> None:
+        """Run cached getters concurrently to warm the cache.
+
+        Errors of any call are raised after all calls finished.
+        """
+        if not calls:
+            return
+        max_workers = min(len(calls), self.settings.glitchtip.max_concurrent_requests)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="glitchtip-fetch"
+        ) as executor:
+            futures = [executor.submit(call) for call in calls]
+        for future in futures:
+            future.result()
+
+    # PREFETCHING
+    def prefetch(self, org_team_slugs: Mapping[str, Collection[str]]) -> None:
+        """Fetch users, teams, projects and team users of organizations concurrently.
+
+        The getters are cached, so subsequent (sequential) calls are cache hits.
+
+        Args:
+            org_team_slugs: Team slugs to fetch members of, keyed by organization
+                slug. Teams that don't exist (yet) are skipped.
+        """
+        self._fetch_concurrently([
+            partial(getter, org_slug)
+            for org_slug in org_team_slugs
+            for getter in (
+                self.get_organization_users,
+                self.get_teams,
+                self.get_projects,
+            )
+        ])
+        self._fetch_concurrently([
+            partial(self.get_team_users, org_slug, team.slug)
+            for org_slug, team_slugs in org_team_slugs.items()
+            for team in self.get_teams(org_slug)
+            if team.slug in team_slugs
+        ])
+
+    def prefetch_project_alerts(
+        self, org_project_slugs: Mapping[str, Collection[str]]
+    ) -> None:
+        """Fetch projects and project alerts of organizations concurrently.
+
+        Args:
+            org_project_slugs: Project slugs to fetch alerts of, keyed by
+                organization slug. Projects that don't exist are skipped.
+        """
+        self._fetch_concurrently([
+            partial(self.get_projects, org_slug) for org_slug in org_project_slugs
+        ])
+        self._fetch_concurrently([
+            partial(self.get_project_alerts, org_slug, project.slug)
+            for org_slug, project_slugs in org_project_slugs.items()
+            for project in self.get_projects(org_slug)
+            if project.slug in project_slugs
+        ])
+
     # CACHED DATA ACCESS
     def get_organizations(self) -> dict[str, Organization]:
         """Get all organizations (cached with distributed locking).
@@ -123,22 +189,13 @@ class GlitchtipWorkspaceClient:
         Returns:
             Dict of Organization objects keyed by organization name
         """
-        cache_key = self._cache_key_organizations()
-
-        if cached := self.cache.get_obj(cache_key, CachedOrganizations):
-            return {org.name: org for org in cached.items}
-
-        with self.cache.lock(cache_key):
-            if cached := self.cache.get_obj(cache_key, CachedOrganizations):
-                return {org.name: org for org in cached.items}
-
-            orgs = self.glitchtip_api.organizations()
-            self.cache.set_obj(
-                cache_key,
-                CachedOrganizations(items=orgs),
-                self.settings.glitchtip.organizations_cache_ttl,
-            )
-            return {org.name: org for org in orgs}
+        cached = self.cache.get_or_set_obj(
+            self._cache_key_organizations(),
+            CachedOrganizations,
+            lambda: CachedOrganizations(items=self.glitchtip_api.organizations()),
+            self.settings.glitchtip.organizations_cache_ttl,
+        )
+        return {org.name: org for org in cached.items}
 
     def get_projects(self, org_slug: str) -> list[Project]:
         """Get projects for an organization (cached with distributed locking).
@@ -149,22 +206,13 @@ class GlitchtipWorkspaceClient:
         Returns:
             List of Project objects
         """
-        cache_key = self._cache_key_projects(org_slug)
-
-        if cached := self.cache.get_obj(cache_key, CachedProjects):
-            return cached.items
-
-        with self.cache.lock(cache_key):
-            if cached := self.cache.get_obj(cache_key, CachedProjects):
-                return cached.items
-
-            projects = self.glitchtip_api.projects(org_slug)
-            self.cache.set_obj(
-                cache_key,
-                CachedProjects(items=projects),
-                self.settings.glitchtip.projects_cache_ttl,
-            )
-            return projects
+        cached = self.cache.get_or_set_obj(
+            self._cache_key_projects(org_slug),
+            CachedProjects,
+            lambda: CachedProjects(items=self.glitchtip_api.projects(org_slug)),
+            self.settings.glitchtip.projects_cache_ttl,
+        )
+        return cached.items
 
     def get_project_alerts(
         self, org_slug: str, project_slug: str
@@ -178,22 +226,15 @@ class GlitchtipWorkspaceClient:
         Returns:
             List of ProjectAlert objects
         """
-        cache_key = self._cache_key_alerts(org_slug, project_slug)
-
-        if cached := self.cache.get_obj(cache_key, CachedProjectAlerts):
-            return cached.items
-
-        with self.cache.lock(cache_key):
-            if cached := self.cache.get_obj(cache_key, CachedProjectAlerts):
-                return cached.items
-
-            alerts = self.glitchtip_api.project_alerts(org_slug, project_slug)
-            self.cache.set_obj(
-                cache_key,
-                CachedProjectAlerts(items=alerts),
-                self.settings.glitchtip.alerts_cache_ttl,
-            )
-            return alerts
+        cached = self.cache.get_or_set_obj(
+            self._cache_key_alerts(org_slug, project_slug),
+            CachedProjectAlerts,
+            lambda: CachedProjectAlerts(
+                items=self.glitchtip_api.project_alerts(org_slug, project_slug)
+            ),
+            self.settings.glitchtip.alerts_cache_ttl,
+        )
+        return cached.items
 
     # WRITE-THROUGH METHODS (clear cache after mutation)
     def create_project_alert(
@@ -267,22 +308,13 @@ class GlitchtipWorkspaceClient:
         Returns:
             List of Team objects
         """
-        cache_key = self._cache_key_teams(org_slug)
-
-        if cached := self.cache.get_obj(cache_key, CachedTeams):
-            return cached.items
-
-        with self.cache.lock(cache_key):
-            if cached := self.cache.get_obj(cache_key, CachedTeams):
-                return cached.items
-
-            teams = self.glitchtip_api.teams(org_slug)
-            self.cache.set_obj(
-                cache_key,
-                CachedTeams(items=teams),
-                self.settings.glitchtip.teams_cache_ttl,
-            )
-            return teams
+        cached = self.cache.get_or_set_obj(
+            self._cache_key_teams(org_slug),
+            CachedTeams,
+            lambda: CachedTeams(items=self.glitchtip_api.teams(org_slug)),
+            self.settings.glitchtip.teams_cache_ttl,
+        )
+        return cached.items
 
     def create_team(self, org_slug: str, slug: str) -> Team:
         """Create a team and clear teams cache."""
@@ -311,22 +343,13 @@ class GlitchtipWorkspaceClient:
         Returns:
             List of User objects
         """
-        cache_key = self._cache_key_org_users(org_slug)
-
-        if cached := self.cache.get_obj(cache_key, CachedUsers):
-            return cached.items
-
-        with self.cache.lock(cache_key):
-            if cached := self.cache.get_obj(cache_key, CachedUsers):
-                return cached.items
-
-            users = self.glitchtip_api.organization_users(org_slug)
-            self.cache.set_obj(
-                cache_key,
-                CachedUsers(items=users),
-                self.settings.glitchtip.users_cache_ttl,
-            )
-            return users
+        cached = self.cache.get_or_set_obj(
+            self._cache_key_org_users(org_slug),
+            CachedUsers,
+            lambda: CachedUsers(items=self.glitchtip_api.organization_users(org_slug)),
+            self.settings.glitchtip.users_cache_ttl,
+        )
+        return cached.items
 
     def invite_user(self, org_slug: str, email: str, role: str) -> User:
         """Invite a user and clear organization users cache."""
@@ -363,22 +386,15 @@ class GlitchtipWorkspaceClient:
         Returns:
             List of User objects
         """
-        cache_key = self._cache_key_team_users(org_slug, team_slug)
-
-        if cached := self.cache.get_obj(cache_key, CachedUsers):
-            return cached.items
-
-        with self.cache.lock(cache_key):
-            if cached := self.cache.get_obj(cache_key, CachedUsers):
-                return cached.items
-
-            users = self.glitchtip_api.team_users(org_slug, team_slug)
-            self.cache.set_obj(
-                cache_key,
-                CachedUsers(items=users),
-                self.settings.glitchtip.users_cache_ttl,
-            )
-            return users
+        cached = self.cache.get_or_set_obj(
+            self._cache_key_team_users(org_slug, team_slug),
+            CachedUsers,
+            lambda: CachedUsers(
+                items=self.glitchtip_api.team_users(org_slug, team_slug)
+            ),
+            self.settings.glitchtip.users_cache_ttl,
+        )
+        return cached.items
 
     def add_user_to_team(self, org_slug: str, team_slug: str, user_pk: int) -> None:
         """Add user to team and clear team users cache."""
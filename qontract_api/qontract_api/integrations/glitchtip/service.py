@@ -178,6 +178,15 @@ class GlitchtipService:
                     for project in desired_org.projects
                 )
 
+        # Warm the cache concurrently, the per-org diffs below are cache hits then
+        glitchtip.prefetch({
+            current_org_by_name[desired_org.name].slug: {
+                _team_slug(team) for team in desired_org.teams
+            }
+            for desired_org in organizations
+            if desired_org.name in current_org_by_name
+        })
+
         # --- Phases 2-4: Per-org reconciliation (only for orgs that currently exist) ---
         for desired_org in organizations:
             current_org = current_org_by_name.get(desired_org.name)
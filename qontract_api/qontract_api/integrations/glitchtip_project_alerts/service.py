@@ -144,6 +144,14 @@ class GlitchtipProjectAlertsService:
         actions: list[GlitchtipAlertAction] = []
 
         current_org_by_name = glitchtip.get_organizations()
+        # Warm the cache concurrently, the per-project diffs below are cache hits then
+        glitchtip.prefetch_project_alerts({
+            current_org_by_name[desired_org.name].slug: {
+                project.slug for project in desired_org.projects
+            }
+            for desired_org in organizations
+            if desired_org.name in current_org_by_name
+        })
 
         for desired_org in organizations:
             current_org = current_org_by_name.get(desired_org.name)
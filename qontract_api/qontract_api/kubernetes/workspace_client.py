@@ -8,11 +8,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
-
+from qontract_api.cache.snapshot import Snapshot, SnapshotCache
 from qontract_api.logger import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from qontract_utils.kubernetes import KubernetesApi, Namespace
 
     from qontract_api.cache.base import CacheBackend
@@ -21,18 +22,24 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-class CachedNamespaceNames(BaseModel, frozen=True):
+class CachedNamespaceNames(Snapshot, frozen=True):
     """Cached set of all namespace names on a cluster."""
 
     names: frozenset[str]
 
+    def with_names(
+        self, added: Iterable[str] = (), removed: Iterable[str] = ()
+    ) -> CachedNamespaceNames:
+        """Return a copy with namespace names added and removed."""
+        return CachedNamespaceNames(names=(self.names | set(added)) - set(removed))
+
 
 class KubernetesWorkspaceClient:
     """Caching layer for Kubernetes namespace operations.
 
     Caches the full set of namespace names per cluster (single LIST call)
     instead of checking each namespace individually.
-    Mutations (create/delete) invalidate the cached set.
+    Mutations (create/delete) update the cached set in place.
     """
 
     def __init__(
@@ -46,53 +53,47 @@ class KubernetesWorkspaceClient:
         self._cluster_name = cluster_name
         self._cache = cache
         self._settings = settings
+        self._namespace_names = SnapshotCache(
+            cache=cache,
+            key=self._cache_key_namespace_names(),
+            model=CachedNamespaceNames,
+            ttl=settings.kubernetes.namespace_cache_ttl,
+            fetch=self._fetch_namespace_names,
+            entity="kubernetes_namespaces",
+            refresh_ahead_ratio=settings.cache_refresh_ahead_ratio,
+        )
 
     def _cache_key_namespace_names(self) -> str:
         return f"kubernetes:{self._cluster_name}:namespace_names"
 
-    def _get_namespace_names(self) -> frozenset[str]:
-        """Get the cached set of namespace names, or fetch and cache it."""
-        cache_key = self._cache_key_namespace_names()
-
-        if cached := self._cache.get_obj(cache_key, CachedNamespaceNames):
-            return cached.names
-
-        with self._cache.lock(cache_key):
-            if cached := self._cache.get_obj(cache_key, CachedNamespaceNames):
-                return cached.names
-
-            namespaces = self._api.list_namespaces()
-            names = frozenset(
+    def _fetch_namespace_names(self) -> CachedNamespaceNames:
+        namespaces = self._api.list_namespaces()
+        return CachedNamespaceNames(
+            names=frozenset(
                 ns.metadata.name
                 for ns in namespaces
                 if ns.metadata and ns.metadata.name
             )
-            self._cache.set_obj(
-                cache_key,
-                CachedNamespaceNames(names=names),
-                self._settings.kubernetes.namespace_cache_ttl,
-            )
-            return names
+        )
 
-    def _invalidate_namespace_cache(self) -> None:
-        cache_key = self._cache_key_namespace_names()
-        with self._cache.lock(cache_key):
-            self._cache.delete(cache_key)
+    def _get_namespace_names(self) -> frozenset[str]:
+        """Get the cached set of namespace names, or fetch and cache it."""
+        return self._namespace_names.get().names
 
     def namespace_exists(self, name: str) -> bool:
         """Check if a namespace exists (cached via full namespace listing)."""
         return name in self._get_namespace_names()
 
     def create_namespace(self, name: str) -> Namespace:
-        """Create a namespace and invalidate cache."""
+        """Create a namespace and add it to the cached set."""
         result = self._api.create_namespace(name)
-        self._invalidate_namespace_cache()
+        self._namespace_names.update(lambda cached: cached.with_names(added=[name]))
         return result
 
     def delete_namespace(self, name: str) -> None:
-        """Delete a namespace and invalidate cache."""
+        """Delete a namespace and remove it from the cached set."""
         self._api.delete_namespace(name)
-        self._invalidate_namespace_cache()
+        self._namespace_names.update(lambda cached: cached.with_names(removed=[name]))
 
     def list_namespaces(self) -> list[Namespace]:
         """List all namespaces (not cached)."""
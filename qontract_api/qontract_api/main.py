@@ -91,6 +91,10 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     if opa_client := getattr(_app.state, "opa_client", None):
         await opa_client.client.aclose()
 
+    # Publish buffered events on shutdown
+    if event_manager := getattr(_app.state, "event_manager", None):
+        event_manager.close()
+
     # Cleanup secret backend on shutdown
     if hasattr(_app.state, "secret_manager") and _app.state.secret_manager is not None:
         _app.state.secret_manager.close()
@@ -1,9 +1,9 @@
 """SlackWorkspaceClient: Caching + compute layer for Slack workspace data.
 
 This layer sits between the stateless SlackApi and business logic, providing:
-- Two-tier caching (memory + Redis) for Slack data
+- Versioned snapshots of Slack data (worker-local + two-tier cache)
 - Distributed locking for thread-safe cache updates
-- Cache updates instead of invalidation (O(1) performance)
+- Delta updates of the cached snapshots instead of invalidation
 - Compute helpers (e.g., get_users_by_ids, get_usergroup_by_handle)
 """
 
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol, TypeVar, runtime_checkable
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 from qontract_utils.slack_api import (
     ChatPostMessageResponse,
     SlackApi,
@@ -22,6 +22,7 @@ from qontract_utils.slack_api import SlackChannel as SlackChannelAPI
 from qontract_utils.slack_api import SlackUser as SlackUserAPI
 from qontract_utils.slack_api import SlackUsergroup as SlackUsergroupAPI
 
+from qontract_api.cache.snapshot import Snapshot, SnapshotCache
 from qontract_api.logger import get_logger
 
 from .domain import (
@@ -47,7 +48,7 @@ class TypeWithId(Protocol):
 T = TypeVar("T", bound=TypeWithId)
 
 
-class CachedUsers(BaseModel, frozen=True):
+class CachedUsers(Snapshot, frozen=True):
     """Cached dict of SlackUserAPI objects (for two-tier cache serialization)."""
 
     items: list[SlackUserAPI] = Field(default_factory=list)
@@ -62,7 +63,7 @@ class CachedUsers(BaseModel, frozen=True):
         return cls(items=list(obj_dict.values()))
 
 
-class CachedUsergroups(BaseModel, frozen=True):
+class CachedUsergroups(Snapshot, frozen=True):
     """Cached dict of SlackUsergroupAPI objects (for two-tier cache serialization)."""
 
     items: list[SlackUsergroupAPI] = Field(default_factory=list)
@@ -76,8 +77,12 @@ class CachedUsergroups(BaseModel, frozen=True):
         """Create from dict keyed by ID."""
         return cls(items=list(obj_dict.values()))
 
+    def with_usergroup(self, usergroup: SlackUsergroupAPI) -> CachedUsergroups:
+        """Return a copy with the usergroup added or replaced (by ID)."""
+        return CachedUsergroups.from_dict({**self.to_dict(), usergroup.id: usergroup})
 
-class CachedChannels(BaseModel, frozen=True):
+
+class CachedChannels(Snapshot, frozen=True):
     """Cached dict of SlackChannelAPI objects (for two-tier cache serialization)."""
 
     items: list[SlackChannelAPI] = Field(default_factory=list)
@@ -102,7 +107,8 @@ class SlackWorkspaceClient:
     Provides:
     - Cached access to users, usergroups, and channels with TTL
     - Distributed locking for thread-safe cache updates
-    - Cache updates instead of invalidation for better performance
+    - Delta updates of cached usergroups instead of invalidation, so writes
+      don't force the next task to re-download the whole workspace
     - Compute helpers for common operations
     """
 
@@ -122,6 +128,33 @@ class SlackWorkspaceClient:
         self.slack_api = slack_api
         self.cache = cache
         self.settings = settings
+        self._users = SnapshotCache(
+            cache=cache,
+            key=self._cache_key_users(),
+            model=CachedUsers,
+            ttl=settings.slack.users_cache_ttl,
+            fetch=lambda: CachedUsers(items=self.slack_api.users_list()),
+            entity="slack_users",
+            refresh_ahead_ratio=settings.cache_refresh_ahead_ratio,
+        )
+        self._usergroups = SnapshotCache(
+            cache=cache,
+            key=self._cache_key_usergroups(),
+            model=CachedUsergroups,
+            ttl=settings.slack.usergroup_cache_ttl,
+            fetch=lambda: CachedUsergroups(items=self.slack_api.usergroups_list()),
+            entity="slack_usergroups",
+            refresh_ahead_ratio=settings.cache_refresh_ahead_ratio,
+        )
+        self._channels = SnapshotCache(
+            cache=cache,
+            key=self._cache_key_channels(),
+            model=CachedChannels,
+            ttl=settings.slack.channels_cache_ttl,
+            fetch=lambda: CachedChannels(items=self.slack_api.conversations_list()),
+            entity="slack_channels",
+            refresh_ahead_ratio=settings.cache_refresh_ahead_ratio,
+        )
 
     # CACHE KEY HELPERS
     def _cache_key_users(self) -> str:
@@ -136,134 +169,34 @@ class SlackWorkspaceClient:
         """Generate cache key for channels."""
         return f"slack:{self.slack_api.workspace_name}:channels"
 
-    # CACHE OPERATIONS (using two-tier cache from CacheBackend)
-    def _get_cached_users(self, cache_key: str) -> dict[str, SlackUserAPI] | None:
-        """Get cached users"""
-        cached = self.cache.get_obj(cache_key, CachedUsers)
-        return cached.to_dict() if cached else None
-
-    def _set_cached_users(
-        self, cache_key: str, users: dict[str, SlackUserAPI], ttl: int
-    ) -> None:
-        """Set cached users"""
-        cached = CachedUsers.from_dict(users)
-        self.cache.set_obj(cache_key, cached, ttl)
-
-    def _get_cached_usergroups(
-        self, cache_key: str
-    ) -> dict[str, SlackUsergroupAPI] | None:
-        """Get cached usergroups"""
-        cached = self.cache.get_obj(cache_key, CachedUsergroups)
-        return cached.to_dict() if cached else None
-
-    def _set_cached_usergroups(
-        self, cache_key: str, usergroups: dict[str, SlackUsergroupAPI], ttl: int
-    ) -> None:
-        """Set cached usergroups"""
-        cached = CachedUsergroups.from_dict(usergroups)
-        self.cache.set_obj(cache_key, cached, ttl)
-
-    def _get_cached_channels(self, cache_key: str) -> dict[str, SlackChannelAPI] | None:
-        """Get cached channels"""
-        cached = self.cache.get_obj(cache_key, CachedChannels)
-        return cached.to_dict() if cached else None
-
-    def _set_cached_channels(
-        self, cache_key: str, channels: dict[str, SlackChannelAPI], ttl: int
-    ) -> None:
-        """Set cached channels"""
-        cached = CachedChannels.from_dict(channels)
-        self.cache.set_obj(cache_key, cached, ttl)
-
-    def _clear_cache(self, cache_key: str) -> None:
-        """Clear cache for given key."""
-        try:
-            with self.cache.lock(cache_key):
-                self.cache.delete(cache_key)
-        except RuntimeError as e:
-            logger.warning(f"Could not acquire lock for {cache_key}: {e}")
-
     # CACHED DATA ACCESS
     def get_users(self) -> dict[str, SlackUserAPI]:
-        """Get all users by ID (cached with distributed locking).
+        """Get all users by ID (cached snapshot with distributed locking).
 
         Returns:
             Dict of SlackUserAPI objects by user ID
         """
-        cache_key = self._cache_key_users()
-
-        # Try cache first (no lock for reads)
-        if cached := self._get_cached_users(cache_key):
-            return cached
-
-        with self.cache.lock(cache_key):
-            # Double-check after lock
-            if cached := self._get_cached_users(cache_key):
-                return cached
-
-            # Fetch from API
-            users = {user.id: user for user in self.slack_api.users_list()}
-
-            # Cache
-            self._set_cached_users(
-                cache_key, users, self.settings.slack.users_cache_ttl
-            )
-
-            return users
+        return self._users.get().to_dict()
 
     def get_usergroups(self) -> dict[str, SlackUsergroupAPI]:
-        """Get all usergroups by ID (cached with distributed locking).
+        """Get all usergroups by ID (cached snapshot with distributed locking).
 
         Returns:
             Dict of SlackUsergroupAPI objects by usergroup ID
         """
-        cache_key = self._cache_key_usergroups()
-
-        # Try cache first (no lock for reads)
-        if cached := self._get_cached_usergroups(cache_key):
-            return cached
-
-        with self.cache.lock(cache_key):
-            # Double-check after lock
-            if cached := self._get_cached_usergroups(cache_key):
-                return cached
-
-            # Fetch from API
-            usergroups = {ug.id: ug for ug in self.slack_api.usergroups_list()}
-
-            # Cache
-            self._set_cached_usergroups(
-                cache_key, usergroups, self.settings.slack.usergroup_cache_ttl
-            )
-
-            return usergroups
+        return self._usergroups.get().to_dict()
 
     def get_channels(self) -> dict[str, SlackChannelAPI]:
-        """Get all channels by ID (cached with distributed locking).
+        """Get all channels by ID (cached snapshot with distributed locking).
 
         Returns:
             Dict of SlackChannelAPI objects by channel ID
         """
-        cache_key = self._cache_key_channels()
-
-        # Try cache first (no lock for reads)
-        if cached := self._get_cached_channels(cache_key):
-            return cached
-
-        with self.cache.lock(cache_key):
-            # Double-check after lock
-            if cached := self._get_cached_channels(cache_key):
-                return cached
+        return self._channels.get().to_dict()
 
-            # Fetch from API
-            channels = {ch.id: ch for ch in self.slack_api.conversations_list()}
-
-            # Cache
-            self._set_cached_channels(
-                cache_key, channels, self.settings.slack.channels_cache_ttl
-            )
-
-            return channels
+    def _update_cached_usergroup(self, usergroup: SlackUsergroupAPI) -> None:
+        """Add or replace a usergroup in the cached snapshot."""
+        self._usergroups.update(lambda cached: cached.with_usergroup(usergroup))
 
     # COMPUTE HELPERS
     def _get_usergroup_by_handle(self, handle: str) -> SlackUsergroupAPI | None:
@@ -379,27 +312,13 @@ class SlackWorkspaceClient:
             Created SlackUsergroupAPI object
         """
         created_ug = self.slack_api.usergroup_create(handle=handle, name=name)
-
-        # Add to cache
-        try:
-            with self.cache.lock(self._cache_key_usergroups()):
-                cached = self._get_cached_usergroups(self._cache_key_usergroups())
-                if cached:
-                    cached[created_ug.id] = created_ug
-                    self._set_cached_usergroups(
-                        self._cache_key_usergroups(),
-                        cached,
-                        self.settings.slack.usergroup_cache_ttl,
-                    )
-        except RuntimeError as e:
-            logger.warning(f"Could not acquire lock to cache created usergroup: {e}")
-
+        self._update_cached_usergroup(created_ug)
         return created_ug
 
     def update_usergroup(
         self, *, handle: str, description: str, channels: Iterable[str]
     ) -> None:
-        """Update usergroup and cache (O(1) update, not invalidation).
+        """Update usergroup and the cached usergroup (delta update, not invalidation).
 
         Args:
             handle: Usergroup handle (e.g., "oncall-team")
@@ -414,14 +333,14 @@ class SlackWorkspaceClient:
         channel_id_by_name = {
             channel.name: pk for pk, channel in self.get_channels().items()
         }
-        # Always clear the usergroup cache (will be repopulated on next read)
-        self._clear_cache(self._cache_key_usergroups())
+        channel_ids = [channel_id_by_name[ch.lstrip("#")] for ch in channels]
 
-        self.slack_api.usergroup_update(
+        updated_ug = self.slack_api.usergroup_update(
             usergroup_id=ug.id,
             description=description,
-            channel_ids=[channel_id_by_name[ch.lstrip("#")] for ch in channels],
+            channel_ids=channel_ids,
         )
+        self._update_cached_usergroup(updated_ug)
 
     def update_usergroup_users(
         self,
@@ -429,7 +348,7 @@ class SlackWorkspaceClient:
         handle: str,
         users: Iterable[str],
     ) -> None:
-        """Update usergroup users.
+        """Update usergroup users and the cached usergroup.
 
         Args:
             handle: Usergroup handle (e.g., "oncall-team")
@@ -466,9 +385,6 @@ class SlackWorkspaceClient:
             # Reactivate usergroup if it was disabled
             self.slack_api.usergroup_enable(usergroup_id=ug.id)
 
-        # Always clear the usergroup cache (will be repopulated on next read)
-        self._clear_cache(self._cache_key_usergroups())
-
         try:
             self.slack_api.usergroup_users_update(usergroup_id=ug.id, user_ids=user_ids)
         except SlackApiError as e:
@@ -477,6 +393,10 @@ class SlackWorkspaceClient:
             if e.response["error"] != "invalid_users":
                 raise
 
+        self._update_cached_usergroup(
+            ug.model_copy(update={"users": user_ids, "date_delete": 0})
+        )
+
     def chat_post_message(
         self,
         *,
@@ -10,6 +10,7 @@ from kombu import Queue
 from prometheus_client import Counter, Histogram
 
 from qontract_api.config import settings
+from qontract_api.event_manager import flush_event_manager
 from qontract_api.logger import get_logger, setup_logger, setup_logging
 from qontract_api.models import TaskResult
 from qontract_api.tasks._deduplication import deduplicated_task
@@ -106,6 +107,8 @@ def on_task_postrun(
     task: celery.Task, state: str, retval: Any, *_: tuple, **__: dict
 ) -> None:
     """Finalize task execution and calculate statistics."""
+    # events of a finished task must not wait for the next flush threshold
+    flush_event_manager()
     now = datetime.now(tz=UTC)
 
     if publish_time_str := getattr(task.request, "__publish_time", None):
@@ -11,6 +11,7 @@ import pytest
 from pydantic import BaseModel
 
 from qontract_api.cache.base import CacheBackend
+from qontract_api.cache.codec import JsonCodec
 
 
 class SampleModel(BaseModel):
@@ -77,6 +78,12 @@ def cache() -> ConcreteCacheBackend:
     return ConcreteCacheBackend()
 
 
+def test_codec_requires_bytes_support(cache: ConcreteCacheBackend) -> None:
+    """Test a codec is rejected by backends without get_bytes/set_bytes."""
+    with pytest.raises(ValueError, match="doesn't support codecs"):
+        CacheBackend.__init__(cache, codec=JsonCodec())
+
+
 def test_cache_backend_is_abstract() -> None:
     """Test that CacheBackend cannot be instantiated directly."""
     with pytest.raises(TypeError, match="Can't instantiate abstract class"):
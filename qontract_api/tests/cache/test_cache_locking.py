@@ -2,10 +2,13 @@
 
 # ruff: noqa: ARG002, SIM117, PT011
 
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 
 import pytest
+from pydantic import BaseModel
 
 from qontract_api.cache.base import CacheBackend
 
@@ -59,6 +62,32 @@ class MockCacheBackend(CacheBackend):
             self.locks.pop(lock_key, None)
 
 
+class TryLockCacheBackend(MockCacheBackend):
+    """Mock cache backend with a thread-safe, non-blocking lock."""
+
+    def __init__(self) -> None:
+        """Initialize mock cache with a mutex for try_lock."""
+        super().__init__()
+        self.mutex = threading.Lock()
+
+    @contextmanager
+    def try_lock(self, key: str, timeout: float = 300) -> Generator[bool]:
+        """Acquire the mutex without blocking."""
+        if not self.mutex.acquire(blocking=False):
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            self.mutex.release()
+
+
+class CachedValue(BaseModel):
+    """Sample cached model."""
+
+    value: str
+
+
 def test_lock_context_manager_acquires_and_releases_lock() -> None:
     """Test that lock context manager acquires and releases lock correctly."""
     cache = MockCacheBackend()
@@ -124,3 +153,93 @@ def test_multiple_locks_on_different_keys() -> None:
 # NOTE: Tests for lock timeout parameters removed - lock() is now abstract
 # and each backend implements its own locking mechanism (e.g., valkey.lock()
 # for Redis, conditional writes for DynamoDB, etc.)
+
+
+def test_try_lock_falls_back_to_lock() -> None:
+    """Test default try_lock() waits for lock() and yields True."""
+    cache = MockCacheBackend()
+
+    with cache.try_lock("test_key") as acquired:
+        assert acquired is True
+        assert "test_key:lock" in cache.locks
+
+    assert "test_key:lock" not in cache.locks
+
+
+def test_get_or_set_obj_returns_cached_value() -> None:
+    """Test get_or_set_obj() doesn't compute on a cache hit."""
+    cache = TryLockCacheBackend()
+    cache.set_obj("test_key", CachedValue(value="cached"))
+
+    def compute() -> CachedValue:
+        raise AssertionError
+
+    assert cache.get_or_set_obj("test_key", CachedValue, compute).value == "cached"
+
+
+def test_get_or_set_obj_computes_and_caches_on_miss() -> None:
+    """Test get_or_set_obj() computes and caches the value on a miss."""
+    cache = TryLockCacheBackend()
+
+    result = cache.get_or_set_obj(
+        "test_key", CachedValue, lambda: CachedValue(value="computed"), ttl=60
+    )
+
+    assert result.value == "computed"
+    cache.clear_memory_cache()
+    assert cache.get_obj("test_key", CachedValue) == result
+
+
+def test_single_flight_coalesces_concurrent_misses() -> None:
+    """Test concurrent misses compute the value only once."""
+    cache = TryLockCacheBackend()
+    calls: list[int] = []
+
+    def compute() -> CachedValue:
+        calls.append(1)
+        time.sleep(0.1)
+        return CachedValue(value="computed")
+
+    results: list[CachedValue] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cache.get_or_set_obj("test_key", CachedValue, compute)
+            )
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert len(calls) == 1
+    assert [r.value for r in results] == ["computed"] * 8
+
+
+def test_single_flight_takes_over_after_failed_leader() -> None:
+    """Test a waiting caller computes the value if the leader didn't."""
+    cache = TryLockCacheBackend()
+    # another process holds the lock and fails without caching a value
+    cache.mutex.acquire()
+    threading.Timer(0.1, cache.mutex.release).start()
+
+    result = cache.single_flight(
+        "test_key", read=lambda: None, compute=lambda: "computed", poll_interval=0.01
+    )
+
+    assert result == "computed"
+
+
+def test_single_flight_leader_exception_releases_lock() -> None:
+    """Test compute() exceptions propagate and release the lock."""
+    cache = TryLockCacheBackend()
+
+    def compute() -> str:
+        raise ValueError("API error")
+
+    with pytest.raises(ValueError, match="API error"):
+        cache.single_flight("test_key", read=lambda: None, compute=compute)
+
+    assert not cache.mutex.locked()
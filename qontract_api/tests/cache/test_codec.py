@@ -0,0 +1,112 @@
+"""Unit tests for cache codecs."""
+
+import pytest
+from pydantic import BaseModel, Field
+
+from qontract_api.cache.codec import CacheDecodeError, JsonCodec, get_codec
+
+
+class SampleItem(BaseModel, frozen=True):
+    """Nested sample model with an alias."""
+
+    pk: str = Field(..., alias="id")
+    name: str = ""
+
+
+class SampleModel(BaseModel, frozen=True):
+    """Sample Pydantic model for codec tests."""
+
+    items: list[SampleItem] = []
+    version: int = 0
+
+
+class OtherModel(BaseModel):
+    """Model with a different schema."""
+
+    name: str
+
+
+@pytest.fixture
+def sample() -> SampleModel:
+    """Create a sample model with nested items."""
+    return SampleModel(
+        items=[SampleItem(id=f"U{i}", name=f"user-{i}") for i in range(100)],
+        version=42,
+    )
+
+
+@pytest.mark.parametrize("compression_threshold", [0, 1])
+def test_roundtrip(compression_threshold: int, sample: SampleModel) -> None:
+    """Test encode() and decode() roundtrip with and without compression."""
+    codec = JsonCodec(compression_threshold=compression_threshold)
+
+    data = codec.encode(sample)
+
+    assert data[:1] == codec.tag
+    assert data[1:2] == (b"z" if compression_threshold else b"0")
+    assert codec.decode(data, SampleModel) == sample
+
+
+def test_compression_reduces_size(sample: SampleModel) -> None:
+    """Test payloads above the threshold are compressed."""
+    raw = JsonCodec().encode(sample)
+    compressed = JsonCodec(compression_threshold=1024).encode(sample)
+
+    assert len(compressed) < len(raw)
+
+
+def test_compression_threshold_not_reached(sample: SampleModel) -> None:
+    """Test payloads below the threshold are stored uncompressed."""
+    codec = JsonCodec(compression_threshold=10 * 1024 * 1024)
+
+    assert codec.encode(sample)[1:2] == b"0"
+
+
+def test_json_codec_uses_aliases(sample: SampleModel) -> None:
+    """Test JsonCodec serializes by alias like the legacy JSON format."""
+    data = JsonCodec().encode(sample)
+
+    assert b'"id":"U0"' in data
+
+
+def test_json_codec_validation_error_is_decode_error(sample: SampleModel) -> None:
+    """Test JsonCodec raises CacheDecodeError for values of another model."""
+    data = JsonCodec().encode(sample)
+
+    with pytest.raises(CacheDecodeError):
+        JsonCodec().decode(data, OtherModel)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b'{"items":[]}', id="legacy-json-string"),
+        pytest.param(b"", id="empty"),
+        pytest.param(b"jx{}", id="unknown-compression"),
+        pytest.param(b"jz-not-zstd", id="corrupt-compression"),
+        pytest.param(b"p0\x80\x05N.", id="other-codec"),
+    ],
+)
+def test_decode_invalid_values(data: bytes) -> None:
+    """Test decode() raises CacheDecodeError for values it didn't write."""
+    with pytest.raises(CacheDecodeError):
+        JsonCodec().decode(data, SampleModel)
+
+
+def test_get_codec() -> None:
+    """Test get_codec() creates the configured codec."""
+    codec = get_codec("json", compression_threshold=1024)
+
+    assert isinstance(codec, JsonCodec)
+    assert codec.compression_threshold == 1024
+
+
+def test_get_codec_legacy() -> None:
+    """Test get_codec() returns None for the legacy format."""
+    assert get_codec("") is None
+
+
+def test_get_codec_unsupported() -> None:
+    """Test get_codec() raises ValueError for unsupported codecs."""
+    with pytest.raises(ValueError, match="Unsupported cache codec: msgpack"):
+        get_codec("msgpack")
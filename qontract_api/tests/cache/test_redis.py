@@ -7,6 +7,7 @@ from unittest.mock import Mock
 import pytest
 from pydantic import BaseModel
 
+from qontract_api.cache.codec import JsonCodec
 from qontract_api.cache.redis import RedisCacheBackend
 
 
@@ -331,3 +332,104 @@ def test_custom_serializer_deserializer() -> None:
     assert result is not None
     assert result.name == "test"
     assert result.value == 42
+
+
+@pytest.fixture
+def mock_binary_client() -> Mock:
+    """Create a mock Redis/Valkey client without response decoding."""
+    return Mock()
+
+
+def test_get_set_bytes_use_binary_client(
+    mock_redis_client: Mock, mock_binary_client: Mock
+) -> None:
+    """Test get_bytes()/set_bytes() use the binary client."""
+    cache = RedisCacheBackend(mock_redis_client, binary_client=mock_binary_client)
+    mock_binary_client.get.return_value = b"\x00value"
+
+    cache.set_bytes("test_key", b"\x00value", ttl=300)
+
+    assert cache.get_bytes("test_key") == b"\x00value"
+    mock_binary_client.setex.assert_called_once_with("test_key", 300, b"\x00value")
+    mock_redis_client.get.assert_not_called()
+    mock_redis_client.setex.assert_not_called()
+
+
+@pytest.mark.parametrize("compression_threshold", [0, 1])
+def test_get_obj_set_obj_roundtrip_with_codec(
+    mock_redis_client: Mock, mock_binary_client: Mock, compression_threshold: int
+) -> None:
+    """Test roundtrip with a codec stores bytes via the binary client."""
+    codec = JsonCodec(compression_threshold=compression_threshold)
+    cache = RedisCacheBackend(
+        mock_redis_client,
+        codec=codec,
+        binary_client=mock_binary_client,
+        memory_max_size=0,
+    )
+    original = NestedModel(
+        users=["alice", "bob"],
+        channels=["general", "random"],
+        description="Test group",
+    )
+
+    cache.set_obj("test_key", original, ttl=300)
+
+    stored = mock_binary_client.setex.call_args[0][2]
+    assert stored[:1] == codec.tag
+    mock_binary_client.get.return_value = stored
+    assert cache.get_obj("test_key", cls=NestedModel) == original
+    mock_redis_client.setex.assert_not_called()
+
+
+def test_get_obj_with_codec_ignores_legacy_value(
+    mock_redis_client: Mock, mock_binary_client: Mock
+) -> None:
+    """Test get_obj() with a codec treats legacy JSON strings as a miss."""
+    cache = RedisCacheBackend(
+        mock_redis_client, codec=JsonCodec(), binary_client=mock_binary_client
+    )
+    mock_binary_client.get.return_value = b'{"name": "test", "value": 42}'
+
+    assert cache.get_obj("test_key", cls=SampleModel) is None
+
+
+def test_close_closes_binary_client(
+    mock_redis_client: Mock, mock_binary_client: Mock
+) -> None:
+    """Test close() closes both clients."""
+    cache = RedisCacheBackend(mock_redis_client, binary_client=mock_binary_client)
+
+    cache.close()
+
+    mock_redis_client.close.assert_called_once()
+    mock_binary_client.close.assert_called_once()
+
+
+def test_try_lock_acquires_non_blocking_lock(
+    cache: RedisCacheBackend, mock_redis_client: Mock
+) -> None:
+    """Test try_lock() yields True and releases the acquired lock."""
+    lock = mock_redis_client.lock.return_value
+    lock.acquire.return_value = True
+
+    with cache.try_lock("test_key", timeout=30) as acquired:
+        assert acquired is True
+
+    mock_redis_client.lock.assert_called_once_with(
+        "test_key:lock", timeout=30, blocking=False
+    )
+    lock.release.assert_called_once()
+
+
+def test_try_lock_yields_false_if_lock_is_held(
+    cache: RedisCacheBackend, mock_redis_client: Mock
+) -> None:
+    """Test try_lock() yields False without waiting if the lock is held."""
+    lock = mock_redis_client.lock.return_value
+    lock.acquire.return_value = False
+
+    with cache.try_lock("test_key") as acquired:
+        assert acquired is False
+
+    lock.release.assert_not_called()
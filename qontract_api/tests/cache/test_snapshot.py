@@ -0,0 +1,218 @@
+"""Unit tests for versioned cache snapshots."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import Field
+
+from qontract_api.cache.base import CacheBackend
+from qontract_api.cache.snapshot import Snapshot, SnapshotCache
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_mock import MockerFixture
+
+
+class CachedNames(Snapshot, frozen=True):
+    """Sample snapshot model."""
+
+    names: list[str] = Field(default_factory=list)
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """In-memory CacheBackend without the memory tier."""
+
+    def __init__(self) -> None:
+        super().__init__(memory_max_size=0)
+        self.storage: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        return self.storage.get(key)
+
+    def set(self, key: str, value: str, ttl: int | None = None) -> None:  # noqa: ARG002
+        self.storage[key] = value
+
+    def _delete_from_backend(self, key: str) -> None:
+        self.storage.pop(key, None)
+
+    def exists(self, key: str) -> bool:
+        return key in self.storage
+
+    def ping(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.storage.clear()
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = 300) -> Generator[None]:  # noqa: ARG002
+        with self._lock:
+            yield
+
+
+@pytest.fixture
+def cache() -> InMemoryCacheBackend:
+    return InMemoryCacheBackend()
+
+
+@pytest.fixture
+def fetch() -> MagicMock:
+    return MagicMock(return_value=CachedNames(names=["a", "b"]))
+
+
+def make_snapshot_cache(
+    cache: CacheBackend, fetch: MagicMock, refresh_ahead_ratio: float = 0.0
+) -> SnapshotCache[CachedNames]:
+    return SnapshotCache(
+        cache=cache,
+        key="test:names",
+        model=CachedNames,
+        ttl=60,
+        fetch=fetch,
+        entity="test_names",
+        refresh_ahead_ratio=refresh_ahead_ratio,
+    )
+
+
+def test_get_fetches_and_stores_versioned_snapshot(
+    cache: InMemoryCacheBackend, fetch: MagicMock
+) -> None:
+    snapshot = make_snapshot_cache(cache, fetch).get()
+
+    assert snapshot.names == ["a", "b"]
+    assert snapshot.fetched_at > 0
+    assert cache.storage["test:names:version"] == str(snapshot.version)
+    assert f"test:names:{snapshot.version}" in cache.storage
+    fetch.assert_called_once()
+
+
+def test_get_reuses_worker_local_snapshot(
+    cache: InMemoryCacheBackend, fetch: MagicMock, mocker: MockerFixture
+) -> None:
+    snapshots = make_snapshot_cache(cache, fetch)
+    first = snapshots.get()
+    get_obj = mocker.spy(cache, "get_obj")
+
+    assert snapshots.get() is first
+    get_obj.assert_not_called()
+    fetch.assert_called_once()
+
+
+def test_get_loads_new_version_written_by_another_worker(
+    cache: InMemoryCacheBackend, fetch: MagicMock
+) -> None:
+    snapshots = make_snapshot_cache(cache, fetch)
+    first = snapshots.get()
+    # simulate another worker publishing a new version
+    newer = CachedNames(names=["c"], version=first.version + 1)
+    cache.set_obj(f"test:names:{newer.version}", newer)
+    cache.set("test:names:version", str(newer.version))
+
+    assert snapshots.get().names == ["c"]
+    fetch.assert_called_once()
+
+
+def test_update_applies_delta_as_new_version(
+    cache: InMemoryCacheBackend, fetch: MagicMock
+) -> None:
+    snapshots = make_snapshot_cache(cache, fetch)
+    first = snapshots.get()
+
+    snapshots.update(lambda cached: CachedNames(names=[*cached.names, "c"]))
+    updated = snapshots.get()
+
+    assert updated.names == ["a", "b", "c"]
+    assert updated.version > first.version
+    assert updated.fetched_at == first.fetched_at
+    assert f"test:names:{first.version}" not in cache.storage
+    fetch.assert_called_once()
+
+
+def publish(cache: CacheBackend, snapshot: CachedNames) -> None:
+    cache.set_obj(f"test:names:{snapshot.version}", snapshot)
+    cache.set("test:names:version", str(snapshot.version))
+
+
+def test_update_keeps_remaining_ttl(
+    cache: InMemoryCacheBackend, fetch: MagicMock, mocker: MockerFixture
+) -> None:
+    publish(cache, CachedNames(names=["a"], version=1, fetched_at=time.time() - 50))
+    set_obj = mocker.spy(cache, "set_obj")
+
+    make_snapshot_cache(cache, fetch).update(
+        lambda cached: CachedNames(names=[*cached.names, "b"])
+    )
+
+    ttl = set_obj.call_args.args[2]
+    assert 0 < ttl <= 10
+    fetch.assert_not_called()
+
+
+def test_update_of_expired_snapshot_forces_full_fetch(
+    cache: InMemoryCacheBackend, fetch: MagicMock
+) -> None:
+    publish(cache, CachedNames(names=["a"], version=1, fetched_at=time.time() - 61))
+    snapshots = make_snapshot_cache(cache, fetch)
+
+    snapshots.update(lambda cached: CachedNames(names=[*cached.names, "c"]))
+
+    assert "test:names:version" not in cache.storage
+    assert snapshots.get().names == ["a", "b"]
+    fetch.assert_called_once()
+
+
+def test_update_without_snapshot_is_noop(
+    cache: InMemoryCacheBackend, fetch: MagicMock
+) -> None:
+    apply = MagicMock()
+
+    make_snapshot_cache(cache, fetch).update(apply)
+
+    apply.assert_not_called()
+    assert not cache.storage
+
+
+def test_update_lock_failure_is_logged(
+    cache: InMemoryCacheBackend, fetch: MagicMock, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(cache, "lock", side_effect=RuntimeError("locked"))
+
+    # should not raise
+    make_snapshot_cache(cache, fetch).update(MagicMock())
+
+
+def test_stale_snapshot_is_served_and_refreshed_in_background(
+    cache: InMemoryCacheBackend, fetch: MagicMock
+) -> None:
+    snapshots = make_snapshot_cache(cache, fetch, refresh_ahead_ratio=0.5)
+    stale = CachedNames(names=["old"], version=1, fetched_at=time.time() - 45)
+    cache.set_obj("test:names:1", stale)
+    cache.set("test:names:version", "1")
+
+    assert snapshots.get().names == ["old"]
+
+    deadline = time.monotonic() + 5
+    while cache.get("test:names:version") == "1" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert snapshots.get().names == ["a", "b"]
+    fetch.assert_called_once()
+
+
+def test_fresh_snapshot_is_not_refreshed(
+    cache: InMemoryCacheBackend, fetch: MagicMock
+) -> None:
+    snapshots = make_snapshot_cache(cache, fetch, refresh_ahead_ratio=0.5)
+    fresh = CachedNames(names=["new"], version=1, fetched_at=time.time())
+    cache.set_obj("test:names:1", fresh)
+    cache.set("test:names:version", "1")
+
+    assert snapshots.get().names == ["new"]
+    fetch.assert_not_called()
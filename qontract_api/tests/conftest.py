@@ -89,3 +89,12 @@ def mock_cache() -> Generator[Mock]:
     # Cleanup
     if hasattr(app.state, "cache"):
         del app.state.cache
+
+
+@pytest.fixture(autouse=True)
+def reset_local_snapshots() -> Generator[None]:
+    """Forget worker-local cache snapshots between tests."""
+    from qontract_api.cache.snapshot import clear_local_snapshots
+
+    yield
+    clear_local_snapshots()
@@ -332,6 +332,34 @@ def test_reconcile_creates_team(
     assert create_team_actions[0].team_slug == "backend"
 
 
+def test_reconcile_prefetches_existing_organizations(
+    service: GlitchtipService,
+    test_token: Secret,
+    test_automation_email_secret: Secret,
+    mock_glitchtip_client: MagicMock,
+) -> None:
+    """Test reconcile warms the cache of existing orgs and desired teams at once."""
+    instance = GIInstance(
+        name="test-instance",
+        console_url="https://glitchtip.example.com",
+        token=test_token,
+        automation_user_email=test_automation_email_secret,
+        organizations=[
+            GIOrganization(
+                name="my-org",
+                teams=[GlitchtipTeam(name="backend")],
+                projects=[],
+                users=[],
+            ),
+            GIOrganization(name="new-org", teams=[], projects=[], users=[]),
+        ],
+    )
+
+    service.reconcile(instances=[instance], dry_run=True)
+
+    mock_glitchtip_client.prefetch.assert_called_once_with({"my-org": {"backend"}})
+
+
 def test_reconcile_creates_team_and_adds_members_in_single_run(
     service: GlitchtipService,
     test_token: Secret,
@@ -1,10 +1,12 @@
-"""Unit tests for GlitchtipWorkspaceClient cache invalidation."""
+"""Unit tests for GlitchtipWorkspaceClient cache invalidation and prefetching."""
 
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 from qontract_utils.glitchtip_api import GlitchtipApi
-from qontract_utils.glitchtip_api.models import Team
+from qontract_utils.glitchtip_api.models import Project, Team
 
 from qontract_api.cache.base import CacheBackend
 from qontract_api.config import Settings
@@ -16,10 +18,15 @@ def mock_api() -> MagicMock:
     return MagicMock(spec=GlitchtipApi)
 
 
+def _compute(_key: str, _cls: type, compute: Callable[[], Any], _ttl: int) -> Any:
+    return compute()
+
+
 @pytest.fixture
 def mock_cache() -> MagicMock:
     m = MagicMock(spec=CacheBackend)
     m.get_obj.return_value = None
+    m.get_or_set_obj.side_effect = _compute
     m.lock.return_value.__enter__ = MagicMock()
     m.lock.return_value.__exit__ = MagicMock(return_value=False)
     return m
@@ -57,3 +64,52 @@ def test_delete_user_clears_team_user_caches(
     assert "glitchtip:test-instance:my-org:users" in deleted_keys
     assert "glitchtip:test-instance:my-org:team-alpha:team_users" in deleted_keys
     assert "glitchtip:test-instance:my-org:team-beta:team_users" in deleted_keys
+
+
+def test_prefetch_fetches_org_collections_and_existing_team_users(
+    client: GlitchtipWorkspaceClient,
+    mock_api: MagicMock,
+) -> None:
+    """prefetch fetches per-org collections and members of existing desired teams."""
+    mock_api.teams.return_value = [
+        Team(pk=1, slug="team-alpha"),
+        Team(pk=2, slug="team-unmanaged"),
+    ]
+
+    client.prefetch({"org-a": {"team-alpha", "team-new"}, "org-b": set()})
+
+    assert {c.args for c in mock_api.organization_users.call_args_list} == {
+        ("org-a",),
+        ("org-b",),
+    }
+    assert {c.args for c in mock_api.projects.call_args_list} == {
+        ("org-a",),
+        ("org-b",),
+    }
+    mock_api.team_users.assert_called_once_with("org-a", "team-alpha")
+
+
+def test_prefetch_raises_fetch_errors(
+    client: GlitchtipWorkspaceClient,
+    mock_api: MagicMock,
+) -> None:
+    """Errors of concurrent fetches are raised by prefetch."""
+    mock_api.projects.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        client.prefetch({"org-a": set()})
+
+
+def test_prefetch_project_alerts_fetches_existing_projects(
+    client: GlitchtipWorkspaceClient,
+    mock_api: MagicMock,
+) -> None:
+    """prefetch_project_alerts fetches alerts of existing desired projects only."""
+    mock_api.projects.return_value = [
+        Project(pk=1, name="Project A", slug="project-a"),
+        Project(pk=2, name="Project B", slug="project-b"),
+    ]
+
+    client.prefetch_project_alerts({"org-a": {"project-a", "project-missing"}})
+
+    mock_api.project_alerts.assert_called_once_with("org-a", "project-a")
@@ -135,6 +135,19 @@ def test_reconcile_no_changes(
     assert result.errors == []
 
 
+def test_reconcile_prefetches_project_alerts(
+    service: GlitchtipProjectAlertsService,
+    test_instance: GlitchtipInstance,
+    mock_glitchtip_client: MagicMock,
+) -> None:
+    """Test reconcile warms the cache of all desired projects at once."""
+    service.reconcile(instances=[test_instance], dry_run=True)
+
+    mock_glitchtip_client.prefetch_project_alerts.assert_called_once_with({
+        "my-org": {"my-project"}
+    })
+
+
 def test_reconcile_creates_new_alert(
     service: GlitchtipProjectAlertsService,
     test_token: Secret,
@@ -1,5 +1,6 @@
 """Shared fixtures for Kubernetes workspace client tests."""
 
+from functools import partial
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,9 +19,14 @@ def mock_kubernetes_api() -> MagicMock:
 def mock_cache() -> MagicMock:
     """Mock CacheBackend with double-check locking support."""
     m = MagicMock(spec=CacheBackend)
+    # a snapshot version exists, get_obj decides between cache hit and miss
+    m.get.return_value = "1"
     m.get_obj.return_value = None
     m.lock.return_value.__enter__ = MagicMock()
     m.lock.return_value.__exit__ = MagicMock(return_value=False)
+    # run the real single-flight logic against the mocked lock and reads
+    m.try_lock.return_value.__enter__.return_value = True
+    m.single_flight.side_effect = partial(CacheBackend.single_flight, m)
     return m
 
 
@@ -96,7 +96,7 @@ def test_namespace_exists_double_check_locking(
 
     assert client.namespace_exists("my-ns") is True
     mock_kubernetes_api.list_namespaces.assert_not_called()
-    mock_cache.lock.assert_called_once()
+    mock_cache.try_lock.assert_called_once()
 
 
 def test_namespace_exists_sets_correct_ttl(
@@ -141,30 +141,50 @@ def test_namespace_exists_single_list_for_multiple_checks(
     mock_kubernetes_api.list_namespaces.assert_called_once()
 
 
-def test_create_namespace_delegates_and_invalidates(
+def test_create_namespace_delegates_and_updates_cache(
     mock_kubernetes_api: MagicMock,
     mock_cache: MagicMock,
     mock_settings: Settings,
 ) -> None:
-    """create_namespace delegates to Layer 1 and invalidates cache."""
+    """create_namespace delegates to Layer 1 and adds the name to the cached set."""
+    mock_cache.get_obj.return_value = CachedNamespaceNames(names=frozenset({"ns"}))
     client = _make_client(mock_kubernetes_api, mock_cache, mock_settings)
     client.create_namespace("new-ns")
 
     mock_kubernetes_api.create_namespace.assert_called_once_with("new-ns")
-    mock_cache.delete.assert_called_once_with("kubernetes:test-cluster:namespace_names")
+    cached_value = mock_cache.set_obj.call_args[0][1]
+    assert cached_value.names == frozenset({"ns", "new-ns"})
+    mock_kubernetes_api.list_namespaces.assert_not_called()
 
 
-def test_delete_namespace_delegates_and_invalidates(
+def test_delete_namespace_delegates_and_updates_cache(
     mock_kubernetes_api: MagicMock,
     mock_cache: MagicMock,
     mock_settings: Settings,
 ) -> None:
-    """delete_namespace delegates to Layer 1 and invalidates cache."""
+    """delete_namespace delegates to Layer 1 and removes the name from the cache."""
+    mock_cache.get_obj.return_value = CachedNamespaceNames(
+        names=frozenset({"ns", "old-ns"})
+    )
     client = _make_client(mock_kubernetes_api, mock_cache, mock_settings)
     client.delete_namespace("old-ns")
 
     mock_kubernetes_api.delete_namespace.assert_called_once_with("old-ns")
-    mock_cache.delete.assert_called_once_with("kubernetes:test-cluster:namespace_names")
+    cached_value = mock_cache.set_obj.call_args[0][1]
+    assert cached_value.names == frozenset({"ns"})
+
+
+def test_create_namespace_without_cached_set(
+    mock_kubernetes_api: MagicMock,
+    mock_cache: MagicMock,
+    mock_settings: Settings,
+) -> None:
+    """Without a cached set there is nothing to update, the next read lists."""
+    mock_cache.get.return_value = None
+    client = _make_client(mock_kubernetes_api, mock_cache, mock_settings)
+    client.create_namespace("new-ns")
+
+    mock_cache.set_obj.assert_not_called()
 
 
 def test_list_namespaces_delegates_no_cache(
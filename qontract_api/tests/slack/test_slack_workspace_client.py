@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
@@ -41,6 +42,13 @@ def client(
     )
 
 
+def cached_usergroup(mock_cache: MagicMock, usergroup_id: str) -> SlackUsergroup:
+    """Return a usergroup from the last usergroups snapshot written to the cache."""
+    cached = mock_cache.set_obj.call_args[0][1]
+    assert isinstance(cached, CachedUsergroups)
+    return cached.to_dict()[usergroup_id]
+
+
 def test_cache_key_users(client: SlackWorkspaceClient) -> None:
     """Test cache key generation for users."""
     assert client._cache_key_users() == "slack:test-workspace:users"
@@ -113,7 +121,9 @@ def test_get_users_acquires_lock_on_cache_miss(
 
     client.get_users()
 
-    mock_cache.lock.assert_called_once_with("slack:test-workspace:users")
+    mock_cache.try_lock.assert_called_once_with(
+        "slack:test-workspace:users", timeout=300
+    )
 
 
 def test_get_usergroups_cache_hit(
@@ -122,7 +132,7 @@ def test_get_usergroups_cache_hit(
     """Test get_usergroups returns cached data on cache hit."""
     # Setup cache hit with CachedUsergroups
     ug = SlackUsergroup(id="UG1", handle="team", name="Team")
-    cached_dict = CachedUsergroups(items=[ug])
+    cached_dict = CachedUsergroups(items=[ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
 
     usergroups = client.get_usergroups()
@@ -155,7 +165,7 @@ def test_get_usergroup_by_handle(
     """Test get_usergroup_by_handle finds usergroup."""
     # Setup cache hit with CachedUsergroups
     ug = SlackUsergroup(id="UG1", handle="oncall", name="On-Call")
-    cached_dict = CachedUsergroups(items=[ug])
+    cached_dict = CachedUsergroups(items=[ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
 
     usergroup = client._get_usergroup_by_handle("oncall")
@@ -171,7 +181,7 @@ def test_get_usergroup_by_handle_not_found(
     """Test get_usergroup_by_handle returns None if not found."""
     # Setup cache hit with CachedUsergroups
     ug = SlackUsergroup(id="UG1", handle="oncall", name="On-Call")
-    cached_dict = CachedUsergroups(items=[ug])
+    cached_dict = CachedUsergroups(items=[ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
 
     usergroup = client._get_usergroup_by_handle("notfound")
@@ -179,20 +189,23 @@ def test_get_usergroup_by_handle_not_found(
     assert usergroup is None
 
 
-def test_update_usergroup_calls_api_and_clears_cache(
+def test_update_usergroup_calls_api_and_updates_cache(
     client: SlackWorkspaceClient,
     mock_slack_api: MagicMock,
     mock_cache: MagicMock,
 ) -> None:
-    """Test update_usergroup calls API and clears cache.
+    """Test update_usergroup calls API and updates the cached usergroup.
 
     WorkspaceClient accepts handle and converts to ID internally.
     SlackApi only accepts IDs.
     """
     # Setup cache with existing usergroup (for handle lookup)
     ug = SlackUsergroup(id="UG1", handle="oncall", name="On-Call")
-    cached_dict = CachedUsergroups(items=[ug])
+    cached_dict = CachedUsergroups(items=[ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
+    mock_slack_api.usergroup_update.return_value = ug.model_copy(
+        update={"description": "Updated desc", "users": ["U1"]}
+    )
 
     # WorkspaceClient takes handle, converts to ID
     client.update_usergroup(
@@ -207,23 +220,26 @@ def test_update_usergroup_calls_api_and_clears_cache(
         description="Updated desc",
         channel_ids=[],
     )
-    # Verify cache was cleared
-    mock_cache.delete.assert_called_once_with("slack:test-workspace:usergroups")
+    # The usergroup returned by the API is cached instead of invalidating
+    assert (
+        cached_usergroup(mock_cache, "UG1")
+        == mock_slack_api.usergroup_update.return_value
+    )
 
 
-def test_update_usergroup_users_calls_api_and_clears_cache(
+def test_update_usergroup_users_calls_api_and_updates_cache(
     client: SlackWorkspaceClient,
     mock_slack_api: MagicMock,
     mock_cache: MagicMock,
 ) -> None:
-    """Test update_usergroup_users calls API and clears cache.
+    """Test update_usergroup_users calls API and updates the cached usergroup.
 
     WorkspaceClient accepts handle and org usernames, converts to usergroup ID
     and Slack user IDs internally. SlackApi only accepts IDs.
     """
     # Setup cache with existing usergroup (for handle lookup)
     ug = SlackUsergroup(id="UG1", handle="oncall", name="On-Call")
-    cached_usergroups = CachedUsergroups(items=[ug])
+    cached_usergroups = CachedUsergroups(items=[ug], fetched_at=time.time())
 
     # Setup cache with users (for org_username -> ID mapping)
     # NOTE: org_username is calculated from profile.email (email prefix before @)
@@ -264,8 +280,8 @@ def test_update_usergroup_users_calls_api_and_clears_cache(
         usergroup_id="UG1",
         user_ids=["U1", "U2"],
     )
-    # Verify cache was cleared
-    mock_cache.delete.assert_called_once_with("slack:test-workspace:usergroups")
+    # Verify the cached usergroup was updated instead of invalidated
+    assert cached_usergroup(mock_cache, "UG1").users == ["U1", "U2"]
 
 
 def test_update_usergroup_with_channels(
@@ -279,7 +295,10 @@ def test_update_usergroup_with_channels(
     """
     # Setup usergroups cache (for handle lookup)
     ug = SlackUsergroup(id="UG1", handle="oncall", name="On-Call")
-    ug_cached = CachedUsergroups(items=[ug])
+    ug_cached = CachedUsergroups(items=[ug], fetched_at=time.time())
+    mock_slack_api.usergroup_update.return_value = ug.model_copy(
+        update={"prefs": SlackUsergroupPrefs(channels=["C1", "C2"])}
+    )
 
     # Setup channels cache (for name → ID conversion)
     c1 = SlackChannel(id="C1", name="general")
@@ -309,8 +328,8 @@ def test_update_usergroup_with_channels(
         description="Updated desc",
         channel_ids=["C1", "C2"],
     )
-    # Verify cache was cleared
-    mock_cache.delete.assert_called_once_with("slack:test-workspace:usergroups")
+    # Verify the usergroup returned by the API was cached
+    assert cached_usergroup(mock_cache, "UG1").prefs.channels == ["C1", "C2"]
 
 
 def test_create_usergroup_with_handle_only(
@@ -321,7 +340,7 @@ def test_create_usergroup_with_handle_only(
     """Test create_usergroup with handle only."""
     # Setup cache with existing usergroups
     existing_ug = SlackUsergroup(id="UG0", handle="existing", name="Existing")
-    cached_dict = CachedUsergroups(items=[existing_ug])
+    cached_dict = CachedUsergroups(items=[existing_ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
 
     created_ug = SlackUsergroup(id="UG1", handle="new-team", name="new-team")
@@ -336,9 +355,11 @@ def test_create_usergroup_with_handle_only(
     mock_slack_api.usergroup_create.assert_called_once_with(
         handle="new-team", name=None
     )
-    # Verify cache update was attempted
+    # Verify the created usergroup was added to the cached snapshot
     mock_cache.lock.assert_called_once_with("slack:test-workspace:usergroups")
     mock_cache.set_obj.assert_called_once()
+    assert cached_usergroup(mock_cache, "UG0") == existing_ug
+    assert cached_usergroup(mock_cache, "UG1") == created_ug
 
 
 def test_create_usergroup_with_custom_name(
@@ -349,7 +370,7 @@ def test_create_usergroup_with_custom_name(
     """Test create_usergroup with handle and custom name."""
     # Setup cache with existing usergroups
     existing_ug = SlackUsergroup(id="UG0", handle="existing", name="Existing")
-    cached_dict = CachedUsergroups(items=[existing_ug])
+    cached_dict = CachedUsergroups(items=[existing_ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
 
     created_ug = SlackUsergroup(id="UG1", handle="new-team", name="Custom Display Name")
@@ -372,7 +393,7 @@ def test_update_usergroup_raises_error_if_handle_not_found(
     """Test update_usergroup raises SlackUsergroupNotFoundError if handle not found."""
     # Setup cache with different usergroup
     ug = SlackUsergroup(id="UG1", handle="other", name="Other")
-    cached_dict = CachedUsergroups(items=[ug])
+    cached_dict = CachedUsergroups(items=[ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
 
     # Should raise error when handle not found
@@ -391,7 +412,7 @@ def test_update_usergroup_users_raises_error_if_handle_not_found(
     """Test update_usergroup_users raises SlackUsergroupNotFoundError if handle not found."""
     # Setup cache with different usergroup
     ug = SlackUsergroup(id="UG1", handle="other", name="Other")
-    cached_dict = CachedUsergroups(items=[ug])
+    cached_dict = CachedUsergroups(items=[ug], fetched_at=time.time())
     mock_cache.get_obj.return_value = cached_dict
 
     # Should raise error when handle not found
@@ -433,7 +454,7 @@ def test_update_usergroup_users_with_empty_list_uses_deleted_user(
     """
     # Setup cache with existing usergroup
     ug = SlackUsergroup(id="UG1", handle="oncall", name="On-Call")
-    cached_usergroups = CachedUsergroups(items=[ug])
+    cached_usergroups = CachedUsergroups(items=[ug], fetched_at=time.time())
 
     # Setup cache with users (including one deleted user)
     user1 = SlackUser(
@@ -473,8 +494,8 @@ def test_update_usergroup_users_with_empty_list_uses_deleted_user(
         usergroup_id="UG1",
         user_ids=["U_DELETED"],
     )
-    # Verify cache was cleared
-    mock_cache.delete.assert_called_once_with("slack:test-workspace:usergroups")
+    # Verify the cached usergroup was updated instead of invalidated
+    assert cached_usergroup(mock_cache, "UG1").users == ["U_DELETED"]
 
 
 def test_update_usergroup_users_with_empty_list_no_deleted_users_raises_error(
@@ -484,7 +505,7 @@ def test_update_usergroup_users_with_empty_list_no_deleted_users_raises_error(
     """Test update_usergroup_users with empty list raises error when no deleted users exist."""
     # Setup cache with existing usergroup
     ug = SlackUsergroup(id="UG1", handle="oncall", name="On-Call")
-    cached_usergroups = CachedUsergroups(items=[ug])
+    cached_usergroups = CachedUsergroups(items=[ug], fetched_at=time.time())
 
     # Setup cache with only active users (no deleted users)
     user1 = SlackUser(
@@ -536,7 +557,7 @@ def test_update_usergroup_users_with_empty_list_reactivates_disabled_usergroup(
         name="On-Call",
         date_delete=1234567890,  # disabled usergroups have date_delete set
     )
-    cached_usergroups = CachedUsergroups(items=[ug])
+    cached_usergroups = CachedUsergroups(items=[ug], fetched_at=time.time())
 
     # Setup cache with users (including deleted user)
     deleted_user = SlackUser(
@@ -572,8 +593,10 @@ def test_update_usergroup_users_with_empty_list_reactivates_disabled_usergroup(
         usergroup_id="UG1",
         user_ids=["U_DELETED"],
     )
-    # Verify cache was cleared
-    mock_cache.delete.assert_called_once_with("slack:test-workspace:usergroups")
+    # Verify the cached usergroup was updated (and is active again)
+    cached_ug = cached_usergroup(mock_cache, "UG1")
+    assert cached_ug.users == ["U_DELETED"]
+    assert cached_ug.is_active()
 
 
 def test_chat_post_message_resolves_channel_name(
@@ -729,7 +752,7 @@ def test_get_slack_usergroups_enterprise_grid_user_resolved(
 
     def get_obj_side_effect(cache_key: str, *_args: Any, **_kwargs: Any) -> Any:
         if "usergroups" in cache_key:
-            return CachedUsergroups(items=[ug])
+            return CachedUsergroups(items=[ug], fetched_at=time.time())
         if "users" in cache_key:
             return CachedUsers(items=[user])
         if "channels" in cache_key:
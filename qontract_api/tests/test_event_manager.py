@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import os
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import ANY, MagicMock
 
 import pytest
 from qontract_utils.events import Event
 
-from qontract_api.event_manager import EventManager
+from qontract_api.event_manager import BufferedPublisher, EventManager
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -19,7 +21,7 @@ def mock_publisher(mocker: MockerFixture) -> MagicMock:
 
 @pytest.fixture
 def event_manager(mock_publisher: MagicMock) -> EventManager:
-    return EventManager(publisher=mock_publisher, stream="test-stream")
+    return EventManager(publisher=mock_publisher, flush_timeout=1.0)
 
 
 @pytest.fixture
@@ -31,6 +33,34 @@ def sample_event() -> Event:
     )
 
 
+@pytest.fixture
+def mock_broker(mocker: MockerFixture) -> MagicMock:
+    return mocker.MagicMock()
+
+
+def make_publisher(
+    mock_broker: MagicMock,
+    buffer_size: int = 100,
+    batch_size: int = 10,
+    flush_interval: float = 60.0,
+) -> BufferedPublisher:
+    return BufferedPublisher(
+        mock_broker,
+        stream="test-stream",
+        buffer_size=buffer_size,
+        batch_size=batch_size,
+        flush_interval=flush_interval,
+    )
+
+
+def published_events(mock_broker: MagicMock) -> list[Event]:
+    return [
+        event
+        for call in mock_broker.publish_batch.call_args_list
+        for event, _ in call.args[0]
+    ]
+
+
 class TestEventManager:
     def test_publish_event(
         self,
@@ -39,9 +69,7 @@ class TestEventManager:
         sample_event: Event,
     ) -> None:
         event_manager.publish_event(sample_event)
-        mock_publisher.__enter__().publish.assert_called_once_with(  # noqa: PLC2801
-            sample_event, stream="test-stream", headers=ANY
-        )
+        mock_publisher.publish.assert_called_once_with(sample_event, headers=ANY)
 
     def test_publish_event_failure_does_not_propagate(
         self,
@@ -49,10 +77,22 @@ class TestEventManager:
         mock_publisher: MagicMock,
         sample_event: Event,
     ) -> None:
-        mock_publisher.__enter__().publish.side_effect = Exception("Redis error")  # noqa: PLC2801
+        mock_publisher.publish.side_effect = Exception("Redis error")
         # Should not raise
         event_manager.publish_event(sample_event)
 
+    def test_flush(
+        self, event_manager: EventManager, mock_publisher: MagicMock
+    ) -> None:
+        event_manager.flush()
+        mock_publisher.flush.assert_called_once_with(1.0)
+
+    def test_close(
+        self, event_manager: EventManager, mock_publisher: MagicMock
+    ) -> None:
+        event_manager.close()
+        mock_publisher.close.assert_called_once_with(1.0)
+
     def test_from_config_disabled(self, mocker: MockerFixture) -> None:
         mock_settings = mocker.MagicMock()
         mock_settings.events.enabled = False
@@ -69,3 +109,141 @@ class TestEventManager:
         result = EventManager.from_config(settings=mock_settings)
         assert result is not None
         assert isinstance(result, EventManager)
+
+
+class TestBufferedPublisher:
+    def test_flush_publishes_buffered_events_in_one_batch(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        publisher = make_publisher(mock_broker)
+        publisher.publish(sample_event, headers={"request_id": "1"})
+        publisher.publish(sample_event, headers=None)
+
+        assert publisher.flush(timeout=5)
+
+        mock_broker.publish_batch.assert_called_once_with(
+            [(sample_event, {"request_id": "1"}), (sample_event, None)],
+            stream="test-stream",
+        )
+        publisher.close(timeout=5)
+
+    def test_batch_size_triggers_flush(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        publisher = make_publisher(mock_broker, batch_size=2)
+        for _ in range(4):
+            publisher.publish(sample_event, headers=None)
+
+        assert publisher.flush(timeout=5)
+
+        assert all(
+            len(call.args[0]) == 2 for call in mock_broker.publish_batch.call_args_list
+        )
+        assert len(published_events(mock_broker)) == 4
+        publisher.close(timeout=5)
+
+    def test_flush_interval_triggers_flush(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        publisher = make_publisher(mock_broker, flush_interval=0.01)
+        publisher.publish(sample_event, headers=None)
+
+        deadline = time.monotonic() + 5
+        while not mock_broker.publish_batch.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        mock_broker.publish_batch.assert_called_once()
+        publisher.close(timeout=5)
+
+    def test_connection_is_reused(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        publisher = make_publisher(mock_broker)
+        publisher.publish(sample_event, headers=None)
+        assert publisher.flush(timeout=5)
+        publisher.publish(sample_event, headers=None)
+        assert publisher.flush(timeout=5)
+
+        publisher.close(timeout=5)
+
+        assert mock_broker.publish_batch.call_count == 2
+        mock_broker.__enter__.assert_called_once()
+        mock_broker.__exit__.assert_called_once()
+
+    def test_reconnects_on_failure(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        mock_broker.publish_batch.side_effect = [ConnectionError("gone"), ["1-0"]]
+        publisher = make_publisher(mock_broker)
+        publisher.publish(sample_event, headers=None)
+
+        assert publisher.flush(timeout=5)
+
+        assert mock_broker.publish_batch.call_count == 2
+        assert mock_broker.__enter__.call_count == 2
+        publisher.close(timeout=5)
+
+    def test_failed_batch_is_dropped(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        mock_broker.publish_batch.side_effect = ConnectionError("gone")
+        publisher = make_publisher(mock_broker)
+        publisher.publish(sample_event, headers=None)
+
+        # should not raise
+        assert publisher.flush(timeout=5)
+        publisher.close(timeout=5)
+
+        assert mock_broker.publish_batch.call_count == 2
+
+    def test_full_buffer_drops_events(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        publisher = make_publisher(mock_broker, buffer_size=1)
+        other_event = Event(source="qontract-api", type="other")
+        # keep the publisher thread from picking up the buffered event
+        with publisher._cond:
+            publisher.publish(sample_event, headers=None)
+            publisher.publish(other_event, headers=None)
+
+        publisher.close(timeout=5)
+
+        assert published_events(mock_broker) == [sample_event]
+
+    def test_close_publishes_remaining_events(
+        self, mock_broker: MagicMock, sample_event: Event
+    ) -> None:
+        publisher = make_publisher(mock_broker)
+        publisher.publish(sample_event, headers=None)
+
+        publisher.close(timeout=5)
+        publisher.publish(sample_event, headers=None)
+
+        assert published_events(mock_broker) == [sample_event]
+
+    def test_flush_without_events(self, mock_broker: MagicMock) -> None:
+        publisher = make_publisher(mock_broker)
+
+        assert publisher.flush(timeout=5)
+        mock_broker.publish_batch.assert_not_called()
+
+    def test_forked_process_starts_with_empty_buffer(
+        self, mock_broker: MagicMock, sample_event: Event, mocker: MockerFixture
+    ) -> None:
+        publisher = make_publisher(mock_broker)
+        # buffer an event in the "parent" without starting its thread
+        ensure_thread = mocker.patch.object(publisher, "_ensure_thread")
+        publisher.publish(sample_event, headers=None)
+        parent_cond = publisher._cond
+        mocker.stop(ensure_thread)
+
+        mocker.patch(
+            "qontract_api.event_manager._publisher.os.getpid",
+            return_value=os.getpid() + 1,
+        )
+        other_event = Event(source="qontract-api", type="other")
+        publisher.publish(other_event, headers=None)
+        publisher.close(timeout=5)
+
+        assert publisher._cond is not parent_cond
+        assert published_events(mock_broker) == [other_event]
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Iterable
 from typing import Any, Self
 
 from faststream.redis import RedisBroker as FastRedisBroker
@@ -39,3 +39,23 @@ class RedisBroker:
     ) -> int | bytes:
         """Publish a message to a Redis Stream."""
         return self._run(self._broker.publish(message, stream=stream, headers=headers))
+
+    def publish_batch(
+        self,
+        messages: Iterable[tuple[SendableMessage, dict[str, Any] | None]],
+        stream: str,
+    ) -> list[Any]:
+        """Publish (message, headers) pairs to a Redis Stream in one round trip."""
+        return self._run(self._publish_batch(messages, stream))
+
+    async def _publish_batch(
+        self,
+        messages: Iterable[tuple[SendableMessage, dict[str, Any] | None]],
+        stream: str,
+    ) -> list[Any]:
+        async with self._broker._connection.pipeline() as pipe:  # noqa: SLF001
+            for message, headers in messages:
+                await self._broker.publish(
+                    message, stream=stream, headers=headers, pipeline=pipe
+                )
+            return await pipe.execute()
@@ -7,6 +7,7 @@ rate limiting via hooks (ADR-006).
 
 import contextvars
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Self
 
@@ -42,6 +43,13 @@ glitchtip_request_duration = Histogram(
     buckets=DEFAULT_BUCKETS_EXTERNAL_API,
 )
 
+glitchtip_page_request_duration = Histogram(
+    "qontract_reconcile_external_api_glitchtip_page_request_duration_seconds",
+    "Glitchtip API request duration of single pages of paginated endpoints in seconds",
+    ["method"],
+    buckets=DEFAULT_BUCKETS_EXTERNAL_API,
+)
+
 # Local storage for latency tracking (tuple stack to support nested calls)
 _latency_tracker: contextvars.ContextVar[tuple[float, ...]] = contextvars.ContextVar(
     f"{__name__}.latency_tracker", default=()
@@ -178,6 +186,7 @@ class GlitchtipApi:
         timeout: int = TIMEOUT,
         max_retries: int = 3,
         hooks: Hooks | None = None,  # noqa: ARG002 - Handled by @with_hooks decorator
+        prefetch_workers: int = 8,
     ) -> None:
         """Initialize Glitchtip API client.
 
@@ -188,6 +197,8 @@ class GlitchtipApi:
             max_retries: Number of retries for failed requests (default: 3)
             hooks: Optional custom hooks to merge with built-in hooks.
                 Built-in hooks (metrics, logging, latency) are automatically included.
+            prefetch_workers: Max next pages of paginated endpoints fetched in the
+                background, shared by concurrent calls (default: 8)
         """
         self.host = host.rstrip("/")
         self._client = httpx2.Client(
@@ -196,13 +207,38 @@ class GlitchtipApi:
             timeout=timeout,
             transport=httpx2.HTTPTransport(retries=max_retries),
         )
+        self._prefetch = ThreadPoolExecutor(
+            max_workers=prefetch_workers, thread_name_prefix="glitchtip-prefetch"
+        )
+
+    def _get_page(
+        self, method: str, url: str, params: dict[str, Any] | None = None
+    ) -> httpx2.Response:
+        """GET a single page of a paginated endpoint.
+
+        Args:
+            method: API method name for metrics (e.g., "organizations.list")
+            url: API path or next page URL
+            params: Optional query parameters
+
+        Returns:
+            Response of the page
+        """
+        with glitchtip_page_request_duration.labels(method).time():
+            response = self._client.get(url, params=params)
+        response.raise_for_status()
+        return response
 
     def _list(
-        self, path: str, params: dict[str, Any] | None = None
+        self, method: str, path: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
         """Fetch all pages from a paginated endpoint.
 
+        The next page (cursor from the Link header) is requested in the background
+        while the current page is parsed.
+
         Args:
+            method: API method name for metrics (e.g., "organizations.list")
             path: API path (e.g., "/api/0/organizations/")
             params: Optional query parameters
 
@@ -210,12 +246,12 @@ class GlitchtipApi:
             Flat list of all items across all pages
         """
         results: list[dict[str, Any]] = []
-        url: str | None = path
-        while url:
-            response = self._client.get(url, params=params if url == path else None)
-            response.raise_for_status()
+        response = self._get_page(method, path, params)
+        while next_url := get_next_url(response):
+            next_page = self._prefetch.submit(self._get_page, method, next_url)
             results.extend(response.json())
-            url = get_next_url(response)
+            response = next_page.result()
+        results.extend(response.json())
         return results
 
     def _post(self, path: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -274,7 +310,9 @@ class GlitchtipApi:
         """
         return [
             Organization.model_validate(r)
-            for r in self._list("/api/0/organizations/", params={"limit": 100})
+            for r in self._list(
+                "organizations.list", "/api/0/organizations/", params={"limit": 100}
+            )
         ]
 
     @invoke_with_hooks(
@@ -300,6 +338,7 @@ class GlitchtipApi:
         return [
             Project.model_validate(r)
             for r in self._list(
+                "projects.list",
                 f"/api/0/organizations/{organization_slug}/projects/",
                 params={"limit": 100},
             )
@@ -331,6 +370,7 @@ class GlitchtipApi:
         return [
             ProjectAlert.model_validate(r)
             for r in self._list(
+                "project_alerts.list",
                 f"/api/0/projects/{organization_slug}/{project_slug}/alerts/",
                 params={"limit": 100},
             )
@@ -480,6 +520,7 @@ class GlitchtipApi:
         return [
             Team.model_validate(r)
             for r in self._list(
+                "teams.list",
                 f"/api/0/organizations/{organization_slug}/teams/",
                 params={"limit": 100},
             )
@@ -667,6 +708,7 @@ class GlitchtipApi:
         return [
             User.model_validate(r)
             for r in self._list(
+                "organization_users.list",
                 f"/api/0/organizations/{organization_slug}/members/",
                 params={"limit": 100},
             )
@@ -757,6 +799,7 @@ class GlitchtipApi:
         return [
             User.model_validate(r)
             for r in self._list(
+                "team_users.list",
                 f"/api/0/teams/{organization_slug}/{team_slug}/members/",
                 params={"limit": 100},
             )
@@ -801,7 +844,8 @@ class GlitchtipApi:
         )
 
     def close(self) -> None:
-        """Close the underlying httpx2 client."""
+        """Close the underlying httpx2 client and the prefetch threads."""
+        self._prefetch.shutdown(cancel_futures=True)
         self._client.close()
 
     def __enter__(self) -> Self:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 from qontract_utils.events import RedisBroker
@@ -120,3 +120,22 @@ def test_reentry_creates_new_loop(
     assert first_loop is not second_loop
     assert mock_fast_broker.connect.await_count == 2
     assert mock_fast_broker.stop.await_count == 2
+
+
+def test_publish_batch(broker: RedisBroker, mock_fast_broker: MagicMock) -> None:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[b"1-0", b"2-0"])
+    mock_fast_broker._connection.pipeline.return_value.__aenter__.return_value = pipe
+
+    with broker:
+        result = broker.publish_batch(
+            [("first", {"x-trace": "abc"}), ("second", None)],
+            stream="test-stream",
+        )
+
+    assert mock_fast_broker.publish.await_args_list == [
+        call("first", stream="test-stream", headers={"x-trace": "abc"}, pipeline=pipe),
+        call("second", stream="test-stream", headers=None, pipeline=pipe),
+    ]
+    pipe.execute.assert_awaited_once()
+    assert result == [b"1-0", b"2-0"]
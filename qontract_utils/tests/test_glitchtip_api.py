@@ -1,5 +1,6 @@
 """Tests for qontract_utils.glitchtip_api module."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import httpx2
@@ -368,6 +369,59 @@ def test_organizations_pagination(
     assert mock_httpx_client.get.call_count == 2
 
 
+def test_pagination_prefetches_next_page(
+    glitchtip_api: GlitchtipApi, mock_httpx_client: MagicMock
+) -> None:
+    """Test the next page is requested before the current page is parsed."""
+    next_link = '<https://glitchtip.example.com/api/0/organizations/?cursor={}>; rel="next"; results="true"'
+    pages = [
+        _make_response(
+            [{"id": i, "name": f"org-{i}", "slug": f"org-{i}"}],
+            link=next_link.format(i) if i < 3 else "",
+        )
+        for i in range(1, 4)
+    ]
+    requested = threading.Event()
+
+    def get(url: str, params: dict | None = None) -> MagicMock:
+        if params:
+            return pages[0]
+        requested.set()
+        return pages[int(url.rsplit("=", 1)[-1])]
+
+    def parse_page1() -> list:
+        # page 2 must be in flight while page 1 is parsed
+        assert requested.wait(timeout=5)
+        return [{"id": 1, "name": "org-1", "slug": "org-1"}]
+
+    pages[0].json.side_effect = parse_page1
+    mock_httpx_client.get.side_effect = get
+
+    orgs = glitchtip_api.organizations()
+
+    assert [o.name for o in orgs] == ["org-1", "org-2", "org-3"]
+    assert mock_httpx_client.get.call_count == 3
+    mock_httpx_client.get.assert_any_call(
+        "https://glitchtip.example.com/api/0/organizations/?cursor=2", params=None
+    )
+
+
+def test_pagination_error_on_next_page(
+    glitchtip_api: GlitchtipApi, mock_httpx_client: MagicMock
+) -> None:
+    """Test errors of prefetched pages are raised."""
+    page1 = _make_response(
+        [{"id": 1, "name": "org-1", "slug": "org-1"}],
+        link='<https://glitchtip.example.com/api/0/organizations/?cursor=abc>; rel="next"; results="true"',
+    )
+    page2 = _make_response([])
+    page2.raise_for_status.side_effect = httpx2.HTTPError("boom")
+    mock_httpx_client.get.side_effect = [page1, page2]
+
+    with pytest.raises(httpx2.HTTPError, match="boom"):
+        glitchtip_api.organizations()
+
+
 def test_projects(glitchtip_api: GlitchtipApi, mock_httpx_client: MagicMock) -> None:
     """Test projects() fetches projects for an organization."""
     mock_httpx_client.get.return_value = _make_response(
@@ -29,6 +29,7 @@ from reconcile.change_owners.decision import (
     apply_decisions_to_changes,
     get_approver_decisions_from_mr_comments,
 )
+from reconcile.change_owners.diff import DiffBackend
 from reconcile.change_owners.implicit_ownership import (
     cover_changes_with_implicit_ownership,
 )
@@ -367,6 +368,7 @@ def run(
     comparison_sha: str,
     change_type_processing_mode: str,
     mr_management_enabled: bool = False,
+    diff_backend: str = DiffBackend.DEEPDIFF.value,
 ) -> None:
     comparison_gql_api = gql.get_api_for_sha(
         comparison_sha, QONTRACT_INTEGRATION, validate_schemas=False
@@ -421,7 +423,7 @@ def run(
         #
         #   C H A N G E   C O V E R A G E
         #
-        changes = fetch_bundle_changes(comparison_sha)
+        changes = fetch_bundle_changes(comparison_sha, DiffBackend(diff_backend))
         logging.info(
             f"detected {len(changes)} changed files "
             f"with {sum(c.raw_diff_count() for c in changes)} differences "
@@ -27,6 +27,7 @@ from reconcile.change_owners.change_types import (
 )
 from reconcile.change_owners.diff import (
     Diff,
+    DiffBackend,
     DiffType,
     extract_diffs,
 )
@@ -246,13 +247,14 @@ def _create_bundle_file_change(
     new_path: str,
     old_backrefs: list[FileRef] | None = None,
     new_backrefs: list[FileRef] | None = None,
+    diff_backend: DiffBackend = DiffBackend.DEEPDIFF,
 ) -> BundleFileChange | None:
     """
     this is a factory method that creates a BundleFileChange object based
     on the old and new content of a file from app-interface. it detects differences
     within the old and new state of the file and represents them as instances
     of the Diff dataclass. for diff detection, the amazing `deepdiff` python
-    library is used.
+    library is used by default, the merkle backend is an alternative.
     """
     fileref = FileRef(path=path, schema=schema, file_type=file_type)
 
@@ -265,6 +267,7 @@ def _create_bundle_file_change(
     diffs = extract_diffs(
         old_file_content=old_file_content,
         new_file_content=new_file_content,
+        backend=diff_backend,
     )
 
     if diffs:
@@ -322,24 +325,27 @@ def get_priority_for_changes(
     return None
 
 
-def fetch_bundle_changes(comparison_sha: str) -> list[BundleFileChange]:
+def fetch_bundle_changes(
+    comparison_sha: str, diff_backend: DiffBackend = DiffBackend.DEEPDIFF
+) -> list[BundleFileChange]:
     """
     reaches out to the qontract-server diff endpoint to find the files that
     changed within two bundles (the current one representing the MR and the
     explicitely passed comparision bundle - usually the state of the master branch).
     """
     qontract_server_diff = QontractServerDiff(**gql.get_diff(comparison_sha))
-    bundle_changes = parse_bundle_changes(qontract_server_diff)
+    bundle_changes = parse_bundle_changes(qontract_server_diff, diff_backend)
 
     # post process bundle changes to aggregate delete/create pairs into pure
     # metadata change
-    return aggregate_file_moves(bundle_changes)
+    return aggregate_file_moves(bundle_changes, diff_backend)
 
 
 @dataclass
 class _MoveCandidates:
     creations: list[BundleFileChange] = field(default_factory=list)
     deletions: list[BundleFileChange] = field(default_factory=list)
+    diff_backend: DiffBackend = DiffBackend.DEEPDIFF
 
     def changes(self) -> list[BundleFileChange]:
         if len(self.creations) == 1 and len(self.deletions) == 1:
@@ -359,6 +365,7 @@ class _MoveCandidates:
                     new_content_sha=creation.new_content_sha,
                     old_path=deletion.fileref.path,
                     new_path=creation.fileref.path,
+                    diff_backend=self.diff_backend,
                 )
                 if move_change:
                     # make mypy happy
@@ -371,13 +378,16 @@ class _MoveCandidates:
 
 def aggregate_file_moves(
     bundle_changes: list[BundleFileChange],
+    diff_backend: DiffBackend = DiffBackend.DEEPDIFF,
 ) -> list[BundleFileChange]:
     """
     This function tries to detect file moves by looking at the bundle changes. If an
     add and remove file change with the same content is detected, those changes are
     replaced with a single move change where the only difference is the path.
     """
-    move_candidates: dict[str, _MoveCandidates] = defaultdict(_MoveCandidates)
+    move_candidates: dict[str, _MoveCandidates] = defaultdict(
+        lambda: _MoveCandidates(diff_backend=diff_backend)
+    )
     new_bundle_changes = []
     for c in bundle_changes:
         if c.is_file_creation():
@@ -395,6 +405,7 @@ def aggregate_file_moves(
 
 def parse_bundle_changes(
     qontract_server_diff: QontractServerDiff,
+    diff_backend: DiffBackend = DiffBackend.DEEPDIFF,
 ) -> list[BundleFileChange]:
     """
     parses the output of the qontract-server /diff endpoint
@@ -415,6 +426,7 @@ def parse_bundle_changes(
             new_content_sha=df.new_data_sha or "",
             old_path=df.old_datafilepath or "",
             new_path=df.new_datafilepath or "",
+            diff_backend=diff_backend,
         )
         if bc is not None:
             change_list.append(bc)
@@ -450,6 +462,7 @@ def parse_bundle_changes(
                 )
                 for br in (rf.new.backrefs if rf.new and rf.new.backrefs else [])
             ],
+            diff_backend=diff_backend,
         )
         if bc is not None:
             change_list.append(bc)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 from dataclasses import dataclass
 from enum import Enum
 from functools import reduce
@@ -15,6 +16,8 @@ from reconcile.utils.json import json_dumps
 from reconcile.utils.jsonpath import parse_jsonpath
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from deepdiff.model import DiffLevel
 
 
@@ -24,6 +27,11 @@ class DiffType(Enum):
     CHANGED = "changed"
 
 
+class DiffBackend(Enum):
+    DEEPDIFF = "deepdiff"
+    MERKLE = "merkle"
+
+
 @dataclass
 class Diff:
     """
@@ -135,7 +143,47 @@ def compare_object_ctx_identifier(
     raise CannotCompare() from None
 
 
-def extract_diffs(old_file_content: Any, new_file_content: Any) -> list[Diff]:
+class SubtreeHasher:
+    """
+    Computes a Merkle-style digest per dict/list subtree, bottom up and only
+    once per subtree, so that identical subtrees compare in O(1). Dict digests
+    don't depend on the key order, list digests depend on the item order.
+    """
+
+    def __init__(self) -> None:
+        self._digests: dict[int, bytes] = {}
+
+    def digest(self, data: Any) -> bytes:
+        if not isinstance(data, dict | list):
+            return repr((type(data).__name__, data)).encode()
+        digest = self._digests.get(id(data))
+        if digest is not None:
+            return digest
+
+        h = hashlib.blake2b(digest_size=16)
+        if isinstance(data, dict):
+            h.update(b"{")
+            for key in sorted(data, key=str):
+                h.update(repr(key).encode())
+                h.update(self.digest(data[key]))
+        else:
+            h.update(b"[")
+            for item in data:
+                h.update(self.digest(item))
+        digest = h.digest()
+        # the hashed data outlives the hasher, so ids are not reused meanwhile
+        self._digests[id(data)] = digest
+        return digest
+
+
+def extract_diffs(
+    old_file_content: Any,
+    new_file_content: Any,
+    backend: DiffBackend = DiffBackend.DEEPDIFF,
+) -> list[Diff]:
+    if backend == DiffBackend.MERKLE and old_file_content and new_file_content:
+        return extract_merkle_diffs(old_file_content, new_file_content)
+
     diffs: list[Diff] = []
     if old_file_content and new_file_content:
         deep_diff = DeepDiff(
@@ -238,17 +286,218 @@ def extract_diffs(old_file_content: Any, new_file_content: Any) -> list[Diff]:
     return diffs
 
 
-def deepdiff_path_to_jsonpath(deep_diff_path: str) -> jsonpath_ng.JSONPath:
+def extract_merkle_diffs(old_file_content: Any, new_file_content: Any) -> list[Diff]:
     """
-    deepdiff's way to describe a path within a data structure differs from jsonpath.
-    This function translates deepdiff paths into regular jsonpath expressions.
+    An alternative to the deepdiff based diff extraction. Both contents are
+    hashed as Merkle trees and the diffing only descends into subtrees with
+    different digests, so unchanged parts of large files are skipped in O(1).
+
+    List items are aligned like deepdiff does with ignore_order: items with an
+    identifier (see `compare_object_ctx_identifier`) are matched by identifier,
+    other items are present if an identical item exists on the other side.
+    Removed and added dicts without an identifier that share keys are paired
+    by similarity and diffed recursively (see `_pair_similar_items`). The
+    remaining removed and added items are paired up in order and reported as
+    a whole change. Paths refer to the position of an item in the old list,
+    except for added items.
+
+    deepdiff pairs items without an identifier by a distance over all their
+    values, so the pairing can differ if several candidates are similar.
+    """
+    diffs: list[Diff] = []
+    _merkle_diffs(old_file_content, new_file_content, (), SubtreeHasher(), diffs)
+    return diffs
 
-    deepdiff paths start with "root" followed by a series of square bracket expressions
-    fields and indices, e.g. `root['openshiftResources'][1]['version']`. The matching
-    jsonpath expression is `openshiftResources.[1].version`
+
+def _merkle_diffs(
+    old: Any,
+    new: Any,
+    path: tuple[str | int, ...],
+    hasher: SubtreeHasher,
+    diffs: list[Diff],
+) -> None:
+    if hasher.digest(old) == hasher.digest(new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in old.items():
+            if key not in new:
+                diffs.append(
+                    Diff(
+                        path=path_parts_to_jsonpath((*path, key)),
+                        diff_type=DiffType.REMOVED,
+                        old=value,
+                        new=None,
+                    )
+                )
+        for key, value in new.items():
+            if key in old:
+                _merkle_diffs(old[key], value, (*path, key), hasher, diffs)
+            else:
+                diffs.append(
+                    Diff(
+                        path=path_parts_to_jsonpath((*path, key)),
+                        diff_type=DiffType.ADDED,
+                        old=None,
+                        new=value,
+                    )
+                )
+    elif isinstance(old, list) and isinstance(new, list):
+        _merkle_list_diffs(old, new, path, hasher, diffs)
+    else:
+        diffs.append(
+            Diff(
+                path=path_parts_to_jsonpath(path),
+                diff_type=DiffType.CHANGED,
+                old=old,
+                new=new,
+            )
+        )
+
+
+def _merkle_list_diffs(
+    old: list[Any],
+    new: list[Any],
+    path: tuple[str | int, ...],
+    hasher: SubtreeHasher,
+    diffs: list[Diff],
+) -> None:
+    old_ids = [_extract_identifier_from_object(item) for item in old]
+    new_ids = [_extract_identifier_from_object(item) for item in new]
+    new_index_by_id: dict[str, int] = {}
+    for j, item_id in enumerate(new_ids):
+        if item_id is not None:
+            new_index_by_id.setdefault(item_id, j)
+    old_digests = {
+        hasher.digest(item)
+        for item, item_id in zip(old, old_ids, strict=True)
+        if item_id is None
+    }
+    new_digests = {
+        hasher.digest(item)
+        for item, item_id in zip(new, new_ids, strict=True)
+        if item_id is None
+    }
+
+    matched: set[int] = set()
+    removed: list[int] = []
+    for i, (item, item_id) in enumerate(zip(old, old_ids, strict=True)):
+        if item_id is None:
+            if hasher.digest(item) not in new_digests:
+                removed.append(i)
+            continue
+        j = new_index_by_id.get(item_id)
+        if j is None or j in matched:
+            removed.append(i)
+            continue
+        matched.add(j)
+        _merkle_diffs(item, new[j], (*path, i), hasher, diffs)
+    added = [
+        j
+        for j, (item, item_id) in enumerate(zip(new, new_ids, strict=True))
+        if (item_id is None and hasher.digest(item) not in old_digests)
+        or (item_id is not None and j not in matched)
+    ]
+
+    similar = _pair_similar_items(
+        [i for i in removed if old_ids[i] is None],
+        [j for j in added if new_ids[j] is None],
+        old,
+        new,
+        hasher,
+    )
+    for i, j in similar:
+        _merkle_diffs(old[i], new[j], (*path, i), hasher, diffs)
+    paired_old = {i for i, _ in similar}
+    paired_new = {j for _, j in similar}
+    removed = [i for i in removed if i not in paired_old]
+    added = [j for j in added if j not in paired_new]
+
+    for i, j in zip(removed, added, strict=False):
+        diffs.append(
+            Diff(
+                path=path_parts_to_jsonpath((*path, i)),
+                diff_type=DiffType.CHANGED,
+                old=old[i],
+                new=new[j],
+            )
+        )
+    pairs = min(len(removed), len(added))
+    diffs.extend(
+        Diff(
+            path=path_parts_to_jsonpath((*path, i)),
+            diff_type=DiffType.REMOVED,
+            old=old[i],
+            new=None,
+        )
+        for i in removed[pairs:]
+    )
+    diffs.extend(
+        Diff(
+            path=path_parts_to_jsonpath((*path, j)),
+            diff_type=DiffType.ADDED,
+            old=None,
+            new=new[j],
+        )
+        for j in added[pairs:]
+    )
+
+
+# above this number of removed x added items, similar items are not searched
+# and the leftovers of a list are paired up in order
+MAX_SIMILARITY_COMPARISONS = 10_000
+
+
+def _pair_similar_items(
+    removed: list[int],
+    added: list[int],
+    old: list[Any],
+    new: list[Any],
+    hasher: SubtreeHasher,
+) -> list[tuple[int, int]]:
+    """
+    Pairs removed and added dict items without an identifier that share keys,
+    most similar first: by the number of equal values, then by the number of
+    shared keys. Like deepdiff, a changed item that moved within the list is
+    diffed against its previous version instead of the item now at its old
+    position.
+    """
+    if len(removed) * len(added) > MAX_SIMILARITY_COMPARISONS:
+        return [
+            (i, j)
+            for i, j in zip(removed, added, strict=False)
+            if isinstance(old[i], dict) and isinstance(new[j], dict)
+        ]
+    candidates = []
+    for i in removed:
+        if not isinstance(old[i], dict):
+            continue
+        for j in added:
+            if not isinstance(new[j], dict):
+                continue
+            shared_keys = old[i].keys() & new[j].keys()
+            if not shared_keys:
+                continue
+            equal_values = sum(
+                hasher.digest(old[i][k]) == hasher.digest(new[j][k])
+                for k in shared_keys
+            )
+            candidates.append((-equal_values, -len(shared_keys), i, j))
+    pairs = []
+    paired_old: set[int] = set()
+    paired_new: set[int] = set()
+    for _, _, i, j in sorted(candidates):
+        if i not in paired_old and j not in paired_new:
+            paired_old.add(i)
+            paired_new.add(j)
+            pairs.append((i, j))
+    return pairs
+
+
+def path_parts_to_jsonpath(path: Iterable[str | int]) -> jsonpath_ng.JSONPath:
+    """
+    Builds a jsonpath from field names and list indices, e.g.
+    ("openshiftResources", 1, "version") becomes `openshiftResources.[1].version`.
     """
-    if not deep_diff_path.startswith("root"):
-        raise ValueError("a deepdiff path must start with 'root'")
 
     def build_jsonpath_part(element: str | int) -> jsonpath_ng.JSONPath:
         match element:
@@ -257,7 +506,21 @@ def deepdiff_path_to_jsonpath(deep_diff_path: str) -> jsonpath_ng.JSONPath:
             case str():
                 return jsonpath_ng.Fields(element)
 
-    path_parts = [build_jsonpath_part(p) for p in parse_path(deep_diff_path)]
+    path_parts = [build_jsonpath_part(p) for p in path]
     if path_parts:
         return reduce(lambda a, b: a.child(b), path_parts)
     return jsonpath_ng.Root()
+
+
+def deepdiff_path_to_jsonpath(deep_diff_path: str) -> jsonpath_ng.JSONPath:
+    """
+    deepdiff's way to describe a path within a data structure differs from jsonpath.
+    This function translates deepdiff paths into regular jsonpath expressions.
+
+    deepdiff paths start with "root" followed by a series of square bracket expressions
+    fields and indices, e.g. `root['openshiftResources'][1]['version']`. The matching
+    jsonpath expression is `openshiftResources.[1].version`
+    """
+    if not deep_diff_path.startswith("root"):
+        raise ValueError("a deepdiff path must start with 'root'")
+    return path_parts_to_jsonpath(parse_path(deep_diff_path))
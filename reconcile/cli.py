@@ -2257,6 +2257,16 @@ def template_renderer(
     default=False,
     help="run without executing terraform plan and apply.",
 )
+@click.option(
+    "--skip-unchanged-accounts/--no-skip-unchanged-accounts",
+    default=False,
+    help="skip terraform plan for accounts unchanged since their last apply.",
+)
+@click.option(
+    "--drift-check-ttl-seconds",
+    default=21600,
+    help="plan unchanged accounts again after this many seconds to detect drift.",
+)
 @click.pass_context
 def terraform_resources(
     ctx: click.Context,
@@ -2271,6 +2281,8 @@ def terraform_resources(
     enable_extended_early_exit: bool,
     extended_early_exit_cache_ttl_seconds: int,
     log_cached_log_output: bool,
+    skip_unchanged_accounts: bool,
+    drift_check_ttl_seconds: int,
 ) -> None:
     import reconcile.terraform_resources
 
@@ -2290,6 +2302,8 @@ def terraform_resources(
         enable_extended_early_exit=enable_extended_early_exit,
         extended_early_exit_cache_ttl_seconds=extended_early_exit_cache_ttl_seconds,
         log_cached_log_output=log_cached_log_output,
+        skip_unchanged_accounts=skip_unchanged_accounts,
+        drift_check_ttl_seconds=drift_check_ttl_seconds,
     )
 
 
@@ -3524,6 +3538,14 @@ def integrations_manager(
     default=bool(os.environ.get("MR_MANAGEMENT")),
     help="Manage MR labels and comments (default to false)",
 )
+@click.option(
+    "--diff-backend",
+    help="how to detect differences within changed files. merkle skips "
+    "unchanged subtrees, but may pair changed list items without an identifier "
+    "differently than deepdiff if several of them are similar.",
+    default=os.environ.get("CHANGE_OWNERS_DIFF_BACKEND", "deepdiff"),
+    type=click.Choice(["deepdiff", "merkle"], case_sensitive=True),
+)
 @click.pass_context
 def change_owners(
     ctx: click.Context,
@@ -3532,6 +3554,7 @@ def change_owners(
     comparison_sha: str | None,
     change_type_processing_mode: str,
     mr_management: bool,
+    diff_backend: str,
 ) -> None:
     import reconcile.change_owners.change_owners
 
@@ -3543,6 +3566,7 @@ def change_owners(
         comparison_sha,
         change_type_processing_mode,
         mr_management,
+        diff_backend,
     )
 
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import sys
+import threading
+from collections import OrderedDict
 from collections.abc import (
     Sequence,
 )
@@ -10,6 +14,7 @@ from typing import TYPE_CHECKING, Any
 
 from github import Github
 from pydantic import BaseModel
+from sretoolbox.utils import threaded
 
 import reconcile.openshift_base as ob
 from reconcile import queries
@@ -32,6 +37,7 @@ from reconcile.utils import (
 )
 from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.defer import defer
+from reconcile.utils.json import json_dumps
 from reconcile.utils.oc import oc_process
 from reconcile.utils.openshift_resource import (
     OpenshiftResource,
@@ -64,6 +70,7 @@ IMAGE_DEFAULT = "quay.io/app-sre/qontract-reconcile"
 UPSTREAM_DEFAULT = "https://github.com/app-sre/qontract-reconcile"
 
 INTEGRATION_UPSTREAM_REPOS_PARAM = "INTEGRATION_UPSTREAM_REPOS"
+RENDER_CACHE_SIZE = 256
 
 
 def get_image_tag_from_ref(ref: str, upstream: str) -> str:
@@ -180,16 +187,65 @@ def collect_integrations_environment(
     return list(int_envs.values())
 
 
+class RenderCache:
+    """LRU cache for the rendering steps of construct_oc_resources.
+
+    The helm template of an environment only depends on the chart and the
+    helm values, the processed resources additionally on the template
+    parameters. Entries are keyed by a digest of these inputs, so
+    environments that did not change since the previous run are neither
+    templated nor processed again.
+    """
+
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*inputs: Any) -> str:
+        data = json_dumps(inputs, cls=helm.JSONEncoder)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            return self._entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+# process wide, so it is reused by every run of the integration loop
+_render_cache = RenderCache()
+
+
 def construct_oc_resources(
     integrations_environment: IntegrationsEnvironment,
     upstream: str,
     image: str,
     image_tag_from_ref: Mapping[str, str] | None,
+    render_cache: RenderCache | None = None,
 ) -> list[OpenshiftResource]:
     # Generate the openshift template with the helm chart. The resulting template
     # contains all the integrations in the environment
     values = build_helm_values(integrations_environment.integration_specs)
-    template = helm.template(values)
+    template_key = None
+    template = None
+    if render_cache:
+        template_key = render_cache.key(
+            helm.chart_digest(helm.QONTRACT_RECONCILE_CHART), values
+        )
+        template = render_cache.get(template_key)
+    if template is None:
+        template = helm.template(values)
+        if render_cache and template_key:
+            render_cache.set(template_key, template)
 
     parameters = collect_parameters(
         template,
@@ -199,7 +255,15 @@ def construct_oc_resources(
         image_tag_from_ref,
     )
 
-    resources = oc_process(template, parameters)
+    if render_cache and template_key:
+        resources_key = render_cache.key(template_key, parameters)
+        # stored serialized, every run gets its own copy of the resources
+        if (serialized := render_cache.get(resources_key)) is None:
+            serialized = json.dumps(oc_process(template, parameters))
+            render_cache.set(resources_key, serialized)
+        resources = json.loads(serialized)
+    else:
+        resources = oc_process(template, parameters)
     return [
         OpenshiftResource(
             r,
@@ -218,9 +282,21 @@ def fetch_desired_state(
     upstream: str,
     image: str,
     image_tag_from_ref: Mapping[str, str] | None,
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+    render_cache: RenderCache | None = None,
 ) -> None:
-    for ie in integrations_environments:
-        oc_resources = construct_oc_resources(ie, upstream, image, image_tag_from_ref)
+    integrations_environments = list(integrations_environments)
+    results = threaded.run(
+        construct_oc_resources,
+        integrations_environments,
+        thread_pool_size,
+        upstream=upstream,
+        image=image,
+        image_tag_from_ref=image_tag_from_ref,
+        render_cache=render_cache,
+    )
+    # resources are added in environment order, as a duplicate is an error
+    for ie, oc_resources in zip(integrations_environments, results, strict=True):
         for r in oc_resources:
             ri.add_desired(
                 ie.namespace.cluster.name, ie.namespace.name, r.kind, r.name, r
@@ -295,6 +371,8 @@ def run(
         upstream or UPSTREAM_DEFAULT,
         image or IMAGE_DEFAULT,
         image_tag_from_ref,
+        thread_pool_size=thread_pool_size,
+        render_cache=_render_cache,
     )
 
     ob.publish_metrics(ri, QONTRACT_INTEGRATION)
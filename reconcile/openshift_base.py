@@ -20,6 +20,7 @@ from typing import (
 )
 
 import yaml
+from kubernetes.dynamic.exceptions import ForbiddenError
 from qontract_utils.differ import DiffPair, diff_mappings
 from sretoolbox.utils import (
     retry,
@@ -67,6 +68,11 @@ RECYCLE_POD_ANNOTATIONS = [
     "kubectl.kubernetes.io/restartedAt",
     "openshift.openshift.io/restartedAt",
 ]
+# a (cluster, kind) is fetched with a single all-namespaces list only if
+# enough of the cluster's namespaces are managed, otherwise we would
+# transfer a lot of objects we throw away right after.
+BATCH_FETCH_MIN_NAMESPACES = 5
+BATCH_FETCH_MIN_NAMESPACE_RATIO = 0.25
 
 
 class ValidationError(Exception):
@@ -97,6 +103,16 @@ class DesiredStateSpec(BaseStateSpec):
     privileged: bool = False
 
 
+@dataclass
+class ClusterCurrentStateSpec:
+    """Current state of a kind in many namespaces of a cluster, fetched at once."""
+
+    oc: OCClient = field(compare=False, repr=False)
+    cluster: str
+    kind: str
+    namespaces: set[str]
+
+
 StateSpec = CurrentStateSpec | DesiredStateSpec
 
 
@@ -325,8 +341,71 @@ def init_specs_to_fetch(
     return state_specs
 
 
+def _should_batch_fetch(
+    oc: OCClient,
+    kind: str,
+    namespaces: set[str],
+    min_namespaces: int,
+    min_namespace_ratio: float,
+) -> bool:
+    if len(namespaces) < min_namespaces:
+        return False
+    try:
+        if not oc.is_kind_namespaced(kind):
+            return False
+    except KindNotFoundError, AmbiguousResourceTypeError:
+        # let the per-namespace specs deal with it the usual way
+        return False
+    # without an initialized project list we can't tell how big the
+    # cluster is, so the namespace count alone has to be good enough
+    if not oc.projects:
+        return True
+    return len(namespaces) / len(oc.projects) >= min_namespace_ratio
+
+
+def batch_current_state_specs(
+    state_specs: Iterable[StateSpec],
+    min_namespaces: int = BATCH_FETCH_MIN_NAMESPACES,
+    min_namespace_ratio: float = BATCH_FETCH_MIN_NAMESPACE_RATIO,
+) -> list[StateSpec | ClusterCurrentStateSpec]:
+    """Group current state specs per (cluster, kind).
+
+    Specs without explicit resource names are merged into a single
+    ClusterCurrentStateSpec, which lists the kind across all namespaces
+    with one call. Groups managing only a small fraction of the cluster
+    namespaces keep their per-namespace specs.
+    """
+    batched: list[StateSpec | ClusterCurrentStateSpec] = []
+    groups: dict[tuple[str, str], list[CurrentStateSpec]] = {}
+    for spec in state_specs:
+        if (
+            isinstance(spec, CurrentStateSpec)
+            and not spec.resource_names
+            and spec.namespace != "cluster"
+        ):
+            groups.setdefault((spec.cluster, spec.kind), []).append(spec)
+        else:
+            batched.append(spec)
+
+    for (cluster, kind), specs in groups.items():
+        oc = specs[0].oc
+        namespaces = {spec.namespace for spec in specs}
+        if _should_batch_fetch(
+            oc, kind, namespaces, min_namespaces, min_namespace_ratio
+        ):
+            batched.append(
+                ClusterCurrentStateSpec(
+                    oc=oc, cluster=cluster, kind=kind, namespaces=namespaces
+                )
+            )
+        else:
+            batched.extend(specs)
+
+    return batched
+
+
 def populate_current_state(
-    spec: CurrentStateSpec,
+    spec: CurrentStateSpec | ClusterCurrentStateSpec,
     ri: ResourceInventory,
     integration: str,
     integration_version: str,
@@ -338,26 +417,66 @@ def populate_current_state(
         msg = f"[{spec.cluster}] cluster has no API resource {spec.kind}."
         logging.warning(msg)
         return
+    if isinstance(spec, ClusterCurrentStateSpec):
+        location = spec.cluster
+    else:
+        location = f"{spec.cluster}/{spec.namespace}"
     try:
-        for item in spec.oc.get_items(
-            spec.kind,
-            namespace=spec.namespace,
-            resource_names=spec.resource_names,
-        ):
+        if isinstance(spec, ClusterCurrentStateSpec):
+            items = spec.oc.iter_items(spec.kind, all_namespaces=True)
+        else:
+            items = spec.oc.iter_items(
+                spec.kind,
+                namespace=spec.namespace,
+                resource_names=spec.resource_names,
+            )
+        for item in items:
+            if isinstance(spec, ClusterCurrentStateSpec):
+                namespace = item["metadata"].get("namespace")
+                if namespace not in spec.namespaces:
+                    continue
+            else:
+                namespace = spec.namespace
+
             openshift_resource = OR(item, integration, integration_version)
 
             if caller and openshift_resource.caller != caller:
                 continue
             ri.add_current(
                 spec.cluster,
-                spec.namespace,
+                namespace,
                 spec.kind,
                 openshift_resource.name,
                 openshift_resource,
             )
-    except StatusCodeError as e:
+    except (StatusCodeError, ForbiddenError) as e:
+        if isinstance(spec, ClusterCurrentStateSpec) and _is_forbidden(e):
+            # listing across all namespaces needs cluster scoped permissions
+            logging.info(
+                f"[{location}] listing {spec.kind} in all namespaces is "
+                "forbidden, fetching it per namespace"
+            )
+            for namespace in sorted(spec.namespaces):
+                populate_current_state(
+                    CurrentStateSpec(
+                        oc=spec.oc,
+                        cluster=spec.cluster,
+                        namespace=namespace,
+                        kind=spec.kind,
+                        resource_names=None,
+                    ),
+                    ri,
+                    integration,
+                    integration_version,
+                    caller=caller,
+                )
+            return
         ri.register_error(cluster=spec.cluster)
-        logging.error(f"[{spec.cluster}/{spec.namespace}] {e!s}")
+        logging.error(f"[{location}] {e!s}")
+
+
+def _is_forbidden(e: Exception) -> bool:
+    return isinstance(e, ForbiddenError) or "Forbidden" in str(e)
 
 
 def fetch_current_state(
@@ -373,6 +492,7 @@ def fetch_current_state(
     caller: str | None = None,
     init_projects: bool = False,
     cluster_scope_resource_validation: bool = False,
+    batch_fetch: bool = False,
 ) -> tuple[ResourceInventory, OC_Map]:
     ri = ResourceInventory()
     settings = queries.get_app_interface_settings()
@@ -396,9 +516,12 @@ def fetch_current_state(
         cluster_admin=cluster_admin,
         cluster_scope_resource_validation=cluster_scope_resource_validation,
     )
+    fetch_specs: list[StateSpec | ClusterCurrentStateSpec] = list(state_specs)
+    if batch_fetch:
+        fetch_specs = batch_current_state_specs(state_specs)
     threaded.run(
         populate_current_state,
-        state_specs,
+        fetch_specs,
         thread_pool_size,
         ri=ri,
         integration=integration,
@@ -88,6 +88,7 @@ class OpenShiftRoleBindingsIntegration(
             integration_version=self.integration_version,
             override_managed_types=[QONTRACT_INTEGRATION_MANAGED_TYPE],
             internal=self.params.internal,
+            batch_fetch=True,
         )
 
     def fetch_desired_state(
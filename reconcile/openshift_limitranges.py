@@ -121,6 +121,7 @@ def run(
         integration_version=QONTRACT_INTEGRATION_VERSION,
         override_managed_types=["LimitRange"],
         internal=internal,
+        batch_fetch=True,
     )
     if defer:
         defer(oc_map.cleanup)
@@ -27,6 +27,7 @@ from reconcile.typed_queries.saas_files import (
     SaasFileList,
     get_saasherder_settings,
 )
+from reconcile.utils import helm
 from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.defer import defer
 from reconcile.utils.gitlab_api import GitLabApi
@@ -34,6 +35,7 @@ from reconcile.utils.json import json_dumps
 from reconcile.utils.openshift_resource import ResourceInventory
 from reconcile.utils.saasherder import SaasHerder
 from reconcile.utils.saasherder.models import ImagePatternsBlockRule
+from reconcile.utils.saasherder.template_cache import TemplateCache
 from reconcile.utils.secret_reader import create_secret_reader
 from reconcile.utils.semver_helper import make_semver
 from reconcile.utils.state import init_state
@@ -46,6 +48,10 @@ if TYPE_CHECKING:
 
 QONTRACT_INTEGRATION = "openshift-saas-deploy"
 QONTRACT_INTEGRATION_VERSION = make_semver(0, 1, 0)
+# directory to cache processed openshift templates in, disabled if unset
+SAAS_TEMPLATE_CACHE_DIR = os.environ.get("SAAS_TEMPLATE_CACHE_DIR")
+# directory for git mirrors and chart dependencies of helm targets, disabled if unset
+SAAS_HELM_CACHE_DIR = os.environ.get("SAAS_HELM_CACHE_DIR")
 
 
 def _saas_file_tekton_pipeline_name(saas_file: SaasFile) -> str:
@@ -262,6 +268,12 @@ def run(
         # as long as there are no access attempts.
         gl = None
 
+    state = init_state(integration=QONTRACT_INTEGRATION, secret_reader=secret_reader)
+    template_cache = (
+        TemplateCache(SAAS_TEMPLATE_CACHE_DIR, state=state)
+        if SAAS_TEMPLATE_CACHE_DIR
+        else None
+    )
     saasherder = SaasHerder(
         saas_files=saas_files,
         thread_pool_size=thread_pool_size,
@@ -272,7 +284,7 @@ def run(
         repo_url=saasherder_settings.repo_url,
         gitlab=gl,
         jenkins_map=jenkins_map,
-        state=init_state(integration=QONTRACT_INTEGRATION, secret_reader=secret_reader),
+        state=state,
         all_saas_files=saas_file_list.saas_files,
         image_patterns_block_rules=[
             ImagePatternsBlockRule(
@@ -281,9 +293,15 @@ def run(
             )
             for rule in (saasherder_settings.image_patterns_block_rules or [])
         ],
+        template_cache=template_cache,
+        helm_cache_dir=SAAS_HELM_CACHE_DIR,
     )
     if defer:
         defer(saasherder.cleanup)
+    if template_cache and not dry_run:
+        template_cache.expire_state()
+    if SAAS_HELM_CACHE_DIR:
+        helm.prune_cache(SAAS_HELM_CACHE_DIR)
     if len(saasherder.namespaces) == 0:
         logging.warning("no targets found")
         sys.exit(ExitCodes.SUCCESS)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import asdict
 from typing import (
     TYPE_CHECKING,
@@ -47,7 +48,9 @@ from reconcile.utils.openshift_resource import ResourceInventory
 from reconcile.utils.runtime.integration import DesiredStateShardConfig
 from reconcile.utils.secret_reader import SecretReaderBase, create_secret_reader
 from reconcile.utils.semver_helper import make_semver
+from reconcile.utils.state import init_state
 from reconcile.utils.terraform_client import TerraformClient as Terraform
+from reconcile.utils.terraform_config_state import TerraformConfigState
 from reconcile.utils.terrascript_aws_client import TerrascriptClient
 from reconcile.utils.terrascript_aws_client import TerrascriptClient as Terrascript
 from reconcile.utils.unleash import get_feature_toggle_state
@@ -74,6 +77,9 @@ if TYPE_CHECKING:
 QONTRACT_INTEGRATION = "terraform_resources"
 QONTRACT_INTEGRATION_VERSION = make_semver(0, 5, 5)
 QONTRACT_TF_PREFIX = "qrtf"
+# directory to keep terraform working dirs and the provider plugin cache in
+# between runs, new temporary working dirs are used if unset
+TERRAFORM_WORKING_DIR_ROOT = os.environ.get("TERRAFORM_WORKING_DIR_ROOT")
 
 
 def get_tf_namespaces(
@@ -164,6 +170,7 @@ def init_working_dirs(
     thread_pool_size: int,
     settings: Mapping[str, Any] | None = None,
     default_tags: Mapping[str, str] | None = None,
+    working_dir_root: str | None = None,
 ) -> tuple[Terrascript, dict[str, str]]:
     ts = Terrascript(
         QONTRACT_INTEGRATION,
@@ -172,8 +179,10 @@ def init_working_dirs(
         accounts,
         settings=settings,
         default_tags=default_tags,
+        # kept working dirs must not store the backend credentials
+        backend_credentials_from_env=working_dir_root is not None,
     )
-    working_dirs = ts.dump()
+    working_dirs = ts.dump(working_dir_root=working_dir_root)
     return ts, working_dirs
 
 
@@ -254,9 +263,25 @@ def setup(
         # no external resources settings found
         default_tags = None
     # initialize terrascript (scripting engine to generate terraform manifests)
+    working_dir_root = (
+        os.path.join(TERRAFORM_WORKING_DIR_ROOT, "working-dirs")
+        if TERRAFORM_WORKING_DIR_ROOT
+        else None
+    )
     ts, working_dirs = init_working_dirs(
-        accounts, thread_pool_size, settings=settings, default_tags=default_tags
+        accounts,
+        thread_pool_size,
+        settings=settings,
+        default_tags=default_tags,
+        working_dir_root=working_dir_root,
     )
+    if working_dir_root:
+        # accounts can be filtered for this run, only prune the working dirs
+        # of accounts that are gone from app-interface
+        ts.prune_working_dirs(
+            working_dir_root,
+            {a["name"] for a in queries.get_aws_accounts(terraform_state=True)},
+        )
 
     # initialize terraform client
     # it is used to plan and apply according to the output of terrascript
@@ -269,6 +294,13 @@ def setup(
         working_dirs,
         thread_pool_size,
         aws_api,
+        plugin_cache_dir=(
+            os.path.join(TERRAFORM_WORKING_DIR_ROOT, "plugin-cache")
+            if TERRAFORM_WORKING_DIR_ROOT
+            else None
+        ),
+        keep_working_dirs=bool(TERRAFORM_WORKING_DIR_ROOT),
+        backend_env=ts.backend_env() if working_dir_root else None,
     )
     clusters = [c for c in queries.get_clusters() if c.get("ocm") is not None]
     if clusters:
@@ -389,6 +421,8 @@ def run(
     enable_extended_early_exit: bool = False,
     extended_early_exit_cache_ttl_seconds: int = 3600,
     log_cached_log_output: bool = False,
+    skip_unchanged_accounts: bool = False,
+    drift_check_ttl_seconds: int = 21600,
     defer: Callable | None = None,
 ) -> None:
     # account_name is a tuple of account names for more detail go to
@@ -417,6 +451,15 @@ def run(
     if print_to_file:
         return
 
+    config_state = None
+    if skip_unchanged_accounts:
+        state = init_state(
+            integration=QONTRACT_INTEGRATION, secret_reader=secret_reader
+        )
+        if defer:
+            defer(state.cleanup)
+        config_state = TerraformConfigState(state, drift_check_ttl_seconds)
+
     runner_params: RunnerParams = {
         "accounts": accounts,
         "account_names": account_names,
@@ -430,6 +473,7 @@ def run(
         "internal": internal,
         "light": light,
         "vault_output_path": vault_output_path,
+        "config_state": config_state,
         "defer": defer,
     }
 
@@ -471,6 +515,7 @@ class RunnerParams(TypedDict):
     internal: bool | None
     light: bool
     vault_output_path: str
+    config_state: TerraformConfigState | None
     defer: Callable | None
 
 
@@ -487,8 +532,22 @@ def runner(
     internal: bool | None = None,
     light: bool = False,
     vault_output_path: str = "",
+    config_state: TerraformConfigState | None = None,
     defer: Callable | None = None,
 ) -> ExtendedEarlyExitRunnerResult:
+    config_hashes: dict[str, str] = {}
+    unchanged: set[str] = set()
+    if config_state and not light:
+        config_hashes = config_state.hashes(
+            ts.terraform_configurations(), tf.working_dirs
+        )
+        unchanged = config_state.unchanged(config_hashes)
+        if unchanged:
+            logging.info(
+                f"skipping plan for unchanged accounts: {', '.join(sorted(unchanged))}"
+            )
+            tf.skip_specs(unchanged)
+
     if not light:
         disabled_deletions_detected, err = tf.plan(enable_deletion)
         if err:
@@ -517,6 +576,10 @@ def runner(
                 account_name=acc_name,
             )
 
+    if config_state and config_hashes:
+        # unchanged accounts keep their record, so their drift check stays due
+        config_state.record(config_hashes, config_hashes.keys() - unchanged)
+
     # refresh output data after terraform apply
     tf.populate_terraform_output_secrets(
         resource_specs=ts.resource_spec_inventory, init_rds_replica_source=True
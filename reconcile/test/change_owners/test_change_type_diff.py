@@ -1,17 +1,27 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 import jsonpath_ng
 import pytest
 
+from reconcile.change_owners import diff as diff_module
 from reconcile.change_owners.change_types import DiffCoverage
 from reconcile.change_owners.diff import (
     Diff,
+    DiffBackend,
     DiffType,
     deepdiff_path_to_jsonpath,
+    extract_diffs,
 )
 from reconcile.test.change_owners.fixtures import (
     build_bundle_datafile_change,
     build_bundle_resourcefile_change,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 #
 # deep diff path translation
 #
@@ -708,3 +718,168 @@ def test_bundle_change_resource_file_dict_value_added() -> None:
     assert bundle_change.diff_coverage[0].diff.diff_type == DiffType.ADDED
     assert bundle_change.diff_coverage[0].diff.old is None
     assert bundle_change.diff_coverage[0].diff.new == "new_value"
+
+
+#
+# merkle diff backend
+#
+
+
+def secret(identifier: str, version: int, **kwargs: Any) -> dict[str, Any]:
+    return {
+        "provider": "vault-secret",
+        "path": f"path-{identifier}",
+        "version": version,
+        "__identifier": identifier,
+        **kwargs,
+    }
+
+
+def resource_template(var2: str) -> dict[str, Any]:
+    return {
+        "provider": "resource-template",
+        "path": "res-1",
+        "variables": {"var1": "val1", "var2": var2},
+    }
+
+
+@pytest.mark.parametrize(
+    "old_content,new_content",
+    [
+        ({"field": "old_value"}, {"field": "new_value"}),
+        ({"field": 10}, {"field": "10"}),
+        (
+            {"parent": {"children": [{"age": 1}]}},
+            {"parent": {"children": [{"age": 2}]}},
+        ),
+        ({"field": {}}, {"field": {"new_field": "new_value"}}),
+        ("something_old", "something_new"),
+        (None, {"field": "value"}),
+        ({"field": "value"}, None),
+        (
+            {
+                "openshiftResources": [
+                    secret("secret-1", 1),
+                    secret("secret-2", 2),
+                    resource_template("val2"),
+                    resource_template("val4"),
+                ]
+            },
+            {
+                "openshiftResources": [
+                    secret("secret-2", 1),
+                    resource_template("new_val"),
+                    secret("secret-1", 2),
+                    resource_template("val4"),
+                ]
+            },
+        ),
+        (
+            {"openshiftResources": [secret("secret-1", 1)]},
+            {"openshiftResources": [secret("secret-1", 1, new_field="value")]},
+        ),
+        (
+            {"openshiftResources": [secret("secret-1", 1, old_field="value")]},
+            {"openshiftResources": [secret("secret-1", 1)]},
+        ),
+        (
+            {"openshiftResources": [secret("secret-1", 1)]},
+            {"openshiftResources": [secret("secret-2", 2), secret("secret-1", 1)]},
+        ),
+        (
+            {"openshiftResources": [secret("secret-1", 1), secret("secret-2", 2)]},
+            {"openshiftResources": [secret("secret-2", 2)]},
+        ),
+        (
+            {"roles": [{"$ref": "a"}, {"$ref": "old"}, {"$ref": "b"}]},
+            {"roles": [{"$ref": "a"}, {"$ref": "new"}, {"$ref": "b"}]},
+        ),
+        (
+            {"roles": [{"$ref": str(i)} for i in range(1, 8)]},
+            {
+                "roles": [
+                    {"$ref": r}
+                    for r in ("1", "2", "changed", "4", "changed too", "6", "7")
+                ]
+            },
+        ),
+        (
+            {"roles": [{"$ref": "a"}, {"$ref": "b"}, {"$ref": "c"}]},
+            {"roles": [{"$ref": "a"}, {"$ref": "c"}, {"$ref": "b"}]},
+        ),
+    ],
+)
+def test_merkle_diff_backend_matches_deepdiff(
+    old_content: Any, new_content: Any
+) -> None:
+    def key(d: Diff) -> str:
+        return d.path_str()
+
+    deepdiff_diffs = extract_diffs(old_content, new_content, DiffBackend.DEEPDIFF)
+    merkle_diffs = extract_diffs(old_content, new_content, DiffBackend.MERKLE)
+    assert sorted(merkle_diffs, key=key) == sorted(deepdiff_diffs, key=key)
+
+
+@pytest.mark.parametrize(
+    "old_content,new_content",
+    [
+        (
+            {"l": [{"a": 1, "b": 2}, {"c": 5, "d": 6}]},
+            {"l": [{"c": 5, "d": 7}, {"a": 1, "b": 2, "e": 1}]},
+        ),
+        (
+            {"l": [{"a": 1, "b": 2}, {"c": 5, "d": 6}]},
+            {"l": [{"x": 9}, {"a": 1, "b": 3}]},
+        ),
+        (
+            {"l": [resource_template("val2"), resource_template("val4")]},
+            {"l": [resource_template("val4"), resource_template("new_val")]},
+        ),
+        ({"l": [1, 2, 3]}, {"l": [3, 4, 1]}),
+    ],
+)
+def test_merkle_diff_backend_matches_deepdiff_on_reordered_items(
+    old_content: Any, new_content: Any
+) -> None:
+    """
+    Reordered and changed items without an identifier. Only paths and diff
+    types are compared: deepdiff looks up the value of a key added to a moved
+    item at its old position.
+    """
+
+    def keys(diffs: list[Diff]) -> list[tuple[str, DiffType]]:
+        return sorted((d.path_str(), d.diff_type) for d in diffs)
+
+    assert keys(extract_diffs(old_content, new_content, DiffBackend.MERKLE)) == keys(
+        extract_diffs(old_content, new_content, DiffBackend.DEEPDIFF)
+    )
+
+
+def test_merkle_diff_backend_pairs_similar_items_differently() -> None:
+    """
+    Both backends pair a changed item without an identifier with a similar
+    one, but deepdiff weighs all values: it pairs {"b": 2} with {"q": 1}
+    instead of {"b": 3}, the merkle backend with the item sharing a key.
+    """
+    old_content = {"l": [{"a": 1}, {"b": 2}]}
+    new_content = {"l": [{"b": 3}, {"a": 1, "z": 1}, {"q": 1}]}
+
+    merkle_diffs = extract_diffs(old_content, new_content, DiffBackend.MERKLE)
+
+    assert sorted((d.path_str(), d.diff_type) for d in merkle_diffs) == [
+        ("l.[0].z", DiffType.ADDED),
+        ("l.[1].b", DiffType.CHANGED),
+        ("l.[2]", DiffType.ADDED),
+    ]
+
+
+def test_merkle_diff_backend_skips_identical_subtrees(mocker: MockerFixture) -> None:
+    unchanged = {"items": [{"name": str(i)} for i in range(100)]}
+    old_content = {"unchanged": unchanged, "field": "old"}
+    new_content = {"unchanged": unchanged, "field": "new"}
+    merkle_diffs = mocker.spy(diff_module, "_merkle_list_diffs")
+
+    diffs = extract_diffs(old_content, new_content, DiffBackend.MERKLE)
+
+    assert [(d.path_str(), d.diff_type) for d in diffs] == [("field", DiffType.CHANGED)]
+    merkle_diffs.assert_not_called()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from time import sleep
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any
 
 import jsonpath_ng
@@ -9,6 +9,7 @@ import pytest
 from reconcile.change_owners.diff import (
     IDENTIFIER_FIELD_NAME,
     Diff,
+    DiffBackend,
     DiffType,
 )
 from reconcile.utils.runtime import desired_state_diff
@@ -173,6 +174,7 @@ def test_extract_diffs_with_timeout() -> None:
     }
 
     # the timeout is lower than the extraction duration -> TIMEOUT
+    start = monotonic()
     with pytest.raises(DiffDetectionTimeoutError):
         extract_diffs_with_timeout(
             diff_extration_with_3_second_sleep,
@@ -180,6 +182,8 @@ def test_extract_diffs_with_timeout() -> None:
             current_desired_state=current_desired_state,
             timeout_seconds=1,
         )
+    # the extraction process is killed at the timeout
+    assert monotonic() - start < 2
 
     # the timeout is higher than the extraction duration -> NO TIMEOUT
     diffs = extract_diffs_with_timeout(
@@ -218,6 +222,69 @@ def test_extract_diffs_with_exception() -> None:
         )
 
 
+@pytest.mark.parametrize(
+    "previous_desired_state, current_desired_state",
+    [
+        (
+            {"shards": [{"shard": "a", "value": "old"}, {"shard": "b", "value": 1}]},
+            {"shards": [{"shard": "a", "value": "old"}, {"shard": "b", "value": 2}]},
+        ),
+        (
+            {"shards": [{"shard": "a", "value": "old"}]},
+            {"shards": [{"shard": "a", "value": "old"}, {"shard": "b", "value": 1}]},
+        ),
+        (
+            {"shards": [{"shard": "a", "value": "old"}, {"shard": "b", "value": 1}]},
+            {"shards": [{"shard": "b", "value": 1}]},
+        ),
+        (
+            {"shards": [{"shard": "a", "value": 1}, {"shard": "b", "value": 2}]},
+            {"shards": [{"shard": "b", "value": 2}, {"shard": "a", "value": 1}]},
+        ),
+        (
+            {
+                "shards": [
+                    {IDENTIFIER_FIELD_NAME: "a", "shard": "a", "value": 1},
+                    {IDENTIFIER_FIELD_NAME: "b", "shard": "b", "value": 2},
+                ]
+            },
+            {
+                "shards": [
+                    {IDENTIFIER_FIELD_NAME: "b", "shard": "b", "value": 3},
+                    {IDENTIFIER_FIELD_NAME: "a", "shard": "a", "value": 1},
+                ]
+            },
+        ),
+        (
+            {"shards": [{"shard": "a", "value": "old"}]},
+            {"shards": [{"shard": "b", "value": "old"}]},
+        ),
+        (
+            {"shards": [{"shard": "a", "value": 1}, {"shard": "b", "value": 2}]},
+            {"shards": [{"shard": "b", "value": 3}, {"shard": "a", "value": 1}]},
+        ),
+    ],
+)
+def test_desired_state_diff_backends_find_same_shards(
+    shardable_test_integration: ShardableTestIntegration,
+    previous_desired_state: dict[str, Any],
+    current_desired_state: dict[str, Any],
+) -> None:
+    sharding_config = shardable_test_integration.get_desired_state_shard_config()
+    assert sharding_config
+
+    def affected_shards(backend: DiffBackend) -> set[str]:
+        assert sharding_config
+        sharding_config.diff_backend = backend
+        return build_desired_state_diff(
+            sharding_config,
+            previous_desired_state=previous_desired_state,
+            current_desired_state=current_desired_state,
+        ).affected_shards
+
+    assert affected_shards(DiffBackend.MERKLE) == affected_shards(DiffBackend.DEEPDIFF)
+
+
 #
 # find changed shards
 #
@@ -1056,6 +1056,55 @@ def test_fetch_desired_state_upstream(
     ] == [upstream]
 
 
+def test_fetch_desired_state_render_cache(
+    basic_integration: IntegrationV1,
+    shard_manager: intop.IntegrationShardManager,
+    mocker: MockerFixture,
+) -> None:
+    integrations_environments = intop.collect_integrations_environment(
+        [basic_integration], "test", shard_manager
+    )
+    template = mocker.patch.object(intop.helm, "template", wraps=intop.helm.template)
+    oc_process = mocker.patch.object(intop, "oc_process", wraps=intop.oc_process)
+    render_cache = intop.RenderCache()
+
+    desired = []
+    for _ in range(2):
+        ri = ResourceInventory()
+        ri.initialize_resource_type("cluster", "ns", "Deployment")
+        ri.initialize_resource_type("cluster", "ns", "Service")
+        intop.fetch_desired_state(
+            integrations_environments=integrations_environments,
+            ri=ri,
+            upstream="http://localhost",
+            image="image",
+            image_tag_from_ref=None,
+            render_cache=render_cache,
+        )
+        desired.append({
+            (kind, name): r.body
+            for _, _, kind, data in ri
+            for name, r in data["desired"].items()
+        })
+
+    template.assert_called_once()
+    oc_process.assert_called_once()
+    assert desired[0] == desired[1]
+    assert len(desired[0]) == 2
+
+
+def test_render_cache_evicts_least_recently_used() -> None:
+    render_cache = intop.RenderCache(max_size=2)
+    render_cache.set("a", 1)
+    render_cache.set("b", 2)
+    render_cache.get("a")
+    render_cache.set("c", 3)
+
+    assert render_cache.get("a") == 1
+    assert render_cache.get("b") is None
+    assert render_cache.key({"a": 1, "b": 2}) == render_cache.key({"b": 2, "a": 1})
+
+
 #
 # collect_integrations_environment tests
 #
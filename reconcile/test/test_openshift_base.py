@@ -722,7 +722,7 @@ def test_populate_current_state(
     # prepare client and resource inventory
     oc_cs1.init_api_resources = True
     oc_cs1.api_resources = api_resources
-    oc_cs1.get_items = lambda kind, **kwargs: [  # type: ignore[method-assign]
+    oc_cs1.iter_items = lambda kind, **kwargs: [  # type: ignore[method-assign]
         build_resource("Kind", "fully.qualified/v1", "name")
     ]
     resource_inventory.initialize_resource_type("cs1", "ns1", "Kind.fully.qualified")
@@ -763,7 +763,7 @@ def test_populate_current_state_unknown_kind(
     sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
 
     assert len(list(iter(resource_inventory))) == 0
-    oc_cs1.get_items.assert_not_called()
+    oc_cs1.iter_items.assert_not_called()
 
 
 def test_populate_current_state_resource_name_filtering(
@@ -783,13 +783,158 @@ def test_populate_current_state_resource_name_filtering(
     )
     sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
 
-    oc_cs1.get_items.assert_called_with(
+    oc_cs1.iter_items.assert_called_with(
         "Kind.fully.qualified",
         namespace="ns1",
         resource_names=["name1", "name2"],
     )
 
 
+def build_namespaced_resource(name: str, namespace: str) -> dict[str, Any]:
+    r = build_resource("Kind", "fully.qualified/v1", name)
+    r["metadata"]["namespace"] = namespace
+    return r
+
+
+def test_populate_current_state_cluster_spec(
+    resource_inventory: resource.ResourceInventory,
+    oc_cs1: MagicMock,
+) -> None:
+    """
+    test that a cluster wide spec fans out the items into their namespaces
+    and drops items of unmanaged namespaces
+    """
+    oc_cs1.iter_items.return_value = [
+        build_namespaced_resource("a", "ns1"),
+        build_namespaced_resource("b", "ns2"),
+        build_namespaced_resource("c", "unmanaged"),
+    ]
+    for ns in ["ns1", "ns2"]:
+        resource_inventory.initialize_resource_type("cs1", ns, "Kind.fully.qualified")
+
+    spec = sut.ClusterCurrentStateSpec(
+        oc=oc_cs1,
+        cluster="cs1",
+        kind="Kind.fully.qualified",
+        namespaces={"ns1", "ns2"},
+    )
+    sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
+
+    oc_cs1.iter_items.assert_called_once_with(
+        "Kind.fully.qualified", all_namespaces=True
+    )
+    current = {
+        (namespace, name)
+        for _, namespace, _, data in resource_inventory
+        for name in data["current"]
+    }
+    assert current == {("ns1", "a"), ("ns2", "b")}
+
+
+def test_populate_current_state_cluster_spec_forbidden_falls_back(
+    resource_inventory: resource.ResourceInventory,
+    oc_cs1: MagicMock,
+) -> None:
+    """
+    test that a forbidden all namespaces list falls back to one list per
+    managed namespace instead of failing the whole cluster
+    """
+
+    def iter_items(kind: str, **kwargs: Any) -> list[dict[str, Any]]:
+        if kwargs.get("all_namespaces"):
+            raise oc.StatusCodeError(
+                'Error from server (Forbidden): rolebindings is forbidden: User "x" '
+                "cannot list resource at the cluster scope"
+            )
+        return [build_namespaced_resource(kwargs["namespace"], kwargs["namespace"])]
+
+    oc_cs1.iter_items.side_effect = iter_items
+    for ns in ["ns1", "ns2"]:
+        resource_inventory.initialize_resource_type("cs1", ns, "Kind.fully.qualified")
+
+    spec = sut.ClusterCurrentStateSpec(
+        oc=oc_cs1,
+        cluster="cs1",
+        kind="Kind.fully.qualified",
+        namespaces={"ns1", "ns2"},
+    )
+    sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
+
+    assert oc_cs1.iter_items.call_count == 3
+    current = {
+        (namespace, name)
+        for _, namespace, _, data in resource_inventory
+        for name in data["current"]
+    }
+    assert current == {("ns1", "ns1"), ("ns2", "ns2")}
+    assert not resource_inventory.has_error_registered()
+
+
+def test_populate_current_state_cluster_spec_error(
+    resource_inventory: resource.ResourceInventory,
+    oc_cs1: MagicMock,
+) -> None:
+    oc_cs1.iter_items.side_effect = oc.StatusCodeError("connection refused")
+    spec = sut.ClusterCurrentStateSpec(
+        oc=oc_cs1,
+        cluster="cs1",
+        kind="Kind.fully.qualified",
+        namespaces={"ns1", "ns2"},
+    )
+    sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
+
+    oc_cs1.iter_items.assert_called_once()
+    assert resource_inventory.has_error_registered(cluster="cs1")
+
+
+def _current_spec(
+    oc_client: oc.OCClient, namespace: str, kind: str = "Kind"
+) -> sut.CurrentStateSpec:
+    return sut.CurrentStateSpec(
+        oc=oc_client, cluster="cs1", namespace=namespace, kind=kind, resource_names=None
+    )
+
+
+def test_batch_current_state_specs(oc_cs1: MagicMock) -> None:
+    oc_cs1.projects = set()
+    specs = [_current_spec(oc_cs1, f"ns{i}") for i in range(3)]
+    named = sut.CurrentStateSpec(
+        oc=oc_cs1, cluster="cs1", namespace="ns0", kind="Other", resource_names=["n"]
+    )
+
+    batched = sut.batch_current_state_specs([*specs, named], min_namespaces=2)
+
+    assert batched == [
+        named,
+        sut.ClusterCurrentStateSpec(
+            oc=oc_cs1, cluster="cs1", kind="Kind", namespaces={"ns0", "ns1", "ns2"}
+        ),
+    ]
+
+
+def test_batch_current_state_specs_small_namespace_ratio(oc_cs1: MagicMock) -> None:
+    oc_cs1.projects = {f"ns{i}" for i in range(100)}
+    specs = [_current_spec(oc_cs1, f"ns{i}") for i in range(3)]
+
+    batched = sut.batch_current_state_specs(
+        specs, min_namespaces=2, min_namespace_ratio=0.5
+    )
+
+    assert batched == specs
+
+
+def test_batch_current_state_specs_cluster_scoped_kind(oc_cs1: MagicMock) -> None:
+    oc_cs1.projects = set()
+    oc_cs1.is_kind_namespaced.return_value = False
+    specs = [
+        _current_spec(oc_cs1, f"ns{i}", kind="ClusterRoleBinding") for i in range(3)
+    ]
+
+    batched = sut.batch_current_state_specs(specs, min_namespaces=2)
+
+    assert batched == specs
+
+
 #
 # determine_user_keys_for_access tests
 #
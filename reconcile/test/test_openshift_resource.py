@@ -1,3 +1,10 @@
+from __future__ import annotations
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from threading import Timer
+from typing import TYPE_CHECKING
+
 import pytest
 
 from reconcile.utils.openshift_resource import (
@@ -11,6 +18,9 @@ from reconcile.utils.semver_helper import make_semver
 
 from .fixtures import Fixtures
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 fxt = Fixtures("openshift_resource")
 
 TEST_INT = "test_openshift_resources"
@@ -216,6 +226,41 @@ def test_secret_string_data() -> None:
     }
     result = OR.canonicalize(resource)
     assert result == expected
+    assert resource["stringData"] == {"k": "v"}
+
+
+def test_canonicalize_does_not_modify_body() -> None:
+    body = {
+        "kind": "Role",
+        "metadata": {
+            "name": "role",
+            "annotations": {"kubectl.kubernetes.io/last-applied-configuration": "{}"},
+        },
+        "rules": [{"verbs": ["list", "get"], "apiGroups": [""]}],
+    }
+    expected = {
+        "kind": "Role",
+        "metadata": {
+            "name": "role",
+            "annotations": {"kubectl.kubernetes.io/last-applied-configuration": "{}"},
+        },
+        "rules": [{"verbs": ["list", "get"], "apiGroups": [""]}],
+    }
+    result = OR.canonicalize(body)
+    assert result["metadata"]["annotations"] == {}
+    assert result["rules"] == [{"verbs": ["get", "list"], "apiGroups": [""]}]
+    assert body == expected
+
+
+def test_annotate_does_not_share_body() -> None:
+    body = fxt.get_anymarkup("annotates_resource.yml")
+    original = copy.deepcopy(body)
+    openshift_resource = OR(body, TEST_INT, TEST_INT_VER)
+    annotated = openshift_resource.annotate()
+    assert annotated.sha256sum() == openshift_resource.sha256sum()
+
+    annotated.body["data"]["key3"] = "val3"
+    assert body == original
 
 
 def test_managed_cluster_label_ignore() -> None:
@@ -440,3 +485,55 @@ def test_resource_inventory_add_desired_resource_mixed_kinds() -> None:
             assert resource["desired"].get("foo")
         elif resource_type == "Deployment":
             assert len(resource["desired"]) == 0
+
+
+def test_resource_inventory_record_reads_like_dict() -> None:
+    ri = ResourceInventory()
+    ri.initialize_resource_type(
+        cluster="cl", namespace="ns", resource_type="Deployment", managed_names=["a"]
+    )
+    _, _, _, resource = next(iter(ri))
+
+    assert dict(resource) == {
+        "current": {},
+        "desired": {},
+        "managed_names": ["a"],
+        "use_admin_token": {},
+    }
+    assert resource.get("missing") is None
+    with pytest.raises(AttributeError):
+        resource.other = {}  # type: ignore[attr-defined]
+
+
+def test_resource_inventory_add_current_concurrently() -> None:
+    ri = ResourceInventory()
+    for n in range(4):
+        ri.initialize_resource_type(
+            cluster="cl", namespace=f"ns-{n}", resource_type="ConfigMap"
+        )
+
+    def add(i: int) -> None:
+        res = build_resource("ConfigMap", "v1", f"cm-{i}")
+        ri.add_current("cl", f"ns-{i % 4}", "ConfigMap", res.name, res)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(add, range(200)))
+
+    assert sum(len(resource["current"]) for _, _, _, resource in ri) == 200
+
+
+def test_resource_inventory_lock_contention_metric(mocker: MockerFixture) -> None:
+    contention = mocker.patch(
+        "reconcile.utils.openshift_resource.resource_inventory_lock_contention"
+    )
+    ri = ResourceInventory()
+    ri.initialize_resource_type(cluster="cl", namespace="ns", resource_type="Pod")
+    lock = ri._locks[hash(("cl", "ns")) % ri.LOCK_STRIPES]
+    lock.acquire()
+    Timer(0.05, lock.release).start()
+
+    res = build_resource("Pod", "v1", "pod")
+    ri.add_current("cl", "ns", "Pod", res.name, res)
+
+    assert ri.get_current("cl", "ns", "Pod", "pod") == res
+    contention.labels.return_value.inc.assert_called_once_with()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import tempfile
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from unittest import TestCase
@@ -41,6 +43,7 @@ from reconcile.utils.saasherder.models import (
     TriggerSpecMovingCommit,
     TriggerSpecUpstreamJob,
 )
+from reconcile.utils.saasherder.template_cache import TemplateCache
 from reconcile.utils.secret_reader import SecretReaderBase
 from reconcile.utils.slo_document_manager import SLODetails
 
@@ -951,7 +954,7 @@ class TestPopulateDesiredState(TestCase):
             wraps=self.fake_get_file_contents,
         )
         self.initiate_gh_patcher.start()
-        self.get_file_contents_patcher.start()
+        self.get_file_contents = self.get_file_contents_patcher.start()
 
         # Mock image checking.
         self.get_check_images_patcher = patch.object(
@@ -1003,6 +1006,111 @@ class TestPopulateDesiredState(TestCase):
         self.assertEqual(5, cnt, "expected 5 resources, found less")
         self.assertEqual(self.saasherder.promotions, [None, None, None, None])
 
+    def test_populate_desired_state_template_cache_resolves_moving_ref_once(
+        self,
+    ) -> None:
+        raw_saas_file = self.fxts.get_anymarkup("saas_remote_openshift_template.yaml")
+        del raw_saas_file["_placeholders"]
+        for resource_template in raw_saas_file["resourceTemplates"]:
+            for target in resource_template["targets"]:
+                target["ref"] = "main"
+        saas_file = self.gql_class_factory(  # type: ignore[attr-defined] # it's set in the fixture
+            SaasFile, raw_saas_file
+        )
+        sha = "4ba049635dd62d57605ea74890c08caef067ed13"
+        ri = ResourceInventory()
+        for cluster, namespace in (("stage-1", "yolo-stage"), ("prod-1", "yolo")):
+            for resource_type in ("Deployment", "Service", "ConfigMap"):
+                ri.initialize_resource_type(cluster, namespace, resource_type)
+
+        with (
+            tempfile.TemporaryDirectory() as cache_dir,
+            patch.object(
+                SaasHerder, "_get_commit_sha", autospec=True, return_value=sha
+            ) as get_commit_sha,
+        ):
+            saasherder = SaasHerder(
+                [saas_file],
+                secret_reader=MockSecretReader(),
+                thread_pool_size=1,
+                integration="",
+                integration_version="",
+                hash_length=7,
+                repo_url="https://repo-url.com",
+                template_cache=TemplateCache(cache_dir),
+            )
+            saasherder.populate_desired_state(ri)
+
+        # the template is fetched at the sha the cache key and COMMIT_SHA use
+        self.assertEqual(4, get_commit_sha.call_count)
+        refs = {c.kwargs["ref"] for c in self.get_file_contents.call_args_list}
+        self.assertEqual({sha}, refs)
+
+    def test_populate_desired_state_template_cache_skips_secret_parameters(
+        self,
+    ) -> None:
+        raw_saas_file = self.fxts.get_anymarkup("saas_remote_openshift_template.yaml")
+        del raw_saas_file["_placeholders"]
+        raw_saas_file["managedResourceTypes"] = ["Secret"]
+        raw_saas_file["allowedSecretParameterPaths"] = ["app-sre"]
+        resource_template = raw_saas_file["resourceTemplates"][0]
+        raw_saas_file["resourceTemplates"] = [resource_template]
+        target = resource_template["targets"][0]
+        resource_template["targets"] = [target]
+        target["secretParameters"] = [
+            {
+                "name": "DB_PASSWORD",
+                "secret": {"path": "app-sre/db", "field": "password"},
+            }
+        ]
+        saas_file = self.gql_class_factory(  # type: ignore[attr-defined] # it's set in the fixture
+            SaasFile, raw_saas_file
+        )
+        template = {
+            "apiVersion": "template.openshift.io/v1",
+            "kind": "Template",
+            "metadata": {"name": "db"},
+            "parameters": [{"name": "DB_PASSWORD", "required": True}],
+            "objects": [
+                {
+                    "apiVersion": "v1",
+                    "kind": "Secret",
+                    "metadata": {"name": "db"},
+                    "stringData": {"password": "${DB_PASSWORD}"},
+                }
+            ],
+        }
+        self.get_file_contents.side_effect = lambda url, path, ref, github: (
+            template,
+            ref,
+        )
+        ri = ResourceInventory()
+        ri.initialize_resource_type("stage-1", "yolo-stage", "Secret")
+
+        with (
+            tempfile.TemporaryDirectory() as cache_dir,
+            patch.object(TemplateCache, "set", autospec=True) as cache_set,
+            patch.object(TemplateCache, "get", autospec=True) as cache_get,
+        ):
+            saasherder = SaasHerder(
+                [saas_file],
+                secret_reader=MockSecretReader(),
+                thread_pool_size=1,
+                integration="",
+                integration_version="",
+                hash_length=7,
+                repo_url="https://repo-url.com",
+                template_cache=TemplateCache(cache_dir),
+            )
+            saasherder.populate_desired_state(ri)
+            self.assertEqual([], os.listdir(cache_dir))
+
+        cache_get.assert_not_called()
+        cache_set.assert_not_called()
+        desired = ri.get_desired("stage-1", "yolo-stage", "Secret", "db")
+        assert desired
+        self.assertEqual({"password": "secret"}, desired.body["stringData"])
+
 
 @pytest.mark.usefixtures("inject_gql_class_factory")
 class TestCollectRepoUrls(TestCase):
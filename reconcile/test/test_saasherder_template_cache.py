@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from reconcile.utils.datetime_util import to_utc_seconds_iso_format, utc_now
+from reconcile.utils.saasherder.template_cache import (
+    STATE_EXPIRY_KEY,
+    TemplateCache,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+RESOURCES = [{"kind": "ConfigMap", "metadata": {"name": "cm"}}]
+
+
+def test_template_cache_key_is_stable() -> None:
+    k1 = TemplateCache.key("url", "path", "sha", {"a": "1", "b": "2"})
+    k2 = TemplateCache.key("url", "path", "sha", {"b": "2", "a": "1"})
+    assert k1 == k2
+    assert k1 != TemplateCache.key("url", "path", "other-sha", {"a": "1", "b": "2"})
+
+
+def test_template_cache_miss(tmp_path: Path) -> None:
+    cache = TemplateCache(str(tmp_path))
+    assert cache.get("key") is None
+
+
+def test_template_cache_set_get(tmp_path: Path) -> None:
+    cache = TemplateCache(str(tmp_path))
+    cache.set("key", RESOURCES)
+
+    assert cache.get("key") == RESOURCES
+    # a fresh instance reads the same directory
+    assert TemplateCache(str(tmp_path)).get("key") == RESOURCES
+
+
+def test_template_cache_returns_copies(tmp_path: Path) -> None:
+    cache = TemplateCache(str(tmp_path))
+    cache.set("key", RESOURCES)
+
+    resources = cache.get("key")
+    assert resources
+    resources[0]["metadata"]["name"] = "changed"
+
+    assert cache.get("key") == RESOURCES
+
+
+def test_template_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = TemplateCache(str(tmp_path))
+    cache.set("old", RESOURCES)
+    cache.set("new", RESOURCES)
+    os.utime(tmp_path / "old.json", (0, 0))
+    entry_size = (tmp_path / "new.json").stat().st_size
+
+    cache.max_size_bytes = 2 * entry_size
+    cache.set("newest", RESOURCES)
+
+    assert not (tmp_path / "old.json").exists()
+    assert cache.get("new") == RESOURCES
+    assert cache.get("newest") == RESOURCES
+
+
+def test_template_cache_state_tier(tmp_path: Path, mocker: MockerFixture) -> None:
+    state = mocker.MagicMock()
+    state.get.return_value = RESOURCES
+    cache = TemplateCache(str(tmp_path), state=state)
+
+    assert cache.get("key") == RESOURCES
+    state.get.assert_called_once_with("template-cache/key", None)
+    # the state hit is stored locally
+    assert (tmp_path / "key.json").exists()
+
+
+def test_template_cache_set_writes_state(tmp_path: Path, mocker: MockerFixture) -> None:
+    state = mocker.MagicMock()
+    cache = TemplateCache(str(tmp_path), state=state)
+
+    cache.set("key", RESOURCES)
+
+    state.add.assert_called_once_with("template-cache/key", RESOURCES, force=True)
+
+
+def test_template_cache_expire_state(tmp_path: Path, mocker: MockerFixture) -> None:
+    state = mocker.MagicMock()
+    state.get.return_value = None
+    state.ls.return_value = ["/template-cache/old-1", "/template-cache/old-2"]
+    state.rm.side_effect = [None, KeyError("removed by another pod")]
+    cache = TemplateCache(str(tmp_path), state=state, state_ttl=timedelta(days=7))
+
+    cache.expire_state()
+
+    state.add.assert_called_once_with(STATE_EXPIRY_KEY, mocker.ANY, force=True)
+    assert state.ls.call_args.args == ("template-cache/",)
+    modified_before = state.ls.call_args.kwargs["modified_before"]
+    assert utc_now() - modified_before >= timedelta(days=7)
+    state.rm.assert_has_calls([
+        mocker.call("template-cache/old-1"),
+        mocker.call("template-cache/old-2"),
+    ])
+
+
+def test_template_cache_expire_state_once_per_interval(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    state = mocker.MagicMock()
+    state.get.return_value = to_utc_seconds_iso_format(utc_now())
+    cache = TemplateCache(str(tmp_path), state=state)
+
+    cache.expire_state()
+
+    state.ls.assert_not_called()
+    state.add.assert_not_called()
@@ -368,6 +368,7 @@ def test_run_with_extended_early_exit_run_enabled(
         internal=None,
         light=False,
         vault_output_path="",
+        config_state=None,
         defer=defer,
     )
 
@@ -524,3 +525,69 @@ def test_terraform_resources_runner_no_dry_run(
         payload=terraform_configurations,
         applied_count=2,
     )
+
+
+def test_terraform_resources_runner_skips_unchanged_accounts(
+    mocker: MockerFixture,
+    secret_reader: SecretReaderBase,
+) -> None:
+    tf = create_autospec(integ.Terraform)
+    tf.plan.return_value = (False, None)
+    tf.should_apply.return_value = False
+    tf.apply_count = 0
+    tf.working_dirs = {"a": "/tmp/a", "b": "/tmp/b"}
+
+    ts = create_autospec(integ.Terrascript)
+    ts.terraform_configurations.return_value = {"a": "config-a", "b": "config-b"}
+    ts.resource_spec_inventory = {}
+
+    config_state = create_autospec(integ.TerraformConfigState)
+    config_state.hashes.return_value = {"a": "hash-a", "b": "hash-b"}
+    config_state.unchanged.return_value = {"a"}
+
+    mocked_ob = mocker.patch("reconcile.terraform_resources.ob")
+    mocked_ob.realize_data.return_value = []
+
+    integ.runner(
+        accounts=[{"name": "a"}, {"name": "b"}],
+        account_names={"a", "b"},
+        tf_namespaces=[],
+        tf=tf,
+        ts=ts,
+        secret_reader=secret_reader,
+        dry_run=False,
+        config_state=config_state,
+    )
+
+    tf.skip_specs.assert_called_once_with({"a"})
+    tf.plan.assert_called_once_with(False)
+    config_state.record.assert_called_once_with({"a": "hash-a", "b": "hash-b"}, {"b"})
+
+
+def test_terraform_resources_runner_dry_run_does_not_record_hashes(
+    secret_reader: SecretReaderBase,
+) -> None:
+    tf = create_autospec(integ.Terraform)
+    tf.plan.return_value = (False, None)
+    tf.working_dirs = {"a": "/tmp/a"}
+
+    ts = create_autospec(integ.Terrascript)
+    ts.terraform_configurations.return_value = {"a": "config-a"}
+
+    config_state = create_autospec(integ.TerraformConfigState)
+    config_state.hashes.return_value = {"a": "hash-a"}
+    config_state.unchanged.return_value = set()
+
+    integ.runner(
+        accounts=[{"name": "a"}],
+        account_names={"a"},
+        tf_namespaces=[],
+        tf=tf,
+        ts=ts,
+        secret_reader=secret_reader,
+        dry_run=True,
+        config_state=config_state,
+    )
+
+    tf.skip_specs.assert_not_called()
+    config_state.record.assert_not_called()
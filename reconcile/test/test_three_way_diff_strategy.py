@@ -15,6 +15,8 @@ from .fixtures import Fixtures
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from pytest_mock import MockerFixture
+
 fxt = Fixtures("openshift_resource")
 
 
@@ -41,6 +43,17 @@ def test_3wpd_equal_objects_should_not_apply(deployment: dict[str, Any]) -> None
     assert three_way_diff_using_hash(c_item, d_item) is True
 
 
+def test_3wpd_equal_objects_skip_patch(
+    deployment: dict[str, Any], mocker: MockerFixture
+) -> None:
+    from_diff = mocker.patch("jsonpatch.JsonPatch.from_diff")
+    d_item = OR(deployment, "", "")
+    c_item = d_item.annotate(canonicalize=False)
+
+    assert three_way_diff_using_hash(c_item, d_item) is True
+    from_diff.assert_not_called()
+
+
 def test_3wpd_change_desired_should_apply(deployment: dict[str, Any]) -> None:
     d_item = OR(deployment, "", "")
     c_item = d_item.annotate(canonicalize=False)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol
 
 import pytest
 
@@ -15,23 +14,35 @@ if TYPE_CHECKING:
 @pytest.fixture
 def oc(mocker: MockerFixture) -> OCCli:
     oc = mocker.create_autospec(OCCli)
-    oc.get_items.side_effect = [[]]
+    # like OCCli, which can't watch
+    oc.supports_watch = False
+    oc.iter_item_pages.side_effect = [iter([])]
     return oc
 
 
-OCItemSetter = Callable[[list[list[dict[str, Any]]]], None]
+class OCItemSetter(Protocol):
+    def __call__(
+        self,
+        item_sequence: list[list[dict[str, Any]]],
+        resource_version: str | None = None,
+    ) -> None: ...
 
 
 @pytest.fixture
-def set_oc_get_items_side_effect(
+def set_oc_list_items_side_effect(
     oc: OCCli,
 ) -> OCItemSetter:
-    def _set_oc_get_items_side_effect(
+    def _set_oc_list_items_side_effect(
         item_sequence: list[list[dict[str, Any]]],
+        resource_version: str | None = None,
     ) -> None:
-        oc.get_items.side_effect = item_sequence  # type: ignore[attr-defined]
+        oc.supports_watch = resource_version is not None  # type: ignore[misc]
+        oc.iter_item_pages.side_effect = [  # type: ignore[attr-defined]
+            iter([{"items": items, "metadata": {"resourceVersion": resource_version}}])
+            for items in item_sequence
+        ]
 
-    return _set_oc_get_items_side_effect
+    return _set_oc_list_items_side_effect
 
 
 @pytest.fixture
@@ -15,8 +15,11 @@ from reconcile.utils.jobcontroller.models import (
     JobStatus,
     JobValidationError,
 )
+from reconcile.utils.oc import ResourceVersionExpiredError, StatusCodeError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from reconcile.test.utils.jobcontroller.conftest import OCItemSetter
     from reconcile.utils.jobcontroller.controller import K8sJobController
 
@@ -50,10 +53,10 @@ def test_controller_enqueue_job_in_progress_job_exists(
     delete_expected: bool,
     create_expected: bool,
     controller: K8sJobController,
-    set_oc_get_items_side_effect: OCItemSetter,
+    set_oc_list_items_side_effect: OCItemSetter,
 ) -> None:
     job = SomeJob(identifying_attribute="some-id")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(active=1))],
     ])
     with patch.object(controller, "delete_job") as mock_delete_job:
@@ -83,10 +86,10 @@ def test_controller_enqueue_job_finished_job_exists(
     delete_expected: bool,
     create_expected: bool,
     controller: K8sJobController,
-    set_oc_get_items_side_effect: OCItemSetter,
+    set_oc_list_items_side_effect: OCItemSetter,
 ) -> None:
     job = SomeJob(identifying_attribute="some-id", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(succeeded=1))],
     ])
     with patch.object(controller, "delete_job") as mock_delete_job:
@@ -116,10 +119,10 @@ def test_controller_enqueue_job_failed_job_exists(
     delete_expected: bool,
     create_expected: bool,
     controller: K8sJobController,
-    set_oc_get_items_side_effect: OCItemSetter,
+    set_oc_list_items_side_effect: OCItemSetter,
 ) -> None:
     job = SomeJob(identifying_attribute="some-id", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(failed=1))],
     ])
     with patch.object(controller, "delete_job") as mock_delete_job:
@@ -147,10 +150,10 @@ def test_controller_wait_for_completion(
     timeout: int,
     expected: bool,
     controller: K8sJobController,
-    set_oc_get_items_side_effect: OCItemSetter,
+    set_oc_list_items_side_effect: OCItemSetter,
 ) -> None:
     job = SomeJob(identifying_attribute="some-id", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(active=1))],  # 0 seconds
         [build_job_resource(job, build_job_status(active=1))],  # 5 seconds
         [build_job_resource(job, status)],  # 10 seconds
@@ -165,10 +168,10 @@ def test_controller_wait_for_completion(
 
 
 def test_controller_wait_for_completion_instant(
-    controller: K8sJobController, set_oc_get_items_side_effect: OCItemSetter
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
 ) -> None:
     job = SomeJob(identifying_attribute="some-id", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(succeeded=1))],  # 0 seconds
     ])
 
@@ -179,10 +182,10 @@ def test_controller_wait_for_completion_instant(
 
 
 def test_controller_wait_for_completion_timeout(
-    controller: K8sJobController, set_oc_get_items_side_effect: OCItemSetter
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
 ) -> None:
     job = SomeJob(identifying_attribute="some-id", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(active=1))],  # 0 seconds
         [build_job_resource(job, build_job_status(active=1))],  # 5 seconds
         [build_job_resource(job, build_job_status(active=1))],  # 10 seconds
@@ -200,11 +203,11 @@ def test_controller_wait_for_completion_timeout(
 
 
 def test_controller_wait_for_job_list_completion(
-    controller: K8sJobController, set_oc_get_items_side_effect: OCItemSetter
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
 ) -> None:
     job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
     job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         # 0 seconds
         [
             build_job_resource(job1, build_job_status(active=1)),
@@ -230,11 +233,11 @@ def test_controller_wait_for_job_list_completion(
 
 
 def test_controller_wait_for_job_list_completion_partial(
-    controller: K8sJobController, set_oc_get_items_side_effect: OCItemSetter
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
 ) -> None:
     job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
     job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         # 0 seconds
         [
             build_job_resource(job1, build_job_status(active=1)),
@@ -266,11 +269,11 @@ def test_controller_wait_for_job_list_completion_partial(
 
 
 def test_controller_wait_for_job_list_completion_no_timeout(
-    controller: K8sJobController, set_oc_get_items_side_effect: OCItemSetter
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
 ) -> None:
     job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
     job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
-    set_oc_get_items_side_effect(
+    set_oc_list_items_side_effect(
         [
             # 0 seconds
             [
@@ -297,6 +300,141 @@ def test_controller_wait_for_job_list_completion_no_timeout(
     assert controller.time_module.time() == 5
 
 
+def with_resource_version(job_resource: dict[str, Any], rv: str) -> dict[str, Any]:
+    job_resource["metadata"]["resourceVersion"] = rv
+    return job_resource
+
+
+def test_controller_wait_for_job_list_completion_watch(
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
+) -> None:
+    job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
+    job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
+    set_oc_list_items_side_effect(
+        [
+            [
+                build_job_resource(job1, build_job_status(active=1)),
+                build_job_resource(job2, build_job_status(active=1)),
+            ],
+        ],
+        resource_version="1",
+    )
+    controller.oc.watch_items.side_effect = [  # type: ignore[attr-defined]
+        iter([
+            ("BOOKMARK", {"metadata": {"resourceVersion": "2"}}),
+            (
+                "MODIFIED",
+                with_resource_version(
+                    build_job_resource(job1, build_job_status(succeeded=1)), "3"
+                ),
+            ),
+        ]),
+        iter([
+            (
+                "MODIFIED",
+                with_resource_version(
+                    build_job_resource(job2, build_job_status(failed=1)), "4"
+                ),
+            ),
+        ]),
+    ]
+
+    assert controller.wait_for_job_list_completion(
+        {job1.name(), job2.name()},
+        check_interval_seconds=5,
+        timeout_seconds=10,
+    ) == {job1.name(): JobStatus.SUCCESS, job2.name(): JobStatus.ERROR}
+    # woken up by the watch without sleeping or listing again
+    assert controller.time_module.time() == 0
+    assert controller.oc.iter_item_pages.call_count == 1  # type: ignore[attr-defined]
+    assert [
+        c.kwargs["resource_version"]
+        for c in controller.oc.watch_items.call_args_list  # type: ignore[attr-defined]
+    ] == ["1", "3"]
+
+
+def test_controller_wait_for_completion_watch_expired(
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
+) -> None:
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    set_oc_list_items_side_effect(
+        [
+            [build_job_resource(job, build_job_status(active=1))],
+            [build_job_resource(job, build_job_status(succeeded=1))],
+        ],
+        resource_version="1",
+    )
+
+    def expired_watch(**_: Any) -> Iterator[tuple[str, dict[str, Any]]]:
+        raise ResourceVersionExpiredError("too old resource version")
+        yield
+
+    controller.oc.watch_items.side_effect = expired_watch  # type: ignore[attr-defined]
+
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=10
+    )
+    assert controller.time_module.time() == 0
+    assert controller.oc.iter_item_pages.call_count == 2  # type: ignore[attr-defined]
+
+
+def test_controller_wait_for_completion_watch_ended_early(
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
+) -> None:
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    set_oc_list_items_side_effect(
+        [
+            [build_job_resource(job, build_job_status(active=1))],
+            [build_job_resource(job, build_job_status(succeeded=1))],
+        ],
+        resource_version="1",
+    )
+    controller.oc.watch_items.return_value = iter([])  # type: ignore[attr-defined]
+
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=10
+    )
+    # polled instead
+    assert controller.time_module.time() == 5
+    assert controller.oc.iter_item_pages.call_count == 2  # type: ignore[attr-defined]
+
+
+def test_controller_wait_for_completion_watch_failed(
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
+) -> None:
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    set_oc_list_items_side_effect(
+        [
+            [build_job_resource(job, build_job_status(active=1))],
+            [build_job_resource(job, build_job_status(succeeded=1))],
+        ],
+        resource_version="1",
+    )
+    controller.oc.watch_items.side_effect = StatusCodeError("watch failed")  # type: ignore[attr-defined]
+
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=10
+    )
+    # polled instead
+    assert controller.time_module.time() == 5
+
+
+def test_controller_wait_for_completion_without_watch_support(
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
+) -> None:
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    set_oc_list_items_side_effect([
+        [build_job_resource(job, build_job_status(active=1))],
+        [build_job_resource(job, build_job_status(succeeded=1))],
+    ])
+
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=10
+    )
+    controller.oc.watch_items.assert_not_called()  # type: ignore[attr-defined]
+    assert controller.time_module.time() == 5
+
+
 #
 # build secret
 #
@@ -384,10 +522,10 @@ def test_create_job(
 
 
 def test_get_job_generation(
-    controller: K8sJobController, set_oc_get_items_side_effect: OCItemSetter
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
 ) -> None:
     job = SomeJob(identifying_attribute="some-id", description="some-description")
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(active=1))],
     ])
     assert controller.get_job_generation(job.name())
@@ -409,7 +547,7 @@ def test_get_job_status_backoff_limit(
     backoff_limit: int,
     expected_job_status: JobStatus,
     controller: K8sJobController,
-    set_oc_get_items_side_effect: OCItemSetter,
+    set_oc_list_items_side_effect: OCItemSetter,
 ) -> None:
     """
     Verify that backoff_limit is honored when determining the job status.
@@ -417,7 +555,7 @@ def test_get_job_status_backoff_limit(
     not exceeded yet.
     """
     job = SomeJob(identifying_attribute="some-id", backoff_limit=backoff_limit)
-    set_oc_get_items_side_effect([
+    set_oc_list_items_side_effect([
         [build_job_resource(job, build_job_status(failed=1))]
     ])
     assert controller.get_job_status(job_name=job.name()) == expected_job_status
@@ -428,8 +566,8 @@ def test_get_job_status_not_exists(controller: K8sJobController) -> None:
 
 
 def test_get_job_status_no_job_resource_status(
-    controller: K8sJobController, set_oc_get_items_side_effect: OCItemSetter
+    controller: K8sJobController, set_oc_list_items_side_effect: OCItemSetter
 ) -> None:
     job = SomeJob(identifying_attribute="some-id")
-    set_oc_get_items_side_effect([[build_job_resource(job)]])
+    set_oc_list_items_side_effect([[build_job_resource(job)]])
     assert controller.get_job_status(job_name=job.name()) == JobStatus.IN_PROGRESS
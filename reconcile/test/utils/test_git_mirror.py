@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from reconcile.utils.git import GitError
+from reconcile.utils.git_mirror import GitMirror
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git binary not available"
+)
+
+
+def git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def commit(repo: Path, content: str) -> str:
+    (repo / "file.txt").write_text(content)
+    git(repo, "add", ".")
+    git(
+        repo,
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@test",
+        "commit",
+        "-qm",
+        content,
+    )
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "main")
+    return repo
+
+
+def test_git_mirror_checkout_ref(repo: Path, tmp_path: Path) -> None:
+    commit(repo, "first")
+    sha = commit(repo, "second")
+    mirror = GitMirror(str(tmp_path / "mirror"))
+    wd = tmp_path / "wd"
+    wd.mkdir()
+
+    assert mirror.checkout(f"file://{repo}", "main", str(wd)) == sha
+    assert (wd / "file.txt").read_text() == "second"
+
+
+def test_git_mirror_checkout_sha(repo: Path, tmp_path: Path) -> None:
+    first = commit(repo, "first")
+    commit(repo, "second")
+    mirror = GitMirror(str(tmp_path / "mirror"))
+    wd = tmp_path / "wd"
+    wd.mkdir()
+
+    assert mirror.checkout(f"file://{repo}", first, str(wd)) == first
+    assert (wd / "file.txt").read_text() == "first"
+
+
+def test_git_mirror_known_sha_is_not_fetched(repo: Path, tmp_path: Path) -> None:
+    sha = commit(repo, "first")
+    url = f"file://{repo}"
+    mirror = GitMirror(str(tmp_path / "mirror"))
+    mirror.fetch(url, sha)
+    shutil.rmtree(repo)
+
+    assert mirror.has_commit(url, sha)
+    assert mirror.fetch(url, sha) == sha
+    with pytest.raises(GitError):
+        mirror.fetch(url, "main")
+
+
+def test_git_mirror_concurrent_checkouts(repo: Path, tmp_path: Path) -> None:
+    shas = [commit(repo, str(i)) for i in range(4)]
+    mirror = GitMirror(str(tmp_path / "mirror"))
+
+    def checkout(i: int) -> str:
+        wd = tmp_path / f"wd-{i}"
+        wd.mkdir()
+        mirror.checkout(f"file://{repo}", shas[i % 4], str(wd))
+        return (wd / "file.txt").read_text()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contents = list(executor.map(checkout, range(16)))
+
+    assert contents == [str(i % 4) for i in range(16)]
+
+
+def test_git_mirror_prune(repo: Path, tmp_path: Path) -> None:
+    sha = commit(repo, "first")
+    url = f"file://{repo}"
+    mirror = GitMirror(str(tmp_path / "mirror"))
+    mirror.fetch(url, sha)
+
+    mirror.prune(timedelta(days=1))
+    assert mirror.has_commit(url, sha)
+
+    old = time.time() - timedelta(days=2).total_seconds()
+    os.utime(mirror.mirror_path(url), (old, old))
+    mirror.prune(timedelta(days=1))
+    assert not mirror.has_commit(url, sha)
+
+
+def test_git_mirror_use_keeps_mirror(repo: Path, tmp_path: Path) -> None:
+    sha = commit(repo, "first")
+    url = f"file://{repo}"
+    mirror = GitMirror(str(tmp_path / "mirror"))
+    mirror.fetch(url, sha)
+    old = time.time() - timedelta(days=2).total_seconds()
+    os.utime(mirror.mirror_path(url), (old, old))
+
+    mirror.fetch(url, sha)
+    mirror.prune(timedelta(days=1))
+    assert mirror.has_commit(url, sha)
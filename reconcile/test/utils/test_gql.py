@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from types import ModuleType
 from typing import TYPE_CHECKING
 
 import pytest
 import requests
-from gql import Client, gql
+from gql import Client, GraphQLRequest, gql
 from gql.transport.exceptions import TransportQueryError
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from graphql import ExecutionResult
     from pytest_httpserver import HTTPServer
     from pytest_mock import MockerFixture
@@ -17,8 +20,12 @@ from reconcile.utils.gql import (
     GqlApiError,
     GqlApiErrorForbiddenSchemaError,
     GqlApiIntegrationNotFoundError,
+    ParsedQueryRequest,
     PersistentRequestsHTTPTransport,
+    parse_query,
+    warm_up_document_cache,
 )
+from reconcile.utils.gql_response_cache import GqlResponseCache
 
 TEST_QUERY = """
 {
@@ -104,6 +111,76 @@ def test_gqlapi_throws_gqlapierrorforbiddenschema_exception(
         gql_api.query.__wrapped__(gql_api, TEST_QUERY)  # type: ignore[attr-defined]
 
 
+def test_gqlapi_response_cache_hit_skips_server(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {
+        "data": {"integrations": []},
+        "extensions": {"schemas": ["TEST_SCHEMA"]},
+    }
+    cache = GqlResponseCache(str(tmp_path))
+
+    for _ in range(2):
+        gql_api = GqlApi("test_url", "test_token", sha="sha", response_cache=cache)
+        result = gql_api.query.__wrapped__(gql_api, TEST_QUERY)  # type: ignore[attr-defined]
+        assert result == {"integrations": []}
+
+    patched_client.assert_called_once()
+    assert "TEST_SCHEMA" in gql_api.get_queried_schemas()
+
+
+def test_gqlapi_response_cache_requires_sha(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {"data": {"integrations": []}}
+    cache = GqlResponseCache(str(tmp_path))
+    gql_api = GqlApi("test_url", "test_token", response_cache=cache)
+
+    for _ in range(2):
+        gql_api.query.__wrapped__(gql_api, TEST_QUERY)  # type: ignore[attr-defined]
+
+    assert patched_client.call_count == 2
+
+
+def test_parse_query_is_cached() -> None:
+    query = "query CachedQuery { __typename }"
+    assert parse_query(query) is parse_query(query)
+
+
+def test_parsed_query_request_payload() -> None:
+    query = "query Payload($a: String) { __typename }"
+    request = ParsedQueryRequest(parse_query(query), {"a": "b"})
+    assert request.payload == GraphQLRequest(query, variable_values={"a": "b"}).payload
+
+
+def test_gqlapi_query_uses_document_cache(mocker: MockerFixture) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {"data": {"integrations": []}}
+    gql_api = GqlApi("test_url", "test_token")
+
+    gql_api.query.__wrapped__(gql_api, TEST_QUERY, {"a": "b"})  # type: ignore[attr-defined]
+    gql_api.query.__wrapped__(gql_api, TEST_QUERY)  # type: ignore[attr-defined]
+
+    first, second = (c.args[1] for c in patched_client.call_args_list)
+    assert first.document is second.document is parse_query(TEST_QUERY).document
+    assert first.variable_values == {"a": "b"}
+    assert second.variable_values is None
+
+
+def test_warm_up_document_cache(mocker: MockerFixture) -> None:
+    module = ModuleType("reconcile.gql_definitions.test.warm_up")
+    module.DEFINITION = "query WarmUp { __typename }"  # type: ignore[attr-defined]
+    broken = ModuleType("reconcile.gql_definitions.test.broken")
+    broken.DEFINITION = "query Broken {"  # type: ignore[attr-defined]
+    mocker.patch.dict("sys.modules", {module.__name__: module, broken.__name__: broken})
+    parse = mocker.patch("reconcile.utils.gql.parse_query", wraps=parse_query)
+
+    assert warm_up_document_cache() >= 2
+    parse.assert_any_call("query WarmUp { __typename }")
+
+
 # --- gql library integration tests (no mocking) ---
 
 SIMPLE_QUERY = "{ __typename }"
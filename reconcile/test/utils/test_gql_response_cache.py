@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from reconcile.utils.gql_response_cache import (
+    GqlResponseCache,
+    response_cache_from_env,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+RESPONSE = {"data": {"namespaces": [{"name": "ns"}]}}
+
+
+def test_gql_response_cache_key() -> None:
+    key = GqlResponseCache.key("query", {"a": "1", "b": "2"})
+    assert key == GqlResponseCache.key("query", {"b": "2", "a": "1"})
+    assert key != GqlResponseCache.key("query", {"a": "2", "b": "2"})
+    assert GqlResponseCache.key("query", None) == GqlResponseCache.key("query", {})
+
+
+def test_gql_response_cache_memory() -> None:
+    cache = GqlResponseCache()
+    assert cache.get("sha", "key") is None
+
+    cache.set("sha", "key", RESPONSE)
+    response = cache.get("sha", "key")
+    assert response == RESPONSE
+    assert cache.get("other-sha", "key") is None
+
+    # callers get their own copy
+    assert response
+    response["data"]["namespaces"].clear()
+    assert cache.get("sha", "key") == RESPONSE
+
+
+def test_gql_response_cache_keeps_last_bundles() -> None:
+    cache = GqlResponseCache(max_bundles=2)
+    for sha in ("sha1", "sha2", "sha3"):
+        cache.set(sha, "key", RESPONSE)
+
+    assert cache.get("sha1", "key") is None
+    assert cache.get("sha2", "key") == RESPONSE
+    assert cache.get("sha3", "key") == RESPONSE
+
+
+def test_gql_response_cache_disk(tmp_path: Path) -> None:
+    GqlResponseCache(str(tmp_path)).set("sha", "key", RESPONSE)
+
+    # a fresh instance, e.g. another pod on the node, reads the entry
+    assert GqlResponseCache(str(tmp_path)).get("sha", "key") == RESPONSE
+
+
+def test_gql_response_cache_disk_evicts_old_bundles(tmp_path: Path) -> None:
+    cache = GqlResponseCache(str(tmp_path), max_bundles=1)
+    cache.set("sha1", "key", RESPONSE)
+    cache.set("sha2", "key", RESPONSE)
+
+    assert not (tmp_path / "sha1").exists()
+    assert (tmp_path / "sha2" / "key.json").exists()
+
+
+def test_gql_response_cache_disk_write_error(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # the bundle directory was evicted by another pod after mkdir
+    mocker.patch(
+        "reconcile.utils.gql_response_cache.tempfile.mkstemp",
+        side_effect=FileNotFoundError("No such file or directory"),
+    )
+    cache = GqlResponseCache(str(tmp_path))
+    cache.set("sha", "key", RESPONSE)
+
+    assert cache.get("sha", "key") == RESPONSE
+
+
+def test_gql_response_cache_corrupt_entry(tmp_path: Path) -> None:
+    (tmp_path / "sha").mkdir()
+    (tmp_path / "sha" / "key.json").write_text("{")
+
+    assert GqlResponseCache(str(tmp_path)).get("sha", "key") is None
+    assert not (tmp_path / "sha" / "key.json").exists()
+
+
+def test_gql_response_cache_bytes_saved(mocker: MockerFixture) -> None:
+    bytes_saved = mocker.patch(
+        "reconcile.utils.gql_response_cache.gql_response_cache_bytes_saved"
+    )
+    cache = GqlResponseCache()
+    cache.set("sha", "key", RESPONSE)
+    cache.get("sha", "key")
+
+    bytes_saved.labels.return_value.inc.assert_called_once_with(
+        len(b'{"data":{"namespaces":[{"name":"ns"}]}}')
+    )
+
+
+def test_response_cache_from_env(mocker: MockerFixture, tmp_path: Path) -> None:
+    mocker.patch.dict("os.environ", {}, clear=True)
+    assert response_cache_from_env() is None
+
+    mocker.patch.dict("os.environ", {"GQL_RESPONSE_CACHE": "true"})
+    cache = response_cache_from_env()
+    assert cache
+    assert cache.directory is None
+
+    mocker.patch.dict("os.environ", {"GQL_RESPONSE_CACHE_DIR": str(tmp_path)})
+    cache = response_cache_from_env()
+    assert cache
+    assert cache.directory == tmp_path
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
 import yaml
@@ -24,6 +28,8 @@ if TYPE_CHECKING:
         Sequence,
     )
 
+    from pytest_mock import MockerFixture
+
 fxt = Fixtures("helm")
 
 
@@ -447,3 +453,58 @@ def test_template_cron_enable_pushgateway(
     template = helm.template(build_helm_values(helm_integration_specs_cron))
     expected = yaml.safe_load(fxt.get("enable_pushgateway.yml"))
     assert template == expected
+
+
+def test_dependencies_key(tmp_path: Path) -> None:
+    deps = [{"name": "dep", "repository": "https://charts", "version": "1.2.3"}]
+    key = helm._dependencies_key(str(tmp_path), deps)
+    assert key
+    assert key == helm._dependencies_key(str(tmp_path), deps)
+
+    (tmp_path / "Chart.lock").write_text("digest: sha256:abc")
+    assert helm._dependencies_key(str(tmp_path), deps) != key
+
+
+@pytest.mark.parametrize(
+    "dep",
+    [
+        {"name": "dep", "repository": "https://charts", "version": "~1.2.3"},
+        {"name": "dep", "repository": "file://../dep", "version": "1.2.3"},
+    ],
+)
+def test_dependencies_key_not_cacheable(tmp_path: Path, dep: dict[str, str]) -> None:
+    assert helm._dependencies_key(str(tmp_path), [dep]) is None
+
+
+def test_build_cached_dependencies(tmp_path: Path, mocker: MockerFixture) -> None:
+    def dependency_build(cmd: list[str], **_: Any) -> None:
+        if cmd[1] == "dependency":
+            (Path(cmd[3]) / "charts").mkdir(exist_ok=True)
+            (Path(cmd[3]) / "charts" / "dep-1.2.3.tgz").write_text("chart")
+
+    run = mocker.patch.object(helm, "run", side_effect=dependency_build)
+    deps = [{"name": "dep", "repository": "https://charts", "version": "1.2.3"}]
+    cache_dir = str(tmp_path / "cache")
+    for chart in ("chart-1", "chart-2"):
+        (tmp_path / chart).mkdir()
+        helm._build_cached_dependencies(
+            str(tmp_path / chart), deps, "repositories.yaml", cache_dir
+        )
+        assert (tmp_path / chart / "charts" / "dep-1.2.3.tgz").read_text() == "chart"
+
+    # repo add + dependency build, only for the first chart
+    assert run.call_count == 2
+
+
+def test_prune_cache(tmp_path: Path) -> None:
+    old = time.time() - timedelta(days=2).total_seconds()
+    for entry in ("git/old", "git/new", "dependencies/old", "dependencies/new"):
+        (tmp_path / entry).mkdir(parents=True)
+        if entry.endswith("old"):
+            os.utime(tmp_path / entry, (old, old))
+
+    helm.prune_cache(str(tmp_path), max_age=timedelta(days=1))
+
+    for kind in ("git", "dependencies"):
+        assert not (tmp_path / kind / "old").exists()
+        assert (tmp_path / kind / "new").exists()
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import io
+import json
 import os
 import tempfile
 from subprocess import CompletedProcess
 from typing import TYPE_CHECKING
 
+import pytest
+
 from reconcile.utils import lean_terraform_client
 
 if TYPE_CHECKING:
@@ -40,6 +44,26 @@ def test_init(mocker: MockerFixture) -> None:
     )
 
 
+def test_init_reconfigure(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "reconcile.utils.lean_terraform_client.os"
+    ).environ.copy.return_value = {}
+    mocked_subprocess = mocker.patch("reconcile.utils.lean_terraform_client.subprocess")
+    mocked_subprocess.run.return_value = CompletedProcess(
+        args=[], returncode=0, stdout=b"", stderr=b""
+    )
+
+    lean_terraform_client.init("working_dir", reconfigure=True)
+
+    assert mocked_subprocess.run.call_args.args[0] == [
+        "terraform",
+        "init",
+        "-input=false",
+        "-no-color",
+        "-reconfigure",
+    ]
+
+
 def test_output(mocker: MockerFixture) -> None:
     mocker.patch(
         "reconcile.utils.lean_terraform_client.os"
@@ -174,6 +198,98 @@ def test_show_json(mocker: MockerFixture) -> None:
     )
 
 
+PLAN = {
+    "format_version": "1.2",
+    "planned_values": {"root_module": {"resources": [{"name": 'a\\"{['}]}},
+    "output_changes": {"out": {"actions": ["create"], "after": 1.5}},
+    "prior_state": {
+        "values": {"outputs": {"old": {"value": "x"}}, "root_module": {}},
+    },
+    "resource_changes": [
+        {"address": "a.noop", "change": {"actions": ["no-op"]}},
+        {
+            "address": "a.moved",
+            "previous_address": "a.old",
+            "change": {"actions": ["no-op"]},
+        },
+        {
+            "address": "a.created",
+            "change": {"actions": ["create"], "after": [1, {}]},
+        },
+    ],
+    "configuration": {"provider_config": {}},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_read_plan_changes(mocker: MockerFixture, chunk_size: int) -> None:
+    mocker.patch("reconcile.utils.lean_terraform_client._CHUNK_SIZE", chunk_size)
+    stream = lean_terraform_client._JsonStream(io.StringIO(json.dumps(PLAN, indent=1)))
+
+    plan = lean_terraform_client._read_plan_changes(stream)
+
+    assert plan == lean_terraform_client.PlanChanges(
+        format_version="1.2",
+        output_changes=PLAN["output_changes"],
+        prior_outputs=["old"],
+        resource_changes=PLAN["resource_changes"][1:],
+    )
+
+
+def test_show_plan(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "reconcile.utils.lean_terraform_client.os"
+    ).environ.copy.return_value = {}
+    mocked_subprocess = mocker.patch("reconcile.utils.lean_terraform_client.subprocess")
+    process = mocked_subprocess.Popen.return_value.__enter__.return_value
+    process.stdout = io.BytesIO(json.dumps(PLAN).encode("utf-8"))
+    process.returncode = 0
+
+    plan = lean_terraform_client.show_plan(working_dir="working_dir", path="tfplan")
+
+    assert plan.format_version == "1.2"
+    assert [rc["address"] for rc in plan.resource_changes] == [
+        "a.moved",
+        "a.created",
+    ]
+    mocked_subprocess.Popen.assert_called_once_with(
+        ["terraform", "show", "-no-color", "-json", "tfplan"],
+        cwd="working_dir",
+        env={},
+        stdout=mocked_subprocess.PIPE,
+        stderr=mocker.ANY,
+    )
+
+
+def test_show_plan_failed(mocker: MockerFixture) -> None:
+    mocked_subprocess = mocker.patch("reconcile.utils.lean_terraform_client.subprocess")
+    process = mocked_subprocess.Popen.return_value.__enter__.return_value
+    process.stdout = io.BytesIO(b"")
+    process.returncode = 1
+
+    with pytest.raises(Exception, match="terraform show failed"):
+        lean_terraform_client.show_plan(working_dir="working_dir", path="tfplan")
+
+
+def test_read_plan_changes_without_prior_state() -> None:
+    stream = lean_terraform_client._JsonStream(
+        io.StringIO('{"format_version": "1.2", "prior_state": null}')
+    )
+
+    plan = lean_terraform_client._read_plan_changes(stream)
+
+    assert plan == lean_terraform_client.PlanChanges(format_version="1.2")
+
+
+def test_read_plan_changes_truncated() -> None:
+    stream = lean_terraform_client._JsonStream(
+        io.StringIO('{"format_version": "1.2", "resource_changes": [{')
+    )
+
+    with pytest.raises(ValueError):
+        lean_terraform_client._read_plan_changes(stream)
+
+
 def test_terraform_component() -> None:
     with tempfile.TemporaryDirectory() as working_dir:
         with open(os.path.join(working_dir, "main.tf"), "w", encoding="locale"):
@@ -182,4 +298,5 @@ def test_terraform_component() -> None:
         assert lean_terraform_client.output(working_dir)[0] == 0
         assert lean_terraform_client.plan(working_dir, "tfplan")[0] == 0
         assert lean_terraform_client.show_json(working_dir, "tfplan") is not None
+        assert lean_terraform_client.show_plan(working_dir, "tfplan").format_version
         assert lean_terraform_client.apply(working_dir, "tfplan")[0] == 0
@@ -18,10 +18,12 @@ from reconcile.utils.oc import (
     LABEL_MAX_KEY_PREFIX_LENGTH,
     LABEL_MAX_VALUE_LENGTH,
     OC,
+    RESOURCE_NAMES_LIST_THRESHOLD,
     AmbiguousResourceTypeError,
     KindNotFoundError,
     OC_Map,
     OCCli,
+    OCCliApiResource,
     OCLogMsg,
     OCNative,
     PodNotReadyError,
@@ -1313,6 +1315,130 @@ def test_oc_native_get_items_with_resource_names(oc_native: OCNative) -> None:
     )
 
 
+def test_oc_native_get_items_with_many_resource_names(oc_native: OCNative) -> None:
+    names = [f"name{i}" for i in range(RESOURCE_NAMES_LIST_THRESHOLD + 1)]
+    obj_client_get = oc_native.client.resources.get.return_value.get
+    obj_client_get.return_value.to_dict.return_value = {
+        "items": [{"metadata": {"name": n}} for n in ["other", *reversed(names)]]
+    }
+
+    items = oc_native.get_items("kind1", resource_names=names)
+
+    assert [i["metadata"]["name"] for i in items] == names
+    obj_client_get.assert_called_once_with(
+        namespace="",
+        label_selector="",
+        _request_timeout=60,
+    )
+
+
+def test_oc_cli_get_items_with_resource_names(
+    oc_cli: OCCli, mocker: MockerFixture
+) -> None:
+    run_json = mocker.patch.object(oc_cli, "_run_json", autospec=True)
+    run_json.side_effect = lambda cmd, allow_not_found: (
+        {} if cmd[-1] == "missing" else {"metadata": {"name": cmd[-1]}}
+    )
+
+    items = oc_cli.get_items("Secret", resource_names=["a", "missing", "b"])
+
+    assert [i["metadata"]["name"] for i in items] == ["a", "b"]
+    assert run_json.call_count == 3
+
+
+def test_oc_native_iter_items_pages(oc_native: OCNative) -> None:
+    obj_client_get = oc_native.client.resources.get.return_value.get
+    obj_client_get.return_value.to_dict.side_effect = [
+        {"items": [{"a": 1}], "metadata": {"continue": "token"}},
+        {"items": [{"b": 2}], "metadata": {}},
+    ]
+
+    items = list(oc_native.iter_items("kind1", page_size=1))
+
+    assert items == [{"a": 1}, {"b": 2}]
+    assert [c.kwargs["_continue"] for c in obj_client_get.call_args_list] == [
+        None,
+        "token",
+    ]
+    obj_client_get.assert_called_with(
+        namespace="",
+        label_selector="",
+        limit=1,
+        _continue="token",
+        _request_timeout=60,
+    )
+
+
+def test_oc_native_iter_item_pages(oc_native: OCNative, mocker: MockerFixture) -> None:
+    mocker.patch.object(oc_native, "project_exists", return_value=True)
+    obj_client_get = oc_native.client.resources.get.return_value.get
+    obj_client_get.return_value.to_dict.side_effect = [
+        {
+            "items": [{"a": 1}],
+            "metadata": {"continue": "token", "resourceVersion": "5"},
+        },
+        {"items": [{"b": 2}], "metadata": {"resourceVersion": "5"}},
+    ]
+
+    pages = oc_native.iter_item_pages("kind1", namespace="ns")
+
+    first_page = next(pages)
+    assert first_page["items"] == [{"a": 1}]
+    # the version comes with the list, no extra request
+    assert first_page["metadata"]["resourceVersion"] == "5"
+    assert obj_client_get.call_count == 1
+    assert [p["items"] for p in pages] == [[{"b": 2}]]
+    assert oc_native.supports_watch
+
+
+def test_oc_cli_iter_items_pages(oc_cli: OCCli, mocker: MockerFixture) -> None:
+    oc_cli.api_resources = {
+        "Secret": [
+            OCCliApiResource(
+                kind="Secret",
+                group="",
+                api_version="v1",
+                namespaced=True,
+                name="secrets",
+            )
+        ]
+    }
+    mocker.patch.object(oc_cli, "project_exists", return_value=True)
+    run_json = mocker.patch.object(oc_cli, "_run_json", autospec=True)
+    run_json.side_effect = [
+        {"items": [{"metadata": {"name": "a"}}], "metadata": {"continue": "t"}},
+        {"items": [{"metadata": {"name": "b"}}], "metadata": {}},
+    ]
+
+    items = list(oc_cli.iter_items("Secret", page_size=1, namespace="ns"))
+
+    assert [i["metadata"]["name"] for i in items] == ["a", "b"]
+    assert all(i["kind"] == "Secret" and i["apiVersion"] == "v1" for i in items)
+    run_json.assert_has_calls([
+        mocker.call(["get", "--raw", "/api/v1/namespaces/ns/secrets?limit=1"]),
+        mocker.call([
+            "get",
+            "--raw",
+            "/api/v1/namespaces/ns/secrets?limit=1&continue=t",
+        ]),
+    ])
+
+
+def test_oc_cli_iter_item_pages(oc_cli: OCCli, mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        oc_cli,
+        "iter_items",
+        autospec=True,
+        return_value=iter([{"a": 1}, {"b": 2}, {"c": 3}]),
+    )
+
+    assert list(oc_cli.iter_item_pages("Secret", namespace="ns", page_size=2)) == [
+        {"items": [{"a": 1}, {"b": 2}], "metadata": {}},
+        {"items": [{"c": 3}], "metadata": {}},
+    ]
+    assert not oc_cli.supports_watch
+
+
 def test_oc_native_get_all(oc_native: OCNative) -> None:
     oc_native.get_all("kind1")
 
@@ -1399,6 +1525,74 @@ def test_delete_project_command_selection(
     assert actual_command == expected_command
 
 
+def test_project_exists_uses_index(oc_cli: OCCli, mocker: MockerFixture) -> None:
+    mocker.patch.object(oc_cli, "is_kind_supported", return_value=True)
+    get_all = mocker.patch.object(
+        oc_cli,
+        "get_all",
+        return_value={"items": [{"metadata": {"name": "ns1"}}]},
+    )
+    get = mocker.patch.object(oc_cli, "get", return_value={})
+
+    assert oc_cli.project_exists("ns1")
+    assert oc_cli.project_exists("ns2")
+    assert oc_cli.project_exists("ns2")
+
+    get_all.assert_called_once_with("Project.project.openshift.io")
+    get.assert_called_once_with(None, "Project.project.openshift.io", "ns2")
+
+
+def test_project_exists_does_not_cache_missing(
+    oc_cli: OCCli, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(oc_cli, "is_kind_supported", return_value=False)
+    get_all = mocker.patch.object(oc_cli, "get_all", return_value={"items": []})
+    get = mocker.patch.object(
+        oc_cli, "get", side_effect=[StatusCodeError("NotFound"), {}]
+    )
+
+    assert not oc_cli.project_exists("ns1")
+    assert oc_cli.project_exists("ns1")
+    assert oc_cli.project_exists("ns1")
+
+    get_all.assert_called_once_with("Namespace")
+    assert get.call_count == 2
+
+
+def test_project_exists_without_list_permissions(
+    oc_cli: OCCli, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(oc_cli, "is_kind_supported", return_value=False)
+    get_all = mocker.patch.object(
+        oc_cli, "get_all", side_effect=StatusCodeError("Forbidden")
+    )
+    get = mocker.patch.object(oc_cli, "get", return_value={})
+
+    assert oc_cli.project_exists("ns1")
+    assert oc_cli.project_exists("ns2")
+
+    get_all.assert_called_once()
+    assert get.call_count == 2
+
+
+def test_project_index_follows_new_and_delete_project(
+    oc_cli: OCCli, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(oc_cli, "is_kind_supported", return_value=True)
+    mocker.patch.object(oc_cli, "get_all", return_value={"items": []})
+    mocker.patch.object(oc_cli, "_run", return_value=b"")
+    get = mocker.patch.object(oc_cli, "get")
+
+    oc_cli.refresh_projects()
+    oc_cli.new_project.__wrapped__(oc_cli, "ns1")  # type: ignore[attr-defined]
+    assert oc_cli.project_exists("ns1")
+
+    get.assert_not_called()
+
+    oc_cli.delete_project.__wrapped__(oc_cli, "ns1")  # type: ignore[attr-defined]
+    assert "ns1" not in oc_cli.projects
+
+
 @pytest.mark.parametrize(
     ("server_side", "expected_command"),
     [
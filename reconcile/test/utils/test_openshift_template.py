@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+import re
+import shutil
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from reconcile.test.fixtures import Fixtures
+from reconcile.utils.oc import OCLocal, StatusCodeError, oc_process
+from reconcile.utils.openshift_template import (
+    TemplateProcessingError,
+    generate_expression_value,
+    process_template,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+fxt = Fixtures("openshift_template")
+# templates and `oc process` output recorded for the saasherder tests
+recorded = Fixtures("saasherder_populate_desired")
+
+SAAS_PARAMETERS = {
+    "OBSERVATORIUM_METRICS_NAMESPACE": "yolo",
+    "OBSERVATORIUM_LOGS_NAMESPACE": "yolo-but-for-logs",
+}
+API_PARAMETERS = {
+    "OBSERVATORIUM_API_CPU_LIMIT": "1",
+    "OBSERVATORIUM_API_CPU_REQUEST": "100m",
+    "OBSERVATORIUM_API_MEMORY_LIMIT": "1Gi",
+    "OBSERVATORIUM_API_MEMORY_REQUEST": "256Mi",
+    "SERVICE_ACCOUNT_NAME": "maor-for-president",
+}
+
+
+def template(**kwargs: Any) -> dict[str, Any]:
+    return {
+        "apiVersion": "template.openshift.io/v1",
+        "kind": "Template",
+        "metadata": {"name": "test"},
+    } | kwargs
+
+
+@pytest.mark.parametrize(
+    "template_file, parameters, expected_files",
+    [
+        (
+            "4ba049635dd62d57605ea74890c08caef067ed13_resource_1.yaml",
+            SAAS_PARAMETERS
+            | API_PARAMETERS
+            | {
+                "OBSERVATORIUM_API_IMAGE": "secret.quay.io/observatorium/api",
+                "VERSION": "v900.1.1",
+                "NAMESPACE": "yolo-stage",
+                "OBSERVATORIUM_METRICS_NAMESPACE": "yolo-stage",
+                "OBSERVATORIUM_LOGS_NAMESPACE": "yolo-but-for-logs-stage",
+                "REPLICAS": 3,
+            },
+            [
+                "expected_stage-1_yolo-stage_ConfigMap.json",
+                "expected_stage-1_yolo-stage_Deployment.json",
+            ],
+        ),
+        (
+            "17358120d2019d171f93a0c92e059b6b9acc7a03_resource_1.yaml",
+            SAAS_PARAMETERS
+            | API_PARAMETERS
+            | {
+                "OBSERVATORIUM_API_IMAGE": "quay.io/observatorium/api",
+                "VERSION": "v100.1.1",
+                "NAMESPACE": "yolo",
+                "REPLICAS": 5,
+            },
+            ["expected_prod-1_yolo_Deployment.json"],
+        ),
+        (
+            "4ba049635dd62d57605ea74890c08caef067ed13_resource_2.yaml",
+            SAAS_PARAMETERS | {"VERSION": "experimental"},
+            ["expected_stage-1_yolo-stage_Service.json"],
+        ),
+        (
+            "4ba049635dd62d57605ea74890c08caef067ed13_resource_2.yaml",
+            SAAS_PARAMETERS,
+            ["expected_prod-1_yolo_Service.json"],
+        ),
+    ],
+)
+def test_process_template_matches_recorded_oc_output(
+    template_file: str, parameters: dict[str, Any], expected_files: list[str]
+) -> None:
+    resources = process_template(recorded.get_anymarkup(template_file), parameters)
+    assert resources == [recorded.get_json(f) for f in expected_files]
+
+
+def test_process_template_substitutes_keys() -> None:
+    t = template(
+        parameters=[{"name": "NAME", "value": "app"}, {"name": "ENABLED"}],
+        objects=[
+            {
+                "kind": "ConfigMap",
+                "metadata": {
+                    "name": "${NAME}",
+                    "labels": {"${NAME}/component": "api"},
+                },
+                "data": {"${NAME}.yaml": "name: ${NAME}", "${{ENABLED}}": "x"},
+            }
+        ],
+    )
+    assert process_template(t, {"ENABLED": "true"}) == [
+        {
+            "kind": "ConfigMap",
+            "metadata": {"name": "app", "labels": {"app/component": "api"}},
+            "data": {"app.yaml": "name: app", "true": "x"},
+        }
+    ]
+
+
+@pytest.mark.parametrize("value", ["${{NAME}}", "prefix-${{NAME}}"])
+def test_process_template_non_string_parameter_invalid_json(value: str) -> None:
+    t = template(
+        parameters=[{"name": "NAME", "value": "app"}],
+        objects=[{"kind": "ConfigMap", "metadata": {"name": value}}],
+    )
+    with pytest.raises(TemplateProcessingError, match="failed to unmarshal"):
+        process_template(t)
+
+
+def test_process_template_non_string_parameter_unknown() -> None:
+    t = template(objects=[{"kind": "ConfigMap", "data": {"a": "${{UNKNOWN}}"}}])
+    assert process_template(t) == [{"kind": "ConfigMap", "data": {"a": "${{UNKNOWN}}"}}]
+
+
+def test_process_template_does_not_modify_template() -> None:
+    t = fxt.get_anymarkup("basic.yml")
+    expected = fxt.get_anymarkup("basic.yml")
+    process_template(t, fxt.get_json("basic_parameters.json"))
+    assert t == expected
+
+
+def test_process_template_generate_expression() -> None:
+    resources = process_template(fxt.get_anymarkup("generate.yml"), {"GIVEN": "given"})
+    data = resources[0]["stringData"]
+    assert re.fullmatch(r"[a-zA-Z0-9]{16}", data["password"])
+    assert re.fullmatch(r"admin-[0-9]{4}", data["user"])
+    assert data["given"] == "given"
+
+
+def test_process_template_required_parameter() -> None:
+    t = template(
+        parameters=[{"name": "IMAGE", "required": True}],
+        objects=[{"kind": "ConfigMap", "metadata": {"name": "${IMAGE}"}}],
+    )
+    with pytest.raises(TemplateProcessingError, match="IMAGE is required"):
+        process_template(t)
+    with pytest.raises(TemplateProcessingError, match="IMAGE is required"):
+        process_template(t, {"IMAGE": ""})
+    assert process_template(t, {"IMAGE": "image"}) == [
+        {"kind": "ConfigMap", "metadata": {"name": "image"}}
+    ]
+
+
+def test_process_template_labels_overwrite_existing() -> None:
+    t = template(
+        labels={"app": "a"},
+        objects=[
+            {
+                "kind": "ConfigMap",
+                "metadata": {"name": "cm", "labels": {"app": "b", "tier": "c"}},
+            }
+        ],
+    )
+    assert process_template(t) == [
+        {
+            "kind": "ConfigMap",
+            "metadata": {"name": "cm", "labels": {"app": "a", "tier": "c"}},
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "expression, pattern",
+    [
+        ("[a-z]{10}", r"[a-z]{10}"),
+        ("[A-Z0-9]{5}", r"[A-Z0-9]{5}"),
+        ("[\\w]{8}", r"\w{8}"),
+        ("[\\a]{8}", r"[a-zA-Z0-9]{8}"),
+        ("[\\d]{3}-[\\d]{3}", r"[0-9]{3}-[0-9]{3}"),
+        ("no-expression", r"no-expression"),
+    ],
+)
+def test_generate_expression_value(expression: str, pattern: str) -> None:
+    assert re.fullmatch(pattern, generate_expression_value(expression))
+
+
+@pytest.mark.parametrize("expression", ["[a-z]{0}", "[a-z]{256}", "[z-a]{4}"])
+def test_generate_expression_value_invalid(expression: str) -> None:
+    with pytest.raises(TemplateProcessingError):
+        generate_expression_value(expression)
+
+
+def test_oc_process_python_backend_raises_status_code_error(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.dict("os.environ", {"OC_PROCESS_BACKEND": "python"})
+    t = template(parameters=[{"name": "IMAGE", "required": True}])
+    with pytest.raises(StatusCodeError):
+        oc_process(t)
+
+
+def test_oc_process_defaults_to_oc(mocker: MockerFixture) -> None:
+    mocker.patch.dict("os.environ")
+    os.environ.pop("OC_PROCESS_BACKEND", None)
+    process = mocker.patch.object(OCLocal, "process", return_value=[])
+    t = template()
+    assert oc_process(t, {"A": "b"}) == []
+    process.assert_called_once_with(t, {"A": "b"})
+
+
+@pytest.mark.skipif(shutil.which("oc") is None, reason="oc binary not available")
+def test_process_template_matches_oc() -> None:
+    t = fxt.get_anymarkup("basic.yml")
+    parameters = fxt.get_json("basic_parameters.json")
+    oc = OCLocal(cluster_name="cluster", server=None, token=None, local=True)
+    assert process_template(t, parameters) == list(oc.process(t, parameters))
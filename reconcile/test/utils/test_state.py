@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import boto3
@@ -13,6 +14,7 @@ from reconcile.gql_definitions.common.state_aws_account import AWSAccountV1
 from reconcile.gql_definitions.fragments.vault_secret import VaultSecret
 from reconcile.typed_queries.get_state_aws_account import get_state_aws_account
 from reconcile.utils import state
+from reconcile.utils.datetime_util import utc_now
 from reconcile.utils.secret_reader import (
     ConfigSecretReader,
     SecretReaderBase,
@@ -29,6 +31,7 @@ from reconcile.utils.state import (
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from pathlib import Path
 
     from mypy_boto3_s3 import S3Client
     from pytest import MonkeyPatch
@@ -145,6 +148,19 @@ def test_ls_when_integration_is_empty_string(
     assert keys == expected
 
 
+def test_ls_modified_before(integration_state: State, s3_client: S3Client) -> None:
+    s3_client.put_object(
+        Bucket=integration_state.bucket,
+        Key="state/integration-name/some-file-1",
+        Body="test",
+    )
+
+    assert integration_state.ls(modified_before=utc_now() - timedelta(days=1)) == []
+    assert integration_state.ls(modified_before=utc_now() + timedelta(days=1)) == [
+        "/some-file-1"
+    ]
+
+
 def test_ls_when_state_is_empty(integration_state: State, s3_client: S3Client) -> None:
     keys = integration_state.ls()
 
@@ -214,6 +230,67 @@ def test_add_with_metadata(integration_state: State) -> None:
     assert integration_state.get("k") == "v"
 
 
+def test_ls_with_prefix_and_delimiter(
+    integration_state: State, s3_client: S3Client
+) -> None:
+    for key in ["a/1", "a/2", "a/sub/3", "b/1"]:
+        s3_client.put_object(
+            Bucket=integration_state.bucket,
+            Key=f"state/integration-name/{key}",
+            Body="test",
+        )
+
+    assert integration_state.ls(prefix="a/") == ["/a/1", "/a/2", "/a/sub/3"]
+    assert integration_state.ls(prefix="a/", delimiter="/") == [
+        "/a/1",
+        "/a/2",
+        "/a/sub/",
+    ]
+
+
+def test_get_many_and_set_many(integration_state: State) -> None:
+    integration_state.set_many({"k1": "v1", "k2": {"a": "b"}})
+
+    assert integration_state.get_many(["k1", "k2", "missing"]) == {
+        "k1": "v1",
+        "k2": {"a": "b"},
+    }
+
+
+def test_get_all(integration_state: State) -> None:
+    integration_state.set_many({"path/k1": "v1", "path/k2": "v2", "other/k3": "v3"})
+
+    assert integration_state.get_all("path") == {"k1": "v1", "k2": "v2"}
+
+
+def test_get_uses_etag_cache(
+    s3_client: S3Client, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    state = State(
+        integration="integration-name",
+        bucket=BUCKET,
+        client=s3_client,
+        cache_dir=str(tmp_path),
+    )
+    state["k"] = "v"
+    get_object = mocker.spy(s3_client, "get_object")
+
+    # unchanged objects are served from the cache
+    assert state["k"] == "v"
+    assert "IfNoneMatch" in get_object.call_args.kwargs
+
+    # changes made by others are picked up
+    s3_client.put_object(
+        Bucket=BUCKET, Key="state/integration-name/k", Body='"changed"'
+    )
+    assert state["k"] == "changed"
+
+    state.rm("k")
+    assert not list(tmp_path.iterdir())
+    with pytest.raises(KeyError):
+        state["k"]
+
+
 #
 # aquire settings
 #
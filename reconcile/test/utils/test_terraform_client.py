@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import base64
+import fcntl
+import json
 import tempfile
 from logging import DEBUG
 from operator import itemgetter
@@ -15,15 +17,20 @@ from reconcile.utils.external_resource_spec import (
     ExternalResourceSpec,
     ExternalResourceUniqueKey,
 )
+from reconcile.utils.lean_terraform_client import PlanChanges
 from reconcile.utils.terraform_client import (
+    AccountUser,
     DeletionApprovalExpirationValueError,
     RdsUpgradeValidationError,
     TerraformClient,
     TerraformSpec,
+    lock_working_dir,
+    unlock_working_dir,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
     from pytest_mock import MockerFixture
 
@@ -1029,6 +1036,7 @@ def test_terraform_init(
             "TF_LOG": "TRACE",
             "TF_LOG_PATH": "temp-name",
         },
+        reconfigure=False,
     )
     mocked_logging.warning.assert_called_once_with(
         f"[{ACCOUNT_NAME} - init] {warning_log}"
@@ -1074,7 +1082,7 @@ def test_terraform_plan(
     terraform_spec_builder: Callable[..., TerraformSpec],
 ) -> None:
     mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
-    mocked_lean_tf.show_json.return_value = {"format_version": "1.2"}
+    mocked_lean_tf.show_plan.return_value = PlanChanges(format_version="1.2")
     mocked_lean_tf.plan.return_value = (0, "", "")
     mocked_tempfile = mocker.patch("reconcile.utils.terraform_client.tempfile")
     mocked_logging = mocker.patch("reconcile.utils.terraform_client.logging")
@@ -1107,6 +1115,47 @@ def test_terraform_plan(
     )
 
 
+def test_log_plan_diff(
+    tf: TerraformClient,
+    mocker: MockerFixture,
+    terraform_spec_builder: Callable[..., TerraformSpec],
+) -> None:
+    mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
+    mocked_lean_tf.show_plan.return_value = PlanChanges(
+        format_version="1.2",
+        output_changes={"kept": {"after": "new"}},
+        prior_outputs=["kept", "deleted"],
+        resource_changes=[
+            {
+                "type": "aws_iam_user_login_profile",
+                "name": "user",
+                "address": "aws_iam_user_login_profile.user",
+                "change": {"actions": ["create"]},
+            },
+            {
+                "type": "aws_s3_bucket",
+                "name": "bucket",
+                "address": "aws_s3_bucket.bucket",
+                "change": {"actions": ["delete"], "before": {}},
+            },
+        ],
+    )
+    mocker.patch(
+        "reconcile.utils.terraform_client.get_app_interface_custom_message",
+        return_value=None,
+    )
+    tf.outputs = {ACCOUNT_NAME: {"kept": {"value": "old"}}}
+
+    disabled_deletion_detected, created_users = tf.log_plan_diff(
+        terraform_spec_builder(ACCOUNT_NAME, "wd"), False
+    )
+
+    assert disabled_deletion_detected is True
+    assert created_users == [AccountUser(ACCOUNT_NAME, "user")]
+    assert tf.apply_count == 4
+    mocked_lean_tf.show_plan.assert_called_once_with("wd", ACCOUNT_NAME, env=None)
+
+
 def test_terraform_plan_with_error(
     tf: TerraformClient,
     mocker: MockerFixture,
@@ -1135,7 +1184,7 @@ def test_terraform_plan_with_error(
     mocked_logging.error.assert_called_once_with(
         f"[{ACCOUNT_NAME} - plan] {error_message}"
     )
-    mocked_lean_tf.show_json.assert_not_called()
+    mocked_lean_tf.show_plan.assert_not_called()
 
 
 def test_terraform_safe_plan_raises_errors(
@@ -1191,3 +1240,142 @@ def test_terraform_apply(
     mocked_logging.warning.assert_called_once_with(
         f"[{ACCOUNT_NAME} - apply] {warning_log}"
     )
+
+
+def test_skip_specs_excludes_plan_and_apply(
+    mocker: MockerFixture, aws_api: MockAWSApi
+) -> None:
+    mocker.patch.object(TerraformClient, "terraform_init")
+    mocker.patch.object(
+        TerraformClient, "terraform_output", side_effect=lambda spec: (spec.name, {})
+    )
+    tf = TerraformClient(
+        "integ", "v1", "integ_pfx", [], {"a": "/a", "b": "/b"}, 1, aws_api
+    )
+    terraform_plan = mocker.patch.object(
+        tf, "terraform_plan", return_value=(False, [], False)
+    )
+    terraform_apply = mocker.patch.object(tf, "terraform_apply", return_value=False)
+
+    tf.skip_specs({"a"})
+    tf.plan(enable_deletion=False)
+    tf.apply()
+    tf.init_outputs()
+
+    b = TerraformSpec(name="b", working_dir="/b")
+    terraform_plan.assert_called_once_with(b, enable_deletion=False)
+    terraform_apply.assert_called_once_with(b)
+    assert tf.outputs == {"a": {}, "b": {}}
+
+
+def init_working_dir(path: Path, backend_key: str) -> str:
+    config = {"terraform": {"backend": {"s3": {"key": backend_key}}}}
+    (path / "config.tf.json").write_text(json.dumps(config))
+    return str(path)
+
+
+def test_init_skipped_for_initialized_working_dir(
+    mocker: MockerFixture, aws_api: MockAWSApi, tmp_path: Path
+) -> None:
+    def terraform_init(spec: TerraformSpec) -> None:
+        (tmp_path / ".terraform").mkdir(exist_ok=True)
+        (tmp_path / ".terraform.lock.hcl").write_text("lock")
+        (tmp_path / "a").write_text("plan")
+
+    init = mocker.patch.object(
+        TerraformClient, "terraform_init", side_effect=terraform_init
+    )
+    mocker.patch.object(TerraformClient, "init_outputs")
+    working_dirs = {"a": init_working_dir(tmp_path, "key")}
+
+    def client() -> TerraformClient:
+        return TerraformClient(
+            "integ",
+            "v1",
+            "integ_pfx",
+            [],
+            working_dirs,
+            1,
+            aws_api,
+            keep_working_dirs=True,
+        )
+
+    client()
+    client()
+    assert init.call_count == 1
+
+    init_working_dir(tmp_path, "other-key")
+    client()
+    assert init.call_count == 2
+
+    (tmp_path / ".terraform.lock.hcl").write_text("upgraded")
+    client().cleanup()
+    assert init.call_count == 3
+    # only the initialized state is kept, the config and plan hold credentials
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        ".terraform",
+        ".terraform.lock.hcl",
+    ]
+
+
+def test_init_uses_plugin_cache_dir(
+    mocker: MockerFixture, aws_api: MockAWSApi, tmp_path: Path
+) -> None:
+    mocker.patch.object(TerraformClient, "init_outputs")
+    lean_tf_init = mocker.patch(
+        "reconcile.utils.terraform_client.lean_tf.init", return_value=(0, "", "")
+    )
+    plugin_cache_dir = tmp_path / "plugin-cache"
+
+    TerraformClient(
+        "integ",
+        "v1",
+        "integ_pfx",
+        [],
+        {"a": init_working_dir(tmp_path, "key")},
+        1,
+        aws_api,
+        plugin_cache_dir=str(plugin_cache_dir),
+    )
+
+    assert plugin_cache_dir.is_dir()
+    env = lean_tf_init.call_args.kwargs["env"]
+    assert env["TF_PLUGIN_CACHE_DIR"] == str(plugin_cache_dir)
+
+
+def test_init_passes_backend_env(
+    mocker: MockerFixture, aws_api: MockAWSApi, tmp_path: Path
+) -> None:
+    mocker.patch.object(TerraformClient, "init_outputs")
+    lean_tf_init = mocker.patch(
+        "reconcile.utils.terraform_client.lean_tf.init", return_value=(0, "", "")
+    )
+    (tmp_path / ".terraform").mkdir()
+
+    TerraformClient(
+        "integ",
+        "v1",
+        "integ_pfx",
+        [],
+        {"a": init_working_dir(tmp_path, "key")},
+        1,
+        aws_api,
+        keep_working_dirs=True,
+        backend_env={"a": {"AWS_ACCESS_KEY_ID": "id"}},
+    )
+
+    assert lean_tf_init.call_args.kwargs["env"]["AWS_ACCESS_KEY_ID"] == "id"
+    assert lean_tf_init.call_args.kwargs["reconfigure"] is True
+
+
+def test_lock_working_dir(tmp_path: Path) -> None:
+    wd = str(tmp_path / "wd")
+    lock_working_dir(wd)
+    # the lock is held by this process already
+    lock_working_dir(wd)
+    with open(f"{wd}.lock", encoding="locale") as f:
+        with pytest.raises(BlockingIOError):
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        unlock_working_dir(wd)
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    unlock_working_dir(wd)
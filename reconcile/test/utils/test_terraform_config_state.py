@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from reconcile.utils.datetime_util import utc_now
+from reconcile.utils.terraform_config_state import LOCK_FILE, TerraformConfigState
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def state(mocker: MockerFixture) -> MagicMock:
+    return mocker.MagicMock()
+
+
+def test_config_hash_includes_provider_lock_file(tmp_path: Path) -> None:
+    without_lock_file = TerraformConfigState.config_hash("config", str(tmp_path))
+    (tmp_path / LOCK_FILE).write_text('provider "aws" { version = "5.0.0" }')
+    with_lock_file = TerraformConfigState.config_hash("config", str(tmp_path))
+    (tmp_path / LOCK_FILE).write_text('provider "aws" { version = "5.1.0" }')
+    upgraded = TerraformConfigState.config_hash("config", str(tmp_path))
+
+    assert len({without_lock_file, with_lock_file, upgraded}) == 3
+
+
+def test_config_hash_changes_with_configuration(tmp_path: Path) -> None:
+    assert TerraformConfigState.config_hash(
+        "a", str(tmp_path)
+    ) != TerraformConfigState.config_hash("b", str(tmp_path))
+
+
+def test_unchanged(state: MagicMock) -> None:
+    recent = (utc_now() - timedelta(minutes=5)).isoformat()
+    expired = (utc_now() - timedelta(hours=2)).isoformat()
+    records: dict[str, Any] = {
+        "config-hashes/same": {"hash": "h1", "applied_at": recent},
+        "config-hashes/changed": {"hash": "old", "applied_at": recent},
+        "config-hashes/expired": {"hash": "h3", "applied_at": expired},
+    }
+    state.get_many.return_value = records
+    config_state = TerraformConfigState(state, ttl_seconds=3600)
+
+    unchanged = config_state.unchanged({
+        "same": "h1",
+        "changed": "h2",
+        "expired": "h3",
+        "new": "h4",
+    })
+
+    assert unchanged == {"same"}
+
+
+def test_record(state: MagicMock) -> None:
+    config_state = TerraformConfigState(state, ttl_seconds=3600)
+
+    config_state.record({"a": "h1", "b": "h2"}, ["b"])
+
+    [values] = state.set_many.call_args.args
+    assert list(values) == ["config-hashes/b"]
+    assert values["config-hashes/b"]["hash"] == "h2"
+    assert values["config-hashes/b"]["applied_at"]
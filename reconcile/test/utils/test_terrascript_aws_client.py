@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import contextlib
+import fcntl
 import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
 import pytest
+from terrascript import Terrascript
 from terrascript.resource import (
     aws_lb,
     aws_s3_bucket,
@@ -28,6 +30,7 @@ from reconcile.utils.external_resource_spec import (
     ExternalResourceUniqueKey,
 )
 from reconcile.utils.ocm.ocm import OCM
+from reconcile.utils.terraform_client import unlock_working_dir
 from reconcile.utils.terrascript_aws_client import (
     OutputResourceNameNotUniqueError,
     ProviderExcludedError,
@@ -36,6 +39,8 @@ from reconcile.utils.terrascript_aws_client import (
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
 
@@ -249,6 +254,45 @@ def ts() -> TerrascriptClient:
     return TerrascriptClient("", "", 1, [], default_tags=None)
 
 
+def test_dump_reuses_working_dirs_below_root(tmp_path: Path) -> None:
+    ts = TerrascriptClient("integ", "", 1, [], default_tags=None)
+    ts.tss = {"account1": Terrascript()}
+
+    working_dirs = ts.dump(working_dir_root=str(tmp_path))
+    wd = tmp_path / "integ" / "account1"
+    assert working_dirs == {"account1": str(wd)}
+    (wd / ".terraform").mkdir()
+
+    assert ts.dump(working_dir_root=str(tmp_path)) == working_dirs
+    assert (wd / "config.tf.json").exists()
+    assert (wd / ".terraform").exists()
+
+
+def test_dump_locks_working_dirs_below_root(tmp_path: Path) -> None:
+    ts = TerrascriptClient("integ", "", 1, [], default_tags=None)
+    ts.tss = {"account1": Terrascript()}
+
+    ts.dump(working_dir_root=str(tmp_path))
+
+    with (
+        open(tmp_path / "integ" / "account1.lock", encoding="locale") as f,
+        pytest.raises(BlockingIOError),
+    ):
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    unlock_working_dir(str(tmp_path / "integ" / "account1"))
+
+
+def test_prune_working_dirs(tmp_path: Path) -> None:
+    ts = TerrascriptClient("integ", "", 1, [], default_tags=None)
+    ts.tss = {"account1": Terrascript(), "account2": Terrascript()}
+    ts.dump(working_dir_root=str(tmp_path))
+
+    ts.prune_working_dirs(str(tmp_path), ["account1"])
+
+    assert (tmp_path / "integ" / "account1").exists()
+    assert not (tmp_path / "integ" / "account2").exists()
+
+
 def test_aws_username_org(ts: TerrascriptClient) -> None:
     result = "org"
     user = {"org_username": result}
@@ -515,6 +559,22 @@ def test_terraform_state_when_not_present(ts: TerrascriptClient) -> None:
     )
 
 
+def test_terraform_state_credentials_from_env(ts: TerrascriptClient) -> None:
+    backend = ts.state_bucket_for_account(
+        "terraform-resources-wrapper",
+        "some-account",
+        terraform_state_config_test_missing,
+        credentials_from_env=True,
+    )
+    assert backend == {
+        "s3": {
+            "bucket": "some-bucket",
+            "key": "qontract-reconcile.tfstate",
+            "region": "us-east-1",
+        }
+    }
+
+
 def test_terraform_state_when_not_present_error(ts: TerrascriptClient) -> None:
     account_name = "some-account"
     integration_name = "not-found-integration"
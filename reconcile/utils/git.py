@@ -1,5 +1,6 @@
 import os
 import subprocess
+import tempfile
 
 
 class GitError(Exception):
@@ -21,6 +22,16 @@ def clone(
         raise GitError(f"git clone failed: {repo_url}")
 
 
+def init(wd: str, bare: bool = False) -> None:
+    cmd = ["git", "init", "--quiet"]
+    if bare:
+        cmd += ["--bare"]
+    cmd += [wd]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise GitError(f"git init failed: {result.stderr}")
+
+
 def rev_parse(ref: str, wd: str) -> str:
     cmd = ["git", "rev-parse", ref]
     result = subprocess.run(cmd, cwd=wd, capture_output=True, text=True, check=True)
@@ -62,6 +73,32 @@ def checkout(
         raise GitError(f"git checkout failed for {ref}: {result.stderr}")
 
 
+def has_commit(sha: str, wd: str) -> bool:
+    cmd = ["git", "cat-file", "-e", f"{sha}^{{commit}}"]
+    result = subprocess.run(cmd, cwd=wd, capture_output=True, check=False)
+    return result.returncode == 0
+
+
+def checkout_tree(ref: str, wd: str, work_tree: str) -> None:
+    """Checks out the files of ref in the repository at wd into work_tree.
+
+    A throw-away index is used, so the repository is not modified and
+    concurrent checkouts from the same repository don't interfere.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        cmd = ["git", "--work-tree", work_tree, "checkout", "--force", ref, "--", "."]
+        result = subprocess.run(
+            cmd,
+            cwd=wd,
+            capture_output=True,
+            text=True,
+            check=False,
+            env=os.environ | {"GIT_INDEX_FILE": os.path.join(tmp, "index")},
+        )
+    if result.returncode != 0:
+        raise GitError(f"git checkout failed for {ref}: {result.stderr}")
+
+
 def is_file_in_git_repo(file_path: str) -> bool:
     real_path = os.path.realpath(file_path)
     dir_path = os.path.dirname(real_path)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from subprocess import CalledProcessError
+from typing import TYPE_CHECKING
+
+from reconcile.utils import git
+from reconcile.utils.git import GitError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import timedelta
+
+COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+_path_locks: dict[str, threading.Lock] = {}
+_path_locks_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def path_lock(path: Path) -> Iterator[None]:
+    """Serializes access to path between threads and processes.
+
+    Threads of this process wait on a lock per path, other processes on a
+    flock of the <path>.lock file.
+    """
+    with _path_locks_lock:
+        lock = _path_locks.setdefault(str(path), threading.Lock())
+    with lock, open(f"{path}.lock", "w", encoding="locale") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+class GitMirror:
+    """Long lived bare mirrors of git repositories.
+
+    Each repository url gets a bare repository below directory. Only the
+    commits that are asked for are fetched into it, and a commit sha that
+    is already in the mirror needs no network access at all. Files are
+    checked out from the mirror with a throw-away index, so checkouts do
+    not modify the mirror and can run concurrently. Mirrors that have not
+    been used for a while are removed by prune.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def mirror_path(self, url: str) -> Path:
+        return self.directory / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def has_commit(self, url: str, sha: str) -> bool:
+        mirror = self.mirror_path(url)
+        return mirror.exists() and git.has_commit(sha, str(mirror))
+
+    def fetch(self, url: str, ref: str, verify: bool = True) -> str:
+        """Makes sure ref of url is in the mirror and returns its commit sha."""
+        mirror = self.mirror_path(url)
+        if COMMIT_SHA_RE.match(ref) and self.has_commit(url, ref):
+            # the modification time is our LRU clock
+            os.utime(mirror)
+            return ref
+
+        with path_lock(mirror):
+            if not mirror.exists():
+                git.init(str(mirror), bare=True)
+            git.fetch(ref, str(mirror), remote=url, depth=1, verify=verify)
+            mirror.touch()
+            # FETCH_HEAD is shared by all fetches, read it while holding the lock
+            try:
+                return git.rev_parse("FETCH_HEAD^{commit}", str(mirror))
+            except CalledProcessError as e:
+                raise GitError(f"git rev-parse failed for {ref}: {e.stderr}") from e
+
+    def checkout(self, url: str, ref: str, wd: str, verify: bool = True) -> str:
+        """Checks out the files of ref into wd and returns the commit sha."""
+        sha = self.fetch(url, ref, verify=verify)
+        git.checkout_tree(sha, str(self.mirror_path(url)), wd)
+        return sha
+
+    def prune(self, max_age: timedelta) -> None:
+        """Removes the mirrors that have not been used for max_age."""
+        prune_unused(self.directory, max_age)
+
+
+def prune_unused(directory: Path, max_age: timedelta) -> None:
+    """Removes the entries of directory that have not been used for max_age.
+
+    The modification time of an entry is its last use. Entries are removed
+    while holding their path_lock, so entries in use are never removed.
+    """
+    if not directory.exists():
+        return
+    for entry in directory.iterdir():
+        if entry.suffix == ".lock" or not entry.is_dir():
+            continue
+        with path_lock(entry):
+            try:
+                unused = time.time() - entry.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if unused > max_age.total_seconds():
+                logging.info(f"removing unused cache entry {entry}")
+                shutil.rmtree(entry, ignore_errors=True)
@@ -1,17 +1,20 @@
 import contextlib
+import functools
 import logging
+import sys
 import textwrap
 import threading
 from datetime import (
     UTC,
     datetime,
 )
-from typing import Any
+from typing import Any, NamedTuple
 from urllib.parse import ParseResult, urlparse
 
 import requests
 from gql import (
     Client,
+    GraphQLRequest,
     gql,
 )
 from gql.transport.exceptions import (
@@ -20,11 +23,16 @@ from gql.transport.exceptions import (
 )
 from gql.transport.requests import RequestsHTTPTransport
 from gql.transport.requests import log as requests_logger
+from graphql import DocumentNode, GraphQLError, print_ast
 from sentry_sdk import capture_exception
 from sretoolbox.utils import retry
 
 from reconcile.status import RunningState
 from reconcile.utils.config import get_config
+from reconcile.utils.gql_response_cache import (
+    GqlResponseCache,
+    response_cache_from_env,
+)
 
 INTEGRATIONS_QUERY = """
 {
@@ -36,6 +44,11 @@ INTEGRATIONS_QUERY = """
 }
 """
 
+# generated query definitions and templates easily add up to a few hundred
+# distinct documents per integration
+DOCUMENT_CACHE_SIZE = 1024
+GQL_DEFINITIONS_PACKAGE = "reconcile.gql_definitions."
+
 requests_logger.setLevel(logging.WARNING)
 
 
@@ -93,6 +106,8 @@ class GqlApi:
         validate_schemas: bool = False,
         commit: str | None = None,
         commit_timestamp: str | None = None,
+        sha: str | None = None,
+        response_cache: GqlResponseCache | None = None,
     ) -> None:
         self.url = url
         self.token = token
@@ -100,6 +115,9 @@ class GqlApi:
         self.validate_schemas = validate_schemas
         self.commit = commit
         self.commit_timestamp = commit_timestamp
+        # responses are only cached for a pinned bundle sha
+        self.sha = sha
+        self.response_cache = response_cache if sha else None
         self.client = self._init_gql_client()
 
         if validate_schemas and not int_name:
@@ -140,21 +158,14 @@ class GqlApi:
         variables: dict[str, Any] | None = None,
         skip_validation: bool = False,
     ) -> dict[str, Any]:
-        try:
-            request = gql(query)
-            if variables:
-                request.variable_values = variables
-            result = self.client.execute(request, get_execution_result=True).formatted
-        except (requests.exceptions.ConnectionError, TransportConnectionFailed) as e:
-            raise GqlApiError(f"Could not connect to GraphQL server ({e})") from None
-        except TransportQueryError as e:
-            raise GqlApiError(f"`error` returned with GraphQL response {e}") from None
-        except AssertionError:
-            raise GqlApiError(
-                "`data` field missing from GraphQL response payload"
-            ) from None
-        except Exception as e:
-            raise GqlApiError("Unexpected error occurred") from e
+        if self.response_cache and self.sha:
+            cache_key = self.response_cache.key(query, variables)
+            result = self.response_cache.get(self.sha, cache_key)
+            if result is None:
+                result = self._execute(query, variables)
+                self.response_cache.set(self.sha, cache_key, result)
+        else:
+            result = self._execute(query, variables)
 
         # show schemas if log level is debug
         query_schemas = result.get("extensions", {}).get("schemas", [])
@@ -174,6 +185,21 @@ class GqlApi:
         assert "data" in result and result["data"] is not None
         return result["data"]
 
+    def _execute(self, query: str, variables: dict[str, Any] | None) -> dict[str, Any]:
+        try:
+            request = ParsedQueryRequest(parse_query(query), variables or None)
+            return self.client.execute(request, get_execution_result=True).formatted
+        except (requests.exceptions.ConnectionError, TransportConnectionFailed) as e:
+            raise GqlApiError(f"Could not connect to GraphQL server ({e})") from None
+        except TransportQueryError as e:
+            raise GqlApiError(f"`error` returned with GraphQL response {e}") from None
+        except AssertionError:
+            raise GqlApiError(
+                "`data` field missing from GraphQL response payload"
+            ) from None
+        except Exception as e:
+            raise GqlApiError("Unexpected error occurred") from e
+
     def get_template(self, path: str) -> dict[str, str]:
         query = """
         query Template($path: String) {
@@ -249,6 +275,69 @@ class GqlApi:
         return None
 
 
+class ParsedQuery(NamedTuple):
+    document: DocumentNode
+    # the document as printed into the request payload
+    text: str
+
+
+@functools.lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def parse_query(query: str) -> ParsedQuery:
+    """Parses a GraphQL document.
+
+    The same query definitions are sent thousands of times per run, so the
+    parsed documents are cached by query text.
+    """
+    document = gql(query).document
+    return ParsedQuery(document=document, text=print_ast(document))
+
+
+class ParsedQueryRequest(GraphQLRequest):
+    """A GraphQLRequest for a cached ParsedQuery.
+
+    GraphQLRequest prints its document again every time the payload is
+    built, which costs more than parsing it. The printed text is cached
+    with the document instead.
+    """
+
+    def __init__(
+        self, query: ParsedQuery, variable_values: dict[str, Any] | None = None
+    ) -> None:
+        super().__init__(query.document, variable_values=variable_values)
+        self.text = query.text
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"query": self.text}
+        if self.operation_name:
+            payload["operationName"] = self.operation_name
+        if self.variable_values:
+            payload["variables"] = self.variable_values
+        return payload
+
+
+def warm_up_document_cache() -> int:
+    """Pre-parses the DEFINITION of every loaded gql_definitions module.
+
+    Called once the integration module is imported, so these are the
+    queries the integration is going to use. Returns the number of parsed
+    definitions.
+    """
+    definitions = {
+        definition
+        for name, module in list(sys.modules.items())
+        if name.startswith(GQL_DEFINITIONS_PACKAGE)
+        and isinstance(definition := getattr(module, "DEFINITION", None), str)
+    }
+    for definition in definitions:
+        try:
+            parse_query(definition)
+        except GraphQLError as e:
+            # query() reports the error once the definition is used
+            logging.debug(f"unable to parse query definition: {e}")
+    return len(definitions)
+
+
 class GqlApiSingleton:
     gql_api: GqlApi | None = None
     gqlapi_lock = threading.Lock()
@@ -288,6 +377,7 @@ def init(
     validate_schemas: bool = False,
     commit: str | None = None,
     commit_timestamp: str | None = None,
+    sha: str | None = None,
 ) -> GqlApi:
     return GqlApiSingleton.create(
         url,
@@ -296,9 +386,18 @@ def init(
         validate_schemas,
         commit=commit,
         commit_timestamp=commit_timestamp,
+        sha=sha,
+        response_cache=get_response_cache(),
     )
 
 
+@functools.cache
+def get_response_cache() -> GqlResponseCache | None:
+    """The process wide response cache, shared by all GqlApi instances so it
+    outlives the re-initialization of gql on every integration run."""
+    return response_cache_from_env()
+
+
 def get_resource(path: str) -> dict[str, Any]:
     return get_api().get_resource(path)
 
@@ -361,7 +460,7 @@ def init_from_config(
     validate_schemas: bool = False,
     print_url: bool = True,
 ) -> GqlApi:
-    server, token, commit, timestamp = _get_gql_server_and_token(
+    server, token, sha, commit, timestamp = _get_gql_server_and_token(
         autodetect_sha=autodetect_sha, sha=sha
     )
 
@@ -374,12 +473,13 @@ def init_from_config(
         validate_schemas,
         commit=commit,
         commit_timestamp=timestamp,
+        sha=sha,
     )
 
 
 def _get_gql_server_and_token(
     autodetect_sha: bool = False, sha: str | None = None
-) -> tuple[str, str, str | None, str | None]:
+) -> tuple[str, str, str | None, str | None, str | None]:
     config = get_config()
 
     server_url = urlparse(config["graphql"]["server"])
@@ -395,9 +495,9 @@ def _get_gql_server_and_token(
         git_commit_info = get_git_commit_info(sha, server_url, token)
         running_state.timestamp = git_commit_info.get("timestamp")  # type: ignore[attr-defined]
         running_state.commit = git_commit_info.get("commit")  # type: ignore[attr-defined]
-        return server, token, running_state.commit, running_state.timestamp
+        return server, token, sha, running_state.commit, running_state.timestamp
 
-    return server, token, None, None
+    return server, token, None, None, None
 
 
 def get_api() -> GqlApi:
@@ -407,7 +507,7 @@ def get_api() -> GqlApi:
 def get_api_for_sha(
     sha: str, integration: str | None = None, validate_schemas: bool = True
 ) -> GqlApi:
-    server, token, commit, timestamp = _get_gql_server_and_token(
+    server, token, sha, commit, timestamp = _get_gql_server_and_token(
         autodetect_sha=False, sha=sha
     )
     return GqlApi(
@@ -417,6 +517,8 @@ def get_api_for_sha(
         validate_schemas,
         commit=commit,
         commit_timestamp=timestamp,
+        sha=sha,
+        response_cache=get_response_cache(),
     )
 
 
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter
+
+from reconcile.status import RunningState
+from reconcile.utils.json import json_dumps
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+GQL_RESPONSE_CACHE_ENV = "GQL_RESPONSE_CACHE"
+GQL_RESPONSE_CACHE_DIR_ENV = "GQL_RESPONSE_CACHE_DIR"
+# the current bundle and the one early exit compares against
+DEFAULT_MAX_BUNDLES = 2
+
+gql_response_cache_hits = Counter(
+    name="qontract_reconcile_gql_response_cache_hits_total",
+    documentation="Number of GraphQL queries served from the response cache",
+    labelnames=["integration", "tier"],
+)
+
+gql_response_cache_misses = Counter(
+    name="qontract_reconcile_gql_response_cache_misses_total",
+    documentation="Number of GraphQL queries sent to the server",
+    labelnames=["integration"],
+)
+
+gql_response_cache_bytes_saved = Counter(
+    name="qontract_reconcile_gql_response_cache_bytes_saved_total",
+    documentation="Size of the GraphQL responses served from the response cache",
+    labelnames=["integration"],
+)
+
+
+class GqlResponseCache:
+    """Cache of GraphQL responses for immutable bundles.
+
+    A bundle served under /graphqlsha/<sha> never changes, so a response is
+    fully determined by the bundle sha, the query and its variables. Entries
+    are kept serialized in memory for the last max_bundles bundles and, if a
+    directory is given, as files below <directory>/<sha>/, which lets pods
+    on the same node share them.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_bundles: int = DEFAULT_MAX_BUNDLES,
+    ) -> None:
+        self.directory = Path(directory) if directory else None
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bundles = max_bundles
+        self._bundles: OrderedDict[str, dict[str, bytes]] = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def key(query: str, variables: Mapping[str, Any] | None) -> str:
+        data = {"query": query, "variables": variables or {}}
+        return hashlib.sha256(json_dumps(data).encode("utf-8")).hexdigest()
+
+    def get(self, sha: str, key: str) -> dict[str, Any] | None:
+        """Returns a fresh copy of the cached response or None on a miss."""
+        integration = RunningState().integration
+        tier = "memory"
+        with self._lock:
+            data = self._bundles.get(sha, {}).get(key)
+        if data is None and self.directory:
+            tier = "disk"
+            try:
+                data = (self.directory / sha / f"{key}.json").read_bytes()
+            except FileNotFoundError:
+                pass
+            else:
+                self._remember(sha, key, data)
+
+        if data is not None:
+            try:
+                response = json.loads(data)
+            except ValueError:
+                logging.warning(f"discarding corrupt gql response cache entry {key}")
+                self._forget(sha, key)
+            else:
+                gql_response_cache_hits.labels(integration=integration, tier=tier).inc()
+                gql_response_cache_bytes_saved.labels(integration=integration).inc(
+                    len(data)
+                )
+                return response
+
+        gql_response_cache_misses.labels(integration=integration).inc()
+        return None
+
+    def set(self, sha: str, key: str, response: Mapping[str, Any]) -> None:
+        data = json.dumps(response, separators=(",", ":")).encode("utf-8")
+        self._remember(sha, key, data)
+        if self.directory:
+            # the disk tier is best effort, e.g. another pod may evict the
+            # bundle directory while we write to it
+            try:
+                self._write(sha, key, data)
+            except OSError as e:
+                logging.warning(f"unable to write gql response cache entry {key}: {e}")
+
+    def _remember(self, sha: str, key: str, data: bytes) -> None:
+        with self._lock:
+            self._bundles.setdefault(sha, {})[key] = data
+            self._bundles.move_to_end(sha)
+            while len(self._bundles) > self.max_bundles:
+                self._bundles.popitem(last=False)
+
+    def _forget(self, sha: str, key: str) -> None:
+        with self._lock:
+            self._bundles.get(sha, {}).pop(key, None)
+        if self.directory:
+            (self.directory / sha / f"{key}.json").unlink(missing_ok=True)
+
+    def _write(self, sha: str, key: str, data: bytes) -> None:
+        assert self.directory
+        bundle_dir = self.directory / sha
+        new_bundle = not bundle_dir.exists()
+        bundle_dir.mkdir(exist_ok=True)
+        # write to a temporary file first, so concurrent readers never see
+        # a partially written entry
+        fd, tmp = tempfile.mkstemp(dir=bundle_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, bundle_dir / f"{key}.json")
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        if new_bundle:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Removes all but the most recently written max_bundles directories."""
+        assert self.directory
+        bundles = []
+        for bundle_dir in self.directory.iterdir():
+            try:
+                bundles.append((bundle_dir.stat().st_mtime, bundle_dir))
+            except FileNotFoundError:
+                continue
+        for _, bundle_dir in sorted(bundles, reverse=True)[self.max_bundles :]:
+            shutil.rmtree(bundle_dir, ignore_errors=True)
+
+
+def response_cache_from_env() -> GqlResponseCache | None:
+    """The response cache is opt-in: GQL_RESPONSE_CACHE=true enables the
+    in-memory tier, GQL_RESPONSE_CACHE_DIR additionally the on-disk tier."""
+    directory = os.environ.get(GQL_RESPONSE_CACHE_DIR_ENV)
+    enabled = os.environ.get(GQL_RESPONSE_CACHE_ENV, "").lower() == "true"
+    if not enabled and not directory:
+        return None
+    return GqlResponseCache(directory=directory)
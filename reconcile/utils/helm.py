@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
+import shutil
 import tempfile
+from datetime import timedelta
+from pathlib import Path
 from subprocess import (
     CalledProcessError,
     run,
@@ -12,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 import yaml
 
 from reconcile.utils import git
+from reconcile.utils.git_mirror import GitMirror, path_lock, prune_unused
 from reconcile.utils.json import json_dumps
 from reconcile.utils.runtime.sharding import ShardSpec
 
@@ -19,6 +25,13 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
 
 
+QONTRACT_RECONCILE_CHART = "./helm/qontract-reconcile"
+# dependency versions that resolve to exactly one chart version
+PINNED_VERSION_RE = re.compile(r"^v?\d+\.\d+\.\d+([-+][0-9A-Za-z.+-]*)?$")
+# git mirrors and chart dependencies unused for this long are removed
+DEFAULT_CACHE_MAX_AGE = timedelta(days=7)
+
+
 class HelmTemplateError(Exception):
     pass
 
@@ -30,48 +43,149 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+def _dependencies_key(
+    path: str, dependencies: Iterable[Mapping[str, Any]]
+) -> str | None:
+    """A digest of the chart dependencies, if they are fully determined by it.
+
+    That is the case if there is a Chart.lock or all versions are pinned and
+    none of the dependencies is a local chart.
+    """
+    chart_lock = Path(path) / "Chart.lock"
+    lock = chart_lock.read_text(encoding="utf-8") if chart_lock.exists() else None
+    for dep in dependencies:
+        repo = dep.get("repository") or ""
+        if not repo or repo.startswith("file://"):
+            return None
+        if lock is None and not PINNED_VERSION_RE.match(str(dep.get("version"))):
+            return None
+    data = json_dumps({"dependencies": dependencies, "lock": lock})
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _build_dependencies(
+    path: str,
+    dependencies: Iterable[Mapping[str, Any]],
+    repository_config: str,
+    repository_cache_dir: str,
+) -> None:
+    for dep in dependencies:
+        if repo := dep.get("repository"):
+            cmd = [
+                "helm",
+                "repo",
+                "add",
+                dep["name"],
+                repo,
+                "--repository-config",
+                repository_config,
+                "--repository-cache",
+                repository_cache_dir,
+            ]
+            run(cmd, capture_output=True, check=True)
+    cmd = [
+        "helm",
+        "dependency",
+        "build",
+        path,
+        "--repository-config",
+        repository_config,
+        "--repository-cache",
+        repository_cache_dir,
+    ]
+    run(cmd, capture_output=True, check=True)
+
+
+def _build_cached_dependencies(
+    path: str,
+    dependencies: Iterable[Mapping[str, Any]],
+    repository_config: str,
+    cache_dir: str,
+) -> None:
+    """Builds the chart dependencies through a content addressed cache.
+
+    The dependency archives `helm dependency build` adds to the charts
+    directory are stored under a digest of the dependencies, so charts with
+    the same dependencies only download them once.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    repository_cache_dir = os.path.join(cache_dir, "repository")
+    key = _dependencies_key(path, dependencies)
+    if key is None:
+        with path_lock(Path(repository_cache_dir)):
+            _build_dependencies(
+                path, dependencies, repository_config, repository_cache_dir
+            )
+        return
+
+    charts_dir = Path(path) / "charts"
+    entry = Path(cache_dir) / "dependencies" / key
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    with path_lock(entry):
+        if not entry.exists():
+            vendored = set(os.listdir(charts_dir)) if charts_dir.exists() else set()
+            with path_lock(Path(repository_cache_dir)):
+                _build_dependencies(
+                    path, dependencies, repository_config, repository_cache_dir
+                )
+            tmp = Path(tempfile.mkdtemp(dir=entry.parent))
+            for name in set(os.listdir(charts_dir)) - vendored:
+                if (charts_dir / name).is_file():
+                    shutil.copy2(charts_dir / name, tmp / name)
+            tmp.rename(entry)
+            return
+        # the modification time is our LRU clock
+        entry.touch()
+
+    charts_dir.mkdir(exist_ok=True)
+    for archive in entry.iterdir():
+        if not (charts_dir / archive.name).exists():
+            shutil.copy2(archive, charts_dir / archive.name)
+
+
 def do_template(
     values: Mapping[str, Any],
     path: str,
     namespace: str,
+    cache_dir: str | None = None,
 ) -> str:
+    """Renders the chart at path.
+
+    Without a cache_dir, chart repositories and dependencies are downloaded
+    into temporary directories for every call. With a cache_dir, the helm
+    repository cache is kept in it and dependencies are reused across calls.
+    """
     try:
         with (
             tempfile.NamedTemporaryFile(
                 mode="w+", encoding="locale"
             ) as repository_config_file,
-            tempfile.TemporaryDirectory() as repository_cache_dir,
+            tempfile.TemporaryDirectory() as tmp_repository_cache_dir,
         ):
+            repository_cache_dir = (
+                os.path.join(cache_dir, "repository")
+                if cache_dir
+                else tmp_repository_cache_dir
+            )
             with open(
                 os.path.join(path, "Chart.yaml"), encoding="locale"
             ) as chart_file:
                 chart = yaml.safe_load(chart_file)
                 if dependencies := chart.get("dependencies"):
-                    for dep in dependencies:
-                        if repo := dep.get("repository"):
-                            cmd = [
-                                "helm",
-                                "repo",
-                                "add",
-                                dep["name"],
-                                repo,
-                                "--repository-config",
-                                repository_config_file.name,
-                                "--repository-cache",
-                                repository_cache_dir,
-                            ]
-                            run(cmd, capture_output=True, check=True)
-                    cmd = [
-                        "helm",
-                        "dependency",
-                        "build",
-                        path,
-                        "--repository-config",
-                        repository_config_file.name,
-                        "--repository-cache",
-                        repository_cache_dir,
-                    ]
-                    run(cmd, capture_output=True, check=True)
+                    if cache_dir:
+                        _build_cached_dependencies(
+                            path,
+                            dependencies,
+                            repository_config_file.name,
+                            cache_dir,
+                        )
+                    else:
+                        _build_dependencies(
+                            path,
+                            dependencies,
+                            repository_config_file.name,
+                            repository_cache_dir,
+                        )
             with tempfile.NamedTemporaryFile(
                 mode="w+", encoding="locale"
             ) as values_file:
@@ -92,7 +206,7 @@ def do_template(
                 ]
                 result = run(cmd, capture_output=True, check=True)
     except CalledProcessError as e:
-        msg = f"Error running helm template [{' '.join(cmd)}]"
+        msg = f"Error running helm template [{' '.join(e.cmd)}]"
         if e.stdout:
             msg += f" {e.stdout.decode()}"
         if e.stderr:
@@ -102,14 +216,33 @@ def do_template(
     return result.stdout.decode()
 
 
+def chart_digest(path: str) -> str:
+    """A digest of the names and contents of all files of the chart at path."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            digest.update(os.path.relpath(file_path, path).encode("utf-8") + b"\0")
+            with open(file_path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
 def template(
     values: Mapping[str, Any],
-    path: str = "./helm/qontract-reconcile",
+    path: str = QONTRACT_RECONCILE_CHART,
     namespace: str = "qontract-reconcile",
 ) -> Mapping[str, Any]:
     return yaml.safe_load(do_template(values=values, path=path, namespace=namespace))
 
 
+def prune_cache(cache_dir: str, max_age: timedelta = DEFAULT_CACHE_MAX_AGE) -> None:
+    """Removes git mirrors and chart dependencies unused for max_age."""
+    GitMirror(os.path.join(cache_dir, "git")).prune(max_age)
+    prune_unused(Path(cache_dir) / "dependencies", max_age)
+
+
 def template_all(
     url: str,
     path: str,
@@ -117,10 +250,27 @@ def template_all(
     namespace: str,
     values: Mapping[str, Any],
     ssl_verify: bool = True,
+    cache_dir: str | None = None,
 ) -> Iterable[Mapping[str, Any]]:
+    """Renders the chart at path in the repository url at ref.
+
+    With a cache_dir, the repository is checked out from a persistent git
+    mirror kept in it instead of being cloned, and chart dependencies are
+    cached as well (see do_template).
+    """
     with tempfile.TemporaryDirectory() as wd:
-        git.clone(url, wd, depth=1, verify=ssl_verify)
-        git.checkout(ref, wd, verify=ssl_verify)
+        if cache_dir:
+            GitMirror(os.path.join(cache_dir, "git")).checkout(
+                url, ref, wd, verify=ssl_verify
+            )
+        else:
+            git.clone(url, wd, depth=1, verify=ssl_verify)
+            git.checkout(ref, wd, verify=ssl_verify)
         return yaml.safe_load_all(
-            do_template(values=values, path=f"{wd}{path}", namespace=namespace)
+            do_template(
+                values=values,
+                path=f"{wd}{path}",
+                namespace=namespace,
+                cache_dir=os.path.join(cache_dir, "helm") if cache_dir else None,
+            )
         )
@@ -3,10 +3,12 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Protocol, TextIO
+from typing import TYPE_CHECKING, Any, Protocol, TextIO
 
+import urllib3
 from kubernetes.client import (
     ApiClient,
+    ApiException,
     V1Job,
     V1ObjectMeta,
     V1OwnerReference,
@@ -21,6 +23,7 @@ from reconcile.utils.jobcontroller.models import (
     JobValidationError,
     K8sJob,
 )
+from reconcile.utils.oc import ResourceVersionExpiredError, StatusCodeError
 from reconcile.utils.oc_map import init_oc_map_from_clusters
 from reconcile.utils.openshift_resource import OpenshiftResource
 
@@ -91,6 +94,8 @@ class K8sJobController:
         self.dry_run = dry_run
         self.time_module = time_module
         self._cache: dict[str, OpenshiftResource] | None = None
+        # resourceVersion the cache is current with, watches resume from it
+        self._resource_version: str | None = None
 
     @property
     def cache(self) -> dict[str, OpenshiftResource]:
@@ -103,19 +108,82 @@ class K8sJobController:
         Updates the cache with the latest jobs in the namespace.
         """
         new_cache = {}
-        for item in self.oc.get_items(
+        resource_version = None
+        for page in self.oc.iter_item_pages(
             kind="Job.batch",
             namespace=self.namespace,
         ):
-            openshift_resource = OpenshiftResource(
-                body=item,
-                integration=self.integration,
-                integration_version=self.integration_version,
-            )
-            new_cache[openshift_resource.name] = openshift_resource
+            if resource_version is None:
+                # all pages are served from the snapshot of the first one,
+                # a watch resumes from its resourceVersion
+                resource_version = page["metadata"].get("resourceVersion")
+            for item in page["items"]:
+                openshift_resource = OpenshiftResource(
+                    body=item,
+                    integration=self.integration,
+                    integration_version=self.integration_version,
+                )
+                new_cache[openshift_resource.name] = openshift_resource
         self._cache = new_cache
+        self._resource_version = resource_version
         return self._cache
 
+    def _update_cache_item(self, event_type: str, item: dict[str, Any]) -> None:
+        if self._cache is None:
+            return
+        if event_type == "DELETED":
+            self._cache.pop(item["metadata"]["name"], None)
+            return
+        openshift_resource = OpenshiftResource(
+            body=item,
+            integration=self.integration,
+            integration_version=self.integration_version,
+        )
+        self._cache[openshift_resource.name] = openshift_resource
+
+    def _watch_for_job_completion(
+        self, job_names: set[str], timeout_seconds: float
+    ) -> bool:
+        """
+        Keeps the cache up to date by watching the jobs in the namespace until
+        one of the given jobs finishes or the timeout passes.
+
+        Returns False if the watch could not cover the whole period, the caller
+        has to fall back to sleeping and updating the cache.
+        """
+        if not self.oc.supports_watch or self._resource_version is None:
+            return False
+        watch_timeout_seconds = max(1, int(timeout_seconds))
+        start_time = self.time_module.time()
+        try:
+            for event_type, item in self.oc.watch_items(
+                kind="Job.batch",
+                namespace=self.namespace,
+                resource_version=self._resource_version,
+                timeout_seconds=watch_timeout_seconds,
+            ):
+                self._resource_version = (
+                    item.get("metadata", {}).get("resourceVersion")
+                    or self._resource_version
+                )
+                if event_type == "BOOKMARK":
+                    continue
+                self._update_cache_item(event_type, item)
+                if item["metadata"]["name"] in job_names and self.get_job_status(
+                    item["metadata"]["name"]
+                ) in {JobStatus.SUCCESS, JobStatus.ERROR}:
+                    return True
+        except ResourceVersionExpiredError:
+            logging.info("Job watch expired, relisting jobs")
+            self.update_cache()
+            return True
+        except (StatusCodeError, ApiException, urllib3.exceptions.HTTPError) as e:
+            logging.warning(f"Watching jobs failed, falling back to polling: {e}")
+            return False
+        # a watch ending early, e.g. on a dropped connection, may have missed
+        # changes and is not trusted
+        return self.time_module.time() - start_time >= watch_timeout_seconds
+
     def get_job_generation(self, job_name: str) -> str | None:
         """
         Returns the generation annotation for a job.
@@ -188,8 +256,10 @@ class K8sJobController:
         )
 
         start_time = self.time_module.time()
+        cache_current = False
         while jobs_left:
-            self.update_cache()
+            if not cache_current:
+                self.update_cache()
             for job_name in list(jobs_left):
                 status = self.get_job_status(job_name)
                 job_statuses[job_name] = status
@@ -205,8 +275,8 @@ class K8sJobController:
                 logging.info(
                     f"Waiting for {jobs_left} to complete. Rechecking in {check_interval_seconds} seconds"
                 )
-                self._sleep_until_timeout(
-                    elapsed_time, timeout_seconds, check_interval_seconds
+                cache_current = self._wait_for_changes(
+                    jobs_left, elapsed_time, timeout_seconds, check_interval_seconds
                 )
         return job_statuses
 
@@ -369,8 +439,10 @@ class K8sJobController:
         the function will wait indefinitely. If a timeout occures, a TimeoutError will be raised.
         """
         start_time = self.time_module.time()
+        cache_current = False
         while True:
-            self.update_cache()
+            if not cache_current:
+                self.update_cache()
             status = self.get_job_status(job_name)
             match status:
                 case JobStatus.SUCCESS:
@@ -380,10 +452,39 @@ class K8sJobController:
             elapsed_time = self.time_module.time() - start_time
             if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
                 raise TimeoutError(f"Timeout waiting for job {job_name} to complete")
-            self._sleep_until_timeout(
-                elapsed_time, timeout_seconds, check_interval_seconds
+            cache_current = self._wait_for_changes(
+                {job_name}, elapsed_time, timeout_seconds, check_interval_seconds
             )
 
+    def _wait_for_changes(
+        self,
+        job_names: set[str],
+        elapsed_time: float,
+        timeout_seconds: float,
+        check_interval_seconds: float,
+    ) -> bool:
+        """
+        Waits up to check_interval_seconds for one of the jobs to finish. A watch
+        wakes up as soon as a job finishes, polling is the fallback.
+
+        Returns True if the cache was kept up to date while waiting.
+        """
+        interval_seconds = check_interval_seconds
+        if timeout_seconds >= 0:
+            interval_seconds = min(
+                check_interval_seconds, timeout_seconds - elapsed_time
+            )
+        watch_start_time = self.time_module.time()
+        if self._watch_for_job_completion(job_names, interval_seconds):
+            return True
+        watched_seconds = self.time_module.time() - watch_start_time
+        self._sleep_until_timeout(
+            elapsed_time + watched_seconds,
+            timeout_seconds,
+            check_interval_seconds - watched_seconds,
+        )
+        return False
+
     def _sleep_until_timeout(
         self,
         elapsed_time: float,
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
+import re
 import subprocess
+import tempfile
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
+    from typing import TextIO
+
+# initial read size of the streaming JSON reader, grows with the pending value
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\r\n"
+_STRUCTURE_RE = re.compile(r'[{}\[\]"]')
+_STRING_END_RE = re.compile(r'["\\]')
+_DECODER = json.JSONDecoder()
 
 
 def state_rm_access_key(
@@ -66,19 +78,241 @@ def show_json(working_dir: str, path: str) -> dict[str, Any]:
     return json.loads(stdout)
 
 
+@dataclass
+class PlanChanges:
+    """The parts of `terraform show -json <plan>` a plan diff acts on."""
+
+    format_version: str | None = None
+    output_changes: dict[str, Any] = field(default_factory=dict)
+    # names of the outputs in the prior state
+    prior_outputs: list[str] = field(default_factory=list)
+    # only resources with an action other than no-op or being moved
+    resource_changes: list[dict[str, Any]] = field(default_factory=list)
+
+
+class _JsonStream:
+    """
+    Minimal pull parser over a JSON text stream. Values are only
+    materialized when decoded, everything else is skipped chunk by chunk.
+    """
+
+    def __init__(self, f: TextIO) -> None:
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        pending = len(self._buf) - self._pos
+        # read at least as much as is pending to keep re-decoding linear
+        chunk = self._f.read(max(_CHUNK_SIZE, pending))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("unexpected end of JSON input")
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} in JSON input")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number at the end of the buffer may continue in the next chunk
+            if end < len(self._buf) or not self._fill():
+                self._pos = end
+                return value
+
+    def skip(self) -> None:
+        if self.peek() not in "{[":
+            self.decode()
+            return
+        depth = 0
+        while True:
+            m = _STRUCTURE_RE.search(self._buf, self._pos)
+            if m is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ValueError("unexpected end of JSON input")
+                continue
+            self._pos = m.end()
+            match m.group():
+                case '"':
+                    self._skip_string()
+                case "{" | "[":
+                    depth += 1
+                case _:
+                    depth -= 1
+                    if depth == 0:
+                        return
+
+    def _skip_string(self) -> None:
+        while True:
+            m = _STRING_END_RE.search(self._buf, self._pos)
+            if m is None or (m.group() == "\\" and m.end() == len(self._buf)):
+                # keep a trailing backslash, it escapes the next chunk
+                self._pos = len(self._buf) if m is None else m.start()
+                if not self._fill():
+                    raise ValueError("unexpected end of JSON input")
+                continue
+            if m.group() == '"':
+                self._pos = m.end()
+                return
+            self._pos = m.end() + 1
+
+    def iter_object(self) -> Iterator[str]:
+        """Yields the keys of an object, each value has to be decoded or skipped."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.decode()
+            self._expect(":")
+            yield key
+            if self.peek() != ",":
+                self._expect("}")
+                return
+            self._pos += 1
+
+    def iter_array(self) -> Iterator[None]:
+        """Yields once per array item, each item has to be decoded or skipped."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self.peek() != ",":
+                self._expect("]")
+                return
+            self._pos += 1
+
+
+def _is_resource_change(resource_change: Mapping[str, Any]) -> bool:
+    return bool(
+        resource_change["change"]["actions"] != ["no-op"]
+        or resource_change.get("previous_address")
+    )
+
+
+def _read_prior_outputs(stream: _JsonStream) -> list[str]:
+    outputs: list[str] = []
+    for key in stream.iter_object():
+        if key != "values" or stream.peek() != "{":
+            stream.skip()
+            continue
+        for values_key in stream.iter_object():
+            if values_key == "outputs":
+                outputs = list(stream.decode() or {})
+            else:
+                stream.skip()
+    return outputs
+
+
+def _read_plan_changes(stream: _JsonStream) -> PlanChanges:
+    plan = PlanChanges()
+    for key in stream.iter_object():
+        match key:
+            case "format_version":
+                plan.format_version = stream.decode()
+            case "output_changes":
+                plan.output_changes = stream.decode() or {}
+            case "prior_state" if stream.peek() == "{":
+                plan.prior_outputs = _read_prior_outputs(stream)
+            case "resource_changes" if stream.peek() == "[":
+                for _ in stream.iter_array():
+                    resource_change = stream.decode()
+                    if _is_resource_change(resource_change):
+                        plan.resource_changes.append(resource_change)
+            case _:
+                stream.skip()
+    return plan
+
+
+def show_plan(
+    working_dir: str,
+    path: str,
+    env: Mapping[str, str] | None = None,
+) -> PlanChanges:
+    """
+    Run terraform show -no-color -json <path> and stream its output.
+
+    Unlike show_json, the full plan document (planned values, configuration,
+    prior state resources) is never loaded into memory; only the output
+    changes and the changed resources are kept.
+
+    :param working_dir: The directory where the terraform files are located
+    :param path: The path to the plan file
+    :param env: Environment variables to pass to the terraform command
+    :return: The changes of the plan
+    """
+    error: ValueError | None = None
+    with tempfile.TemporaryFile() as stderr:
+        with subprocess.Popen(
+            ["terraform", "show", "-no-color", "-json", path],
+            cwd=working_dir,
+            env=_compute_terraform_env(env),
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+        ) as process:
+            assert process.stdout is not None
+            stdout = io.TextIOWrapper(process.stdout, encoding="utf-8")
+            try:
+                plan = _read_plan_changes(_JsonStream(stdout))
+            except ValueError as e:
+                error = e
+                # drain the pipe so that terraform can exit
+                while stdout.read(_CHUNK_SIZE):
+                    pass
+        if process.returncode != 0:
+            stderr.seek(0)
+            msg = f"[{path}] terraform show failed: {stderr.read().decode('utf-8')}"
+            logging.warning(msg)
+            raise Exception(msg)
+    if error is not None:
+        raise error
+    return plan
+
+
 def init(
     working_dir: str,
     env: Mapping[str, str] | None = None,
+    reconfigure: bool = False,
 ) -> tuple[int, str, str]:
     """
     Run terraform init -input=false -no-color.
 
     :param working_dir: The directory where the terraform files are located
     :param env: Environment variables to pass to the terraform command
+    :param reconfigure: Ignore the backend configuration of a previous init
     :return: (return_code, stdout, stderr)
     """
+    args = ["terraform", "init", "-input=false", "-no-color"]
+    if reconfigure:
+        args.append("-reconfigure")
     return _terraform_command(
-        args=["terraform", "init", "-input=false", "-no-color"],
+        args=args,
         working_dir=working_dir,
         env=env,
     )
@@ -84,6 +84,38 @@ oc_get_items_duration = Histogram(
     buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf")),
 )
 
+oc_get_items_by_name_strategy = Counter(
+    name="qontract_reconcile_oc_get_items_by_name_total",
+    documentation="Strategy used by OC get_items to fetch items by name",
+    labelnames=["integration", "cluster", "kind", "strategy"],
+)
+
+resource_inventory_lock_contention = Counter(
+    name="qontract_reconcile_resource_inventory_lock_contention_total",
+    documentation="Number of ResourceInventory updates that waited for a lock",
+    labelnames=["integration"],
+)
+
+resource_inventory_lock_wait = Histogram(
+    name="qontract_reconcile_resource_inventory_lock_wait_seconds",
+    documentation="Time ResourceInventory updates waited for a contended lock",
+    labelnames=["integration"],
+    buckets=(0.0001, 0.001, 0.01, 0.1, 1.0, float("inf")),
+)
+
+terraform_init_duration = Histogram(
+    name="qontract_reconcile_terraform_init_seconds",
+    documentation="Duration of terraform init per account",
+    labelnames=["integration", "account"],
+    buckets=(1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float("inf")),
+)
+
+terraform_init_skipped = Counter(
+    name="qontract_reconcile_terraform_init_skipped_total",
+    documentation="Number of terraform inits skipped for an initialized working dir",
+    labelnames=["integration", "account"],
+)
+
 registry_reachouts = Counter(
     name="qontract_reconcile_registry_get_manifest_total",
     documentation="Number of GET requests on image registries",
@@ -17,10 +17,12 @@ from functools import cache, wraps
 from subprocess import Popen
 from threading import Lock
 from typing import TYPE_CHECKING, Any, Self, TextIO, cast
+from urllib.parse import urlencode
 
 import urllib3
 from kubernetes.client import (
     ApiClient,
+    ApiException,
     Configuration,
 )
 from kubernetes.dynamic.client import DynamicClient
@@ -48,8 +50,16 @@ from sretoolbox.utils import (
 
 from reconcile.status import RunningState
 from reconcile.utils.json import json_dumps
-from reconcile.utils.metrics import oc_get_items_duration, reconcile_time
+from reconcile.utils.metrics import (
+    oc_get_items_by_name_strategy,
+    oc_get_items_duration,
+    reconcile_time,
+)
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
+from reconcile.utils.openshift_template import (
+    TemplateProcessingError,
+    process_template,
+)
 from reconcile.utils.secret_reader import (
     SecretNotFoundError,
     SecretReader,
@@ -57,13 +67,18 @@ from reconcile.utils.secret_reader import (
 from reconcile.utils.unleash import get_feature_toggle_state
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     from reconcile.utils.oc_connection_parameters import OCConnectionParameters
 
 urllib3.disable_warnings()
 
 GET_REPLICASET_MAX_ATTEMPTS = 20
+DEFAULT_LIST_PAGE_SIZE = 500
+# above this many resource names, get_items lists the kind once and filters
+# the items by name instead of issuing a request per name
+RESOURCE_NAMES_LIST_THRESHOLD = 10
+RESOURCE_NAMES_THREAD_POOL_SIZE = 5
 DEFAULT_GROUP = ""
 PROJECT_KIND = "Project.project.openshift.io"
 POD_RECYCLE_SUPPORTED_TRIGGER_KINDS = [
@@ -152,6 +167,10 @@ class AmbiguousResourceTypeError(Exception):
     pass
 
 
+class ResourceVersionExpiredError(Exception):
+    pass
+
+
 class OCDecorators:
     @classmethod
     def process_reconcile_time(cls, function: Callable) -> Callable:
@@ -241,6 +260,16 @@ class OCProcessReconcileTimeDecoratorMsg:
 def oc_process(
     template: Mapping[str, Any], parameters: Mapping[str, Any] | None = None
 ) -> Iterable[dict[str, Any]]:
+    """Processes an OpenShift Template.
+
+    Templates are processed with `oc process` by default. Set
+    OC_PROCESS_BACKEND=python to process them in-process instead.
+    """
+    if os.environ.get("OC_PROCESS_BACKEND") == "python":
+        try:
+            return process_template(template, parameters)
+        except TemplateProcessingError as e:
+            raise StatusCodeError(f"error processing template: {e}") from e
     oc = OCLocal(cluster_name="cluster", server=None, token=None, local=True)
     return oc.process(template, parameters)
 
@@ -265,6 +294,7 @@ class OCCliApiResource:
     group: str
     api_version: str
     namespaced: bool
+    name: str = ""
 
     @property
     def group_version(self) -> str:
@@ -272,6 +302,15 @@ class OCCliApiResource:
             return f"{self.group}/{self.api_version}"
         return self.api_version
 
+    def path(self, namespace: str | None = None) -> str:
+        """API path to list this resource, optionally within a namespace."""
+        prefix = (
+            f"/apis/{self.group_version}" if self.group else f"/api/{self.api_version}"
+        )
+        if namespace and self.namespaced:
+            return f"{prefix}/namespaces/{namespace}/{self.name}"
+        return f"{prefix}/{self.name}"
+
 
 class OCCli:
     def __init__(
@@ -357,14 +396,10 @@ class OCCli:
         self.api_resources_lock = threading.RLock()
         self.init_api_resources = init_api_resources
         self.api_resources = {}
-        self.projects = set()
         if self.init_api_resources:
             self.api_resources = self.get_api_resources()
 
-        self.init_projects = init_projects
-        if self.init_projects:
-            kind = PROJECT_KIND if self.is_kind_supported(PROJECT_KIND) else "Namespace"
-            self.projects = {p["metadata"]["name"] for p in self.get_all(kind)["items"]}
+        self._init_projects(init_projects)
 
         self.slow_oc_reconcile_threshold = float(
             os.environ.get("SLOW_OC_RECONCILE_THRESHOLD", "600")
@@ -408,14 +443,10 @@ class OCCli:
         self.api_resources_lock = threading.RLock()
         self.init_api_resources = init_api_resources
         self.api_resources = {}
-        self.projects = set()
         if self.init_api_resources:
             self.api_resources = self.get_api_resources()
 
-        self.init_projects = init_projects
-        if self.init_projects:
-            kind = PROJECT_KIND if self.is_kind_supported(PROJECT_KIND) else "Namespace"
-            self.projects = {p["metadata"]["name"] for p in self.get_all(kind)["items"]}
+        self._init_projects(init_projects)
 
         self.slow_oc_reconcile_threshold = float(
             os.environ.get("SLOW_OC_RECONCILE_THRESHOLD", "600")
@@ -444,6 +475,8 @@ class OCCli:
                     if not self.project_exists(namespace):
                         return []
                     cmd.extend(["-n", namespace])
+            elif kwargs.get("all_namespaces"):
+                cmd.append("--all-namespaces")
 
             if "labels" in kwargs:
                 labels_list = [f"{k}={v}" for k, v in kwargs.get("labels", {}).items()]
@@ -451,13 +484,16 @@ class OCCli:
 
             resource_names = kwargs.get("resource_names")
             if resource_names:
-                resource_items = []
-                for resource_name in resource_names:
-                    resource_cmd = cmd + [resource_name]
-                    item = self._run_json(resource_cmd, allow_not_found=True)
-                    if item:
-                        resource_items.append(item)
-                items_list = {"items": resource_items}
+                items_list = {
+                    "items": self._get_items_by_name(
+                        kind,
+                        resource_names,
+                        get_item=lambda name: self._run_json(
+                            cmd + [name], allow_not_found=True
+                        ),
+                        list_items=lambda: self._run_json(cmd).get("items") or [],
+                    )
+                }
             else:
                 items_list = self._run_json(cmd)
 
@@ -473,6 +509,132 @@ class OCCli:
                 kind=kind,
             ).observe(duration)
 
+    def _get_items_by_name(
+        self,
+        kind: str,
+        resource_names: Iterable[str],
+        get_item: Callable[[str], dict[str, Any] | None],
+        list_items: Callable[[], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Fetch the items of a kind with the given names.
+
+        Above RESOURCE_NAMES_LIST_THRESHOLD names a single list call filtered
+        by name is cheaper than a request per name. Field selectors can't
+        select a set of names, so the filtering happens here. Fewer names
+        are fetched one by one, concurrently.
+        """
+        names = list(dict.fromkeys(resource_names))
+        if len(names) > RESOURCE_NAMES_LIST_THRESHOLD:
+            strategy = "list"
+            items_by_name = {i["metadata"]["name"]: i for i in list_items()}
+            items = [items_by_name[n] for n in names if n in items_by_name]
+        else:
+            strategy = "get"
+            if len(names) == 1:
+                results = [get_item(names[0])]
+            else:
+                results = threaded.run(
+                    get_item, names, min(len(names), RESOURCE_NAMES_THREAD_POOL_SIZE)
+                )
+            items = [i for i in results if i]
+
+        oc_get_items_by_name_strategy.labels(
+            integration=RunningState().integration,
+            cluster=self.cluster_name,
+            kind=kind,
+            strategy=strategy,
+        ).inc()
+        return items
+
+    def iter_items(
+        self, kind: str, page_size: int = DEFAULT_LIST_PAGE_SIZE, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items of a kind, listing them page by page.
+
+        Takes the same keyword arguments as get_items. Collections are
+        fetched in chunks of page_size items using the limit/continue list
+        API, so only a single page is held in memory at any time.
+        """
+        if kwargs.get("resource_names") or not self.api_resources:
+            yield from self.get_items(kind, **kwargs)
+            return
+
+        resource = self.get_api_resource(kind)
+        if not resource.name:
+            yield from self.get_items(kind, **kwargs)
+            return
+
+        namespace = None
+        if "namespace" in kwargs:
+            namespace = kwargs["namespace"]
+            # for cluster scoped integrations
+            # currently only openshift-clusterrolebindings
+            if namespace == "cluster":
+                namespace = None
+            elif not self.project_exists(namespace):
+                return
+
+        query: dict[str, Any] = {"limit": page_size}
+        if "labels" in kwargs:
+            query["labelSelector"] = ",".join(
+                f"{k}={v}" for k, v in kwargs.get("labels", {}).items()
+            )
+
+        path = resource.path(namespace)
+        while True:
+            start_time = time.monotonic()
+            page = self._run_json(["get", "--raw", f"{path}?{urlencode(query)}"])
+            oc_get_items_duration.labels(
+                integration=RunningState().integration,
+                cluster=self.cluster_name,
+                kind=kind,
+            ).observe(time.monotonic() - start_time)
+
+            # raw list responses don't carry apiVersion and kind per item
+            for item in page.get("items") or []:
+                item.setdefault("apiVersion", resource.group_version)
+                item.setdefault("kind", resource.kind)
+                yield item
+
+            continue_token = page.get("metadata", {}).get("continue")
+            if not continue_token:
+                return
+            query["continue"] = continue_token
+
+    @property
+    def supports_watch(self) -> bool:
+        """Whether watch_items can stream changes. The oc binary can't."""
+        return False
+
+    def iter_item_pages(
+        self, kind: str, namespace: str, page_size: int = DEFAULT_LIST_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the list responses of a kind in a namespace page by page.
+
+        The resourceVersion in the metadata of the first page is the starting
+        point for watch_items. Pages of this client carry no metadata.
+        """
+        for items in itertools.batched(
+            self.iter_items(kind, page_size=page_size, namespace=namespace),
+            page_size,
+            strict=False,
+        ):
+            yield {"items": list(items), "metadata": {}}
+
+    def watch_items(
+        self,
+        kind: str,
+        namespace: str,
+        resource_version: str,
+        timeout_seconds: int,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (event type, item) for each change of a kind after
+        resource_version until the server ends the watch.
+
+        Only available if supports_watch, callers have to poll otherwise.
+        """
+        raise NotImplementedError("watching requires the native client")
+
     def get(
         self,
         namespace: str | None,
@@ -609,9 +771,39 @@ class OCCli:
         resource = OR({"kind": kind, "metadata": {"name": name}}, "", "")
         return self._msg_to_process_reconcile_time(namespace or "", resource)
 
+    def _init_projects(self, init_projects: bool) -> None:
+        self.projects: set[str] = set()
+        self._projects_lock = threading.Lock()
+        self._projects_indexed = False
+        self.init_projects = init_projects
+        if self.init_projects:
+            self.refresh_projects()
+
+    def refresh_projects(self) -> None:
+        """(Re)build the index of existing namespaces with a single list."""
+        kind = PROJECT_KIND if self.is_kind_supported(PROJECT_KIND) else "Namespace"
+        items = self.get_all(kind)["items"]
+        with self._projects_lock:
+            self.projects = {p["metadata"]["name"] for p in items}
+            self._projects_indexed = True
+
+    def _index_projects(self) -> None:
+        with self._projects_lock:
+            if self._projects_indexed:
+                return
+            self._projects_indexed = True
+        try:
+            self.refresh_projects()
+        except (StatusCodeError, ForbiddenError) as e:
+            # without list permissions every lookup falls back to a GET
+            logging.debug(f"[{self.cluster_name}] unable to list namespaces: {e}")
+
     def project_exists(self, name: str) -> bool:
+        self._index_projects()
         if name in self.projects:
             return True
+
+        # a miss is never cached, callers wait for namespaces to appear
         kind = PROJECT_KIND if self.is_kind_supported(PROJECT_KIND) else "Namespace"
         try:
             self.get(None, kind, name)
@@ -619,6 +811,7 @@ class OCCli:
             if "NotFound" in str(e):
                 return False
             raise
+        self.projects.add(name)
         return True
 
     def _use_oc_project(self, namespace: str) -> bool:
@@ -638,6 +831,7 @@ class OCCli:
         except StatusCodeError as e:
             if "AlreadyExists" not in str(e):
                 raise
+        self.projects.add(namespace)
 
         # This return will be removed by the last decorator
         resource = OR({"kind": "Namespace", "metadata": {"name": namespace}}, "", "")
@@ -650,6 +844,7 @@ class OCCli:
         else:
             cmd = ["delete", "namespace", namespace]
         self._run(cmd)
+        self.projects.discard(namespace)
 
         # This return will be removed by the last decorator
         resource = OR({"kind": "Namespace", "metadata": {"name": namespace}}, "", "")
@@ -703,6 +898,7 @@ class OCCli:
                 results = self._run(cmd).decode("utf-8").split("\n")
                 for line in results:
                     r = line.split()
+                    name = r[0]
                     kind = r[-1]
                     namespaced = r[-2].lower() == "true"
                     # r[-3] is APIVERSION column
@@ -711,7 +907,9 @@ class OCCli:
                     group_version = r[-3].split("/", 1)
                     group = "" if len(group_version) == 1 else group_version[0]
                     api_version = group_version[-1]
-                    obj = OCCliApiResource(kind, group, api_version, namespaced)
+                    obj = OCCliApiResource(
+                        kind, group, api_version, namespaced, name=name
+                    )
                     d = self.api_resources.setdefault(kind, [])
                     d.append(obj)
 
@@ -1326,11 +1524,7 @@ class OCNative(OCCli):
         self.client = self._get_client(server, token)
         self.api_resources = self.get_api_resources()
 
-        self.projects = set()
-        self.init_projects = init_projects
-        if self.init_projects:
-            kind = PROJECT_KIND if self.is_kind_supported(PROJECT_KIND) else "Namespace"
-            self.projects = {p["metadata"]["name"] for p in self.get_all(kind)["items"]}
+        self._init_projects(init_projects)
 
     def __enter__(self) -> Self:
         return self
@@ -1388,6 +1582,8 @@ class OCNative(OCCli):
                 if namespace != "cluster":
                     if not self.project_exists(namespace):
                         return []
+            # without a namespace the dynamic client lists the kind
+            # across all namespaces, so all_namespaces needs no handling
 
             labels = ""
             if "labels" in kwargs:
@@ -1396,20 +1592,32 @@ class OCNative(OCCli):
 
             resource_names = kwargs.get("resource_names")
             if resource_names:
-                resource_items = []
-                for resource_name in resource_names:
+
+                def get_item(name: str) -> dict[str, Any] | None:
                     try:
                         item = obj_client.get(
-                            name=resource_name,
+                            name=name,
                             namespace=namespace,
                             label_selector=labels,
                             _request_timeout=REQUEST_TIMEOUT,
                         )
-                        if item:
-                            resource_items.append(item.to_dict())
                     except NotFoundError:
-                        pass
-                items_list = {"items": resource_items}
+                        return None
+                    return item.to_dict() if item else None
+
+                def list_items() -> list[dict[str, Any]]:
+                    items_list = obj_client.get(
+                        namespace=namespace,
+                        label_selector=labels,
+                        _request_timeout=REQUEST_TIMEOUT,
+                    ).to_dict()
+                    return items_list.get("items") or []
+
+                items_list = {
+                    "items": self._get_items_by_name(
+                        kind, resource_names, get_item, list_items
+                    )
+                }
             else:
                 items_list = obj_client.get(
                     namespace=namespace,
@@ -1429,6 +1637,119 @@ class OCNative(OCCli):
                 kind=kind,
             ).observe(duration)
 
+    @retry(max_attempts=5, exceptions=(ServerTimeoutError))
+    def _list_page(
+        self,
+        obj_client: Resource,
+        namespace: str,
+        labels: str,
+        limit: int,
+        continue_token: str | None,
+    ) -> dict[str, Any]:
+        return obj_client.get(
+            namespace=namespace,
+            label_selector=labels,
+            limit=limit,
+            _continue=continue_token,
+            _request_timeout=REQUEST_TIMEOUT,
+        ).to_dict()
+
+    def iter_items(
+        self, kind: str, page_size: int = DEFAULT_LIST_PAGE_SIZE, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        if kwargs.get("resource_names"):
+            yield from self.get_items(kind, **kwargs)
+            return
+
+        for page in self._iter_pages(kind, page_size, **kwargs):
+            yield from page.get("items") or []
+
+    @property
+    def supports_watch(self) -> bool:
+        return True
+
+    def iter_item_pages(
+        self, kind: str, namespace: str, page_size: int = DEFAULT_LIST_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        yield from self._iter_pages(kind, page_size, namespace=namespace)
+
+    def _iter_pages(
+        self, kind: str, page_size: int, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=resource.group_version, kind=resource.kind
+        )
+
+        namespace = ""
+        if "namespace" in kwargs:
+            namespace = kwargs["namespace"]
+            # for cluster scoped integrations
+            # currently only openshift-clusterrolebindings
+            if namespace != "cluster":
+                if not self.project_exists(namespace):
+                    return
+
+        labels = ""
+        if "labels" in kwargs:
+            labels_list = [f"{k}={v}" for k, v in kwargs.get("labels", {}).items()]
+            labels = ",".join(labels_list)
+
+        continue_token = None
+        while True:
+            start_time = time.monotonic()
+            page = self._list_page(
+                obj_client, namespace, labels, page_size, continue_token
+            )
+            oc_get_items_duration.labels(
+                integration=RunningState().integration,
+                cluster=self.cluster_name,
+                kind=kind,
+            ).observe(time.monotonic() - start_time)
+
+            yield page
+
+            continue_token = (page.get("metadata") or {}).get("continue")
+            if not continue_token:
+                return
+
+    def watch_items(
+        self,
+        kind: str,
+        namespace: str,
+        resource_version: str,
+        timeout_seconds: int,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (event type, item) for each change of a kind after
+        resource_version until the server ends the watch after
+        timeout_seconds. BOOKMARK events only carry a newer resourceVersion.
+
+        Raises ResourceVersionExpiredError if resource_version is too old to
+        resume from (410 Gone), the caller has to list again.
+        """
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=resource.group_version, kind=resource.kind
+        )
+        try:
+            for event in self.client.watch(
+                obj_client,
+                namespace=namespace,
+                resource_version=resource_version,
+                timeout=timeout_seconds,
+                allow_watch_bookmarks=True,
+            ):
+                item = event["raw_object"]
+                if event["type"] == "ERROR":
+                    if item.get("code") == 410:
+                        raise ResourceVersionExpiredError(item.get("message"))
+                    raise StatusCodeError(f"[{self.server}]: {item.get('message')}")
+                yield event["type"], item
+        except ApiException as e:
+            if e.status == 410:
+                raise ResourceVersionExpiredError(str(e)) from None
+            raise
+
     @retry(max_attempts=5, exceptions=(ServerTimeoutError, ForbiddenError))
     def get(
         self,
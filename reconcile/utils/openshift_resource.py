@@ -7,6 +7,8 @@ import copy
 import hashlib
 import logging
 import re
+import time
+from collections.abc import Mapping
 from threading import Lock
 from typing import TYPE_CHECKING, Any
 
@@ -14,12 +16,17 @@ import semver
 from pydantic import BaseModel
 
 from reconcile.external_resources.meta import SECRET_UPDATED_AT
+from reconcile.status import RunningState
 from reconcile.utils.datetime_util import to_utc_seconds_iso_format, utc_now
 from reconcile.utils.json import json_dumps
-from reconcile.utils.metrics import GaugeMetric
+from reconcile.utils.metrics import (
+    GaugeMetric,
+    resource_inventory_lock_contention,
+    resource_inventory_lock_wait,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Iterator
 
 SECRET_MAX_KEY_LENGTH = 253
 
@@ -374,45 +381,52 @@ class OpenshiftResource:
         if self.caller_name:
             annotations[QONTRACT_ANNOTATION_CALLER_NAME] = self.caller_name
 
-        return OpenshiftResource(body, self.integration, self.integration_version)
+        return OpenshiftResource(
+            body,
+            self.integration,
+            self.integration_version,
+        )
 
     def sha256sum(self) -> str:
-        body = self.annotate().body
-
-        annotations = body["metadata"]["annotations"]
-        return annotations["qontract.sha256sum"]
+        return self.calculate_sha256sum(self.serialize(self.canonicalize(self.body)))
 
     def to_json(self) -> str:
         return self.serialize(self.body)
 
     @staticmethod
     def canonicalize(body: dict[str, Any]) -> dict[str, Any]:
-        body = copy.deepcopy(body)
-
-        # create annotations if not present
-        body["metadata"].setdefault("annotations", {})
-        if body["metadata"]["annotations"] is None:
-            body["metadata"]["annotations"] = {}
-        annotations = body["metadata"]["annotations"]
+        """
+        Returns the body without the fields that are set by the cluster or
+        qontract-reconcile. The input is not modified: the containers on the
+        changed paths are copied, everything else is shared with the input.
+        """
+        body = dict(body)
+        metadata = body["metadata"] = dict(body["metadata"])
+        annotations = metadata["annotations"] = dict(metadata.get("annotations") or {})
 
         # remove openshift specific params
-        body["metadata"].pop("creationTimestamp", None)
-        body["metadata"].pop("resourceVersion", None)
-        body["metadata"].pop("generation", None)
-        body["metadata"].pop("selfLink", None)
-        body["metadata"].pop("uid", None)
-        body["metadata"].pop("namespace", None)
-        body["metadata"].pop("managedFields", None)
+        metadata.pop("creationTimestamp", None)
+        metadata.pop("resourceVersion", None)
+        metadata.pop("generation", None)
+        metadata.pop("selfLink", None)
+        metadata.pop("uid", None)
+        metadata.pop("namespace", None)
+        metadata.pop("managedFields", None)
         annotations.pop("kubectl.kubernetes.io/last-applied-configuration", None)
 
         # remove status
         body.pop("status", None)
 
         # remove controller managed labels
-        labels = body["metadata"].get("labels", {})
-        for label in set(labels.keys()):
-            if OpenshiftResource.is_controller_managed_label(body["kind"], label):
-                labels.pop(label)
+        labels = metadata.get("labels", {})
+        if managed_labels := {
+            label
+            for label in labels
+            if OpenshiftResource.is_controller_managed_label(body["kind"], label)
+        }:
+            metadata["labels"] = {
+                k: v for k, v in labels.items() if k not in managed_labels
+            }
 
         # Default fields for specific resource types
         # ConfigMaps and Secrets are by default Opaque
@@ -422,17 +436,18 @@ class OpenshiftResource:
         if body["kind"] == "Secret":
             string_data = body.pop("stringData", None)
             if string_data:
-                body.setdefault("data", {})
+                data = body["data"] = dict(body.get("data", {}))
                 for k, v in string_data.items():
                     v = base64_encode_secret_field_value(str(v))
-                    body["data"][k] = v
+                    data[k] = v
 
         if body["kind"] == "Deployment":
             annotations.pop("deployment.kubernetes.io/revision", None)
 
         if body["kind"] == "Route":
-            if body["spec"].get("wildcardPolicy") == "None":
-                body["spec"].pop("wildcardPolicy")
+            spec = body["spec"] = dict(body["spec"])
+            if spec.get("wildcardPolicy") == "None":
+                spec.pop("wildcardPolicy")
             # remove tls-acme specific params from Route
             if "kubernetes.io/tls-acme" in annotations:
                 annotations.pop(
@@ -441,13 +456,13 @@ class OpenshiftResource:
                 annotations.pop(
                     "kubernetes.io/tls-acme-awaiting-authorization-at-url", None
                 )
-                if "tls" in body["spec"]:
-                    tls = body["spec"]["tls"]
+                if "tls" in spec:
+                    tls = spec["tls"] = dict(spec["tls"])
                     tls.pop("key", None)
                     tls.pop("certificate", None)
-            subdomain = body["spec"].get("subdomain", None)
+            subdomain = spec.get("subdomain")
             if not subdomain:
-                body["spec"].pop("subdomain", None)
+                spec.pop("subdomain", None)
 
         if body["kind"] == "ServiceAccount":
             if "imagePullSecrets" in body:
@@ -462,18 +477,22 @@ class OpenshiftResource:
                 body.pop("secrets")
 
         if body["kind"] == "Role":
+            rules = []
             for rule in body["rules"]:
+                rule = dict(rule)
                 if "resources" in rule:
-                    rule["resources"].sort()
+                    rule["resources"] = sorted(rule["resources"])
 
                 if "verbs" in rule:
-                    rule["verbs"].sort()
+                    rule["verbs"] = sorted(rule["verbs"])
 
                 if (
                     "attributeRestrictions" in rule
                     and not rule["attributeRestrictions"]
                 ):
                     rule.pop("attributeRestrictions")
+                rules.append(rule)
+            body["rules"] = rules
 
         if body["kind"] == "OperatorGroup":
             annotations.pop("olm.providedAPIs", None)
@@ -484,38 +503,44 @@ class OpenshiftResource:
             if "userNames" in body:
                 body.pop("userNames")
             if "roleRef" in body:
-                if "namespace" in body["roleRef"]:
-                    body["roleRef"].pop("namespace")
+                role_ref = body["roleRef"] = dict(body["roleRef"])
+                if "namespace" in role_ref:
+                    role_ref.pop("namespace")
                 if (
-                    "apiGroup" in body["roleRef"]
-                    and body["roleRef"]["apiGroup"] in body["apiVersion"]
+                    "apiGroup" in role_ref
+                    and role_ref["apiGroup"] in body["apiVersion"]
                 ):
-                    body["roleRef"].pop("apiGroup")
-                if "kind" in body["roleRef"]:
-                    body["roleRef"].pop("kind")
+                    role_ref.pop("apiGroup")
+                if "kind" in role_ref:
+                    role_ref.pop("kind")
+            subjects = []
             for subject in body["subjects"]:
+                subject = dict(subject)
                 if "namespace" in subject:
                     subject.pop("namespace")
                 if "apiGroup" in subject and (
                     not subject["apiGroup"] or subject["apiGroup"] in body["apiVersion"]
                 ):
                     subject.pop("apiGroup")
+                subjects.append(subject)
+            body["subjects"] = subjects
 
         if body["kind"] == "ClusterRoleBinding":
             if "userNames" in body:
                 body.pop("userNames")
             if "roleRef" in body:
+                role_ref = body["roleRef"] = dict(body["roleRef"])
                 if (
-                    "apiGroup" in body["roleRef"]
-                    and body["roleRef"]["apiGroup"] in body["apiVersion"]
+                    "apiGroup" in role_ref
+                    and role_ref["apiGroup"] in body["apiVersion"]
                 ):
-                    body["roleRef"].pop("apiGroup")
-                if "kind" in body["roleRef"]:
-                    body["roleRef"].pop("kind")
+                    role_ref.pop("apiGroup")
+                if "kind" in role_ref:
+                    role_ref.pop("kind")
             if "groupNames" in body:
                 body.pop("groupNames")
         if body["kind"] == "Service":
-            spec = body["spec"]
+            spec = body["spec"] = dict(body["spec"])
             if spec.get("sessionAffinity") == "None":
                 spec.pop("sessionAffinity")
             if spec.get("type") == "ClusterIP":
@@ -566,12 +591,65 @@ class OpenshiftResourceInventoryGauge(OpenshiftResourceBaseMetric, GaugeMetric):
         return "qontract_reconcile_openshift_resource_inventory"
 
 
+class ResourceTypeInventory(Mapping[str, Any]):
+    """
+    The state of one resource type in a cluster namespace.
+
+    Fields are attributes, but the record can still be read like the dict it
+    replaces, e.g. data["desired"], so the ResourceInventory iteration API
+    is unchanged.
+    """
+
+    __slots__ = ("current", "desired", "managed_names", "use_admin_token")
+    FIELDS = __slots__
+
+    def __init__(self, managed_names: list[str] | None = None) -> None:
+        self.current: dict[str, OpenshiftResource] = {}
+        self.desired: dict[str, OpenshiftResource] = {}
+        self.use_admin_token: dict[str, bool] = {}
+        self.managed_names = managed_names
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+
 class ResourceInventory:
+    # inserts lock one of the stripes, selected by cluster and namespace,
+    # so threads filling different namespaces do not wait for each other
+    LOCK_STRIPES = 64
+
     def __init__(self) -> None:
-        self._clusters: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        self._clusters: dict[str, dict[str, dict[str, ResourceTypeInventory]]] = {}
         self._error_registered = False
         self._error_registered_clusters: dict[str, bool] = {}
-        self._lock = Lock()
+        self._locks = [Lock() for _ in range(self.LOCK_STRIPES)]
+
+    @contextlib.contextmanager
+    def _lock(self, cluster: str, namespace: str) -> Iterator[None]:
+        lock = self._locks[hash((cluster, namespace)) % self.LOCK_STRIPES]
+        if not lock.acquire(blocking=False):
+            integration = RunningState().integration or ""
+            resource_inventory_lock_contention.labels(integration=integration).inc()
+            start = time.monotonic()
+            lock.acquire()
+            resource_inventory_lock_wait.labels(integration=integration).observe(
+                time.monotonic() - start
+            )
+        try:
+            yield
+        finally:
+            lock.release()
 
     def initialize_resource_type(
         self,
@@ -583,13 +661,7 @@ class ResourceInventory:
         self._clusters.setdefault(cluster, {})
         self._clusters[cluster].setdefault(namespace, {})
         self._clusters[cluster][namespace].setdefault(
-            resource_type,
-            {
-                "current": {},
-                "desired": {},
-                "use_admin_token": {},
-                "managed_names": managed_names,
-            },
+            resource_type, ResourceTypeInventory(managed_names)
         )
 
     def is_cluster_present(self, cluster: str) -> bool:
@@ -634,28 +706,22 @@ class ResourceInventory:
         # state-specs that lead up to add_desired calls. while this is a
         # mismatch between schema and implementation for now, it will enable
         # us to implement per-resource configuration in the future
-        with self._lock:
-            # fail if the name of the resource is not within the managed names if they are defined
-            managed_names = self._clusters[cluster][namespace][resource_type][
-                "managed_names"
-            ]
-            if managed_names is not None and name not in managed_names:
-                raise ResourceNotManagedError(name)
+        data = self._clusters[cluster][namespace][resource_type]
+        # fail if the name of the resource is not within the managed names if they are defined
+        if data.managed_names is not None and name not in data.managed_names:
+            raise ResourceNotManagedError(name)
 
-            desired = self._clusters[cluster][namespace][resource_type]["desired"]
-            if name in desired:
+        with self._lock(cluster, namespace):
+            if name in data.desired:
                 raise ResourceKeyExistsError(name)
-            desired[name] = value
-            admin_token_usage = self._clusters[cluster][namespace][resource_type][
-                "use_admin_token"
-            ]
-            admin_token_usage[name] = privileged
+            data.desired[name] = value
+            data.use_admin_token[name] = privileged
 
     def get_desired(
         self, cluster: str, namespace: str, resource_type: str, name: str
     ) -> OpenshiftResource | None:
         try:
-            return self._clusters[cluster][namespace][resource_type]["desired"][name]
+            return self._clusters[cluster][namespace][resource_type].desired[name]
         except KeyError:
             return None
 
@@ -663,7 +729,7 @@ class ResourceInventory:
         self, cluster: str, namespace: str, resource_type: str
     ) -> dict[str, OpenshiftResource] | None:
         try:
-            return self._clusters[cluster][namespace][resource_type]["desired"]
+            return self._clusters[cluster][namespace][resource_type].desired
         except KeyError:
             return None
 
@@ -671,7 +737,7 @@ class ResourceInventory:
         self, cluster: str, namespace: str, resource_type: str, name: str
     ) -> OpenshiftResource | None:
         try:
-            return self._clusters[cluster][namespace][resource_type]["current"][name]
+            return self._clusters[cluster][namespace][resource_type].current[name]
         except KeyError:
             return None
 
@@ -683,11 +749,11 @@ class ResourceInventory:
         name: str,
         value: OpenshiftResource,
     ) -> None:
-        with self._lock:
-            current = self._clusters[cluster][namespace][resource_type]["current"]
-            current[name] = value
+        data = self._clusters[cluster][namespace][resource_type]
+        with self._lock(cluster, namespace):
+            data.current[name] = value
 
-    def __iter__(self) -> Iterator[tuple[str, str, str, dict[str, Any]]]:
+    def __iter__(self) -> Iterator[tuple[str, str, str, ResourceTypeInventory]]:
         for cluster_name, cluster in self._clusters.items():
             for namespace_name, namespace in cluster.items():
                 for resource_type, resource in namespace.items():
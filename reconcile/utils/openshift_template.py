@@ -0,0 +1,206 @@
+"""In-process implementation of `oc process --local --ignore-unknown-parameters`.
+
+Processing a template does not need a cluster, only parameter resolution and
+string substitution, so doing it in Python avoids spawning an `oc` subprocess
+(and the JSON round trip) for every template. The behaviour follows the
+OpenShift template processor:
+
+* parameters passed in override the template defaults, unknown ones are ignored
+* empty parameters with `generate: expression` get a random value generated
+  from their `from` expression
+* required parameters without a value are an error
+* `${NAME}` is replaced within strings, `${{NAME}}` makes the string a JSON
+  decoded value (e.g. numbers and booleans) and fails if it is not valid JSON
+* map keys are substituted too, but always stay strings
+* hardcoded namespaces are stripped from the objects
+* the template labels are added to every object
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import secrets
+import string
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+STRING_PARAMETER_RE = re.compile(r"\$\{([a-zA-Z0-9_]+?)\}")
+NON_STRING_PARAMETER_RE = re.compile(r"\$\{\{([a-zA-Z0-9_]+)\}\}")
+
+GENERATOR_RE = re.compile(r"\[([a-zA-Z0-9\-\\]+)\](\{(\w+)\})")
+EXPRESSION_RE = re.compile(r"\[(\\w|\\d|\\a|\\A)|([a-zA-Z0-9]\-[a-zA-Z0-9])+\]")
+RANGE_RE = re.compile(r"(\\?[a-zA-Z0-9]\-?[a-zA-Z0-9]?)")
+
+ALPHABET = string.ascii_letters
+NUMERALS = string.digits
+SYMBOLS = "~!@#$%^&*()-_+={}[]\\|<,>.?/\"';:`"
+EXPRESSION_CLASSES = {
+    r"\w": ALPHABET + NUMERALS + "_",
+    r"\d": NUMERALS,
+    r"\a": ALPHABET + NUMERALS,
+    r"\A": SYMBOLS,
+}
+MAX_GENERATED_LENGTH = 255
+
+
+class TemplateProcessingError(Exception):
+    pass
+
+
+def generate_expression_value(expression: str) -> str:
+    """Replaces every `[range]{length}` in expression with random characters.
+
+    e.g. `[a-zA-Z0-9]{8}` or `admin-[\\w]{4}`
+    """
+    while match := GENERATOR_RE.search(expression):
+        generator = match.group(0)
+        ranges = generator[: generator.rindex("{")]
+        if not EXPRESSION_RE.search(ranges):
+            raise TemplateProcessingError(f"malformed expression syntax: {ranges}")
+        try:
+            length = int(match.group(3))
+        except ValueError:
+            length = 0
+        if not 0 < length <= MAX_GENERATED_LENGTH:
+            raise TemplateProcessingError(
+                f"range must be within [1-{MAX_GENERATED_LENGTH}] characters ({length})"
+            )
+
+        alphabet = ""
+        for r in RANGE_RE.findall(ranges):
+            if r in EXPRESSION_CLASSES:
+                alphabet += EXPRESSION_CLASSES[r]
+            elif len(r) == 3:
+                start, end = ord(r[0]), ord(r[2])
+                if start > end:
+                    raise TemplateProcessingError(f"invalid range specified: {r}")
+                alphabet += "".join(chr(c) for c in range(start, end + 1))
+            else:
+                alphabet += r
+        # keep the order, drop duplicates
+        alphabet = "".join(dict.fromkeys(alphabet))
+        value = "".join(secrets.choice(alphabet) for _ in range(length))
+        expression = expression.replace(generator, value, 1)
+    return expression
+
+
+def _resolve_parameters(
+    template: Mapping[str, Any], parameters: Mapping[str, Any]
+) -> dict[str, str]:
+    values: dict[str, str] = {}
+    errors: list[str] = []
+    for i, param in enumerate(template.get("parameters") or []):
+        name = param["name"]
+        value = param.get("value") or ""
+        generate = param.get("generate")
+        if not isinstance(value, str):
+            raise TemplateProcessingError(
+                f"parameter {name} value must be a string, got {value!r}"
+            )
+        if name in parameters:
+            # same formatting as the NAME=VALUE arguments passed to oc process
+            value = str(parameters[name])
+            generate = None
+
+        if not value and generate:
+            if generate != "expression":
+                raise TemplateProcessingError(
+                    f"Unable to find the '{generate}' generator for parameter {name}"
+                )
+            value = generate_expression_value(param.get("from") or "")
+
+        if not value and param.get("required"):
+            errors.append(
+                f"template.parameters[{i}]: parameter {name} is required "
+                "and must be specified"
+            )
+        values[name] = value
+
+    if errors:
+        raise TemplateProcessingError("\n".join(errors))
+    return values
+
+
+def _substitute_string(value: str, parameters: Mapping[str, str]) -> tuple[str, bool]:
+    """Returns the substituted value and whether it is to be kept as a string."""
+    # like oc, the first ${{NAME}} with a known parameter makes the whole
+    # value a non-string, even with a prefix or suffix
+    for match in NON_STRING_PARAMETER_RE.finditer(value):
+        if match.group(1) in parameters:
+            return value.replace(match.group(0), parameters[match.group(1)], 1), False
+
+    out = value
+    for match in STRING_PARAMETER_RE.finditer(value):
+        if match.group(1) in parameters:
+            out = out.replace(match.group(0), parameters[match.group(1)], 1)
+    return out, True
+
+
+def _substitute(value: Any, parameters: Mapping[str, str]) -> Any:
+    if isinstance(value, str):
+        out, as_string = _substitute_string(value, parameters)
+        if as_string:
+            return out
+        try:
+            return _normalize_number(json.loads(out))
+        except ValueError as e:
+            raise TemplateProcessingError(f"failed to unmarshal {out!r}: {e}") from e
+    if isinstance(value, dict):
+        return {
+            _substitute_string(k, parameters)[0] if isinstance(k, str) else k: (
+                _substitute(v, parameters)
+            )
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_substitute(v, parameters) for v in value]
+    return _normalize_number(value)
+
+
+def _normalize_number(value: Any) -> Any:
+    # oc serializes integral floats (e.g. 1.0) as integers
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _strip_namespace(item: dict[str, Any], obj: Mapping[str, Any]) -> None:
+    """Removes the namespace from item unless obj references a parameter in it."""
+    metadata = obj.get("metadata")
+    if not isinstance(metadata, dict) or "namespace" not in metadata:
+        return
+    namespace = metadata["namespace"]
+    if not isinstance(namespace, str) or not STRING_PARAMETER_RE.search(namespace):
+        del item["metadata"]["namespace"]
+
+
+def _add_labels(obj: dict[str, Any], labels: Mapping[str, str]) -> None:
+    """Adds the template labels to obj, overwriting existing labels like oc."""
+    metadata = obj.get("metadata")
+    if not isinstance(metadata, dict):
+        return
+    metadata["labels"] = {**(metadata.get("labels") or {}), **labels}
+
+
+def process_template(
+    template: Mapping[str, Any], parameters: Mapping[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Processes an OpenShift Template and returns the resulting objects."""
+    values = _resolve_parameters(template, parameters or {})
+
+    labels: dict[str, str] = {}
+    for k, v in (template.get("labels") or {}).items():
+        labels[_substitute_string(k, values)[0]] = _substitute_string(v, values)[0]
+
+    items = []
+    for obj in template.get("objects") or []:
+        # _substitute returns a copy, the template is left untouched
+        item = _substitute(obj, values)
+        _strip_namespace(item, obj)
+        if labels:
+            _add_labels(item, labels)
+        items.append(item)
+    return items
@@ -1,3 +1,4 @@
+import functools
 import logging
 import multiprocessing
 from collections.abc import Callable, Iterable, Mapping
@@ -195,7 +196,9 @@ def build_desired_state_diff(
         if desired_state_diff_found and sharding_config:
             # detect shards based on fine grained diffs
             diffs = extract_diffs_with_timeout(
-                extraction_function=extract_diffs,
+                extraction_function=functools.partial(
+                    extract_diffs, backend=sharding_config.diff_backend
+                ),
                 previous_desired_state=previous_desired_state,
                 current_desired_state=current_desired_state,
                 timeout_seconds=exract_diff_timeout_seconds,
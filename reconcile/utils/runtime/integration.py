@@ -24,6 +24,7 @@ from qontract_api_client.config import (
     Config as QontractApiClientConfig,
 )
 
+from reconcile.change_owners.diff import DiffBackend
 from reconcile.typed_queries.app_interface_vault_settings import (
     get_app_interface_vault_settings,
 )
@@ -95,6 +96,14 @@ class DesiredStateShardConfig:
     collection. In that case, this flag should be set to `True`.
     """
 
+    diff_backend: DiffBackend = DiffBackend.DEEPDIFF
+    """
+    The backend used to find the fine grained diffs in the desired state.
+    The merkle backend is faster on large desired states, but pairs changed
+    list items without an identifier differently than deepdiff, see
+    `extract_merkle_diffs`.
+    """
+
 
 RunParamsSelfTypeVar = TypeVar("RunParamsSelfTypeVar", bound="RunParams")
 
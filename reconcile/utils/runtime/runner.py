@@ -159,6 +159,8 @@ def run_integration_cfg(run_cfg: IntegrationRunConfiguration) -> None:
     Runs an integration with the given configuration, making sure to run it
     in the right mode accoring to `run.cfg.dry_run`.
     """
+    definitions = gql.warm_up_document_cache()
+    logging.debug(f"pre-parsed {definitions} GraphQL query definitions")
     if run_cfg.dry_run:
         desired_state_diff = get_desired_state_diff(run_cfg)
         run_cfg.switch_to_main_bundle()
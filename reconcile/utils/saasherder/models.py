@@ -363,6 +363,18 @@ class TargetSpec:
     def delete(self) -> bool:
         return bool(self.target.delete)
 
+    @property
+    def has_secret_parameters(self) -> bool:
+        return any(
+            container.secret_parameters
+            for container in (
+                self.saas_file,
+                self.resource_template,
+                self.target.namespace.environment,
+                self.target,
+            )
+        )
+
     @property
     def html_url(self) -> str:
         git_object = "blob" if self.provider == "openshift-template" else "tree"
@@ -35,8 +35,8 @@ from reconcile.utils.datetime_util import utc_now
 from reconcile.utils.github_api import GithubRepositoryApi
 from reconcile.utils.json import json_dumps
 from reconcile.utils.oc import (
-    OCLocal,
     StatusCodeError,
+    oc_process,
 )
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
 from reconcile.utils.openshift_resource import (
@@ -78,6 +78,7 @@ from reconcile.utils.saasherder.models import (
     TriggerTypes,
     UpstreamJob,
 )
+from reconcile.utils.saasherder.template_cache import TemplateCache
 from reconcile.utils.slo_document_manager import SLODetails, SLODocumentManager
 from reconcile.utils.vcs import VCS
 
@@ -137,6 +138,8 @@ class SaasHerder:
         include_trigger_trace: bool = False,
         all_saas_files: Iterable[SaasFile] | None = None,
         image_patterns_block_rules: list[ImagePatternsBlockRule] | None = None,
+        template_cache: TemplateCache | None = None,
+        helm_cache_dir: str | None = None,
     ) -> None:
         self.error_registered = False
         self.saas_files = saas_files
@@ -158,6 +161,8 @@ class SaasHerder:
         self.jenkins_map = jenkins_map
         self.include_trigger_trace = include_trigger_trace
         self.state = state
+        self.template_cache = template_cache
+        self.helm_cache_dir = helm_cache_dir
         self._promotion_state = PromotionState(state=state) if state else None
         self._channel_map = self._assemble_channels(saas_files=all_saas_files)
         self.images: set[str] = set()
@@ -756,7 +761,9 @@ class SaasHerder:
     def _get_file_contents(
         self, url: str, path: str, ref: str, github: Github
     ) -> tuple[Any, str]:
-        commit_sha = self._get_commit_sha(url, ref, github)
+        commit_sha = (
+            ref if is_commit_sha(ref) else self._get_commit_sha(url, ref, github)
+        )
 
         repo_info = VCS.parse_repo_url(url)
         match repo_info.platform:
@@ -897,6 +904,116 @@ class SaasHerder:
         """
         return template | {"apiVersion": TEMPLATE_API_VERSION}
 
+    def _add_commit_parameters(
+        self,
+        consolidated_parameters: dict[str, Any],
+        commit_sha: str,
+        hash_length: int,
+        error_prefix: str,
+    ) -> None:
+        # add COMMIT_SHA only if it is unspecified
+        consolidated_parameters.setdefault("COMMIT_SHA", commit_sha)
+
+        # add IMAGE_TAG only if it is unspecified
+        if not consolidated_parameters.get("IMAGE_TAG"):
+            sha_substring = commit_sha[:hash_length]
+            # IMAGE_TAG takes one of two forms:
+            # - If saas file attribute 'use_channel_in_image_tag' is true,
+            #   it is {CHANNEL}-{SHA}
+            # - Otherwise it is just {SHA}
+            if self._get_saas_file_feature_enabled("use_channel_in_image_tag"):
+                try:
+                    channel = consolidated_parameters["CHANNEL"]
+                except KeyError:
+                    logging.error(
+                        f"{error_prefix} CHANNEL is required when "
+                        + "'use_channel_in_image_tag' is true."
+                    )
+                    raise
+                image_tag = f"{channel}-{sha_substring}"
+            else:
+                image_tag = sha_substring
+            consolidated_parameters["IMAGE_TAG"] = image_tag
+
+    def _process_openshift_template(
+        self,
+        spec: TargetSpec,
+        consolidated_parameters: dict[str, Any],
+        commit_sha: str | None = None,
+    ) -> tuple[Iterable[Any], str, bool]:
+        """Fetch and process an openshift template.
+
+        The template is fetched at commit_sha if given, otherwise at the
+        target ref. Returns the processed resources, the commit sha of the
+        template and whether the result may be cached. Templates resolving
+        image digests are not cacheable, because a digest can move while the
+        tag stays.
+        """
+        error_prefix = spec.error_prefix
+        try:
+            template, commit_sha = self._get_file_contents(
+                url=spec.url,
+                path=spec.path,
+                ref=commit_sha or spec.ref,
+                github=spec.github,
+            )
+        except Exception as e:
+            logging.error(f"{error_prefix} error fetching template: {e!s}")
+            raise
+
+        cacheable = True
+        self._add_commit_parameters(
+            consolidated_parameters, commit_sha, spec.hash_length, error_prefix
+        )
+        image_tag = consolidated_parameters["IMAGE_TAG"]
+
+        # This relies on IMAGE_TAG already being calculated.
+        need_repo_digest = self._parameter_value_needed(
+            "REPO_DIGEST", consolidated_parameters, template
+        )
+        need_image_digest = self._parameter_value_needed(
+            "IMAGE_DIGEST", consolidated_parameters, template
+        )
+        if need_repo_digest or need_image_digest:
+            cacheable = False
+            try:
+                logging.debug("Generating REPO_DIGEST.")
+                registry_image = consolidated_parameters["REGISTRY_IMG"]
+            except KeyError as e:
+                logging.error(
+                    f"{error_prefix} error generating REPO_DIGEST. "
+                    + "Is REGISTRY_IMG missing? "
+                    + f"{e!s}"
+                )
+                raise
+
+            image_uri = f"{registry_image}:{image_tag}"
+            img = self._get_image(
+                image=image_uri,
+                image_patterns=spec.image_patterns,
+                image_auth=spec.image_auth,
+                error_prefix=error_prefix,
+            )
+            if not img:
+                msg = f"{error_prefix} error get image for {image_uri}"
+                logging.error(msg)
+                raise Exception(msg)
+
+            if need_repo_digest:
+                consolidated_parameters["REPO_DIGEST"] = img.url_digest
+            if need_image_digest:
+                consolidated_parameters["IMAGE_DIGEST"] = img.digest
+
+        try:
+            resources: Iterable[Mapping[str, Any]] = oc_process(
+                template=self._pre_process_template(template),
+                parameters=consolidated_parameters,
+            )
+        except StatusCodeError as e:
+            logging.error(f"{error_prefix} error processing template: {e!s}")
+            raise
+        return resources, commit_sha, cacheable
+
     def _process_template(
         self, spec: TargetSpec
     ) -> tuple[Iterable[Any], Promotion | None]:
@@ -914,82 +1031,44 @@ class SaasHerder:
 
         if provider == "openshift-template":
             consolidated_parameters = spec.parameters()
-            try:
-                template, commit_sha = self._get_file_contents(
-                    url=url, path=path, ref=ref, github=github
-                )
-            except Exception as e:
-                logging.error(f"{error_prefix} error fetching template: {e!s}")
-                raise
-
-            # add COMMIT_SHA only if it is unspecified
-            consolidated_parameters.setdefault("COMMIT_SHA", commit_sha)
-
-            # add IMAGE_TAG only if it is unspecified
-            if not (image_tag := consolidated_parameters.get("IMAGE_TAG", "")):
-                sha_substring = commit_sha[:hash_length]
-                # IMAGE_TAG takes one of two forms:
-                # - If saas file attribute 'use_channel_in_image_tag' is true,
-                #   it is {CHANNEL}-{SHA}
-                # - Otherwise it is just {SHA}
-                if self._get_saas_file_feature_enabled("use_channel_in_image_tag"):
-                    try:
-                        channel = consolidated_parameters["CHANNEL"]
-                    except KeyError:
-                        logging.error(
-                            f"{error_prefix} CHANNEL is required when "
-                            + "'use_channel_in_image_tag' is true."
-                        )
-                        raise
-                    image_tag = f"{channel}-{sha_substring}"
-                else:
-                    image_tag = sha_substring
-                consolidated_parameters["IMAGE_TAG"] = image_tag
-
-            # This relies on IMAGE_TAG already being calculated.
-            need_repo_digest = self._parameter_value_needed(
-                "REPO_DIGEST", consolidated_parameters, template
-            )
-            need_image_digest = self._parameter_value_needed(
-                "IMAGE_DIGEST", consolidated_parameters, template
-            )
-            if need_repo_digest or need_image_digest:
+            key_commit_sha = None
+            cache_key = None
+            cached_resources = None
+            # rendered templates are persisted in plain text, so anything
+            # rendered with secret parameters must never reach the cache
+            if self.template_cache and not spec.has_secret_parameters:
+                # resolve a moving ref once: the cache key, COMMIT_SHA/IMAGE_TAG
+                # and the fetched template must all describe the same commit
                 try:
-                    logging.debug("Generating REPO_DIGEST.")
-                    registry_image = consolidated_parameters["REGISTRY_IMG"]
-                except KeyError as e:
-                    logging.error(
-                        f"{error_prefix} error generating REPO_DIGEST. "
-                        + "Is REGISTRY_IMG missing? "
-                        + f"{e!s}"
+                    key_commit_sha = (
+                        ref
+                        if is_commit_sha(ref)
+                        else self._get_commit_sha(url=url, ref=ref, github=github)
                     )
+                except Exception as e:
+                    logging.error(f"{error_prefix} error fetching commit sha: {e!s}")
                     raise
-
-                image_uri = f"{registry_image}:{image_tag}"
-                img = self._get_image(
-                    image=image_uri,
-                    image_patterns=spec.image_patterns,
-                    image_auth=spec.image_auth,
-                    error_prefix=error_prefix,
+                self._add_commit_parameters(
+                    consolidated_parameters, key_commit_sha, hash_length, error_prefix
                 )
-                if not img:
-                    msg = f"{error_prefix} error get image for {image_uri}"
-                    logging.error(msg)
-                    raise Exception(msg)
-
-                if need_repo_digest:
-                    consolidated_parameters["REPO_DIGEST"] = img.url_digest
-                if need_image_digest:
-                    consolidated_parameters["IMAGE_DIGEST"] = img.digest
-
-            oc = OCLocal("cluster", None, None, local=True)
-            try:
-                resources: Iterable[Mapping[str, Any]] = oc.process(
-                    template=self._pre_process_template(template),
+                cache_key = TemplateCache.key(
+                    url=url,
+                    path=path,
+                    commit_sha=key_commit_sha,
                     parameters=consolidated_parameters,
                 )
-            except StatusCodeError as e:
-                logging.error(f"{error_prefix} error processing template: {e!s}")
+                cached_resources = self.template_cache.get(cache_key)
+
+            if cached_resources is not None and key_commit_sha:
+                resources = cached_resources
+                commit_sha = key_commit_sha
+            else:
+                resources, commit_sha, cacheable = self._process_openshift_template(
+                    spec, consolidated_parameters, commit_sha=key_commit_sha
+                )
+                if self.template_cache and cache_key and cacheable:
+                    resources = list(resources)
+                    self.template_cache.set(cache_key, resources)
 
         elif provider == "directory":
             try:
@@ -1017,6 +1096,7 @@ class SaasHerder:
                 namespace=spec.target.namespace.name,
                 values=consolidated_parameters,
                 ssl_verify=ssl_verify,
+                cache_dir=self.helm_cache_dir,
             )
 
         else:
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter
+
+from reconcile.status import RunningState
+from reconcile.utils.datetime_util import (
+    from_utc_iso_format,
+    to_utc_seconds_iso_format,
+    utc_now,
+)
+from reconcile.utils.json import json_dumps
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from reconcile.utils.state import State
+
+DEFAULT_MAX_SIZE_BYTES = 1024 * 1024 * 1024
+DEFAULT_STATE_TTL = timedelta(days=30)
+STATE_KEY_PREFIX = "template-cache"
+# time of the last state expiry run, shared by all pods
+STATE_EXPIRY_KEY = "template-cache-expiry"
+STATE_EXPIRY_INTERVAL = timedelta(days=1)
+
+template_cache_hits = Counter(
+    name="qontract_reconcile_saas_template_cache_hits_total",
+    documentation="Number of processed saas templates served from the cache",
+    labelnames=["integration", "tier"],
+)
+
+template_cache_misses = Counter(
+    name="qontract_reconcile_saas_template_cache_misses_total",
+    documentation="Number of saas templates that had to be fetched and processed",
+    labelnames=["integration"],
+)
+
+
+class TemplateCache:
+    """Content addressed cache of processed saas templates.
+
+    The processed resources of a template are fully determined by the
+    template location, the commit sha and the parameters used to process it,
+    so they are stored under a digest of those inputs. Entries live as files
+    in a local directory; once the directory grows above max_size_bytes the
+    least recently used entries are evicted. If a State is given, it serves
+    as a shared second tier that survives pod restarts. State entries written
+    more than state_ttl ago are removed by expire_state.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+        state: State | None = None,
+        state_ttl: timedelta = DEFAULT_STATE_TTL,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.state = state
+        self.state_ttl = state_ttl
+        self._lock = Lock()
+        self._size: int | None = None
+
+    @staticmethod
+    def key(url: str, path: str, commit_sha: str, parameters: Mapping[str, Any]) -> str:
+        data = {
+            "url": url,
+            "path": path,
+            "commit_sha": commit_sha,
+            "parameters": parameters,
+        }
+        return hashlib.sha256(json_dumps(data).encode("utf-8")).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Returns the cached resources or None on a cache miss."""
+        integration = RunningState().integration
+        entry = self._entry(key)
+        try:
+            resources = json.loads(entry.read_text())
+            # the modification time is our LRU clock
+            entry.touch()
+            template_cache_hits.labels(integration=integration, tier="local").inc()
+            return resources
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            logging.warning(f"discarding corrupt template cache entry {entry}")
+            entry.unlink(missing_ok=True)
+
+        if self.state is not None:
+            resources = self.state.get(f"{STATE_KEY_PREFIX}/{key}", None)
+            if resources is not None:
+                self._write(key, resources)
+                template_cache_hits.labels(integration=integration, tier="state").inc()
+                return resources
+
+        template_cache_misses.labels(integration=integration).inc()
+        return None
+
+    def set(self, key: str, resources: list[dict[str, Any]]) -> None:
+        self._write(key, resources)
+        if self.state is not None:
+            self.state.add(f"{STATE_KEY_PREFIX}/{key}", resources, force=True)
+
+    def expire_state(self) -> None:
+        """Removes state entries written more than state_ttl ago.
+
+        Listing the state is expensive, so this runs at most once per
+        STATE_EXPIRY_INTERVAL across all pods. Entries that are still in use
+        are written again on their next miss.
+        """
+        if self.state is None:
+            return
+        now = utc_now()
+        last_expiry = self.state.get(STATE_EXPIRY_KEY, None)
+        if last_expiry and now - from_utc_iso_format(last_expiry) < (
+            STATE_EXPIRY_INTERVAL
+        ):
+            return
+        self.state.add(STATE_EXPIRY_KEY, to_utc_seconds_iso_format(now), force=True)
+
+        expired = self.state.ls(
+            f"{STATE_KEY_PREFIX}/", modified_before=now - self.state_ttl
+        )
+        for key in expired:
+            # another pod may be expiring the same entries
+            with contextlib.suppress(KeyError):
+                self.state.rm(key.removeprefix("/"))
+        logging.info(f"expired {len(expired)} template cache entries from state")
+
+    def _write(self, key: str, resources: list[dict[str, Any]]) -> None:
+        data = json_dumps(resources)
+        # write to a temporary file first, so concurrent readers never see
+        # a partially written entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        os.replace(tmp, self._entry(key))
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._evict()
+            else:
+                self._size += len(data)
+                if self._size > self.max_size_bytes:
+                    self._size = self._evict()
+
+    def _evict(self) -> int:
+        """Removes the least recently used entries and returns the cache size."""
+        entries = []
+        total_size = 0
+        for entry in self.directory.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total_size += stat.st_size
+
+        for _, size, entry in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
+        return total_size
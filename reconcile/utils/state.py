@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
 import logging
 import os
+import tempfile
 from abc import abstractmethod
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,6 +18,7 @@ from typing import (
 import boto3
 from botocore.errorfactory import ClientError
 from pydantic import BaseModel
+from sretoolbox.utils import threaded
 
 from reconcile.gql_definitions.common.app_interface_state_settings import (
     AppInterfaceStateConfigurationS3V1,
@@ -28,6 +32,7 @@ from reconcile.typed_queries.app_interface_vault_settings import (
 )
 from reconcile.typed_queries.get_state_aws_account import get_state_aws_account
 from reconcile.utils.aws_api import aws_config_file_path
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.json import json_dumps
 from reconcile.utils.secret_reader import (
     SecretReaderBase,
@@ -35,7 +40,8 @@ from reconcile.utils.secret_reader import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Mapping
+    from collections.abc import Callable, Generator, Iterable, Mapping
+    from datetime import datetime
 
     from mypy_boto3_s3 import S3Client
 
@@ -58,6 +64,7 @@ def init_state(
         integration=integration,
         bucket=s3_settings.bucket,
         client=s3_settings.build_client(),
+        cache_dir=os.environ.get("APP_INTERFACE_STATE_CACHE_DIR"),
     )
 
 
@@ -233,18 +240,29 @@ class State:
     Bad example: openshift-resources' source of truth is the clusters
 
     :param integration: name of calling integration
-    :param accounts: Graphql AWS accounts query results
-    :param settings: App Interface settings
+    :param bucket: name of the state bucket
+    :param client: S3 client
+    :param cache_dir: (optional) directory to cache values in. Cached values
+    are only downloaded again if their ETag changed.
 
     :raises StateInaccessibleException: if the bucket is missing
     or not accessible
     """
 
-    def __init__(self, integration: str, bucket: str, client: S3Client) -> None:
+    def __init__(
+        self,
+        integration: str,
+        bucket: str,
+        client: S3Client,
+        cache_dir: str | None = None,
+    ) -> None:
         """Initiates S3 client from AWSApi."""
         self.state_path = f"state/{integration}" if integration else "state"
         self.bucket = bucket
         self.client = client
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # check if the bucket exists
         try:
@@ -305,29 +323,43 @@ class State:
                 f"in bucket {self.bucket} - {details!s}"
             ) from None
 
-    def ls(self) -> list[str]:
+    def ls(
+        self,
+        prefix: str = "",
+        delimiter: str | None = None,
+        modified_before: datetime | None = None,
+    ) -> list[str]:
         """
         Returns a list of keys in the state
-        """
-        objects = self.client.list_objects_v2(
-            Bucket=self.bucket, Prefix=f"{self.state_path}/"
-        )
-
-        if "Contents" not in objects:
-            return []
 
-        contents = objects["Contents"]
-
-        while objects["IsTruncated"]:
-            objects = self.client.list_objects_v2(
-                Bucket=self.bucket,
-                Prefix=f"{self.state_path}/",
-                ContinuationToken=objects["NextContinuationToken"],
-            )
-
-            contents += objects["Contents"]
-
-        return [c["Key"].replace(self.state_path, "") for c in contents]
+        :param prefix: (optional) only list the keys starting with prefix
+        :param delimiter: (optional) group the keys containing the delimiter
+        after the prefix, e.g. with delimiter "/" only the direct children of
+        prefix are returned and sub directories are returned as "/prefix/dir/"
+        :param modified_before: (optional) only list the keys last modified
+        before this (timezone aware) point in time
+        """
+        kwargs: dict[str, Any] = {
+            "Bucket": self.bucket,
+            "Prefix": f"{self.state_path}/{prefix}",
+        }
+        if delimiter:
+            kwargs["Delimiter"] = delimiter
+
+        keys: list[str] = []
+        while True:
+            objects = self.client.list_objects_v2(**kwargs)
+            keys += [
+                c["Key"]
+                for c in objects.get("Contents", [])
+                if modified_before is None or c["LastModified"] < modified_before
+            ]
+            keys += [p["Prefix"] for p in objects.get("CommonPrefixes", [])]
+            if not objects["IsTruncated"]:
+                break
+            kwargs["ContinuationToken"] = objects["NextContinuationToken"]
+
+        return [k.replace(self.state_path, "") for k in keys]
 
     def add(
         self,
@@ -353,12 +385,32 @@ class State:
     def _set(
         self, key: str, value: Any, metadata: Mapping[str, str] | None = None
     ) -> None:
-        self.client.put_object(
+        key_path = f"{self.state_path}/{key}"
+        response = self.client.put_object(
             Bucket=self.bucket,
-            Key=f"{self.state_path}/{key}",
+            Key=key_path,
             Body=json_dumps(value),
             Metadata=metadata or {},
         )
+        self._write_cache(key_path, response.get("ETag"), value)
+
+    def set_many(
+        self,
+        values: Mapping[str, Any],
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+    ) -> None:
+        """
+        Sets multiple keys, overriding existing ones. The keys are written
+        concurrently.
+
+        :param values: mapping of keys to values
+        :param thread_pool_size: (optional) number of concurrent requests
+        """
+        threaded.run(
+            lambda item: self._set(item[0], item[1]),
+            list(values.items()),
+            thread_pool_size,
+        )
 
     def rm(self, key: str) -> None:
         """
@@ -370,7 +422,9 @@ class State:
         """
         if not self.exists(key):
             raise KeyError(f"[state] key {key} does not exists in {self.state_path}")
-        self.client.delete_object(Bucket=self.bucket, Key=f"{self.state_path}/{key}")
+        key_path = f"{self.state_path}/{key}"
+        self.client.delete_object(Bucket=self.bucket, Key=key_path)
+        self._remove_cache(key_path)
 
     def get(self, key: str, *args: Any) -> Any:
         """
@@ -390,28 +444,96 @@ class State:
                 return args[0]
             raise
 
+    def get_many(
+        self,
+        keys: Iterable[str],
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+    ) -> dict[str, Any]:
+        """
+        Gets the values of multiple keys. The keys are fetched concurrently,
+        keys that do not exist are left out of the result.
+
+        :param keys: keys to get
+        :param thread_pool_size: (optional) number of concurrent requests
+        """
+        missing = object()
+        keys = list(keys)
+        values = threaded.run(
+            lambda key: self.get(key, missing), keys, thread_pool_size
+        )
+        return {k: v for k, v in zip(keys, values, strict=True) if v is not missing}
+
     def get_all(self, path: str) -> dict[str, Any]:
         """
         Gets all keys and values from the state in the specified path.
         """
+        keys = [k.lstrip("/") for k in self.ls(prefix=path) if k.startswith(f"/{path}")]
         return {
-            k.replace(f"{path}/", "").strip("/"): self.get(k.lstrip("/"))
-            for k in self.ls()
-            if k.startswith(f"/{path}")
+            k.replace(f"{path}/", "").strip("/"): v
+            for k, v in self.get_many(keys).items()
         }
 
     def __getitem__(self, item: str) -> Any:
+        key_path = f"{self.state_path}/{item}"
+        kwargs: dict[str, Any] = {}
+        cached = self._read_cache(key_path)
+        if cached:
+            # conditional GET, S3 answers 304 if our copy is still current
+            kwargs["IfNoneMatch"] = cached["etag"]
         try:
             response = self.client.get_object(
-                Bucket=self.bucket, Key=f"{self.state_path}/{item}"
+                Bucket=self.bucket, Key=key_path, **kwargs
             )
-            return json.loads(response["Body"].read())
+            value = json.loads(response["Body"].read())
         except ClientError as details:
-            if details.response["Error"]["Code"] == "NoSuchKey":
+            error_code = details.response["Error"]["Code"]
+            if cached and error_code == "304":
+                return cached["value"]
+            if error_code == "NoSuchKey":
+                self._remove_cache(key_path)
                 raise KeyError(item) from None
             raise
         except json.decoder.JSONDecodeError:
             raise KeyError(item) from None
+        self._write_cache(key_path, response.get("ETag"), value)
+        return value
+
+    def _cache_path(self, key_path: str) -> Path | None:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256(f"{self.bucket}/{key_path}".encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read_cache(self, key_path: str) -> dict[str, Any] | None:
+        path = self._cache_path(key_path)
+        if not path:
+            return None
+        try:
+            return json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_cache(self, key_path: str, etag: str | None, value: Any) -> None:
+        path = self._cache_path(key_path)
+        if not path:
+            return
+        if not etag:
+            path.unlink(missing_ok=True)
+            return
+        # write to a temporary file first, so concurrent readers never see
+        # a partially written entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(json_dumps({"etag": etag, "value": value}))
+        os.replace(tmp, path)
+
+    def _remove_cache(self, key_path: str) -> None:
+        path = self._cache_path(key_path)
+        if path:
+            path.unlink(missing_ok=True)
 
     def __setitem__(self, key: str, value: Any) -> None:
         self._set(key, value)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import fcntl
+import hashlib
 import json
 import logging
+import os
 import re
 import shutil
 import tempfile
+import time
 from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -32,8 +36,10 @@ import reconcile.utils.lean_terraform_client as lean_tf
 from reconcile.typed_queries.app_interface_custom_messages import (
     get_app_interface_custom_message,
 )
+from reconcile.utils import metrics
 from reconcile.utils.aws_helper import get_region_from_availability_zone
 from reconcile.utils.datetime_util import ensure_utc, utc_now
+from reconcile.utils.json import json_dumps
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -57,6 +63,33 @@ PROVIDER_LOG_IGNORE_REGEX = (
     r""".*(?:ObjectLockConfigurationNotFoundError|WaitForState).*"""
 )
 TERRAFORM_LOG_LEVEL = "TRACE"  # can change to INFO after tf 0.15
+# hash of the inputs of the last successful terraform init in a working dir
+INIT_HASH_FILE = os.path.join(".terraform", "qontract-init.sha256")
+LOCK_FILE = ".terraform.lock.hcl"
+
+
+_working_dir_locks: dict[str, IO[str]] = {}
+_working_dir_locks_lock = Lock()
+
+
+def lock_working_dir(working_dir: str) -> None:
+    """Locks a kept working dir against other processes until
+    unlock_working_dir is called. Runs sharing the working dir root wait for
+    each other instead of overwriting the configuration of a running plan.
+    A working dir this process holds already stays locked."""
+    with _working_dir_locks_lock:
+        if working_dir in _working_dir_locks:
+            return
+        lock_file = open(f"{working_dir}.lock", "w", encoding="locale")  # noqa: SIM115
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        _working_dir_locks[working_dir] = lock_file
+
+
+def unlock_working_dir(working_dir: str) -> None:
+    with _working_dir_locks_lock:
+        lock_file = _working_dir_locks.pop(working_dir, None)
+    if lock_file is not None:
+        lock_file.close()
 
 
 @dataclass
@@ -94,6 +127,9 @@ class TerraformClient:
         thread_pool_size: int,
         aws_api: AWSApi | None = None,
         init_users: bool = False,
+        plugin_cache_dir: str | None = None,
+        keep_working_dirs: bool = False,
+        backend_env: Mapping[str, Mapping[str, str]] | None = None,
     ) -> None:
         self.integration = integration
         self.integration_version = integration_version
@@ -105,8 +141,16 @@ class TerraformClient:
         self._aws_api = aws_api
         self._log_lock = Lock()
         self.apply_count = 0
+        self.plugin_cache_dir = plugin_cache_dir
+        if plugin_cache_dir:
+            os.makedirs(plugin_cache_dir, exist_ok=True)
+        self.keep_working_dirs = keep_working_dirs
+        # per account environment of the terraform commands, used to pass
+        # the backend credentials when they are not in the configuration
+        self.backend_env = backend_env or {}
 
         self.specs: list[TerraformSpec] = []
+        self.skipped_specs: set[str] = set()
         self.init_specs()
         self.outputs: dict[str, Any] = {}
         self.init_outputs()
@@ -154,14 +198,72 @@ class TerraformClient:
             for name, wd in self.working_dirs.items()
         ]
         for spec in self.specs:
+            # only kept working dirs can have been initialized before
+            if self.keep_working_dirs and self._read_init_hash(
+                spec.working_dir
+            ) == self._init_hash(spec.working_dir):
+                metrics.terraform_init_skipped.labels(
+                    integration=self.integration, account=spec.name
+                ).inc()
+                continue
+            start = time.monotonic()
             self.terraform_init(spec)
+            metrics.terraform_init_duration.labels(
+                integration=self.integration, account=spec.name
+            ).observe(time.monotonic() - start)
+            if self.keep_working_dirs:
+                self._write_init_hash(spec.working_dir)
+
+    @staticmethod
+    def _init_hash(working_dir: str) -> str:
+        """Hashes everything terraform init acts on: the terraform block of
+        the configuration (backend and required providers), the module
+        sources and the provider lock file. Provider blocks are not
+        included, init does not depend on them."""
+        with open(os.path.join(working_dir, "config.tf.json"), encoding="utf-8") as f:
+            config = json.load(f)
+        init_config = {
+            "terraform": config.get("terraform"),
+            "module": config.get("module"),
+        }
+        h = hashlib.sha256(json_dumps(init_config).encode("utf-8"))
+        lock_file = os.path.join(working_dir, LOCK_FILE)
+        if os.path.exists(lock_file):
+            with open(lock_file, "rb") as f:
+                h.update(f.read())
+        return h.hexdigest()
+
+    @staticmethod
+    def _read_init_hash(working_dir: str) -> str | None:
+        try:
+            with open(os.path.join(working_dir, INIT_HASH_FILE), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_init_hash(self, working_dir: str) -> None:
+        # init may have created or updated the lock file, hash after it ran
+        with open(
+            os.path.join(working_dir, INIT_HASH_FILE), "w", encoding="utf-8"
+        ) as f:
+            f.write(self._init_hash(working_dir))
+
+    def skip_specs(self, names: Iterable[str]) -> None:
+        """Leaves the accounts out of plan and apply. Their outputs are still
+        read, as the output secrets are populated for all accounts."""
+        self.skipped_specs = set(names)
+
+    @property
+    def planned_specs(self) -> list[TerraformSpec]:
+        return [s for s in self.specs if s.name not in self.skipped_specs]
 
     @contextmanager
     def _terraform_log_file(
-        self, working_dir: str
+        self, spec: TerraformSpec
     ) -> Iterator[tuple[IO[bytes], dict[str, str]]]:
-        with tempfile.NamedTemporaryFile(dir=working_dir) as f:
+        with tempfile.NamedTemporaryFile(dir=spec.working_dir) as f:
             env = {
+                **self.backend_env.get(spec.name, {}),
                 "TF_LOG": TERRAFORM_LOG_LEVEL,
                 "TF_LOG_PATH": f.name,
             }
@@ -169,8 +271,13 @@ class TerraformClient:
 
     @retry(exceptions=TerraformCommandError)
     def terraform_init(self, spec: TerraformSpec) -> None:
-        with self._terraform_log_file(spec.working_dir) as (f, env):
-            return_code, stdout, stderr = lean_tf.init(spec.working_dir, env=env)
+        with self._terraform_log_file(spec) as (f, env):
+            if self.plugin_cache_dir:
+                env["TF_PLUGIN_CACHE_DIR"] = self.plugin_cache_dir
+            # the backend configuration of a kept working dir may be outdated
+            return_code, stdout, stderr = lean_tf.init(
+                spec.working_dir, env=env, reconfigure=self.keep_working_dirs
+            )
             log = f.read().decode("utf-8")
         error = self.check_output(spec.name, "init", return_code, stdout, stderr, log)
         if error:
@@ -184,7 +291,7 @@ class TerraformClient:
 
     @retry(exceptions=TerraformCommandError)
     def terraform_output(self, spec: TerraformSpec) -> tuple[str, Any]:
-        with self._terraform_log_file(spec.working_dir) as (f, env):
+        with self._terraform_log_file(spec) as (f, env):
             return_code, stdout, stderr = lean_tf.output(spec.working_dir, env=env)
             log = f.read().decode("utf-8")
         error = self.check_output(spec.name, "output", return_code, stdout, stderr, log)
@@ -206,7 +313,7 @@ class TerraformClient:
         disabled_deletions_detected = False
         results: list[tuple[bool, list[AccountUser], bool]] = threaded.run(
             self.terraform_plan,
-            self.specs,
+            self.planned_specs,
             self.thread_pool_size,
             enable_deletion=enable_deletion,
         )
@@ -233,7 +340,7 @@ class TerraformClient:
     def terraform_plan(
         self, spec: TerraformSpec, enable_deletion: bool
     ) -> tuple[bool, list[AccountUser], bool]:
-        with self._terraform_log_file(spec.working_dir) as (f, env):
+        with self._terraform_log_file(spec) as (f, env):
             return_code, stdout, stderr = lean_tf.plan(
                 spec.working_dir,
                 spec.name,
@@ -295,9 +402,10 @@ class TerraformClient:
         deletions_allowed = enable_deletion or account_enable_deletion
         created_users: list[AccountUser] = []
 
-        output = lean_tf.show_json(spec.working_dir, name)
-        format_version = output.get("format_version")
-        if format_version != ALLOWED_TF_SHOW_FORMAT_VERSION:
+        # only the changes are read from the plan, the rest of the
+        # (potentially huge) document is streamed past
+        plan = lean_tf.show_plan(spec.working_dir, name, env=self.backend_env.get(name))
+        if plan.format_version != ALLOWED_TF_SHOW_FORMAT_VERSION:
             raise NotImplementedError("terraform show untested format version")
 
         # https://www.terraform.io/docs/internals/json-format.html
@@ -306,7 +414,7 @@ class TerraformClient:
         # fully accurate, but the "after" value will always be correct.
         # to overcome the "before" value not being accurate,
         # we find it in the previously initiated outputs.
-        output_changes = output.get("output_changes", {})
+        output_changes = plan.output_changes
         for output_name, output_change in output_changes.items():
             before = self.outputs[name].get(output_name, {}).get("value")
             after = output_change.get("after")
@@ -319,18 +427,11 @@ class TerraformClient:
         # the output changes do not contain deleted outputs
         # while the prior state does. for the outputs to
         # actually be deleted, we should apply.
-        prior_outputs = (
-            output.get("prior_state", {}).get("values", {}).get("outputs", {})
-        )
-        deleted_outputs = [po for po in prior_outputs if po not in output_changes]
+        deleted_outputs = [po for po in plan.prior_outputs if po not in output_changes]
         for output_name in deleted_outputs:
             logging.info(["delete", name, "output", output_name])
             self.increment_apply_count()
 
-        resource_changes = output.get("resource_changes")
-        if resource_changes is None:
-            return disabled_deletion_detected, created_users
-
         always_enabled_deletions = {
             "random_id",
             "aws_lb_target_group_attachment",
@@ -339,7 +440,8 @@ class TerraformClient:
         }
 
         # https://www.terraform.io/docs/internals/json-format.html
-        for resource_change in resource_changes:
+        # no-op resources that are not moved are already left out
+        for resource_change in plan.resource_changes:
             resource_type = resource_change["type"]
             resource_name = resource_change["name"]
             resource_address = resource_change["address"]
@@ -449,11 +551,13 @@ class TerraformClient:
 
     # terraform apply
     def apply(self) -> bool:
-        errors = threaded.run(self.terraform_apply, self.specs, self.thread_pool_size)
+        errors = threaded.run(
+            self.terraform_apply, self.planned_specs, self.thread_pool_size
+        )
         return any(errors)
 
     def terraform_apply(self, spec: TerraformSpec) -> bool:
-        with self._terraform_log_file(spec.working_dir) as (f, env):
+        with self._terraform_log_file(spec) as (f, env):
             return_code, stdout, stderr = lean_tf.apply(
                 spec.working_dir,
                 spec.name,
@@ -669,7 +773,26 @@ class TerraformClient:
         if self._aws_api is not None:
             self._aws_api.cleanup()
         for wd in self.working_dirs.values():
-            shutil.rmtree(wd)
+            if self.keep_working_dirs:
+                self._scrub_working_dir(wd)
+                unlock_working_dir(wd)
+            else:
+                shutil.rmtree(wd)
+
+    @staticmethod
+    def _scrub_working_dir(working_dir: str) -> None:
+        """Keeps only what terraform init produced. The rendered config and
+        the plan files contain the provider credentials, they are written
+        again on the next run. The backend credentials of kept working dirs
+        are passed in the environment, so the backend configuration init
+        stores in .terraform has none."""
+        for entry in os.scandir(working_dir):
+            if entry.name in {".terraform", LOCK_FILE}:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
 
     def _can_skip_rds_modifications(
         self, account_name: str, resource_name: str, resource_change: Mapping[str, Any]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from reconcile.utils.datetime_util import ensure_utc, utc_now
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from reconcile.utils.state import State
+
+CONFIG_HASHES_PREFIX = "config-hashes"
+# written by terraform init, pins the selected provider versions
+LOCK_FILE = ".terraform.lock.hcl"
+
+
+class TerraformConfigState:
+    """Hashes of the terraform configurations of the last successful apply.
+
+    An account whose generated configuration, together with the provider
+    versions terraform init selected, hashes to the value recorded at its
+    last successful apply has nothing new to plan. Changes made outside of
+    terraform are not visible in the configuration though, so an account is
+    planned again once its record is older than ttl_seconds.
+    """
+
+    def __init__(self, state: State, ttl_seconds: int) -> None:
+        self.state = state
+        self.ttl = timedelta(seconds=ttl_seconds)
+
+    @staticmethod
+    def config_hash(configuration: str, working_dir: str) -> str:
+        h = hashlib.sha256(configuration.encode("utf-8"))
+        lock_file = Path(working_dir) / LOCK_FILE
+        if lock_file.exists():
+            h.update(lock_file.read_bytes())
+        return h.hexdigest()
+
+    def hashes(
+        self, configurations: Mapping[str, str], working_dirs: Mapping[str, str]
+    ) -> dict[str, str]:
+        return {
+            name: self.config_hash(configuration, working_dirs[name])
+            for name, configuration in configurations.items()
+            if name in working_dirs
+        }
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return f"{CONFIG_HASHES_PREFIX}/{name}"
+
+    def unchanged(self, config_hashes: Mapping[str, str]) -> set[str]:
+        """Returns the accounts that are unchanged since their last apply and
+        whose drift check is not due yet."""
+        records = self.state.get_many(self._key(name) for name in config_hashes)
+        now = utc_now()
+        unchanged = set()
+        for name, config_hash in config_hashes.items():
+            record = records.get(self._key(name))
+            if not record or record.get("hash") != config_hash:
+                continue
+            applied_at = ensure_utc(datetime.fromisoformat(record["applied_at"]))
+            if now - applied_at < self.ttl:
+                unchanged.add(name)
+        return unchanged
+
+    def record(self, config_hashes: Mapping[str, str], names: Iterable[str]) -> None:
+        """Records the hashes of the accounts that were applied successfully."""
+        applied_at = utc_now().isoformat()
+        self.state.set_many({
+            self._key(name): {"hash": config_hashes[name], "applied_at": applied_at}
+            for name in names
+        })
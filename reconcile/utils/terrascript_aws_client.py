@@ -8,6 +8,7 @@ import logging
 import os
 import random
 import re
+import shutil
 import string
 import tempfile
 from collections import Counter
@@ -189,6 +190,7 @@ from reconcile.utils.password_validator import (
 )
 from reconcile.utils.secret_reader import SecretReader, SecretReaderBase
 from reconcile.utils.terraform import safe_resource_id
+from reconcile.utils.terraform_client import lock_working_dir
 from reconcile.utils.vcs import VCS
 
 if TYPE_CHECKING:
@@ -483,6 +485,7 @@ class TerrascriptClient:
         settings: Mapping[str, Any] | None = None,
         prefetch_resources_by_schemas: Iterable[str] | None = None,
         secret_reader: SecretReaderBase | None = None,
+        backend_credentials_from_env: bool = False,
     ) -> None:
         self.integration = integration
         self.integration_prefix = integration_prefix
@@ -528,7 +531,10 @@ class TerrascriptClient:
 
             ts += Terraform(
                 backend=TerrascriptClient.state_bucket_for_account(
-                    self.integration, name, config
+                    self.integration,
+                    name,
+                    config,
+                    credentials_from_env=backend_credentials_from_env,
                 ),
                 required_providers={
                     "aws": {
@@ -605,11 +611,21 @@ class TerrascriptClient:
 
     @staticmethod
     def state_bucket_for_account(
-        integration: str, account_name: str, config: Mapping[str, Any]
+        integration: str,
+        account_name: str,
+        config: Mapping[str, Any],
+        credentials_from_env: bool = False,
     ) -> Backend:
-        # creds
-        access_key_backend_value = config["aws_access_key_id"]
-        secret_key_backend_value = config["aws_secret_access_key"]
+        # creds, terraform init stores the backend configuration in
+        # .terraform, credentials_from_env keeps them out of it
+        creds = (
+            {}
+            if credentials_from_env
+            else {
+                "access_key": config["aws_access_key_id"],
+                "secret_key": config["aws_secret_access_key"],
+            }
+        )
 
         # defaults from account
         bucket_backend_value = config.get("bucket")
@@ -630,14 +646,24 @@ class TerrascriptClient:
         if bucket_backend_value and key_backend_value and region_backend_value:
             return Backend(
                 "s3",
-                access_key=access_key_backend_value,
-                secret_key=secret_key_backend_value,
+                **creds,
                 bucket=bucket_backend_value,
                 key=key_backend_value,
                 region=region_backend_value,
             )
         raise ValueError(f"No bucket config found for account {account_name}")
 
+    def backend_env(self) -> dict[str, dict[str, str]]:
+        """The environment passing the backend credentials of each account
+        to terraform, for backends created with backend_credentials_from_env."""
+        return {
+            name: {
+                "AWS_ACCESS_KEY_ID": config["aws_access_key_id"],
+                "AWS_SECRET_ACCESS_KEY": config["aws_secret_access_key"],
+            }
+            for name, config in self.configs.items()
+        }
+
     def get_rosa_auth_kinesis_to_os_zip(self, release_url: str) -> str:
         if not self.rosa_auth_kinesis_to_os_zip.get(release_url):
             with self.rosa_auth_kinesis_to_os_zip_lock:
@@ -4466,6 +4492,7 @@ class TerrascriptClient:
         self,
         print_to_file: str | None = None,
         existing_dirs: dict[str, str] | None = None,
+        working_dir_root: str | None = None,
     ) -> dict[str, str]:
         """
         Dump the Terraform configurations (in JSON format) to the working directories.
@@ -4474,6 +4501,11 @@ class TerrascriptClient:
                               the standard location
         :param existing_dirs: existing working directory, key is account name, value is
                               the directory location
+        :param working_dir_root: reuse <working_dir_root>/<integration>/<account> as
+                                 working directories instead of new temporary ones,
+                                 which keeps the initialized .terraform directories
+                                 between runs. The working directories stay
+                                 locked until TerraformClient.cleanup()
         :return: key is AWS account name and value is directory location
         """
         if existing_dirs is None:
@@ -4494,7 +4526,11 @@ class TerrascriptClient:
                     f.write(f"##### {name} #####\n")
                     f.write(content)
                     f.write("\n")
-            if existing_dirs is None:
+            if existing_dirs is None and working_dir_root:
+                wd = os.path.join(working_dir_root, self.integration, name)
+                os.makedirs(wd, exist_ok=True)
+                lock_working_dir(wd)
+            elif existing_dirs is None:
                 wd = tempfile.mkdtemp(prefix=TMP_DIR_PREFIX)
             else:
                 wd = working_dirs[name]
@@ -4504,6 +4540,20 @@ class TerrascriptClient:
 
         return working_dirs
 
+    def prune_working_dirs(
+        self, working_dir_root: str, account_names: Iterable[str]
+    ) -> None:
+        """Removes the working directories dump() kept below working_dir_root
+        for accounts that are not in account_names (anymore)."""
+        integration_root = os.path.join(working_dir_root, self.integration)
+        if not os.path.isdir(integration_root):
+            return
+        keep = set(account_names)
+        for entry in os.scandir(integration_root):
+            if entry.name not in keep and entry.is_dir(follow_symlinks=False):
+                logging.info(f"removing working dir of account {entry.name}")
+                shutil.rmtree(entry.path)
+
     def terraform_configurations(self) -> dict[str, str]:
         """
         Return the Terraform configurations (in JSON format) for each AWS account.
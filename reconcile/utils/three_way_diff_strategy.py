@@ -150,6 +150,10 @@ def three_way_diff_using_hash(c_item: OR, d_item: OR) -> bool:
     current = normalize_object(c_item)
     desired = normalize_object(d_item)
 
+    # unchanged objects don't need a patch to tell
+    if current.body == desired.body:
+        return True
+
     patch = jsonpatch.JsonPatch.from_diff(current.body, desired.body)
     valid_changes = [
         item for item in patch.patch if is_valid_change(current, desired, item)